@@ -0,0 +1,266 @@
+"""
+Replay recorded calls through CallOrchestrator with fake providers.
+
+Drives N concurrent synthetic calls through handle_call_start,
+handle_audio_received and handle_call_end, feeding each call's audio in real
+time. The STT, LLM and TTS clients are deterministic in-process fakes with
+configurable latency distributions (see fake_providers.LatencyModel). Each
+WAV file passed with --audio is one caller utterance; calls cycle through
+them, and a synthetic utterance is used when none are given. After each
+utterance the caller keeps sending silence until the response has played.
+
+Reports throughput, turn-latency percentiles per stage (from the
+orchestrator's turn traces), event-loop lag and RSS per call.
+
+Usage:
+    python benchmarks/call_replay.py --calls 200 --turns 3 --streaming \\
+        --stt-latency lognormal:0.15,0.3 --llm-latency lognormal:0.35,0.4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Sequence
+from unittest.mock import patch
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_providers import FakeLLMClient, FakeSTTClient, FakeTTSClient, LatencyModel  # noqa: E402
+from src.audio.codec import decode_samples, resample, unwrap_wav  # noqa: E402
+from src.orchestrator import CallOrchestrator, CallContext  # noqa: E402
+
+
+SAMPLE_RATE = 16000
+CHUNK_MS = 20
+
+TRANSCRIPTS = [
+    "Hi, what are your opening hours?",
+    "Do you have parking nearby?",
+    "Can I book a table for four tonight?",
+    "Thanks, that's all."
+]
+RESPONSES = [
+    "We're open from nine in the morning until ten at night. Is there anything else?",
+    "Yes, there is a public car park right behind the building.",
+    "Sure, I have a table for four at seven thirty. Shall I book it?",
+    "You're welcome. Have a great evening!"
+]
+
+
+@dataclass
+class ReplayStats:
+    """Results collected across all replayed calls."""
+    calls_completed: int = 0
+    calls_rejected: int = 0
+    turns: List[Dict[str, float]] = field(default_factory=list)
+    loop_lag: List[float] = field(default_factory=list)
+    peak_rss: int = 0
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes."""
+    try:
+        import psutil
+    except ImportError:
+        # Peak RSS (KiB on Linux) is the best available without psutil
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return psutil.Process().memory_info().rss
+
+
+def load_utterance(path: Path) -> bytes:
+    """Load a WAV file as PCM16 mono at the pipeline sample rate."""
+    payload, spec = unwrap_wav(path.read_bytes())
+    samples = decode_samples(bytes(payload), spec.codec)
+    if spec.channels > 1:
+        samples = samples.reshape(-1, spec.channels).mean(axis=1).astype(np.int16)
+    return resample(samples, spec.sample_rate, SAMPLE_RATE).tobytes()
+
+
+def synthetic_utterance(speech_seconds: float = 1.2, silence_seconds: float = 0.8) -> bytes:
+    """A voiced tone followed by enough silence to end the utterance."""
+    t = np.arange(int(SAMPLE_RATE * speech_seconds)) / SAMPLE_RATE
+    speech = (np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16)
+    silence = np.zeros(int(SAMPLE_RATE * silence_seconds), dtype=np.int16)
+    return np.concatenate([speech, silence]).tobytes()
+
+
+def build_orchestrator(args: argparse.Namespace) -> CallOrchestrator:
+    """Create an orchestrator wired to the fake providers."""
+    settings = SimpleNamespace(
+        context_window_size=4000,
+        cartesia_voice_id="replay_voice",
+        audio_sample_rate=SAMPLE_RATE
+    )
+    with patch("src.orchestrator.get_settings", return_value=settings):
+        return CallOrchestrator(
+            stt_client=FakeSTTClient(LatencyModel.parse(args.stt_latency), TRANSCRIPTS, seed=args.seed),
+            llm_client=FakeLLMClient(
+                LatencyModel.parse(args.llm_latency),
+                args.token_interval,
+                RESPONSES,
+                seed=args.seed + 1
+            ),
+            tts_client=FakeTTSClient(LatencyModel.parse(args.tts_latency), SAMPLE_RATE, seed=args.seed + 2),
+            max_concurrent_calls=args.calls,
+            streaming_mode=args.streaming,
+            persistent_stt=args.persistent_stt
+        )
+
+
+async def monitor_loop(stats: ReplayStats, stop: asyncio.Event, interval: float = 0.01) -> None:
+    """Sample event-loop lag and RSS until stopped."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        stats.loop_lag.append(max(0.0, loop.time() - expected))
+        stats.peak_rss = max(stats.peak_rss, current_rss())
+
+
+async def replay_call(
+    orchestrator: CallOrchestrator,
+    index: int,
+    utterances: Sequence[bytes],
+    turns: int,
+    stats: ReplayStats
+) -> None:
+    """Play one caller through a full call."""
+    context = CallContext(
+        call_id=f"replay-{index}",
+        caller_number="+15550000000",
+        start_time=datetime.now(UTC),
+        livekit_room=f"replay-room-{index}"
+    )
+    await orchestrator.handle_call_start(context)
+    session = orchestrator.sessions.get(context.call_id)
+    if session is None:
+        stats.calls_rejected += 1
+        return
+    
+    loop = asyncio.get_running_loop()
+    chunk_bytes = SAMPLE_RATE * CHUNK_MS // 1000 * 2
+    silence = bytes(chunk_bytes)
+    next_send = loop.time()
+    
+    async def send(chunk: bytes) -> None:
+        nonlocal next_send
+        await orchestrator.handle_audio_received(context.call_id, chunk)
+        next_send += CHUNK_MS / 1000
+        await asyncio.sleep(max(0.0, next_send - loop.time()))
+    
+    for turn in range(turns):
+        audio = utterances[(index + turn) % len(utterances)]
+        for offset in range(0, len(audio), chunk_bytes):
+            await send(audio[offset:offset + chunk_bytes])
+        # Keep the microphone open (silence) while the response plays
+        while session.turn_tasks:
+            await send(silence)
+    
+    stats.turns.extend(trace.spans() for trace in session.metrics.turn_traces)
+    await orchestrator.handle_call_end(context)
+    stats.calls_completed += 1
+
+
+def percentiles(values: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99/max of a sample in milliseconds."""
+    data = np.asarray(values) * 1000
+    return {
+        "count": len(data),
+        "p50": float(np.percentile(data, 50)),
+        "p95": float(np.percentile(data, 95)),
+        "p99": float(np.percentile(data, 99)),
+        "max": float(data.max())
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    utterances = [load_utterance(Path(path)) for path in args.audio] or [synthetic_utterance()]
+    orchestrator = build_orchestrator(args)
+    stats = ReplayStats()
+    baseline_rss = current_rss()
+    
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_loop(stats, stop))
+    started = time.perf_counter()
+    
+    async def staggered(index: int) -> None:
+        await asyncio.sleep(args.ramp * index / max(1, args.calls))
+        await replay_call(orchestrator, index, utterances, args.turns, stats)
+    
+    await asyncio.gather(*(staggered(index) for index in range(args.calls)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+    
+    stages = sorted({name for spans in stats.turns for name in spans})
+    return {
+        "calls": args.calls,
+        "calls_completed": stats.calls_completed,
+        "calls_rejected": stats.calls_rejected,
+        "turns_completed": len(stats.turns),
+        "elapsed_seconds": elapsed,
+        "turns_per_second": len(stats.turns) / elapsed,
+        "turn_latency_ms": {
+            stage: percentiles([spans[stage] for spans in stats.turns if stage in spans])
+            for stage in stages
+        },
+        "event_loop_lag_ms": percentiles(stats.loop_lag) if stats.loop_lag else {},
+        "rss_baseline_mib": baseline_rss / 1024 / 1024,
+        "rss_peak_mib": stats.peak_rss / 1024 / 1024,
+        "rss_per_call_kib": max(0, stats.peak_rss - baseline_rss) / max(1, stats.calls_completed) / 1024
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"calls completed:     {report['calls_completed']} / {report['calls']} "
+          f"({report['calls_rejected']} rejected)")
+    print(f"turns completed:     {report['turns_completed']} in {report['elapsed_seconds']:.1f} s "
+          f"({report['turns_per_second']:.1f} turns/s)")
+    print("turn latency (ms):   stage              p50      p95      p99      max")
+    for stage, values in report["turn_latency_ms"].items():
+        print(f"                     {stage:<16} {values['p50']:7.1f}  {values['p95']:7.1f}  "
+              f"{values['p99']:7.1f}  {values['max']:7.1f}")
+    lag = report["event_loop_lag_ms"]
+    if lag:
+        print(f"event loop lag (ms): p50 {lag['p50']:.2f}  p99 {lag['p99']:.2f}  max {lag['max']:.2f}")
+    print(f"rss:                 baseline {report['rss_baseline_mib']:.1f} MiB, "
+          f"peak {report['rss_peak_mib']:.1f} MiB, {report['rss_per_call_kib']:.1f} KiB per call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50, help="Number of concurrent calls")
+    parser.add_argument("--turns", type=int, default=3, help="Caller utterances per call")
+    parser.add_argument("--audio", nargs="*", default=[], help="WAV files, one utterance each")
+    parser.add_argument("--ramp", type=float, default=1.0, help="Seconds over which call starts are spread")
+    parser.add_argument("--streaming", action="store_true", help="Use the streaming turn pipeline")
+    parser.add_argument("--persistent-stt", action="store_true", help="Keep one STT stream open per call")
+    parser.add_argument("--stt-latency", default="lognormal:0.15,0.3", help="STT final-result latency")
+    parser.add_argument("--llm-latency", default="lognormal:0.35,0.4", help="LLM first-token latency")
+    parser.add_argument("--token-interval", type=float, default=0.02, help="Seconds between LLM tokens")
+    parser.add_argument("--tts-latency", default="lognormal:0.12,0.3", help="TTS first-byte latency")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for provider latencies")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Memory-per-call benchmark for CallOrchestrator sessions.
+
+Starts N simulated calls on an orchestrator with mocked provider clients,
+measures the Python heap with tracemalloc, then ends every call and checks
+that teardown returns the memory.
+
+Usage:
+    python benchmarks/call_session_memory.py --calls 1000 --buffer-ms 30000
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import sys
+import tracemalloc
+from datetime import datetime, UTC
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.clients.cartesia_tts import CartesiaTTSClient  # noqa: E402
+from src.clients.deepgram_stt import DeepgramSTTClient  # noqa: E402
+from src.clients.openai_llm import OpenAILLMClient  # noqa: E402
+from src.orchestrator import CallOrchestrator, CallContext  # noqa: E402
+
+
+def build_orchestrator(calls: int, buffer_ms: int) -> CallOrchestrator:
+    """Create an orchestrator with mocked clients sized for the benchmark."""
+    settings = SimpleNamespace(
+        context_window_size=4000,
+        cartesia_voice_id="benchmark_voice",
+        audio_sample_rate=16000
+    )
+    with patch("src.orchestrator.get_settings", return_value=settings):
+        return CallOrchestrator(
+            stt_client=AsyncMock(spec=DeepgramSTTClient),
+            llm_client=AsyncMock(spec=OpenAILLMClient),
+            tts_client=AsyncMock(spec=CartesiaTTSClient),
+            max_concurrent_calls=calls,
+            max_buffered_audio_ms=buffer_ms
+        )
+
+
+async def run(calls: int, buffer_ms: int) -> None:
+    orchestrator = build_orchestrator(calls, buffer_ms)
+    contexts = [
+        CallContext(
+            call_id=f"bench-{index}",
+            caller_number="+15550000000",
+            start_time=datetime.now(UTC),
+            livekit_room=f"room-{index}"
+        )
+        for index in range(calls)
+    ]
+    
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    
+    for context in contexts:
+        await orchestrator.handle_call_start(context)
+    
+    gc.collect()
+    active, peak = tracemalloc.get_traced_memory()
+    buffer_bytes = sum(
+        session.audio_buffer.allocated + session.spare_buffer.allocated
+        for session in orchestrator.sessions.values()
+    )
+    
+    for context in contexts:
+        await orchestrator.handle_call_end(context)
+    
+    gc.collect()
+    after_teardown, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    started = len(contexts)
+    per_call = (active - baseline) / started
+    print(f"calls started:            {started}")
+    print(f"inbound buffer duration:  {buffer_ms} ms")
+    print(f"heap per call:            {per_call / 1024:.1f} KiB")
+    print(f"  audio buffers:          {buffer_bytes / started / 1024:.1f} KiB")
+    print(f"  session state:          {(active - baseline - buffer_bytes) / started / 1024:.1f} KiB")
+    print(f"peak heap:                {(peak - baseline) / 1024 / 1024:.1f} MiB")
+    print(f"retained after teardown:  {(after_teardown - baseline) / 1024:.1f} KiB")
+    print(f"sessions left:            {len(orchestrator.sessions)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000, help="Number of simulated calls")
+    parser.add_argument(
+        "--buffer-ms",
+        type=int,
+        default=30000,
+        help="Maximum inbound audio buffered per call"
+    )
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.calls, args.buffer_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Microbenchmark for preparing LLM requests from a long conversation.
+
+Plays a conversation of N turns and, before each reply, prepares the
+request the way the client did before (rebuild every message dict and
+re-estimate every message's tokens) and with the context's incremental
+view and running total. Both use the 4-characters-per-token estimate, so
+the difference is list building and re-counting, not tokenizer speed.
+Also times history optimization at the final length: re-adding the kept
+messages one at a time versus dropping the oldest in place.
+
+Usage:
+    python benchmarks/context_messages.py --turns 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.clients.openai_llm import ConversationContext, MessageRole  # noqa: E402
+from src.clients.token_counter import TokenCounter  # noqa: E402
+
+SYSTEM_PROMPT = "You are a friendly phone agent for a dental clinic. Keep answers short."
+
+
+def rebuild_request(context: ConversationContext) -> int:
+    """Request preparation as it was: fresh dicts and a full re-estimate."""
+    messages: List[Dict[str, str]] = [{"role": "system", "content": context.system_prompt}]
+    for message in context.messages:
+        messages.append({"role": message.role.value, "content": message.content})
+    return sum(len(message["role"]) // 4 + len(message["content"]) // 4 + 4 for message in messages)
+
+
+def incremental_request(context: ConversationContext) -> int:
+    context.get_messages_for_api()
+    return context.token_count
+
+
+def play(turns: int, prepare: Callable[[ConversationContext], int]) -> float:
+    """Seconds spent preparing requests over a whole conversation."""
+    context = ConversationContext("bench", system_prompt=SYSTEM_PROMPT, token_counter=TokenCounter())
+    spent = 0.0
+    for turn in range(turns):
+        context.add_message(MessageRole.USER, f"Turn {turn}: could I move my appointment to Thursday afternoon?")
+        start = time.perf_counter()
+        prepare(context)
+        spent += time.perf_counter() - start
+        context.add_message(MessageRole.ASSISTANT, f"Of course. Thursday at {turn % 8 + 1} pm is free, shall I book it?")
+    return spent
+
+
+def conversation(turns: int) -> ConversationContext:
+    context = ConversationContext("bench", system_prompt=SYSTEM_PROMPT, token_counter=TokenCounter())
+    for turn in range(turns):
+        context.add_message(MessageRole.USER, f"Turn {turn}: could I move my appointment?")
+        context.add_message(MessageRole.ASSISTANT, f"Of course, Thursday at {turn % 8 + 1} pm is free.")
+    return context
+
+
+def time_optimize(turns: int, keep: int, repeats: int) -> None:
+    readd = 0.0
+    drop = 0.0
+    for _ in range(repeats):
+        context = conversation(turns)
+        kept = context.get_messages_for_api()[-keep:]
+        start = time.perf_counter()
+        context.messages = []
+        for message in kept:
+            context.add_message(MessageRole(message["role"]), message["content"])
+        readd += time.perf_counter() - start
+        
+        context = conversation(turns)
+        # Count tokens up front so only the drop itself is timed
+        _ = context.token_count
+        start = time.perf_counter()
+        context.drop_oldest(len(context.messages) - keep)
+        drop += time.perf_counter() - start
+    print(f"optimize history, keep {keep} of {turns * 2} messages:")
+    print(f"  re-add kept messages: {readd / repeats * 1e6:8.1f} us")
+    print(f"  drop oldest in place: {drop / repeats * 1e6:8.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200, help="Conversation length in turns")
+    parser.add_argument("--repeats", type=int, default=20, help="Conversations played per variant")
+    args = parser.parse_args()
+    
+    for name, prepare in (("rebuild per request", rebuild_request), ("incremental view", incremental_request)):
+        spent = min(play(args.turns, prepare) for _ in range(args.repeats))
+        print(f"{name}:")
+        print(f"  per request, mean over {args.turns} turns: {spent / args.turns * 1e6:8.1f} us")
+    
+    time_optimize(args.turns, keep=args.turns // 2, repeats=args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Deterministic in-process STT, LLM and TTS clients for load testing.
+
+The fakes implement the parts of DeepgramSTTClient, OpenAILLMClient and
+CartesiaTTSClient that CallOrchestrator and DialogueManager use. They
+answer from canned text with latencies drawn from seeded distributions,
+so a replay run is repeatable and needs no network access or API keys.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from src.clients.cartesia_tts import AudioFormat, TTSResponse
+from src.clients.deepgram_stt import TranscriptionResult
+from src.clients.openai_llm import ConversationContext, LLMResponse, TokenUsage
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """
+    Latency distribution of a fake provider, in seconds.
+    
+    Specs are "fixed:0.2", "uniform:0.1,0.4" or "lognormal:0.3,0.5", where
+    the lognormal parameters are the median and sigma of the log.
+    """
+    kind: str
+    params: tuple
+    
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        Parse a latency spec.
+        
+        Args:
+            spec: Distribution spec
+        
+        Returns:
+            LatencyModel
+        
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        kind, _, values = spec.partition(":")
+        params = tuple(float(value) for value in values.split(",") if value)
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}.get(kind)
+        if expected is None or len(params) != expected:
+            raise ValueError(f"Invalid latency spec '{spec}'")
+        return cls(kind, params)
+    
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency."""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        median, sigma = self.params
+        return rng.lognormvariate(0.0, sigma) * median
+
+
+def _health_status(service: str) -> Dict[str, Any]:
+    return {"service": service, "circuit_breaker_state": "closed", "healthy": True}
+
+
+class FakeSTTClient:
+    """Speech-to-text fake that returns scripted transcripts in turn."""
+    
+    def __init__(self, latency: LatencyModel, transcripts: Sequence[str], seed: int = 0):
+        self.latency = latency
+        self.transcripts = list(transcripts)
+        self.streaming_config = SimpleNamespace(language="en-US")
+        self._rng = random.Random(seed)
+        self._next = 0
+        # Finalize requests per open stream, as the byte offset they cover
+        self._finalize_requests: Dict[str, asyncio.Queue] = {}
+        self._received: Dict[str, int] = {}
+    
+    def _result(
+        self,
+        audio_bytes: int,
+        is_final: bool = True,
+        start_bytes: int = 0,
+        from_finalize: bool = False
+    ) -> TranscriptionResult:
+        text = self.transcripts[self._next % len(self.transcripts)]
+        if is_final:
+            self._next += 1
+        return TranscriptionResult(
+            text=text,
+            confidence=0.95,
+            language="en-US",
+            duration=audio_bytes / 32000,
+            is_final=is_final,
+            start_time=start_bytes / 32000,
+            end_time=(start_bytes + audio_bytes) / 32000,
+            metadata={"from_finalize": from_finalize}
+        )
+    
+    async def transcribe_batch(
+        self,
+        audio_data: bytes,
+        mimetype: str = "audio/wav",
+        options: Optional[Dict[str, Any]] = None
+    ) -> TranscriptionResult:
+        await asyncio.sleep(self.latency.sample(self._rng))
+        return self._result(len(audio_data))
+    
+    async def transcribe_stream(
+        self,
+        audio_stream: AsyncIterator[bytes],
+        connection_id: Optional[str] = None
+    ) -> AsyncIterator[TranscriptionResult]:
+        """
+        Answer each finalize request with a final covering the audio since
+        the previous one, and the end of the stream with one for the rest.
+        """
+        connection_id = connection_id or "replay"
+        requests: asyncio.Queue = asyncio.Queue()
+        self._finalize_requests[connection_id] = requests
+        self._received[connection_id] = 0
+        
+        async def receive() -> None:
+            async for chunk in audio_stream:
+                self._received[connection_id] += len(chunk)
+            await requests.put(None)
+        
+        receiver = asyncio.create_task(receive())
+        covered = 0
+        try:
+            while True:
+                offset = await requests.get()
+                end = self._received[connection_id] if offset is None else offset
+                if end > covered:
+                    await asyncio.sleep(self.latency.sample(self._rng))
+                    yield self._result(end - covered, start_bytes=covered, from_finalize=offset is not None)
+                    covered = end
+                if offset is None:
+                    break
+        finally:
+            receiver.cancel()
+            del self._finalize_requests[connection_id]
+            del self._received[connection_id]
+    
+    async def finalize_stream(self, connection_id: str) -> bool:
+        requests = self._finalize_requests.get(connection_id)
+        if requests is None:
+            return False
+        requests.put_nowait(self._received[connection_id])
+        return True
+    
+    async def health_check(self) -> bool:
+        return True
+    
+    def get_health_status(self) -> Dict[str, Any]:
+        return _health_status("deepgram_stt")
+    
+    async def close(self) -> None:
+        pass
+
+
+class FakeLLMClient:
+    """Language model fake that streams a canned response word by word."""
+    
+    def __init__(
+        self,
+        first_token_latency: LatencyModel,
+        token_interval: float,
+        responses: Sequence[str],
+        seed: int = 0
+    ):
+        self.first_token_latency = first_token_latency
+        self.token_interval = token_interval
+        self.responses = list(responses)
+        self._rng = random.Random(seed)
+        self._next = 0
+    
+    def _next_response(self) -> str:
+        response = self.responses[self._next % len(self.responses)]
+        self._next += 1
+        return response
+    
+    def create_conversation_context(
+        self,
+        conversation_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> ConversationContext:
+        return ConversationContext(
+            conversation_id=conversation_id or "replay",
+            system_prompt=system_prompt,
+            max_tokens=max_tokens or 4000
+        )
+    
+    async def generate_response(
+        self,
+        context: ConversationContext,
+        correlation_id: Optional[str] = None,
+        use_cache: bool = True
+    ) -> LLMResponse:
+        start = time.time()
+        content = self._next_response()
+        words = content.split()
+        await asyncio.sleep(self.first_token_latency.sample(self._rng) + self.token_interval * len(words))
+        return LLMResponse(
+            content=content,
+            token_usage=TokenUsage(completion_tokens=len(words), total_tokens=len(words)),
+            model="replay",
+            finish_reason="stop",
+            response_time=time.time() - start
+        )
+    
+    async def stream_response(
+        self,
+        context: ConversationContext,
+        correlation_id: Optional[str] = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        words = self._next_response().split()
+        await asyncio.sleep(self.first_token_latency.sample(self._rng))
+        for index, word in enumerate(words):
+            yield word if index == 0 else f" {word}"
+            await asyncio.sleep(self.token_interval)
+    
+    def generate_fallback_response(self, error_type: str = "general") -> LLMResponse:
+        return LLMResponse(
+            content="Sorry, could you repeat that?",
+            token_usage=TokenUsage(),
+            model="fallback",
+            finish_reason="fallback",
+            response_time=0.0
+        )
+    
+    def calculate_context_tokens(self, messages: Union[ConversationContext, List[Dict[str, str]]]) -> int:
+        if isinstance(messages, ConversationContext):
+            return messages.token_count
+        return sum(len(message["content"]) // 4 + 4 for message in messages)
+    
+    def optimize_conversation_history(self, context: ConversationContext) -> None:
+        pass
+    
+    def get_token_usage_summary(self) -> Dict[str, Any]:
+        return {}
+    
+    async def health_check(self) -> bool:
+        return True
+    
+    def get_health_status(self) -> Dict[str, Any]:
+        return _health_status("openai_llm")
+    
+    async def close(self) -> None:
+        pass
+
+
+class FakeTTSClient:
+    """
+    Text-to-speech fake producing silent PCM16.
+    
+    Audio lasts seconds_per_word per word and streams in chunk_ms chunks,
+    generated faster than real time like a real provider.
+    """
+    
+    def __init__(
+        self,
+        first_byte_latency: LatencyModel,
+        sample_rate: int = 16000,
+        seconds_per_word: float = 0.3,
+        chunk_ms: int = 100,
+        realtime_factor: float = 0.2,
+        seed: int = 0
+    ):
+        self.first_byte_latency = first_byte_latency
+        self.sample_rate = sample_rate
+        self.seconds_per_word = seconds_per_word
+        self.chunk_ms = chunk_ms
+        self.realtime_factor = realtime_factor
+        self._rng = random.Random(seed)
+    
+    def _audio(self, text: str) -> bytes:
+        seconds = max(1, len(text.split())) * self.seconds_per_word
+        return bytes(int(seconds * self.sample_rate) * 2)
+    
+    async def synthesize_batch(
+        self,
+        text: str,
+        voice_config: Any = None,
+        audio_config: Any = None,
+        correlation_id: Optional[str] = None
+    ) -> TTSResponse:
+        start = time.time()
+        audio = self._audio(text)
+        duration = len(audio) / (self.sample_rate * 2)
+        await asyncio.sleep(self.first_byte_latency.sample(self._rng) + duration * self.realtime_factor)
+        return TTSResponse(
+            audio_data=audio,
+            duration=duration,
+            format=AudioFormat.RAW,
+            sample_rate=self.sample_rate,
+            characters_processed=len(text),
+            synthesis_time=time.time() - start
+        )
+    
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice_config: Any = None,
+        audio_config: Any = None,
+        correlation_id: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        audio = self._audio(text)
+        chunk_bytes = self.sample_rate * self.chunk_ms // 1000 * 2
+        await asyncio.sleep(self.first_byte_latency.sample(self._rng))
+        for offset in range(0, len(audio), chunk_bytes):
+            yield audio[offset:offset + chunk_bytes]
+            await asyncio.sleep(self.chunk_ms / 1000 * self.realtime_factor)
+    
+    async def health_check(self) -> bool:
+        return True
+    
+    def get_health_status(self) -> Dict[str, Any]:
+        return _health_status("cartesia_tts")
+    
+    async def close(self) -> None:
+        pass
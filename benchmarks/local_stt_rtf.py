@@ -0,0 +1,92 @@
+"""
+Real-time factor and throughput benchmark for the local STT fallback.
+
+Transcribes N utterances through LocalWhisperSTT with the given number of
+workers and reports the model load time, the real-time factor of each
+transcription (compute seconds per audio second; below 1.0 keeps up with
+a caller) and the aggregate throughput in audio seconds per wall second.
+Uses a WAV file if given, otherwise synthetic 8 kHz audio, which measures
+compute cost but not accuracy. Needs faster-whisper
+(pip install 'voice-ai-agent[local-stt]') and the model, which is
+downloaded on first use unless --model names a local directory.
+
+Usage:
+    python benchmarks/local_stt_rtf.py --model tiny.en --utterances 8 --workers 2 [--wav call.wav]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.audio.codec import AudioFormatSpec, wrap_wav  # noqa: E402
+from src.clients.deepgram_stt import StreamingConfig  # noqa: E402
+from src.clients.local_stt import LocalWhisperSTT  # noqa: E402
+from src.metrics import MetricsCollector  # noqa: E402
+
+
+def synthetic_utterance(seconds: float, sample_rate: int = 8000) -> bytes:
+    """Telephone-rate WAV with a voiced-like harmonic signal and noise."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 120 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    signal = sum(np.sin(2 * np.pi * pitch * harmonic * t) / harmonic for harmonic in range(1, 6))
+    signal = signal * (0.5 + 0.5 * np.sin(2 * np.pi * 2 * t)) + 0.05 * rng.standard_normal(len(t))
+    pcm = (signal / np.max(np.abs(signal)) * 12000).astype(np.int16).tobytes()
+    return wrap_wav(pcm, AudioFormatSpec(sample_rate=sample_rate))
+
+
+async def run(args: argparse.Namespace) -> None:
+    audio = Path(args.wav).read_bytes() if args.wav else synthetic_utterance(args.seconds)
+    engine = LocalWhisperSTT(
+        model_size=args.model,
+        streaming_config=StreamingConfig(sample_rate=8000),
+        workers=args.workers,
+        cpu_threads=args.cpu_threads,
+        metrics_collector=MetricsCollector()
+    )
+    try:
+        start = time.perf_counter()
+        try:
+            await engine.warm_up()
+        except ImportError as e:
+            sys.exit(str(e))
+        print(f"model {args.model}: loaded in {time.perf_counter() - start:.2f}s, "
+              f"{engine.workers} workers x {engine.cpu_threads} threads")
+        
+        # One untimed pass so first-call allocation is not counted
+        await engine.transcribe_batch(audio)
+        
+        start = time.perf_counter()
+        results = await asyncio.gather(*(engine.transcribe_batch(audio) for _ in range(args.utterances)))
+        wall = time.perf_counter() - start
+    finally:
+        await engine.close()
+    
+    factors = sorted(result.metadata["real_time_factor"] for result in results)
+    audio_seconds = sum(result.end_time for result in results)
+    print(f"{args.utterances} utterances of {results[0].end_time:.1f}s audio")
+    print(f"  real-time factor: median {statistics.median(factors):.3f}, max {factors[-1]:.3f}")
+    print(f"  throughput:       {audio_seconds / wall:.1f} audio s per wall s")
+    print(f"  sample text:      {results[0].text[:60]!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="tiny.en", help="faster-whisper model name or directory")
+    parser.add_argument("--utterances", type=int, default=8, help="Transcriptions in the timed run")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel transcriptions")
+    parser.add_argument("--cpu-threads", type=int, default=None, help="Threads per transcription")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of the synthetic utterance")
+    parser.add_argument("--wav", default=None, help="WAV file to transcribe instead of synthetic audio")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Allocation benchmark for word-level transcription data.
+
+Builds the words of N streaming results the way the Deepgram client did
+before (one dict per word) and with WordTimings, and reports the Python
+heap and allocation count of each with tracemalloc.
+
+Usage:
+    python benchmarks/word_timings.py --results 3000 --words 12
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.clients.deepgram_stt import WordTimings  # noqa: E402
+
+
+def make_results(results: int, words: int) -> List[List[Any]]:
+    """Provider word objects for each result, as the SDK hands them over."""
+    return [
+        [
+            SimpleNamespace(word=f"word{index}", start=index * 0.3, end=index * 0.3 + 0.25, confidence=0.9)
+            for index in range(words)
+        ]
+        for _ in range(results)
+    ]
+
+
+def as_dicts(words: List[Any]) -> List[dict]:
+    return [
+        {
+            "word": word.word,
+            "start": word.start,
+            "end": word.end,
+            "confidence": word.confidence
+        }
+        for word in words
+    ]
+
+
+def measure(build: Callable[[List[Any]], Any], provider_words: List[List[Any]]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    before = tracemalloc.take_snapshot()
+    
+    start = time.perf_counter()
+    built = [build(words) for words in provider_words]
+    elapsed = time.perf_counter() - start
+    
+    retained, _ = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    count = len(built)
+    print(f"  heap per result:        {(retained - baseline) / count:.0f} B")
+    print(f"  live blocks per result: {allocations / count:.1f}")
+    print(f"  build time per result:  {elapsed / count * 1e6:.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--results", type=int, default=3000, help="Number of results (~1 call-minute of interims is 600)")
+    parser.add_argument("--words", type=int, default=12, help="Words per result")
+    args = parser.parse_args()
+    
+    provider_words = make_results(args.results, args.words)
+    print(f"{args.results} results x {args.words} words")
+    print("list of dicts:")
+    measure(as_dicts, provider_words)
+    print("WordTimings:")
+    measure(WordTimings.from_words, provider_words)
+
+
+if __name__ == "__main__":
+    main()
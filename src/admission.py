@@ -0,0 +1,343 @@
+"""
+Adaptive admission control for incoming calls.
+
+This module implements the AdmissionController class that decides whether a
+new call can be accepted. Instead of a fixed concurrency cap, the limit is
+adjusted from rolling provider latency percentiles and circuit-breaker
+state, so new calls are shed (or briefly queued) before overload pushes
+every active caller past the response-latency budget.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.metrics import get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+
+class RejectionReason(str, Enum):
+    """Why a call was not admitted."""
+    AT_CAPACITY = "max_concurrent_calls_reached"
+    LATENCY_SLA = "latency_sla_breach"
+    PROVIDER_UNAVAILABLE = "provider_unavailable"
+    QUEUE_FULL = "admission_queue_full"
+    QUEUE_TIMEOUT = "admission_queue_timeout"
+
+
+@dataclass
+class AdmissionDecision:
+    """Result of an admission request."""
+    admitted: bool
+    limit: int
+    reason: Optional[RejectionReason] = None
+    wait_time: float = 0.0
+
+
+@dataclass
+class AdmissionConfig:
+    """Configuration for adaptive admission control."""
+    min_limit: int = 1
+    stt_p95_target: float = 0.3
+    llm_p95_target: float = 0.8
+    tts_p95_target: float = 0.4
+    window_size: int = 200
+    min_samples: int = 20
+    adjust_interval: float = 5.0
+    increase_step: int = 1
+    decrease_factor: float = 0.75
+    headroom: float = 0.8
+    queue_size: int = 0
+    queue_timeout: float = 5.0
+    
+    @classmethod
+    def from_latency_budget(cls, budget: float, **kwargs: Any) -> "AdmissionConfig":
+        """
+        Split an end-to-end response latency budget into per-service targets.
+        
+        Args:
+            budget: Maximum response latency in seconds
+            **kwargs: Other AdmissionConfig fields
+        
+        Returns:
+            AdmissionConfig instance
+        """
+        return cls(
+            stt_p95_target=budget * 0.2,
+            llm_p95_target=budget * 0.55,
+            tts_p95_target=budget * 0.25,
+            **kwargs
+        )
+    
+    def latency_target(self, service: str) -> float:
+        """Get the p95 latency target for a service."""
+        return getattr(self, f"{service}_p95_target")
+
+
+class LatencyWindow:
+    """Rolling window of latency samples."""
+    
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+    
+    def add(self, latency: float) -> None:
+        self.samples.append(latency)
+    
+    def __len__(self) -> int:
+        return len(self.samples)
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """Nearest-rank percentile, or None without samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+
+class AdmissionController:
+    """
+    Adaptive concurrency limit for new calls.
+    
+    The limit follows AIMD: when any provider's p95 latency exceeds its
+    target (or its circuit breaker is half-open) the limit is cut by
+    decrease_factor; when every provider is comfortably under target it
+    grows by increase_step, up to max_limit. While a provider's circuit
+    breaker is open, new calls are rejected outright.
+    
+    Calls over the limit are rejected with a RejectionReason, or wait in a
+    bounded FIFO queue for a free slot when queue_size > 0.
+    """
+    
+    SERVICES = ("stt", "llm", "tts")
+    
+    def __init__(
+        self,
+        max_limit: int,
+        config: Optional[AdmissionConfig] = None,
+        clients: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the admission controller.
+        
+        Args:
+            max_limit: Upper bound for the concurrency limit
+            config: Admission configuration
+            clients: Service clients by name ("stt", "llm", "tts") whose
+                get_health_status() reports circuit-breaker state
+        """
+        self.config = config or AdmissionConfig()
+        self.max_limit = max_limit
+        self.min_limit = max(1, min(self.config.min_limit, max_limit))
+        self.clients = clients or {}
+        
+        self.limit = max_limit
+        self.latency_windows: Dict[str, LatencyWindow] = {
+            service: LatencyWindow(self.config.window_size) for service in self.SERVICES
+        }
+        
+        self._admitted: set = set()
+        self._waiters: Deque[Tuple[str, asyncio.Future]] = deque()
+        self._last_adjust = time.monotonic()
+        self.rejections: Dict[str, int] = {reason.value: 0 for reason in RejectionReason}
+        self.metrics_collector = get_metrics_collector()
+    
+    @property
+    def active(self) -> int:
+        """Number of currently admitted calls."""
+        return len(self._admitted)
+    
+    def record_latency(self, service: str, latency: float) -> None:
+        """
+        Record a provider latency sample.
+        
+        Args:
+            service: Service name ("stt", "llm" or "tts")
+            latency: Latency in seconds
+        """
+        window = self.latency_windows.get(service)
+        if window is not None:
+            window.add(latency)
+    
+    def open_circuits(self) -> List[str]:
+        """Get the services whose circuit breaker is currently open."""
+        return [
+            service for service in self.SERVICES
+            if self._circuit_state(service) == "open"
+        ]
+    
+    def adjust_limit(self) -> int:
+        """
+        Re-evaluate the concurrency limit from latency and breaker state.
+        
+        Returns:
+            The new limit
+        """
+        self._last_adjust = time.monotonic()
+        previous = self.limit
+        
+        overloaded = []
+        within_headroom = True
+        for service in self.SERVICES:
+            if self._circuit_state(service) == "half_open":
+                overloaded.append(service)
+                continue
+            
+            window = self.latency_windows[service]
+            if len(window) < self.config.min_samples:
+                continue
+            
+            p95 = window.percentile(95)
+            target = self.config.latency_target(service)
+            if p95 > target:
+                overloaded.append(service)
+            elif p95 > target * self.config.headroom:
+                within_headroom = False
+        
+        if overloaded:
+            self.limit = max(self.min_limit, int(self.limit * self.config.decrease_factor))
+        elif within_headroom:
+            self.limit = min(self.max_limit, self.limit + self.config.increase_step)
+        
+        if self.limit != previous:
+            logger.info(
+                f"Admission limit changed from {previous} to {self.limit}",
+                extra={
+                    "previous_limit": previous,
+                    "limit": self.limit,
+                    "overloaded_services": overloaded
+                }
+            )
+            self.metrics_collector.set_gauge("admission_concurrency_limit", self.limit)
+            self._wake_waiters()
+        
+        return self.limit
+    
+    async def acquire(self, call_id: str) -> AdmissionDecision:
+        """
+        Request admission for a new call.
+        
+        Args:
+            call_id: Call identifier
+        
+        Returns:
+            AdmissionDecision; admitted calls must be released with release()
+        """
+        if time.monotonic() - self._last_adjust >= self.config.adjust_interval:
+            self.adjust_limit()
+        
+        if self.open_circuits():
+            return self._reject(RejectionReason.PROVIDER_UNAVAILABLE)
+        
+        if self.active < self.limit and not self._waiters:
+            self._admitted.add(call_id)
+            return AdmissionDecision(admitted=True, limit=self.limit)
+        
+        if self.config.queue_size <= 0:
+            return self._reject(self._capacity_reason())
+        if len(self._waiters) >= self.config.queue_size:
+            return self._reject(RejectionReason.QUEUE_FULL)
+        
+        future = asyncio.get_running_loop().create_future()
+        entry = (call_id, future)
+        self._waiters.append(entry)
+        wait_start = time.monotonic()
+        
+        try:
+            await asyncio.wait_for(future, self.config.queue_timeout)
+        except asyncio.TimeoutError:
+            return self._reject(RejectionReason.QUEUE_TIMEOUT, time.monotonic() - wait_start)
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before the cancellation landed; the caller
+                # never sees the decision, so it cannot release the slot
+                self.release(call_id)
+            raise
+        finally:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+        
+        return AdmissionDecision(
+            admitted=True,
+            limit=self.limit,
+            wait_time=time.monotonic() - wait_start
+        )
+    
+    def would_queue(self) -> bool:
+        """
+        Whether acquire() would currently wait for a slot instead of deciding at once.
+        
+        Returns:
+            True if a new call would be put in the admission queue
+        """
+        if self.config.queue_size <= 0 or len(self._waiters) >= self.config.queue_size:
+            return False
+        if self.open_circuits():
+            return False
+        return self.active >= self.limit or bool(self._waiters)
+    
+    def release(self, call_id: str) -> None:
+        """
+        Release the slot held by a call; unknown call IDs are ignored.
+        
+        Args:
+            call_id: Call identifier
+        """
+        if call_id in self._admitted:
+            self._admitted.discard(call_id)
+            self._wake_waiters()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get admission controller status."""
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "active": self.active,
+            "queued": len(self._waiters),
+            "open_circuits": self.open_circuits(),
+            "p95_latency": {
+                service: window.percentile(95)
+                for service, window in self.latency_windows.items()
+            },
+            "rejections": dict(self.rejections)
+        }
+    
+    def _capacity_reason(self) -> RejectionReason:
+        """Distinguish the configured cap from a latency-driven reduction."""
+        if self.limit < self.max_limit:
+            return RejectionReason.LATENCY_SLA
+        return RejectionReason.AT_CAPACITY
+    
+    def _reject(self, reason: RejectionReason, wait_time: float = 0.0) -> AdmissionDecision:
+        self.rejections[reason.value] += 1
+        return AdmissionDecision(
+            admitted=False,
+            limit=self.limit,
+            reason=reason,
+            wait_time=wait_time
+        )
+    
+    def _wake_waiters(self) -> None:
+        """Admit queued calls, oldest first, while there is capacity."""
+        while self._waiters and self.active < self.limit:
+            call_id, future = self._waiters.popleft()
+            if future.done():
+                continue
+            self._admitted.add(call_id)
+            future.set_result(True)
+    
+    def _circuit_state(self, service: str) -> Optional[str]:
+        """Read a client's circuit breaker state from its health status."""
+        client = self.clients.get(service)
+        if client is None:
+            return None
+        try:
+            return client.get_health_status().get("circuit_breaker_state")
+        except Exception:
+            return None
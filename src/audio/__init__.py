@@ -0,0 +1,38 @@
+"""Audio processing package for the Voice AI Agent."""
+
+from .vad import VoiceActivityDetector, VADConfig, VADEvent
+from .ring_buffer import AudioRingBuffer, OverflowPolicy
+from .outbound import (
+    AudioSink,
+    FramePacketizer,
+    OutboundAudioConfig,
+    OutboundAudioStats,
+    OutboundAudioStream
+)
+from .codec import (
+    AudioFormatSpec,
+    AudioTranscoder,
+    Codec,
+    transcoding_sink,
+    unwrap_wav,
+    wrap_wav
+)
+
+__all__ = [
+    "VoiceActivityDetector",
+    "VADConfig",
+    "VADEvent",
+    "AudioRingBuffer",
+    "OverflowPolicy",
+    "AudioSink",
+    "FramePacketizer",
+    "OutboundAudioConfig",
+    "OutboundAudioStats",
+    "OutboundAudioStream",
+    "AudioFormatSpec",
+    "AudioTranscoder",
+    "Codec",
+    "transcoding_sink",
+    "unwrap_wav",
+    "wrap_wav"
+]
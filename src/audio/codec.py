@@ -0,0 +1,495 @@
+"""
+Audio format conversion for the call pipeline.
+
+This module implements G.711 μ-law/A-law decoding and encoding, PCM16
+resampling and WAV framing, all vectorized with NumPy/SciPy. The
+AudioTranscoder class chains them so caller audio can be converted to the
+pipeline's PCM16 format before VAD and STT, and TTS output can be converted
+to the call's negotiated format before it is sent.
+"""
+
+import logging
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from math import gcd
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from scipy.signal import firwin, resample_poly
+
+from src.audio.outbound import AudioSink
+
+
+logger = logging.getLogger(__name__)
+
+
+class Codec(str, Enum):
+    """Sample encodings supported by the transcoder."""
+    PCM16 = "pcm16"
+    MULAW = "mulaw"
+    ALAW = "alaw"
+
+
+# SIP/RTP codec names (as in livekit-sip.yaml) mapped to sample encodings
+SIP_CODECS: Dict[str, Codec] = {
+    "PCMU": Codec.MULAW,
+    "PCMA": Codec.ALAW,
+    "L16": Codec.PCM16
+}
+
+# WAVE format tags
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_ALAW = 6
+WAVE_FORMAT_MULAW = 7
+
+_WAVE_FORMATS = {
+    Codec.PCM16: WAVE_FORMAT_PCM,
+    Codec.ALAW: WAVE_FORMAT_ALAW,
+    Codec.MULAW: WAVE_FORMAT_MULAW
+}
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+@dataclass(frozen=True)
+class AudioFormatSpec:
+    """Encoding, sample rate and channel count of an audio stream."""
+    codec: Codec = Codec.PCM16
+    sample_rate: int = 16000
+    channels: int = 1
+    
+    @classmethod
+    def for_sip_codec(cls, name: str, sample_rate: int, channels: int = 1) -> Optional["AudioFormatSpec"]:
+        """
+        Build a spec for a SIP codec name.
+        
+        Args:
+            name: Codec name such as "PCMU" or "PCMA"
+            sample_rate: Codec sample rate in Hz
+            channels: Number of channels
+        
+        Returns:
+            AudioFormatSpec, or None if the codec cannot be transcoded
+        """
+        codec = SIP_CODECS.get(name.upper())
+        if codec is None:
+            return None
+        return cls(codec=codec, sample_rate=sample_rate, channels=channels)
+    
+    @property
+    def sample_width(self) -> int:
+        """Bytes per sample."""
+        return 2 if self.codec is Codec.PCM16 else 1
+    
+    @property
+    def bytes_per_second(self) -> int:
+        """Data rate of the stream."""
+        return self.sample_rate * self.channels * self.sample_width
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "codec": self.codec.value,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels
+        }
+
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    values = ~np.arange(256, dtype=np.int32) & 0xFF
+    magnitude = (((values & 0x0F) << 3) + 0x84) << ((values & 0x70) >> 4)
+    return np.where(values & 0x80, 0x84 - magnitude, magnitude - 0x84).astype(np.int16)
+
+
+def _build_alaw_decode_table() -> np.ndarray:
+    values = np.arange(256, dtype=np.int32) ^ 0x55
+    segment = (values & 0x70) >> 4
+    magnitude = (values & 0x0F) << 4
+    magnitude = np.where(
+        segment == 0,
+        magnitude + 8,
+        (magnitude + 0x108) << np.maximum(segment - 1, 0)
+    )
+    return np.where(values & 0x80, magnitude, -magnitude).astype(np.int16)
+
+
+def _all_pcm16_samples() -> np.ndarray:
+    """Every int16 value, ordered so index == value viewed as uint16."""
+    return np.arange(65536, dtype=np.uint32).astype(np.uint16).view(np.int16).astype(np.int32)
+
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    pcm = _all_pcm16_samples() >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    pcm = np.minimum(np.abs(pcm), 8159) + 0x21
+    segment = np.searchsorted(
+        np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]),
+        pcm
+    )
+    encoded = (segment << 4) | ((pcm >> (segment + 1)) & 0x0F)
+    encoded = np.where(segment >= 8, 0x7F, encoded)
+    return (encoded ^ mask).astype(np.uint8)
+
+
+def _build_alaw_encode_table() -> np.ndarray:
+    pcm = _all_pcm16_samples() >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    pcm = np.where(pcm >= 0, pcm, -pcm - 1)
+    segment = np.searchsorted(
+        np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]),
+        pcm
+    )
+    encoded = (segment << 4) | np.where(
+        segment < 2,
+        (pcm >> 1) & 0x0F,
+        (pcm >> np.maximum(segment, 1)) & 0x0F
+    )
+    encoded = np.where(segment >= 8, 0x7F, encoded)
+    return (encoded ^ mask).astype(np.uint8)
+
+
+# G.711 lookup tables: decoding indexes by code byte, encoding by PCM16 value
+_ULAW_DECODE = _build_ulaw_decode_table()
+_ALAW_DECODE = _build_alaw_decode_table()
+_ULAW_ENCODE = _build_ulaw_encode_table()
+_ALAW_ENCODE = _build_alaw_encode_table()
+
+
+def decode_samples(data: bytes, codec: Codec) -> np.ndarray:
+    """
+    Decode audio bytes to PCM16 samples.
+    
+    Args:
+        data: Encoded audio; PCM16 input must be little-endian and sample aligned
+        codec: Encoding of data
+    
+    Returns:
+        int16 sample array (a read-only view for PCM16 input)
+    """
+    if codec is Codec.PCM16:
+        return np.frombuffer(data, dtype="<i2")
+    codes = np.frombuffer(data, dtype=np.uint8)
+    table = _ULAW_DECODE if codec is Codec.MULAW else _ALAW_DECODE
+    return table[codes]
+
+
+def encode_samples(samples: np.ndarray, codec: Codec) -> bytes:
+    """
+    Encode PCM16 samples.
+    
+    Args:
+        samples: int16 sample array
+        codec: Target encoding
+    
+    Returns:
+        Encoded audio bytes
+    """
+    samples = np.asarray(samples, dtype=np.int16)
+    if codec is Codec.PCM16:
+        return samples.astype("<i2", copy=False).tobytes()
+    table = _ULAW_ENCODE if codec is Codec.MULAW else _ALAW_ENCODE
+    return table[samples.view(np.uint16)].tobytes()
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int, channels: int = 1) -> np.ndarray:
+    """
+    Resample PCM16 audio with a polyphase filter.
+    
+    Args:
+        samples: Interleaved int16 samples
+        source_rate: Input sample rate in Hz
+        target_rate: Output sample rate in Hz
+        channels: Number of interleaved channels
+    
+    Returns:
+        Interleaved int16 samples at target_rate
+    """
+    if source_rate == target_rate or samples.size == 0:
+        return samples
+    divisor = gcd(source_rate, target_rate)
+    frames = samples.reshape(-1, channels).astype(np.float32)
+    resampled = resample_poly(frames, target_rate // divisor, source_rate // divisor, axis=0)
+    return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16).reshape(-1)
+
+
+class StreamResampler:
+    """
+    Polyphase resampler that carries its filter state from chunk to chunk.
+    
+    It applies the same anti-aliasing filter as resample(), so the output of
+    a stream fed in chunks matches resampling the whole stream at once. Each
+    output sample is produced once all the input it depends on has arrived,
+    so a few samples (half the filter length) wait for the next chunk;
+    flush() releases them at the end of the stream.
+    """
+    
+    def __init__(self, source_rate: int, target_rate: int, channels: int = 1):
+        """
+        Initialize the resampler.
+        
+        Args:
+            source_rate: Input sample rate in Hz
+            target_rate: Output sample rate in Hz
+            channels: Number of interleaved channels
+        """
+        divisor = gcd(source_rate, target_rate)
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+        self.channels = channels
+        
+        # Filter design and alignment as in scipy.signal.resample_poly
+        max_rate = max(self.up, self.down)
+        half_len = 10 * max_rate
+        pre_pad = self.down - half_len % self.down
+        taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * self.up
+        taps = np.concatenate((np.zeros(pre_pad), taps))
+        self._taps_per_phase = -(-len(taps) // self.up)
+        taps = np.concatenate((taps, np.zeros(self._taps_per_phase * self.up - len(taps))))
+        # Row p holds the taps applied to x[n], x[n - 1], ... for output phase p
+        self._phases = taps.reshape(self._taps_per_phase, self.up).T
+        self._delay = (half_len + pre_pad) // self.down
+        
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget buffered input and start a new stream."""
+        self._history = np.zeros((self._taps_per_phase - 1, self.channels))
+        self._consumed = 0
+        self._next_output = 0
+    
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of the stream.
+        
+        Args:
+            samples: Interleaved int16 samples
+        
+        Returns:
+            Interleaved int16 samples at the target rate that are complete
+        """
+        return self._run(samples.reshape(-1, self.channels))
+    
+    def flush(self) -> np.ndarray:
+        """
+        End the stream, returning the output still held back.
+        
+        Returns:
+            Interleaved int16 samples at the target rate
+        """
+        total_output = -(-self._consumed * self.up // self.down)
+        last_output = self._delay + total_output - 1
+        padding = max(0, -(-(last_output + 1) * self.down // self.up) - self._consumed)
+        tail = self._run(np.zeros((padding, self.channels)), last_output)
+        self.reset()
+        return tail
+    
+    def _run(self, frames: np.ndarray, last_output: Optional[int] = None) -> np.ndarray:
+        """Compute every output sample that the input so far fully determines."""
+        first_index = self._consumed - len(self._history)
+        window = np.concatenate((self._history, frames.astype(np.float64)))
+        self._consumed += len(frames)
+        self._history = window[len(window) - len(self._history):]
+        
+        end = (self._consumed * self.up - 1) // self.down + 1
+        if last_output is not None:
+            end = min(end, last_output + 1)
+        outputs = np.arange(max(self._next_output, self._delay), end)
+        self._next_output = max(self._next_output, end)
+        if outputs.size == 0:
+            return np.zeros(0, dtype=np.int16)
+        
+        positions = outputs * self.down
+        newest = positions // self.up - first_index
+        inputs = window[newest[:, None] - np.arange(self._taps_per_phase)[None, :]]
+        resampled = np.einsum("mkc,mk->mc", inputs, self._phases[positions % self.up])
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16).reshape(-1)
+
+
+def convert_channels(samples: np.ndarray, source_channels: int, target_channels: int) -> np.ndarray:
+    """
+    Downmix to mono or duplicate mono across channels.
+    
+    Args:
+        samples: Interleaved int16 samples
+        source_channels: Input channel count
+        target_channels: Output channel count
+    
+    Returns:
+        Interleaved int16 samples with target_channels channels
+    """
+    if source_channels == target_channels:
+        return samples
+    frames = samples.reshape(-1, source_channels).astype(np.int32)
+    mono = frames.mean(axis=1) if source_channels > 1 else frames[:, 0]
+    return np.repeat(mono.astype(np.int16)[:, None], target_channels, axis=1).reshape(-1)
+
+
+def wav_header(data_size: int, spec: AudioFormatSpec) -> bytes:
+    """
+    Build a canonical 44-byte WAV header.
+    
+    Args:
+        data_size: Size of the audio payload in bytes
+        spec: Format of the payload
+    
+    Returns:
+        RIFF/WAVE header bytes
+    """
+    block_align = spec.channels * spec.sample_width
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, _WAVE_FORMATS[spec.codec], spec.channels,
+        spec.sample_rate, spec.sample_rate * block_align, block_align, spec.sample_width * 8,
+        b"data", data_size
+    )
+
+
+def wrap_wav(data: bytes, spec: AudioFormatSpec) -> bytes:
+    """
+    Frame raw audio as a WAV file.
+    
+    Args:
+        data: Bytes-like audio payload
+        spec: Format of the payload
+    
+    Returns:
+        WAV file bytes
+    """
+    return b"".join((wav_header(len(data), spec), data))
+
+
+def unwrap_wav(data: bytes) -> Tuple[memoryview, AudioFormatSpec]:
+    """
+    Locate the audio payload of a WAV file.
+    
+    Args:
+        data: WAV file bytes
+    
+    Returns:
+        Tuple of (zero-copy payload view, payload format)
+    
+    Raises:
+        ValueError: If the data is not a supported WAV file
+    """
+    view = memoryview(data)
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+    
+    spec: Optional[AudioFormatSpec] = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        chunk_size = int.from_bytes(view[offset + 4:offset + 8], "little")
+        body = offset + 8
+        
+        if chunk_id == b"fmt ":
+            format_tag, channels, sample_rate = struct.unpack_from("<HHI", view, body)
+            bits = struct.unpack_from("<H", view, body + 14)[0]
+            codec = {tag: codec for codec, tag in _WAVE_FORMATS.items()}.get(format_tag)
+            if codec is None or (codec is Codec.PCM16 and bits != 16):
+                raise ValueError(f"Unsupported WAV format tag {format_tag} with {bits} bits")
+            spec = AudioFormatSpec(codec=codec, sample_rate=sample_rate, channels=channels)
+        elif chunk_id == b"data":
+            if spec is None:
+                raise ValueError("WAV data chunk before fmt chunk")
+            return view[body:min(body + chunk_size, len(view))], spec
+        
+        offset = body + chunk_size + (chunk_size & 1)
+    
+    raise ValueError("WAV file has no data chunk")
+
+
+class AudioTranscoder:
+    """
+    Convert a stream of audio chunks from one format to another.
+    
+    Chunks are decoded to PCM16, resampled and remixed if needed, then
+    encoded. PCM16 input that is not sample aligned is carried over to the
+    next chunk. Resampling keeps its filter state between chunks, so chunk
+    boundaries leave no discontinuities; it holds back a few samples until
+    the next chunk, which flush() returns at the end of a stream.
+    """
+    
+    def __init__(self, source: AudioFormatSpec, target: AudioFormatSpec):
+        """
+        Initialize the transcoder.
+        
+        Args:
+            source: Format of the input chunks
+            target: Format of the output chunks
+        """
+        self.source = source
+        self.target = target
+        self._frame_bytes = source.sample_width * source.channels
+        self._remainder = b""
+        self._resampler: Optional[StreamResampler] = None
+        if source.sample_rate != target.sample_rate:
+            self._resampler = StreamResampler(source.sample_rate, target.sample_rate, source.channels)
+    
+    @property
+    def is_passthrough(self) -> bool:
+        """Whether input and output formats are identical."""
+        return self.source == self.target
+    
+    def convert(self, data: bytes) -> bytes:
+        """
+        Convert one chunk.
+        
+        Args:
+            data: Bytes-like audio in the source format
+        
+        Returns:
+            Audio in the target format
+        """
+        if self.is_passthrough:
+            return data
+        
+        if self._remainder:
+            data = self._remainder + bytes(data)
+        usable = len(data) - len(data) % self._frame_bytes
+        self._remainder = bytes(data[usable:])
+        if not usable:
+            return b""
+        
+        samples = decode_samples(memoryview(data)[:usable], self.source.codec)
+        if self._resampler is not None:
+            samples = self._resampler.process(samples)
+        samples = convert_channels(samples, self.source.channels, self.target.channels)
+        return encode_samples(samples, self.target.codec)
+    
+    def reset(self) -> None:
+        """Discard carried-over input and resampler state, e.g. when playback is cut off."""
+        self._remainder = b""
+        if self._resampler is not None:
+            self._resampler.reset()
+    
+    def flush(self) -> bytes:
+        """
+        End the stream, returning the audio the resampler still holds.
+        
+        Returns:
+            Audio in the target format
+        """
+        self._remainder = b""
+        if self._resampler is None:
+            return b""
+        samples = convert_channels(self._resampler.flush(), self.source.channels, self.target.channels)
+        return encode_samples(samples, self.target.codec)
+
+
+def transcoding_sink(sink: AudioSink, transcoder: AudioTranscoder) -> AudioSink:
+    """
+    Wrap an audio sink so each frame is transcoded before it is published.
+    
+    Args:
+        sink: Sink expecting audio in the transcoder's target format
+        transcoder: Converter from the frames' format
+    
+    Returns:
+        Sink accepting frames in the transcoder's source format
+    """
+    async def publish(frame: bytes) -> None:
+        await sink(transcoder.convert(frame))
+    
+    return publish
@@ -0,0 +1,349 @@
+"""
+Paced outbound audio delivery.
+
+This module implements the OutboundAudioStream class that takes synthesized
+audio chunks of any size, repacketizes them into fixed-duration PCM16 frames
+and paces them into the caller's audio track through a small jitter buffer.
+Underruns and overruns are counted so caller-perceived latency and
+smoothness can be measured and the buffer depth tuned.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from src.metrics import get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+
+# Receives one fixed-size PCM16 frame at a time, e.g. a LiveKit audio source
+AudioSink = Callable[[bytes], Awaitable[None]]
+
+
+@dataclass
+class OutboundAudioConfig:
+    """Configuration for outbound audio pacing."""
+    sample_rate: int = 16000
+    channels: int = 1
+    frame_ms: int = 20
+    jitter_buffer_ms: int = 60
+    max_buffer_ms: int = 2000
+    
+    @property
+    def frame_bytes(self) -> int:
+        """PCM16 bytes per frame."""
+        return self.sample_rate * self.frame_ms // 1000 * self.channels * 2
+    
+    @property
+    def prebuffer_frames(self) -> int:
+        """Frames queued before playout starts (or resumes after an underrun)."""
+        return max(1, self.jitter_buffer_ms // self.frame_ms)
+    
+    @property
+    def max_frames(self) -> int:
+        """Frames queued before writers are held back."""
+        return max(self.prebuffer_frames, self.max_buffer_ms // self.frame_ms)
+
+
+@dataclass
+class OutboundAudioStats:
+    """Delivery statistics for one call's outbound audio."""
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    underruns: int = 0
+    overruns: int = 0
+    late_frames: int = 0
+    max_lateness: float = 0.0
+    first_frame_latency: float = 0.0
+    # time.monotonic() when the latest response's first frame was published
+    first_frame_at: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "underruns": self.underruns,
+            "overruns": self.overruns,
+            "late_frames": self.late_frames,
+            "max_lateness": self.max_lateness,
+            "first_frame_latency": self.first_frame_latency
+        }
+
+
+class FramePacketizer:
+    """Cut a byte stream into fixed-size frames."""
+    
+    def __init__(self, frame_bytes: int):
+        """
+        Initialize the packetizer.
+        
+        Args:
+            frame_bytes: Size of each output frame in bytes
+        """
+        if frame_bytes <= 0:
+            raise ValueError("frame_bytes must be positive")
+        self.frame_bytes = frame_bytes
+        self._pending = bytearray()
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add data and return every complete frame.
+        
+        Args:
+            data: Bytes-like audio data
+        
+        Returns:
+            Complete frames in order; the remainder is kept for the next call
+        """
+        self._pending += data
+        usable = len(self._pending) - len(self._pending) % self.frame_bytes
+        if not usable:
+            return []
+        
+        view = memoryview(self._pending)
+        frames = [bytes(view[offset:offset + self.frame_bytes]) for offset in range(0, usable, self.frame_bytes)]
+        view.release()
+        del self._pending[:usable]
+        return frames
+    
+    def flush(self) -> Optional[bytes]:
+        """
+        Return the buffered remainder padded with silence to a full frame.
+        
+        Returns:
+            Final frame, or None if nothing is buffered
+        """
+        if not self._pending:
+            return None
+        frame = bytes(self._pending) + bytes(self.frame_bytes - len(self._pending))
+        self._pending.clear()
+        return frame
+    
+    def clear(self) -> None:
+        """Discard the buffered remainder."""
+        self._pending.clear()
+
+
+class OutboundAudioStream:
+    """
+    Jitter-buffered, real-time paced audio output for one call.
+    
+    Writers push TTS audio with write() and mark the end of a response with
+    drain(). A background pacer starts playout once jitter_buffer_ms of audio
+    is queued and then hands one frame to the sink every frame_ms, scheduled
+    against a monotonic deadline so sink latency does not accumulate as drift.
+    
+    Running out of frames mid-response is an underrun: playout pauses until
+    the jitter buffer refills. A write that finds max_buffer_ms already queued
+    is an overrun: the writer waits for playout to make room, which applies
+    backpressure to TTS instead of dropping audio.
+    
+    bytes_written and bytes_played are offsets into the stream of audio that
+    will reach the caller, so a writer can record where a piece of audio
+    starts and later tell whether it has actually been played.
+    """
+    
+    def __init__(self, sink: Optional[AudioSink] = None, config: Optional[OutboundAudioConfig] = None):
+        """
+        Initialize the stream.
+        
+        Args:
+            sink: Coroutine function receiving each frame; frames are paced and
+                discarded when no sink is attached
+            config: Outbound audio configuration
+        """
+        self.sink = sink
+        self.config = config or OutboundAudioConfig()
+        self.stats = OutboundAudioStats()
+        self.metrics_collector = get_metrics_collector()
+        
+        self._packetizer = FramePacketizer(self.config.frame_bytes)
+        self._frames: Deque[bytes] = deque()
+        self._ending = False
+        self._interrupted = False
+        self._response_start: Optional[float] = None
+        self._first_frame_pending = False
+        self._task: Optional[asyncio.Task] = None
+        self._bytes_written = 0
+        self._bytes_played = 0
+        
+        # Created lazily so the stream can be built outside a running loop
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._drained: Optional[asyncio.Event] = None
+    
+    @property
+    def queued_frames(self) -> int:
+        """Frames waiting for playout."""
+        return len(self._frames)
+    
+    @property
+    def queued_ms(self) -> int:
+        """Audio waiting for playout in milliseconds."""
+        return len(self._frames) * self.config.frame_ms
+    
+    @property
+    def bytes_written(self) -> int:
+        """Stream offset at which the next written audio will be played."""
+        return self._bytes_written
+    
+    @property
+    def bytes_played(self) -> int:
+        """Stream offset up to which audio has been handed to the sink."""
+        return self._bytes_played
+    
+    @property
+    def bytes_per_second(self) -> int:
+        """Playout rate of the stream."""
+        return self.config.sample_rate * self.config.channels * 2
+    
+    async def write(self, audio_data: bytes) -> None:
+        """
+        Queue audio for playout.
+        
+        Args:
+            audio_data: PCM16 audio at the configured sample rate
+        """
+        self._ensure_started()
+        self._drained.clear()
+        if self._response_start is None:
+            # Only the first write of a response starts the first-frame clock
+            self._response_start = asyncio.get_running_loop().time()
+            self._first_frame_pending = True
+        # Counted up front: the whole chunk is queued even if the writer waits
+        self._bytes_written += len(audio_data)
+        
+        for frame in self._packetizer.feed(audio_data):
+            if len(self._frames) >= self.config.max_frames:
+                self.stats.overruns += 1
+                self.metrics_collector.increment_counter("outbound_audio_overruns_total")
+                self._wakeup.set()
+                while len(self._frames) >= self.config.max_frames:
+                    self._space.clear()
+                    await self._space.wait()
+            self._frames.append(frame)
+        
+        self._wakeup.set()
+    
+    async def drain(self) -> None:
+        """Mark the end of the response and wait until it has been played."""
+        self._ensure_started()
+        pending = len(self._packetizer)
+        final_frame = self._packetizer.flush()
+        if final_frame is not None:
+            # The silence padding is played too
+            self._bytes_written += len(final_frame) - pending
+            self._frames.append(final_frame)
+        self._ending = True
+        self._wakeup.set()
+        await self._drained.wait()
+    
+    def clear(self) -> int:
+        """
+        Drop all audio that has not been played yet.
+        
+        Returns:
+            Number of frames dropped
+        """
+        dropped = len(self._frames)
+        self._frames.clear()
+        self._packetizer.clear()
+        self._bytes_written = self._bytes_played
+        self.stats.frames_dropped += dropped
+        # Audio written after a clear is a new response
+        self._response_start = None
+        self._first_frame_pending = False
+        self._ending = False
+        if self._task is not None:
+            # Sends the pacer back to buffering without counting an underrun
+            self._interrupted = True
+            self._wakeup.set()
+            self._space.set()
+            self._drained.set()
+        return dropped
+    
+    def close(self) -> None:
+        """Stop the pacer and drop queued audio."""
+        self.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._drained is not None:
+            self._drained.set()
+    
+    def _ensure_started(self) -> None:
+        """Start the pacer task on first use."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._drained = asyncio.Event()
+            self._drained.set()
+            self._task = asyncio.create_task(self._run())
+    
+    async def _run(self) -> None:
+        """Pace queued frames into the sink in real time."""
+        loop = asyncio.get_running_loop()
+        frame_seconds = self.config.frame_ms / 1000
+        
+        while True:
+            # Buffering: wait for the jitter buffer to fill, or for the end of a short response
+            while len(self._frames) < self.config.prebuffer_frames and not self._ending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            
+            deadline = loop.time()
+            while self._frames and not self._interrupted:
+                frame = self._frames.popleft()
+                self._bytes_played += len(frame)
+                self._space.set()
+                
+                lateness = loop.time() - deadline
+                if lateness > frame_seconds:
+                    self.stats.late_frames += 1
+                    self.stats.max_lateness = max(self.stats.max_lateness, lateness)
+                    # Resynchronize rather than bursting to catch up
+                    deadline = loop.time()
+                
+                if self.sink is not None:
+                    try:
+                        await self.sink(frame)
+                    except Exception as e:
+                        logger.error(f"Error sending outbound audio frame: {e}")
+                self.stats.frames_sent += 1
+                
+                if self._first_frame_pending:
+                    first_frame_latency = loop.time() - self._response_start
+                    self._first_frame_pending = False
+                    self.stats.first_frame_latency = first_frame_latency
+                    self.stats.first_frame_at = time.monotonic()
+                    self.metrics_collector.record_timer(
+                        "outbound_audio_first_frame_latency",
+                        first_frame_latency
+                    )
+                
+                deadline += frame_seconds
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            
+            if self._interrupted:
+                # Cleared: the next response starts with a full jitter buffer
+                self._interrupted = False
+            elif self._ending:
+                self._ending = False
+                self._response_start = None
+                self._first_frame_pending = False
+                self._drained.set()
+            else:
+                self.stats.underruns += 1
+                self.metrics_collector.increment_counter("outbound_audio_underruns_total")
+                logger.debug("Outbound audio underrun, rebuffering")
@@ -0,0 +1,202 @@
+"""
+Bounded per-call audio buffer.
+
+This module implements the AudioRingBuffer class that holds inbound call
+audio in a single bytearray. Reads return a memoryview over the buffered
+window, so the current utterance can be handed to STT without joining a
+list of chunks, and the buffer size is capped by a maximum duration with an
+explicit overflow policy.
+"""
+
+import logging
+from enum import Enum
+
+
+logger = logging.getLogger(__name__)
+
+# Storage allocated up front: half a second of 16 kHz PCM16
+DEFAULT_INITIAL_SIZE = 16 * 1024
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a write does not fit in the buffer."""
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity byte buffer with zero-copy reads.
+    
+    Buffered data is always kept contiguous in a bytearray: when a write
+    would run past the end of the storage, the live window is moved back to
+    the front, or to the front of a storage twice the size if it holds more
+    than half the current one. Storage starts at initial_size and grows
+    only as far as the audio actually buffered needs, up to twice the
+    capacity, so a call that is mostly silent never allocates for its
+    longest possible utterance. Compaction happens at most once per half
+    storage written, so writes stay amortized O(1) per byte while view() can
+    return a single memoryview without wrap-around.
+    
+    With DROP_OLDEST, a write that does not fit discards the oldest audio.
+    With REJECT (backpressure), the part of the write that does not fit is
+    refused and write() returns the number of bytes accepted.
+    
+    Views returned by view() are only valid until the next write, trim or
+    clear on the same buffer.
+    """
+    
+    def __init__(
+        self,
+        capacity: int,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        initial_size: int = DEFAULT_INITIAL_SIZE
+    ):
+        """
+        Initialize the buffer.
+        
+        Args:
+            capacity: Maximum number of buffered bytes
+            policy: Overflow policy
+            initial_size: Bytes of storage allocated before the first write
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        
+        self.capacity = capacity
+        self.policy = OverflowPolicy(policy)
+        self._storage = bytearray(max(1, min(initial_size, capacity * 2)))
+        self._start = 0
+        self._end = 0
+        
+        self.dropped_bytes = 0
+        self.overflow_count = 0
+    
+    @classmethod
+    def for_duration(
+        cls,
+        max_ms: int,
+        sample_rate: int,
+        sample_width: int = 2,
+        channels: int = 1,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    ) -> "AudioRingBuffer":
+        """
+        Create a buffer sized for a maximum audio duration.
+        
+        Args:
+            max_ms: Maximum buffered duration in milliseconds
+            sample_rate: Sample rate in Hz
+            sample_width: Bytes per sample
+            channels: Number of channels
+            policy: Overflow policy
+        
+        Returns:
+            AudioRingBuffer instance
+        """
+        frame_bytes = sample_width * channels
+        capacity = max(1, sample_rate * max_ms // 1000) * frame_bytes
+        return cls(capacity, policy)
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    @property
+    def allocated(self) -> int:
+        """Number of bytes of storage currently allocated."""
+        return len(self._storage)
+    
+    @property
+    def free(self) -> int:
+        """Number of bytes that can be written without overflow."""
+        return self.capacity - len(self)
+    
+    def write(self, data: bytes) -> int:
+        """
+        Append audio to the buffer.
+        
+        Args:
+            data: Bytes-like audio data
+        
+        Returns:
+            Number of bytes from data that were accepted
+        """
+        size = len(data)
+        if size == 0:
+            return 0
+        
+        if size > self.free:
+            self.overflow_count += 1
+            if self.policy is OverflowPolicy.REJECT:
+                accepted = self.free
+                self.dropped_bytes += size - accepted
+                data = memoryview(data)[:accepted]
+                size = accepted
+            elif size >= self.capacity:
+                # Only the newest capacity bytes survive
+                self.dropped_bytes += len(self) + size - self.capacity
+                data = memoryview(data)[size - self.capacity:]
+                size = self.capacity
+                self._start = self._end = 0
+            else:
+                dropped = size - self.free
+                self.dropped_bytes += dropped
+                self._start += dropped
+        
+        if size == 0:
+            return 0
+        
+        if self._end + size > len(self._storage):
+            self._make_room(size)
+        
+        self._storage[self._end:self._end + size] = data
+        self._end += size
+        return size
+    
+    def view(self) -> memoryview:
+        """
+        Return a zero-copy view of the buffered audio.
+        
+        Returns:
+            Read-only memoryview of the buffered bytes
+        """
+        return memoryview(self._storage)[self._start:self._end].toreadonly()
+    
+    def trim(self, max_bytes: int) -> None:
+        """
+        Keep only the newest max_bytes of buffered audio.
+        
+        Trimmed audio is intentionally discarded and is not counted as dropped.
+        
+        Args:
+            max_bytes: Number of bytes to keep
+        """
+        excess = len(self) - max(0, max_bytes)
+        if excess > 0:
+            self._start += excess
+        if self._start == self._end:
+            self._start = self._end = 0
+    
+    def clear(self) -> None:
+        """Discard all buffered audio."""
+        self._start = self._end = 0
+    
+    def _make_room(self, size: int) -> None:
+        """Move the live window to the front of the storage, growing it if needed."""
+        length = len(self)
+        needed = length + size
+        storage_size = len(self._storage)
+        
+        if needed > storage_size // 2 and storage_size < self.capacity * 2:
+            # Double until the window fits in half, so compaction stays rare
+            while storage_size < needed * 2:
+                storage_size *= 2
+            storage = bytearray(min(storage_size, self.capacity * 2))
+            storage[:length] = memoryview(self._storage)[self._start:self._end]
+            self._storage = storage
+        elif self._start:
+            # Here start > storage - needed >= storage / 2 >= length, so the
+            # source and destination ranges never overlap
+            self._storage[:length] = memoryview(self._storage)[self._start:self._end]
+        self._start = 0
+        self._end = length
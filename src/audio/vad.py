@@ -0,0 +1,169 @@
+"""
+Energy-based voice activity detection and endpointing.
+
+This module implements the VoiceActivityDetector class that tracks speech
+start and end over a stream of 16-bit PCM audio, so the orchestrator only
+runs STT and the LLM once per utterance instead of once per audio frame.
+"""
+
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import List
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class VADEvent(str, Enum):
+    """Voice activity events emitted by the detector."""
+    SPEECH_START = "speech_start"
+    SPEECH_END = "speech_end"
+
+
+@dataclass
+class VADConfig:
+    """Configuration for voice activity detection."""
+    sample_rate: int = 16000
+    threshold: float = 0.5
+    frame_ms: int = 20
+    speech_start_ms: int = 60
+    speech_end_ms: int = 600
+    max_speech_ms: int = 30000
+    speech_pad_ms: int = 100
+    floor_db: float = -60.0
+    noise_margin_db: float = 10.0
+    
+    @property
+    def threshold_db(self) -> float:
+        """
+        Map the 0-1 threshold onto a dBFS level.
+        
+        0.0 corresponds to floor_db and 1.0 to full scale, so the default
+        0.5 with a -60 dB floor places the speech threshold at -30 dBFS.
+        """
+        return self.floor_db * (1.0 - self.threshold)
+    
+    @property
+    def frame_samples(self) -> int:
+        """Number of samples per analysis frame."""
+        return max(1, self.sample_rate * self.frame_ms // 1000)
+    
+    @property
+    def speech_pad_bytes(self) -> int:
+        """PCM16 bytes of audio to keep before speech start."""
+        return self.sample_rate * self.speech_pad_ms // 1000 * 2
+
+
+class VoiceActivityDetector:
+    """
+    Detect speech start and end in a stream of PCM16 mono audio.
+    
+    Audio is analysed in fixed frames whose RMS level is computed with NumPy
+    over the whole chunk at once. Speech starts after speech_start_ms of
+    consecutive voiced frames and ends after speech_end_ms of consecutive
+    unvoiced frames (or when max_speech_ms is exceeded). The speech threshold
+    is raised above an adaptive noise floor so steady background noise does
+    not hold an utterance open.
+    """
+    
+    def __init__(self, config: VADConfig):
+        """
+        Initialize the detector.
+        
+        Args:
+            config: VAD configuration
+        """
+        self.config = config
+        self._frame_bytes = config.frame_samples * 2
+        self._start_frames = max(1, config.speech_start_ms // config.frame_ms)
+        self._end_frames = max(1, config.speech_end_ms // config.frame_ms)
+        self._max_speech_frames = max(1, config.max_speech_ms // config.frame_ms)
+        self._noise_floor_db = config.floor_db
+        self.reset()
+    
+    def reset(self) -> None:
+        """Reset detection state (the noise floor estimate is kept)."""
+        self._remainder = b""
+        self._is_speaking = False
+        self._voiced_run = 0
+        self._unvoiced_run = 0
+        self._speech_frames = 0
+    
+    @property
+    def is_speaking(self) -> bool:
+        """Whether an utterance is currently in progress."""
+        return self._is_speaking
+    
+    @property
+    def noise_floor_db(self) -> float:
+        """Current noise floor estimate in dBFS."""
+        return self._noise_floor_db
+    
+    def frame_levels(self, audio_data: bytes) -> np.ndarray:
+        """
+        Compute per-frame RMS levels in dBFS for complete frames in the input.
+        
+        Incomplete trailing frames are carried over to the next call.
+        
+        Args:
+            audio_data: PCM16 little-endian mono audio
+        
+        Returns:
+            Array of frame levels in dBFS
+        """
+        data = self._remainder + audio_data if self._remainder else audio_data
+        usable = len(data) - (len(data) % self._frame_bytes)
+        self._remainder = bytes(data[usable:])
+        if usable == 0:
+            return np.empty(0, dtype=np.float32)
+        
+        samples = np.frombuffer(data, dtype="<i2", count=usable // 2)
+        frames = samples.reshape(-1, self.config.frame_samples).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        return 20.0 * np.log10(np.maximum(rms, 1.0) / 32768.0)
+    
+    def process(self, audio_data: bytes) -> List[VADEvent]:
+        """
+        Process an audio chunk and return the events it triggered.
+        
+        Args:
+            audio_data: PCM16 little-endian mono audio
+        
+        Returns:
+            Speech start/end events in the order they occurred
+        """
+        levels = self.frame_levels(audio_data)
+        if levels.size == 0:
+            return []
+        
+        events: List[VADEvent] = []
+        threshold_db = self.config.threshold_db
+        
+        for level in levels.tolist():
+            voiced = level >= max(threshold_db, self._noise_floor_db + self.config.noise_margin_db)
+            
+            if not voiced and not self._is_speaking:
+                # Track the background level only while nobody is talking
+                self._noise_floor_db = 0.95 * self._noise_floor_db + 0.05 * max(level, self.config.floor_db)
+            
+            if self._is_speaking:
+                self._speech_frames += 1
+                self._unvoiced_run = 0 if voiced else self._unvoiced_run + 1
+                if (self._unvoiced_run >= self._end_frames or
+                        self._speech_frames >= self._max_speech_frames):
+                    self._is_speaking = False
+                    self._voiced_run = 0
+                    self._unvoiced_run = 0
+                    events.append(VADEvent.SPEECH_END)
+            else:
+                self._voiced_run = self._voiced_run + 1 if voiced else 0
+                if self._voiced_run >= self._start_frames:
+                    self._is_speaking = True
+                    self._speech_frames = self._voiced_run
+                    self._unvoiced_run = 0
+                    events.append(VADEvent.SPEECH_START)
+        
+        return events
@@ -66,6 +66,52 @@ class ClientMetrics:
         return self.total_latency / self.success_count
 
 
+class RequestRateLimiter:
+    """
+    Token bucket shared by every request that must respect a provider rate limit.
+    
+    Up to burst requests go out at once; after that, one request per 1/rate
+    seconds. Waiters are served in arrival order.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter with a full bucket.
+        
+        Args:
+            rate: Requests per second
+            burst: Requests that may go out back to back
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            
+            wait = 0.0
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                self._tokens = 1.0
+                self._updated_at = time.monotonic()
+            self._tokens -= 1
+            return wait
+
+
 class CircuitBreaker:
     """Circuit breaker implementation for handling service failures."""
     
@@ -0,0 +1,285 @@
+"""Pool of pre-opened Deepgram live connections."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+from deepgram import LiveTranscriptionEvents
+
+from src.metrics import MetricsCollector, get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Any], Awaitable[None]]
+
+
+class LiveConnection:
+    """
+    A started Deepgram live connection whose stream handlers attach on use.
+    
+    Event handlers are registered once, before the connection starts, and
+    forward to whichever stream has attached; an idle connection only tracks
+    whether the server has closed it.
+    """
+    
+    def __init__(self, connection: Any):
+        """
+        Initialize the wrapper and register its event handlers.
+        
+        Args:
+            connection: Deepgram async live client, not yet started
+        """
+        self.connection = connection
+        self.opened_at = time.monotonic()
+        self.closed = False
+        self.on_transcript: Optional[EventHandler] = None
+        self.on_error: Optional[EventHandler] = None
+        self.on_close: Optional[EventHandler] = None
+        
+        # The async live client awaits handlers as handler(connection, event, **kwargs)
+        connection.on(LiveTranscriptionEvents.Transcript, self._dispatch_transcript)
+        connection.on(LiveTranscriptionEvents.Error, self._dispatch_error)
+        connection.on(LiveTranscriptionEvents.Close, self._dispatch_close)
+    
+    @property
+    def in_use(self) -> bool:
+        """Whether a stream has attached to the connection."""
+        return self.on_transcript is not None
+    
+    @property
+    def usable(self) -> bool:
+        """Whether the connection can be handed to a new stream."""
+        return not self.closed and not self.in_use
+    
+    def attach(self, on_transcript: EventHandler, on_error: EventHandler, on_close: EventHandler) -> None:
+        """
+        Route the connection's events to a stream.
+        
+        Args:
+            on_transcript: Called with each transcript result
+            on_error: Called with connection errors
+            on_close: Called when the connection closes
+        """
+        self.on_transcript = on_transcript
+        self.on_error = on_error
+        self.on_close = on_close
+    
+    async def _dispatch_transcript(self, _connection: Any, result: Any, **kwargs: Any) -> None:
+        if self.on_transcript is not None:
+            await self.on_transcript(result)
+    
+    async def _dispatch_error(self, _connection: Any, error: Any, **kwargs: Any) -> None:
+        if self.on_error is not None:
+            await self.on_error(error)
+        else:
+            logger.warning(f"Idle Deepgram connection error: {error}")
+            self.closed = True
+    
+    async def _dispatch_close(self, _connection: Any, close: Any, **kwargs: Any) -> None:
+        self.closed = True
+        if self.on_close is not None:
+            await self.on_close(close)
+    
+    async def keep_alive(self) -> bool:
+        """Send a KeepAlive so the server keeps an idle connection open."""
+        try:
+            alive = bool(await self.connection.keep_alive())
+        except Exception as e:
+            logger.debug(f"KeepAlive failed: {e}")
+            alive = False
+        if not alive:
+            self.closed = True
+        return alive
+    
+    async def finish(self) -> None:
+        """Close the connection, ignoring errors from one already closed."""
+        self.closed = True
+        try:
+            await self.connection.finish()
+        except Exception:
+            pass
+
+
+@dataclass
+class LivePoolConfig:
+    """Sizing and upkeep of the live connection pool."""
+    min_idle: int = 1
+    max_idle: int = 8
+    # Idle connections cover this many seconds of expected call arrivals
+    lookahead_seconds: float = 5.0
+    # Deepgram closes a connection that receives no audio for about 10 seconds
+    keepalive_interval: float = 4.0
+    # Idle connections older than this are recycled
+    max_idle_age: float = 300.0
+    # Weight of the newest arrival-rate sample in the moving average
+    rate_smoothing: float = 0.3
+
+
+class LiveConnectionPool:
+    """
+    Keeps started live connections ready so a new stream skips the handshake.
+    
+    The number of idle connections follows an exponentially weighted moving
+    average of the stream arrival rate. Idle connections are kept open with
+    KeepAlive messages; those the server has closed are dropped when found
+    and replaced by the maintenance task. A stream that finds the pool empty
+    opens its own connection.
+    """
+    
+    def __init__(
+        self,
+        open_connection: Callable[[], Awaitable[LiveConnection]],
+        config: Optional[LivePoolConfig] = None,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the pool; call start() to begin filling it.
+        
+        Args:
+            open_connection: Opens and starts one live connection
+            config: Pool sizing and upkeep settings
+            metrics_collector: Collector for pool metrics, defaults to the global one
+        """
+        self.open_connection = open_connection
+        self.config = config or LivePoolConfig()
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        
+        self.arrival_rate = 0.0
+        self._idle: Deque[LiveConnection] = deque()
+        self._arrivals = 0
+        self._rate_updated_at = time.monotonic()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def idle(self) -> int:
+        """Idle connections currently pooled."""
+        return len(self._idle)
+    
+    @property
+    def target_idle(self) -> int:
+        """Idle connections wanted for the current arrival rate."""
+        wanted = math.ceil(self.arrival_rate * self.config.lookahead_seconds)
+        return max(self.config.min_idle, min(self.config.max_idle, wanted))
+    
+    async def start(self) -> None:
+        """Start the maintenance task that fills and keeps up the pool."""
+        if self._task is None:
+            # Fill right away rather than after the first keepalive interval
+            self._wake.set()
+            self._task = asyncio.create_task(self._maintain())
+            logger.info(
+                "Started Deepgram live connection pool",
+                extra={"min_idle": self.config.min_idle, "max_idle": self.config.max_idle}
+            )
+    
+    async def stop(self) -> None:
+        """Stop maintenance and close idle connections."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        idle, self._idle = list(self._idle), deque()
+        await asyncio.gather(*(live.finish() for live in idle))
+    
+    async def acquire(self) -> LiveConnection:
+        """
+        Take a warm connection, or open one if none is ready.
+        
+        Returns:
+            A started LiveConnection for the caller's exclusive use
+        """
+        self._arrivals += 1
+        self._wake.set()
+        
+        while self._idle:
+            live = self._idle.popleft()
+            if live.usable:
+                self.metrics_collector.increment_counter("deepgram_pool_hits_total")
+                self.metrics_collector.set_gauge("deepgram_pool_idle", len(self._idle))
+                return live
+            self.metrics_collector.increment_counter("deepgram_pool_replaced_total")
+        
+        self.metrics_collector.increment_counter("deepgram_pool_misses_total")
+        return await self._open()
+    
+    async def _open(self) -> LiveConnection:
+        """Open a connection, timing the handshake."""
+        start = time.perf_counter()
+        live = await self.open_connection()
+        self.metrics_collector.record_timer("deepgram_connect_duration", time.perf_counter() - start)
+        return live
+    
+    def _update_arrival_rate(self) -> None:
+        """Fold arrivals since the last update into the moving average."""
+        now = time.monotonic()
+        elapsed = now - self._rate_updated_at
+        if elapsed < self.config.keepalive_interval:
+            return
+        
+        sample = self._arrivals / elapsed
+        alpha = self.config.rate_smoothing
+        self.arrival_rate = alpha * sample + (1 - alpha) * self.arrival_rate
+        self._arrivals = 0
+        self._rate_updated_at = now
+    
+    async def _refresh_idle(self) -> None:
+        """Drop closed or old idle connections and keep the rest alive."""
+        now = time.monotonic()
+        # Taken out of the pool while keepalives are awaited so acquire()
+        # cannot mutate the deque being walked
+        idle, self._idle = self._idle, deque()
+        kept: Deque[LiveConnection] = deque()
+        for live in idle:
+            if now - live.opened_at > self.config.max_idle_age:
+                await live.finish()
+            elif live.usable and await live.keep_alive():
+                kept.append(live)
+            else:
+                self.metrics_collector.increment_counter("deepgram_pool_replaced_total")
+        self._idle.extend(live for live in kept if live.usable)
+    
+    async def _fill(self) -> None:
+        """Open connections until the pool reaches its target size."""
+        missing = self.target_idle - len(self._idle)
+        if missing <= 0:
+            return
+        
+        results = await asyncio.gather(*(self._open() for _ in range(missing)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, LiveConnection):
+                self._idle.append(result)
+            else:
+                self.metrics_collector.increment_counter("deepgram_pool_open_failures_total")
+                logger.warning(f"Failed to open pooled Deepgram connection: {result}")
+    
+    async def _maintain(self) -> None:
+        """Refill after acquisitions and refresh idle connections periodically."""
+        last_refresh = time.monotonic()
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.config.keepalive_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            
+            try:
+                self._update_arrival_rate()
+                if time.monotonic() - last_refresh >= self.config.keepalive_interval:
+                    last_refresh = time.monotonic()
+                    await self._refresh_idle()
+                await self._fill()
+            except Exception as e:
+                logger.error(f"Error maintaining Deepgram connection pool: {e}")
+            
+            self.metrics_collector.set_gauge("deepgram_pool_idle", len(self._idle))
+            self.metrics_collector.set_gauge("deepgram_pool_target", self.target_idle)
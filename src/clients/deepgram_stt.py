@@ -3,17 +3,26 @@
 import asyncio
 import json
 import logging
+import mimetypes
+import mmap
+import os
+import threading
 import time
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Sequence, Union
 from uuid import uuid4
 
 import websockets
-from deepgram import DeepgramClient, DeepgramClientOptions, LiveTranscriptionEvents
+from deepgram import DeepgramClient, DeepgramClientOptions
 from deepgram.clients.live.v1 import LiveOptions
 
-from src.clients.base import BaseResilientClient, ClientMetrics
+from src.clients.base import BaseResilientClient, ClientMetrics, RequestRateLimiter
+from src.clients.deepgram_pool import LiveConnection, LiveConnectionPool, LivePoolConfig
+from src.clients.stt_backend import STTBackend
 from src.config import get_settings
 from src.security import validate_audio_data
 
@@ -24,6 +33,152 @@ class TranscriptionMode(Enum):
     BATCH = "batch"
 
 
+class WordTimings(Sequence[Dict[str, Any]]):
+    """
+    Word-level timings of a transcript, stored as parallel arrays.
+    
+    Words share one string, sliced by offsets; start, end and confidence
+    are float arrays. Indexing or iterating yields the usual
+    {"word", "start", "end", "confidence"} dicts, built only when a
+    consumer asks for them, so results nobody inspects word by word cost a
+    few arrays instead of one dict per word.
+    """
+    
+    __slots__ = ("_text", "_offsets", "_starts", "_ends", "_confidences")
+    
+    def __init__(self) -> None:
+        """Initialize an empty sequence; use from_words() or from_dicts() to fill one."""
+        self._text = ""
+        self._offsets = array("I", (0,))
+        self._starts = array("d")
+        self._ends = array("d")
+        self._confidences = array("d")
+    
+    @classmethod
+    def from_words(cls, words: Optional[Iterable[Any]]) -> "WordTimings":
+        """
+        Build from provider word objects with word, start, end and confidence attributes.
+        
+        Args:
+            words: Word objects, e.g. from a Deepgram alternative; None for none
+        
+        Returns:
+            WordTimings holding the words
+        """
+        timings = cls()
+        if not words:
+            return timings
+        
+        text = []
+        offset = 0
+        for word in words:
+            text.append(word.word)
+            offset += len(word.word)
+            timings._offsets.append(offset)
+            timings._starts.append(word.start)
+            timings._ends.append(word.end)
+            timings._confidences.append(word.confidence)
+        timings._text = "".join(text)
+        return timings
+    
+    @classmethod
+    def from_dicts(cls, words: Iterable[Dict[str, Any]]) -> "WordTimings":
+        """
+        Build from word dicts as yielded by a WordTimings.
+        
+        Args:
+            words: Dicts with word, start, end and confidence keys
+        
+        Returns:
+            WordTimings holding the words
+        """
+        return cls.from_words(SimpleNamespace(**word) for word in words)
+    
+    @classmethod
+    def concat(cls, parts: Iterable["WordTimings"]) -> "WordTimings":
+        """
+        Join the words of several results, e.g. the segments of an utterance.
+        
+        Args:
+            parts: WordTimings in order
+        
+        Returns:
+            WordTimings with every part's words
+        """
+        timings = cls()
+        text = []
+        base = 0
+        for part in parts:
+            if not isinstance(part, WordTimings):
+                part = cls.from_dicts(part)
+            text.append(part._text)
+            timings._offsets.extend(base + offset for offset in part._offsets[1:])
+            timings._starts.extend(part._starts)
+            timings._ends.extend(part._ends)
+            timings._confidences.extend(part._confidences)
+            base += len(part._text)
+        timings._text = "".join(text)
+        return timings
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return {
+            "word": self.word(index),
+            "start": self._starts[index],
+            "end": self._ends[index],
+            "confidence": self._confidences[index]
+        }
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WordTimings):
+            return (
+                self._text == other._text
+                and self._offsets == other._offsets
+                and self._starts == other._starts
+                and self._ends == other._ends
+                and self._confidences == other._confidences
+            )
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other, strict=True))
+        return NotImplemented
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        return f"WordTimings({self.text()!r})"
+    
+    def word(self, index: int) -> str:
+        """Text of one word, without building its dict."""
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+    
+    def text(self, separator: str = " ") -> str:
+        """All words joined by separator."""
+        return separator.join(self.word(index) for index in range(len(self)))
+    
+    @property
+    def starts(self) -> array:
+        """Start times in seconds, one per word."""
+        return self._starts
+    
+    @property
+    def ends(self) -> array:
+        """End times in seconds, one per word."""
+        return self._ends
+    
+    @property
+    def confidences(self) -> array:
+        """Confidence scores, one per word."""
+        return self._confidences
+
+
 @dataclass
 class TranscriptionResult:
     """Result of a transcription operation."""
@@ -36,10 +191,36 @@ class TranscriptionResult:
     channel: int = 0
     start_time: float = 0.0
     end_time: float = 0.0
-    words: List[Dict[str, Any]] = field(default_factory=list)
+    # Lazily materialized word dicts, see WordTimings
+    words: WordTimings = field(default_factory=WordTimings)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BatchItem:
+    """One recording for transcribe_many()."""
+    # Audio bytes, or the path of a file that is memory-mapped rather than read
+    audio: Union[bytes, str, os.PathLike]
+    item_id: Optional[str] = None
+    # Guessed from the file extension when not given
+    mimetype: Optional[str] = None
+    options: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class BatchTranscription:
+    """Outcome of one transcribe_many() item."""
+    index: int
+    item_id: str
+    result: Optional[TranscriptionResult] = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the item was transcribed."""
+        return self.error is None
+
+
 @dataclass
 class StreamingConfig:
     """Configuration for streaming transcription."""
@@ -57,6 +238,8 @@ class StreamingConfig:
     utterance_end_ms: int = 1000
     vad_events: bool = True
     endpointing: int = 300
+    # Results held for a slow consumer before interim results are dropped
+    result_buffer_size: int = 256
 
 
 @dataclass
@@ -68,6 +251,7 @@ class DeepgramMetrics(ClientMetrics):
     total_transcription_time: float = 0.0
     average_confidence: float = 0.0
     reconnection_count: int = 0
+    dropped_results: int = 0
     
     @property
     def transcription_speed_ratio(self) -> float:
@@ -77,7 +261,90 @@ class DeepgramMetrics(ClientMetrics):
         return self.total_transcription_time / self.total_audio_duration
 
 
-class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
+class _ResultChannel:
+    """
+    Bounded FIFO handoff of results from connection callbacks to the consumer.
+    
+    put_nowait() never blocks or allocates a task; it is safe to call from
+    the SDK's own threads, which hand the result to the loop with
+    call_soon_threadsafe. When the consumer falls behind, the oldest interim
+    result is dropped first, since a later interim or final supersedes it.
+    """
+    
+    def __init__(self, maxsize: int, metrics: DeepgramMetrics):
+        """
+        Initialize the channel on the running event loop.
+        
+        Args:
+            maxsize: Most results held for the consumer
+            metrics: Metrics whose dropped_results count overflows
+        """
+        self.maxsize = max(1, maxsize)
+        self.metrics = metrics
+        self.closed = False
+        self._items: Deque[TranscriptionResult] = deque()
+        self._ready = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+    
+    def put_nowait(self, result: TranscriptionResult) -> None:
+        """Hand over a result without waiting, from any thread."""
+        if threading.get_ident() == self._loop_thread:
+            self._put(result)
+        else:
+            self._loop.call_soon_threadsafe(self._put, result)
+    
+    def close(self) -> None:
+        """End the channel once buffered results are consumed, from any thread."""
+        if threading.get_ident() == self._loop_thread:
+            self._close()
+        else:
+            self._loop.call_soon_threadsafe(self._close)
+    
+    def _put(self, result: TranscriptionResult) -> None:
+        if self.closed:
+            return
+        if len(self._items) >= self.maxsize:
+            self._drop_one()
+        self._items.append(result)
+        self._ready.set()
+    
+    def _drop_one(self) -> None:
+        """Drop the oldest interim result, or the oldest result if all are final."""
+        for index, item in enumerate(self._items):
+            if not item.is_final:
+                del self._items[index]
+                break
+        else:
+            self._items.popleft()
+        self.metrics.dropped_results += 1
+    
+    def _close(self) -> None:
+        self.closed = True
+        self._ready.set()
+    
+    async def get(self) -> Optional[TranscriptionResult]:
+        """
+        Wait for the next result.
+        
+        Returns:
+            The oldest buffered result, or None once the channel is closed and drained
+        """
+        while not self._items:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+
+async def _iter_chunks(data: mmap.mmap, chunk_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    """Upload a memory-mapped file in chunks, without reading it into memory."""
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset:offset + chunk_size]
+
+
+class DeepgramSTTClient(BaseResilientClient[TranscriptionResult], STTBackend):
     """
     Deepgram Speech-to-Text client with streaming and batch support.
     
@@ -93,7 +360,8 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
         self,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
-        streaming_config: Optional[StreamingConfig] = None
+        streaming_config: Optional[StreamingConfig] = None,
+        batch_requests_per_second: Optional[float] = None
     ):
         """
         Initialize Deepgram STT client.
@@ -102,6 +370,8 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
             api_key: Deepgram API key (uses config if not provided)
             timeout: Request timeout in seconds
             streaming_config: Configuration for streaming transcription
+            batch_requests_per_second: Limit on batch transcription requests,
+                retries included, across all callers; None for no limit
         """
         super().__init__(
             service_name="deepgram_stt",
@@ -137,6 +407,14 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
         self._active_connections: Dict[str, Any] = {}
         self._connection_lock = asyncio.Lock()
         
+        # Shared by every batch request, see transcribe_many()
+        self.batch_rate_limiter: Optional[RequestRateLimiter] = (
+            RequestRateLimiter(batch_requests_per_second) if batch_requests_per_second else None
+        )
+        
+        # Pre-opened live connections, see start_connection_pool()
+        self.connection_pool: Optional[LiveConnectionPool] = None
+        
         self.logger.info(
             "Deepgram STT client initialized",
             extra={
@@ -173,7 +451,7 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
     
     async def transcribe_batch(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, mmap.mmap],
         mimetype: str = "audio/wav",
         options: Optional[Dict[str, Any]] = None
     ) -> TranscriptionResult:
@@ -181,7 +459,7 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
         Transcribe audio data in batch mode.
         
         Args:
-            audio_data: Audio data bytes
+            audio_data: Audio data bytes, or a memory-mapped file uploaded in chunks
             mimetype: MIME type of audio data
             options: Additional transcription options
             
@@ -230,8 +508,15 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
             transcription_options.update(options)
         
         async def _transcribe():
+            if self.batch_rate_limiter is not None:
+                await self.batch_rate_limiter.acquire()
+            if isinstance(audio_data, bytes):
+                source = {"buffer": audio_data, "mimetype": mimetype}
+            else:
+                # A fresh iterator per attempt, so retries upload from the start
+                source = {"stream": _iter_chunks(audio_data), "mimetype": mimetype}
             response = await self.deepgram_client.listen.asyncrest.v("1").transcribe_file(
-                {"buffer": audio_data, "mimetype": mimetype},
+                source,
                 transcription_options
             )
             return response
@@ -259,15 +544,7 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                 duration=duration,
                 alternatives=[alt.transcript for alt in channel.alternatives[1:5]],
                 is_final=True,
-                words=[
-                    {
-                        "word": word.word,
-                        "start": word.start,
-                        "end": word.end,
-                        "confidence": word.confidence
-                    }
-                    for word in alternative.words
-                ] if hasattr(alternative, 'words') and alternative.words else [],
+                words=WordTimings.from_words(getattr(alternative, 'words', None)),
                 metadata={
                     "model": response.results.metadata.model_info.name if response.results.metadata else None,
                     "model_version": response.results.metadata.model_info.version if response.results.metadata else None,
@@ -294,6 +571,102 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
             )
             raise
     
+    async def transcribe_many(
+        self,
+        items: Iterable[Union[BatchItem, bytes, str, os.PathLike]],
+        concurrency: int = 4,
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[BatchTranscription]:
+        """
+        Transcribe many recordings, yielding each outcome as it finishes.
+        
+        Items are taken from the iterable lazily, at most concurrency at a
+        time. Every request goes through transcribe_batch(), so all items
+        share the client's retry and circuit breaker budget and its batch
+        rate limit. Files are memory-mapped and uploaded in chunks instead of
+        being read into memory. A failed item is reported in its outcome and
+        does not stop the others.
+        
+        Args:
+            items: BatchItems, audio bytes or file paths
+            concurrency: Most items in flight at once
+            options: Transcription options for items that set none
+        
+        Yields:
+            BatchTranscription: Outcomes in completion order
+        """
+        pending = iter(enumerate(items))
+        outcomes: asyncio.Queue[Optional[BatchTranscription]] = asyncio.Queue()
+        
+        async def worker():
+            try:
+                for index, item in pending:
+                    if not isinstance(item, BatchItem):
+                        item = BatchItem(audio=item)
+                    await outcomes.put(await self._transcribe_item(index, item, options))
+            finally:
+                await outcomes.put(None)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        running = len(workers)
+        completed = failed = 0
+        start_time = time.time()
+        
+        try:
+            while running:
+                outcome = await outcomes.get()
+                if outcome is None:
+                    running -= 1
+                    continue
+                completed += 1
+                failed += not outcome.ok
+                yield outcome
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+            self.logger.info(
+                "Batch transcription run finished",
+                extra={
+                    "completed": completed,
+                    "failed": failed,
+                    "concurrency": concurrency,
+                    "duration": time.time() - start_time
+                }
+            )
+    
+    async def _transcribe_item(
+        self,
+        index: int,
+        item: BatchItem,
+        options: Optional[Dict[str, Any]]
+    ) -> BatchTranscription:
+        """Transcribe one transcribe_many() item, capturing its error."""
+        item_id = item.item_id or (os.fspath(item.audio) if not isinstance(item.audio, bytes) else str(index))
+        outcome = BatchTranscription(index=index, item_id=item_id)
+        item_options = item.options if item.options is not None else options
+        
+        try:
+            if isinstance(item.audio, bytes):
+                outcome.result = await self.transcribe_batch(
+                    item.audio, item.mimetype or "audio/wav", item_options
+                )
+            else:
+                path = os.fspath(item.audio)
+                mimetype = item.mimetype or mimetypes.guess_type(path)[0] or "audio/wav"
+                with open(path, "rb") as audio_file:
+                    if os.fstat(audio_file.fileno()).st_size == 0:
+                        raise ValueError("Invalid audio data: Audio data cannot be empty")
+                    with mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        outcome.result = await self.transcribe_batch(mapped, mimetype, item_options)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            outcome.error = e
+        
+        return outcome
+    
     async def transcribe_stream(
         self,
         audio_stream: AsyncIterator[bytes],
@@ -397,32 +770,17 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
         Yields:
             TranscriptionResult: Transcription results
         """
-        # Configure live transcription options
-        options = LiveOptions(
-            model=self.streaming_config.model,
-            language=self.streaming_config.language,
-            sample_rate=self.streaming_config.sample_rate,
-            channels=self.streaming_config.channels,
-            encoding=self.streaming_config.encoding,
-            interim_results=self.streaming_config.interim_results,
-            punctuate=self.streaming_config.punctuate,
-            smart_format=self.streaming_config.smart_format,
-            profanity_filter=self.streaming_config.profanity_filter,
-            redact=self.streaming_config.redact,
-            keywords=self.streaming_config.keywords,
-            utterance_end_ms=self.streaming_config.utterance_end_ms,
-            vad_events=self.streaming_config.vad_events,
-            endpointing=self.streaming_config.endpointing
-        )
+        if self.connection_pool is not None:
+            live = await self.connection_pool.acquire()
+        else:
+            live = await self._open_live_connection()
+        dg_connection = live.connection
         
-        # Create live transcription connection
-        dg_connection = self.deepgram_client.listen.asynclive.v("1")
-        
-        # Result queue for handling async events
-        result_queue: asyncio.Queue[TranscriptionResult] = asyncio.Queue()
+        # Bounded, ordered handoff from the connection's event handlers
+        results = _ResultChannel(self.streaming_config.result_buffer_size, self.deepgram_metrics)
         connection_active = True
         
-        def on_message(self, result, **kwargs):
+        async def on_message(result):
             """Handle transcription messages."""
             try:
                 if result.channel and result.channel.alternatives:
@@ -436,19 +794,14 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                         is_final=result.is_final,
                         channel=result.channel_index[0] if result.channel_index else 0,
                         start_time=result.start if hasattr(result, 'start') else 0.0,
-                        end_time=result.end if hasattr(result, 'end') else 0.0,
-                        words=[
-                            {
-                                "word": word.word,
-                                "start": word.start,
-                                "end": word.end,
-                                "confidence": word.confidence
-                            }
-                            for word in alternative.words
-                        ] if hasattr(alternative, 'words') and alternative.words else [],
+                        # Live results carry start and duration, in seconds of streamed audio
+                        end_time=getattr(result, 'start', 0.0) + getattr(result, 'duration', 0.0),
+                        words=WordTimings.from_words(getattr(alternative, 'words', None)),
                         metadata={
                             "model_uuid": result.metadata.model_uuid if result.metadata else None,
-                            "request_id": result.metadata.request_id if result.metadata else None
+                            "request_id": result.metadata.request_id if result.metadata else None,
+                            "speech_final": bool(getattr(result, 'speech_final', False)),
+                            "from_finalize": bool(getattr(result, 'from_finalize', False))
                         }
                     )
                     
@@ -460,7 +813,7 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                             (current_avg * current_count + alternative.confidence) / (current_count + 1)
                         )
                     
-                    asyncio.create_task(result_queue.put(transcription_result))
+                    results.put_nowait(transcription_result)
                     
             except Exception as e:
                 self.logger.error(
@@ -468,7 +821,7 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                     extra={"connection_id": connection_id}
                 )
         
-        def on_error(self, error, **kwargs):
+        async def on_error(error):
             """Handle connection errors."""
             self.logger.error(
                 f"Streaming transcription error: {str(error)}",
@@ -476,9 +829,9 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
             )
             nonlocal connection_active
             connection_active = False
-            asyncio.create_task(result_queue.put(None))  # Signal end
+            results.close()
         
-        def on_close(self, close, **kwargs):
+        async def on_close(close):
             """Handle connection close."""
             self.logger.info(
                 "Streaming transcription connection closed",
@@ -486,17 +839,14 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
             )
             nonlocal connection_active
             connection_active = False
-            asyncio.create_task(result_queue.put(None))  # Signal end
+            results.close()
         
-        # Register event handlers
-        dg_connection.on(LiveTranscriptionEvents.Transcript, on_message)
-        dg_connection.on(LiveTranscriptionEvents.Error, on_error)
-        dg_connection.on(LiveTranscriptionEvents.Close, on_close)
+        live.attach(on_message, on_error, on_close)
         
         try:
-            # Start the connection
-            if not await dg_connection.start(options):
-                raise Exception("Failed to start Deepgram live transcription")
+            # A pooled connection the server closed since its last keepalive
+            if live.closed:
+                raise Exception("Deepgram live connection closed before use")
             
             # Store active connection
             async with self._connection_lock:
@@ -517,21 +867,20 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                 finally:
                     if connection_active:
                         await dg_connection.finish()
+                    # Results flushed by finish() are already buffered
+                    results.close()
             
             # Start audio streaming
             audio_task = asyncio.create_task(stream_audio())
             
             try:
-                # Yield results as they come
-                while connection_active:
-                    try:
-                        result = await asyncio.wait_for(result_queue.get(), timeout=1.0)
-                        if result is None:  # End signal
-                            break
-                        yield result
-                    except asyncio.TimeoutError:
-                        continue
-                        
+                # Yield results as they come; the channel wakes us, no polling
+                while True:
+                    result = await results.get()
+                    if result is None:  # Connection ended
+                        break
+                    yield result
+            
             finally:
                 # Clean up
                 audio_task.cancel()
@@ -551,6 +900,74 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                 if connection_id in self._active_connections:
                     del self._active_connections[connection_id]
     
+    def _live_options(self) -> LiveOptions:
+        """Build live transcription options from the streaming configuration."""
+        return LiveOptions(
+            model=self.streaming_config.model,
+            language=self.streaming_config.language,
+            sample_rate=self.streaming_config.sample_rate,
+            channels=self.streaming_config.channels,
+            encoding=self.streaming_config.encoding,
+            interim_results=self.streaming_config.interim_results,
+            punctuate=self.streaming_config.punctuate,
+            smart_format=self.streaming_config.smart_format,
+            profanity_filter=self.streaming_config.profanity_filter,
+            redact=self.streaming_config.redact,
+            keywords=self.streaming_config.keywords,
+            utterance_end_ms=self.streaming_config.utterance_end_ms,
+            vad_events=self.streaming_config.vad_events,
+            endpointing=self.streaming_config.endpointing
+        )
+    
+    async def _open_live_connection(self) -> LiveConnection:
+        """
+        Open and start a live transcription connection.
+        
+        Returns:
+            LiveConnection: Started connection with no stream attached
+        """
+        live = LiveConnection(self.deepgram_client.listen.asynclive.v("1"))
+        if not await live.connection.start(self._live_options()):
+            raise Exception("Failed to start Deepgram live transcription")
+        return live
+    
+    async def start_connection_pool(self, config: Optional[LivePoolConfig] = None) -> None:
+        """
+        Keep live connections pre-opened so new streams skip the handshake.
+        
+        Args:
+            config: Pool sizing and upkeep settings
+        """
+        if self.connection_pool is None:
+            self.connection_pool = LiveConnectionPool(self._open_live_connection, config)
+            await self.connection_pool.start()
+    
+    async def finalize_stream(self, connection_id: str) -> bool:
+        """
+        Ask a streaming connection to flush final results for the audio sent so far.
+        
+        Deepgram answers with final results marked from_finalize, without
+        waiting for its own endpointing; the connection stays open.
+        
+        Args:
+            connection_id: Connection identifier
+            
+        Returns:
+            bool: True if the request was sent
+        """
+        connection = self._active_connections.get(connection_id)
+        if connection is None:
+            return False
+        
+        try:
+            return bool(await connection.finalize())
+        except Exception as e:
+            self.logger.warning(
+                f"Error finalizing connection {connection_id}: {str(e)}",
+                extra={"connection_id": connection_id}
+            )
+            return False
+    
     async def close_connection(self, connection_id: str) -> None:
         """
         Close a specific streaming connection.
@@ -578,6 +995,10 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
         for connection_id in connection_ids:
             await self.close_connection(connection_id)
     
+    def is_available(self) -> bool:
+        """Whether the circuit breaker lets requests through."""
+        return self.circuit_breaker.can_execute()
+    
     def get_deepgram_metrics(self) -> DeepgramMetrics:
         """
         Get Deepgram-specific metrics.
@@ -598,7 +1019,8 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
                 "total_audio_duration": self.deepgram_metrics.total_audio_duration,
                 "transcription_speed_ratio": self.deepgram_metrics.transcription_speed_ratio,
                 "average_confidence": self.deepgram_metrics.average_confidence,
-                "reconnection_count": self.deepgram_metrics.reconnection_count
+                "reconnection_count": self.deepgram_metrics.reconnection_count,
+                "dropped_results": self.deepgram_metrics.dropped_results
             },
             "streaming_config": {
                 "model": self.streaming_config.model,
@@ -612,5 +1034,8 @@ class DeepgramSTTClient(BaseResilientClient[TranscriptionResult]):
     
     async def close(self) -> None:
         """Close the client and all connections."""
+        if self.connection_pool is not None:
+            await self.connection_pool.stop()
+            self.connection_pool = None
         await self.close_all_connections()
         await super().close()
\ No newline at end of file
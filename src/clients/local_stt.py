@@ -0,0 +1,319 @@
+"""
+CPU-only offline speech-to-text.
+
+This module implements the LocalWhisperSTT backend, which runs a small
+Whisper model through faster-whisper (CTranslate2, int8 on CPU). It is the
+fallback used while the hosted provider is unavailable: slower and less
+accurate, but it keeps calls answering. faster-whisper is an optional
+dependency (``pip install voice-ai-agent[local-stt]``); the model is loaded
+on first use, or ahead of time with warm_up().
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import numpy as np
+
+from src.audio.codec import AudioFormatSpec, AudioTranscoder, unwrap_wav
+from src.clients.deepgram_stt import StreamingConfig, TranscriptionResult, WordTimings
+from src.clients.stt_backend import STTBackend
+from src.executor import BlockingExecutor
+from src.metrics import MetricsCollector, get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+# Whisper models take 16 kHz mono float32
+MODEL_AUDIO_FORMAT = AudioFormatSpec(sample_rate=16000, channels=1)
+
+
+class LocalWhisperSTT(STTBackend):
+    """
+    Whisper transcription on the local CPU.
+    
+    Inference runs on the engine's own worker threads so it never blocks
+    the event loop or starves the shared housekeeping executor. Streams are
+    buffered and transcribed on finalize_stream() and when they end, since
+    Whisper decodes whole utterances rather than incremental audio.
+    """
+    
+    name = "local_whisper"
+    
+    def __init__(
+        self,
+        model_size: str = "tiny.en",
+        streaming_config: Optional[StreamingConfig] = None,
+        workers: int = 1,
+        cpu_threads: Optional[int] = None,
+        beam_size: int = 1,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the engine; the model is loaded on first use.
+        
+        Args:
+            model_size: faster-whisper model name or local model directory
+            streaming_config: Language and format of streamed audio
+            workers: Transcriptions run in parallel
+            cpu_threads: CTranslate2 threads per transcription, defaults to
+                the CPU count divided among workers
+            beam_size: Decoding beam size; 1 is greedy and fastest
+            metrics_collector: Collector for engine metrics, defaults to the global one
+        """
+        self.model_size = model_size
+        self.streaming_config = streaming_config or StreamingConfig()
+        self.workers = max(1, workers)
+        self.cpu_threads = cpu_threads or max(1, (os.cpu_count() or 1) // self.workers)
+        self.beam_size = beam_size
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        
+        self.language = self.streaming_config.language.split("-")[0].lower()
+        self.executor = BlockingExecutor(
+            max_workers=self.workers,
+            max_pending=self.workers * 4,
+            thread_name_prefix="local-stt",
+            metrics_collector=self.metrics_collector
+        )
+        self._model: Any = None
+        self._model_lock = asyncio.Lock()
+        self._load_error: Optional[Exception] = None
+        self._streams: Dict[str, List[bytes]] = {}
+        self._stream_positions: Dict[str, float] = {}
+        self._stream_results: Dict[str, asyncio.Queue] = {}
+    
+    def _load_model(self) -> Any:
+        """Load the Whisper model; runs on a worker thread."""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise ImportError(
+                "Local STT needs faster-whisper: pip install 'voice-ai-agent[local-stt]'"
+            ) from e
+        
+        start = time.perf_counter()
+        model = WhisperModel(
+            self.model_size,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=self.cpu_threads,
+            num_workers=self.workers
+        )
+        logger.info(
+            f"Loaded local Whisper model {self.model_size}",
+            extra={"model": self.model_size, "load_time": time.perf_counter() - start}
+        )
+        return model
+    
+    async def warm_up(self) -> None:
+        """Load the model now rather than on the first fallback request."""
+        async with self._model_lock:
+            if self._model is not None:
+                return
+            try:
+                self._model = await self.executor.run(self._load_model, task_name="local_stt_load")
+                self._load_error = None
+            except Exception as e:
+                self._load_error = e
+                raise
+    
+    def is_available(self) -> bool:
+        """Available unless the model failed to load."""
+        return self._load_error is None
+    
+    async def health_check(self) -> bool:
+        """Healthy once the model loads."""
+        try:
+            await self.warm_up()
+        except Exception as e:
+            logger.error(f"Local STT model unavailable: {e}")
+            return False
+        return True
+    
+    def get_health_status(self) -> Dict[str, Any]:
+        """Get health status of the local engine."""
+        return {
+            "service": self.name,
+            "healthy": self.is_available(),
+            "model": self.model_size,
+            "model_loaded": self._model is not None,
+            "error": str(self._load_error) if self._load_error else None,
+            "in_flight": self.executor.in_flight
+        }
+    
+    def _decode(self, audio_data: bytes, mimetype: str) -> np.ndarray:
+        """Convert WAV or raw PCM16 in the streaming format to model input."""
+        if bytes(audio_data[:4]) == b"RIFF":
+            payload, spec = unwrap_wav(audio_data)
+        elif mimetype in ("audio/l16", "audio/pcm", "audio/raw", "application/octet-stream"):
+            payload = memoryview(audio_data)
+            spec = AudioFormatSpec(
+                sample_rate=self.streaming_config.sample_rate,
+                channels=self.streaming_config.channels
+            )
+        else:
+            raise ValueError(f"Local STT cannot decode {mimetype} audio")
+        
+        transcoder = AudioTranscoder(spec, MODEL_AUDIO_FORMAT)
+        pcm = transcoder.convert(payload) + transcoder.flush()
+        return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    
+    def _transcribe_audio(self, audio_data: bytes, mimetype: str) -> TranscriptionResult:
+        """Decode and transcribe one utterance; runs on a worker thread."""
+        samples = self._decode(audio_data, mimetype)
+        start = time.perf_counter()
+        segments, _ = self._model.transcribe(
+            samples,
+            language=self.language,
+            beam_size=self.beam_size,
+            word_timestamps=True,
+            condition_on_previous_text=False
+        )
+        # Decoding happens while the segment generator is consumed
+        segments = list(segments)
+        elapsed = time.perf_counter() - start
+        
+        audio_duration = len(samples) / MODEL_AUDIO_FORMAT.sample_rate
+        words = [
+            {"word": word.word.strip(), "start": word.start, "end": word.end, "confidence": word.probability}
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+        confidence = (
+            sum(math.exp(segment.avg_logprob) for segment in segments) / len(segments)
+            if segments else 0.0
+        )
+        return TranscriptionResult(
+            text=" ".join(segment.text.strip() for segment in segments).strip(),
+            confidence=confidence,
+            language=self.streaming_config.language,
+            duration=elapsed,
+            is_final=True,
+            end_time=audio_duration,
+            words=WordTimings.from_dicts(words),
+            metadata={
+                "model": self.model_size,
+                "backend": self.name,
+                "real_time_factor": elapsed / audio_duration if audio_duration else 0.0
+            }
+        )
+    
+    async def _transcribe(self, audio_data: bytes, mimetype: str) -> TranscriptionResult:
+        await self.warm_up()
+        result = await self.executor.run(self._transcribe_audio, audio_data, mimetype, task_name="local_stt")
+        self.metrics_collector.record_timer("local_stt_duration", result.duration)
+        self.metrics_collector.set_gauge("local_stt_real_time_factor", result.metadata["real_time_factor"])
+        return result
+    
+    async def transcribe_batch(
+        self,
+        audio_data: bytes,
+        mimetype: str = "audio/wav",
+        options: Optional[Dict[str, Any]] = None
+    ) -> TranscriptionResult:
+        """
+        Transcribe a complete recording.
+        
+        Args:
+            audio_data: WAV file, or raw PCM16 in the streaming format
+            mimetype: MIME type of audio data
+            options: Ignored; accepted for interface compatibility
+        
+        Returns:
+            TranscriptionResult: Transcription result
+        
+        Raises:
+            ValueError: If the audio cannot be decoded
+        """
+        return await self._transcribe(audio_data, mimetype)
+    
+    async def transcribe_stream(
+        self,
+        audio_stream: AsyncIterator[bytes],
+        connection_id: Optional[str] = None
+    ) -> AsyncIterator[TranscriptionResult]:
+        """
+        Buffer streamed PCM16 and transcribe it on finalize and at the end.
+        
+        Args:
+            audio_stream: Async iterator of PCM16 chunks in the streaming format
+            connection_id: Optional connection identifier
+        
+        Yields:
+            TranscriptionResult: Final results positioned in the stream
+        """
+        key = connection_id or f"local_{id(audio_stream)}"
+        self._streams[key] = []
+        self._stream_positions[key] = 0.0
+        results: asyncio.Queue = asyncio.Queue()
+        self._stream_results[key] = results
+        
+        async def receive():
+            try:
+                async for chunk in audio_stream:
+                    self._streams[key].append(bytes(chunk))
+                await self._flush(key, from_finalize=False)
+            finally:
+                await results.put(None)
+        
+        receiver = asyncio.create_task(receive())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                yield result
+            await receiver
+        finally:
+            receiver.cancel()
+            self._streams.pop(key, None)
+            self._stream_positions.pop(key, None)
+            self._stream_results.pop(key, None)
+    
+    async def finalize_stream(self, connection_id: str) -> bool:
+        """
+        Transcribe the audio buffered on a stream since the last finalize.
+        
+        Args:
+            connection_id: Connection identifier
+        
+        Returns:
+            bool: True if the stream exists
+        """
+        if connection_id not in self._streams:
+            return False
+        await self._flush(connection_id, from_finalize=True)
+        return True
+    
+    async def _flush(self, key: str, from_finalize: bool) -> None:
+        """Transcribe a stream's buffered audio and queue the final result."""
+        chunks = self._streams.get(key)
+        results = self._stream_results.get(key)
+        if chunks is None or results is None:
+            return
+        audio = b"".join(chunks)
+        chunks.clear()
+        
+        start = self._stream_positions[key]
+        format_spec = AudioFormatSpec(
+            sample_rate=self.streaming_config.sample_rate,
+            channels=self.streaming_config.channels
+        )
+        end = start + len(audio) / format_spec.bytes_per_second
+        self._stream_positions[key] = end
+        
+        if audio:
+            result = await self._transcribe(audio, "audio/l16")
+        else:
+            result = TranscriptionResult(text="", confidence=0.0, language=self.streaming_config.language, duration=0.0)
+        result.start_time = start
+        result.end_time = end
+        result.metadata["from_finalize"] = from_finalize
+        await results.put(result)
+    
+    async def close(self) -> None:
+        """Stop the worker threads without waiting for a running transcription."""
+        self.executor.shutdown(wait=False)
@@ -9,11 +9,14 @@ from enum import Enum
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from uuid import uuid4
 
+import numpy as np
 import openai
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 from src.clients.base import BaseResilientClient, RetryConfig, CircuitBreakerConfig
+from src.clients.response_cache import CacheLookup, ResponseCache, ResponseCacheConfig
+from src.clients.token_counter import TOKENS_PER_REPLY, TokenCounter, get_token_counter
 from src.config import get_settings
 
 
@@ -26,18 +29,29 @@ class MessageRole(str, Enum):
 
 @dataclass
 class Message:
-    """Conversation message."""
+    """
+    Conversation message.
+    
+    Its API form and token count are cached, so content should only be
+    changed through ConversationContext.replace_message() once the message
+    is in a context.
+    """
     role: MessageRole
     content: str
     timestamp: float = field(default_factory=time.time)
     metadata: Optional[Dict[str, Any]] = None
+    # Prompt tokens of the message, counted once by ConversationContext
+    token_count: Optional[int] = field(default=None, repr=False, compare=False)
+    _api_format: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_openai_format(self) -> Dict[str, str]:
         """Convert to OpenAI API format."""
-        return {
-            "role": self.role.value,
-            "content": self.content
-        }
+        if self._api_format is None:
+            self._api_format = {
+                "role": self.role.value,
+                "content": self.content
+            }
+        return self._api_format
 
 
 @dataclass
@@ -58,35 +72,143 @@ class TokenUsage:
 
 @dataclass
 class ConversationContext:
-    """Context for conversation management."""
+    """
+    Context for conversation management.
+    
+    The context keeps an API-ready view of its messages and a running
+    total of their tokens, both updated by add_message(), replace_message(),
+    remove_message() and drop_oldest() so a request neither rebuilds the
+    message list nor re-counts the conversation. Each message's token count
+    is computed once, when it is added. If messages is replaced or resized
+    directly, both are rebuilt from the per-message caches on next use;
+    message content must only be changed through replace_message().
+    """
     conversation_id: str
     messages: List[Message] = field(default_factory=list)
     system_prompt: Optional[str] = None
     max_tokens: int = 4000
     temperature: float = 0.7
     metadata: Dict[str, Any] = field(default_factory=dict)
+    token_counter: TokenCounter = field(default_factory=get_token_counter, repr=False, compare=False)
+    
+    # API view and token total of messages, valid while it is the synced list
+    _api_messages: List[Dict[str, str]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _message_tokens: int = field(default=0, init=False, repr=False, compare=False)
+    _synced_messages: Optional[List[Message]] = field(default=None, init=False, repr=False, compare=False)
+    _synced_length: int = field(default=0, init=False, repr=False, compare=False)
+    _system_message: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _count(self, message: Message) -> int:
+        if message.token_count is None:
+            message.token_count = self.token_counter.count_message(message.role.value, message.content)
+        return message.token_count
+    
+    def _sync(self) -> None:
+        """Rebuild the view and token total if messages changed behind the context's back."""
+        if self._synced_messages is self.messages and self._synced_length == len(self.messages):
+            return
+        # A new list, since a copied context may share the old one
+        self._api_messages = [message.to_openai_format() for message in self.messages]
+        self._message_tokens = sum(self._count(message) for message in self.messages)
+        self._synced_messages = self.messages
+        self._synced_length = len(self.messages)
+    
+    @property
+    def message_tokens(self) -> int:
+        """Prompt tokens of the conversation messages."""
+        self._sync()
+        return self._message_tokens
+    
+    @property
+    def token_count(self) -> int:
+        """Prompt tokens of get_messages_for_api(), including chat formatting."""
+        system_tokens = self.token_counter.count_message("system", self.system_prompt) if self.system_prompt else 0
+        return system_tokens + self.message_tokens + TOKENS_PER_REPLY
+    
+    def use_token_counter(self, token_counter: TokenCounter) -> None:
+        """
+        Count tokens with another model's counter from now on.
+        
+        Args:
+            token_counter: Counter for the model the context is sent to
+        """
+        if token_counter is self.token_counter:
+            return
+        self.token_counter = token_counter
+        for message in self.messages:
+            message.token_count = None
+        self._synced_messages = None
     
     def add_message(self, role: MessageRole, content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Add message to conversation."""
+        self._sync()
         message = Message(role=role, content=content, metadata=metadata)
+        self._message_tokens += self._count(message)
         self.messages.append(message)
+        self._api_messages.append(message.to_openai_format())
+        self._synced_length += 1
+    
+    def replace_message(self, index: int, content: str) -> None:
+        """
+        Change the content of a message already in the conversation.
+        
+        Args:
+            index: Position of the message in messages
+            content: New message content
+        """
+        self._sync()
+        message = self.messages[index]
+        self._message_tokens -= self._count(message)
+        message.content = content
+        message.token_count = None
+        message._api_format = None
+        self._message_tokens += self._count(message)
+        self._api_messages[index] = message.to_openai_format()
+    
+    def remove_message(self, index: int) -> None:
+        """
+        Remove one message from the conversation.
+        
+        Args:
+            index: Position of the message in messages
+        """
+        self._sync()
+        self._message_tokens -= self._count(self.messages[index])
+        del self.messages[index]
+        del self._api_messages[index]
+        self._synced_length = len(self.messages)
+    
+    def drop_oldest(self, count: int) -> None:
+        """
+        Remove the oldest messages from the conversation.
+        
+        Args:
+            count: Number of messages to remove
+        """
+        self._sync()
+        count = min(max(count, 0), len(self.messages))
+        self._message_tokens -= sum(self._count(message) for message in self.messages[:count])
+        del self.messages[:count]
+        del self._api_messages[:count]
+        self._synced_length = len(self.messages)
     
     def get_messages_for_api(self) -> List[Dict[str, str]]:
-        """Get messages formatted for OpenAI API."""
-        api_messages = []
+        """
+        Get messages formatted for OpenAI API.
+        
+        The returned list is new, but its message dicts are shared with the
+        context and must not be modified.
+        """
+        self._sync()
+        if not self.system_prompt:
+            return list(self._api_messages)
         
-        # Add system prompt if provided
-        if self.system_prompt:
-            api_messages.append({
+        if self._system_message is None or self._system_message["content"] != self.system_prompt:
+            self._system_message = {
                 "role": "system",
                 "content": self.system_prompt
-            })
-        
-        # Add conversation messages
-        for message in self.messages:
-            api_messages.append(message.to_openai_format())
-        
-        return api_messages
+            }
+        return [self._system_message] + self._api_messages
 
 
 @dataclass
@@ -141,6 +263,7 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
         self.max_context_tokens = max_context_tokens or settings.context_window_size
         self.max_response_tokens = max_response_tokens or settings.max_response_tokens
         self.temperature = temperature or settings.ai_temperature
+        self.token_counter = get_token_counter(self.model)
         
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
@@ -164,31 +287,145 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
         # Token usage tracking
         self.total_token_usage = TokenUsage()
         self.conversation_contexts: Dict[str, ConversationContext] = {}
+        
+        # Answers to repeated standalone questions, off unless enabled
+        self.response_cache: Optional[ResponseCache] = None
     
     async def close(self) -> None:
         """Close the OpenAI client."""
         await super().close()
         await self.client.close()
     
+    def enable_response_cache(self, config: Optional[ResponseCacheConfig] = None) -> ResponseCache:
+        """
+        Answer repeated standalone questions from a cache.
+        
+        Args:
+            config: Cache size, lifetime and matching rules
+        
+        Returns:
+            ResponseCache: The client's cache
+        """
+        config = config or ResponseCacheConfig()
+        
+        async def embed(text: str) -> np.ndarray:
+            response = await asyncio.wait_for(
+                self.client.embeddings.create(model=config.embedding_model, input=text),
+                timeout=config.embedding_timeout
+            )
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
+        
+        self.response_cache = ResponseCache(config, embed=embed)
+        self.logger.info(
+            "LLM response cache enabled",
+            extra={"max_entries": config.max_entries, "similarity_threshold": config.similarity_threshold}
+        )
+        return self.response_cache
+    
+    def _lookup_cached_response(self, context: ConversationContext) -> Optional[CacheLookup]:
+        """Look up the context's last user message exactly, if the cache is enabled and it ends the context."""
+        if self.response_cache is None or not context.messages:
+            return None
+        last_message = context.messages[-1]
+        if last_message.role != MessageRole.USER:
+            return None
+        return self.response_cache.lookup_exact(context.system_prompt, last_message.content)
+    
+    def _start_semantic_lookup(self, lookup: Optional[CacheLookup]) -> Optional[asyncio.Task]:
+        """Match an exact miss semantically in the background, so the request does not wait for it."""
+        if lookup is None or lookup.entry is not None or self.response_cache.embed is None:
+            return None
+        return asyncio.create_task(self.response_cache.lookup_semantic(lookup))
+    
+    @staticmethod
+    async def _semantic_hit_first(semantic: Optional[asyncio.Task], pending: asyncio.Future) -> bool:
+        """
+        Wait for pending work or a semantic cache match, whichever comes first.
+        
+        Returns:
+            bool: True if the cache matched before pending finished; pending is then cancelled
+        """
+        if semantic is None:
+            return False
+        try:
+            await asyncio.wait({semantic, pending}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            pending.cancel()
+            await asyncio.wait({pending})
+            raise
+        if pending.done() or semantic.result().entry is None:
+            return False
+        pending.cancel()
+        await asyncio.wait({pending})
+        return True
+    
+    def _finish_cache_miss(
+        self,
+        lookup: CacheLookup,
+        semantic: Optional[asyncio.Task],
+        context: ConversationContext,
+        content: Optional[str],
+        model: str
+    ) -> None:
+        """
+        Record a lookup the model answered and cache the answer if it may be reused.
+        
+        Only complete answers to a context's first turn are stored: an answer
+        shaped by earlier turns would be wrong for other callers. The answer
+        is stored once the semantic lookup has its embedding.
+        """
+        cache = self.response_cache
+        # The model answered, whatever a late semantic match found
+        lookup.entry = None
+        lookup.match = None
+        cache.record(lookup)
+        
+        standalone = all(message.role == MessageRole.SYSTEM for message in context.messages[:-1])
+        if content is None or not standalone:
+            if semantic is not None:
+                semantic.cancel()
+        elif semantic is None or semantic.done():
+            cache.store(lookup, content, model)
+        else:
+            semantic.add_done_callback(lambda _: cache.store(lookup, content, model))
+    
+    def _cached_response(self, lookup: CacheLookup, correlation_id: str, started_at: float) -> LLMResponse:
+        entry = lookup.entry
+        return LLMResponse(
+            content=entry.content,
+            token_usage=TokenUsage(),  # No tokens used for cached answers
+            model=entry.model,
+            finish_reason="stop",
+            response_time=time.time() - started_at,
+            metadata={
+                "correlation_id": correlation_id,
+                "cached": True,
+                "cache_match": lookup.match,
+                "cache_hits": entry.hits
+            }
+        )
+    
     def estimate_tokens(self, text: str) -> int:
         """
-        Estimate token count for text.
+        Count tokens for text with the model's encoding.
         
-        This is a rough approximation: ~4 characters per token for English.
-        For production, consider using tiktoken library for accurate counting.
+        Falls back to ~4 characters per token when tiktoken or the
+        encoding is unavailable.
         """
-        return len(text) // 4
-    
-    def calculate_context_tokens(self, messages: List[Dict[str, str]]) -> int:
-        """Calculate total tokens for message context."""
-        total_tokens = 0
-        for message in messages:
-            # Add tokens for role and content
-            total_tokens += self.estimate_tokens(message["role"])
-            total_tokens += self.estimate_tokens(message["content"])
-            # Add overhead for message formatting
-            total_tokens += 4
-        return total_tokens
+        return self.token_counter.count(text)
+    
+    def calculate_context_tokens(self, messages: Union[ConversationContext, List[Dict[str, str]]]) -> int:
+        """
+        Calculate total prompt tokens for message context.
+        
+        A ConversationContext answers from its running total; a list of
+        API-formatted messages is counted, reusing cached counts of texts
+        seen before.
+        """
+        if isinstance(messages, ConversationContext):
+            messages.use_token_counter(self.token_counter)
+            return messages.token_count
+        return self.token_counter.count_messages(messages)
     
     def truncate_context(self, messages: List[Dict[str, str]], max_tokens: int) -> List[Dict[str, str]]:
         """
@@ -207,8 +444,9 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
         conversation_messages = [msg for msg in messages if msg["role"] != "system"]
         
         # Calculate tokens for system messages
-        system_tokens = sum(self.estimate_tokens(msg["content"]) for msg in system_messages)
-        available_tokens = max_tokens - system_tokens - self.max_response_tokens
+        count_message = self.token_counter.count_message
+        system_tokens = sum(count_message(msg["role"], msg["content"]) for msg in system_messages)
+        available_tokens = max_tokens - system_tokens - TOKENS_PER_REPLY - self.max_response_tokens
         
         if available_tokens <= 0:
             self.logger.warning("System messages exceed token limit")
@@ -220,7 +458,7 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
         
         # Process messages in reverse order (most recent first)
         for message in reversed(conversation_messages):
-            message_tokens = self.estimate_tokens(message["content"]) + 4  # overhead
+            message_tokens = count_message(message["role"], message["content"])
             
             if current_tokens + message_tokens <= available_tokens:
                 truncated_conversation.insert(0, message)
@@ -233,7 +471,7 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
                         "role": "system",
                         "content": f"[Previous conversation context has been summarized due to length. {len(conversation_messages) - len(truncated_conversation)} earlier messages were condensed.]"
                     }
-                    if self.estimate_tokens(summary_msg["content"]) + current_tokens <= available_tokens:
+                    if count_message(summary_msg["role"], summary_msg["content"]) + current_tokens <= available_tokens:
                         truncated_conversation.insert(0, summary_msg)
                 break
         
@@ -242,17 +480,32 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
     async def generate_response(
         self,
         context: ConversationContext,
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        use_cache: bool = True
     ) -> LLMResponse:
-        """Generate response using OpenAI API."""
+        """
+        Generate response using OpenAI API.
+        
+        With the response cache enabled, a standalone question asked before
+        is answered from the cache; pass use_cache=False for turns whose
+        answer depends on the conversation so far. A semantic cache lookup
+        runs alongside the API request and only wins if it finishes first.
+        """
         if correlation_id is None:
             correlation_id = self._generate_correlation_id()
         
+        started_at = time.time()
+        cache_lookup = self._lookup_cached_response(context) if use_cache else None
+        if cache_lookup is not None and cache_lookup.entry is not None:
+            self.response_cache.record(cache_lookup)
+            return self._cached_response(cache_lookup, correlation_id, started_at)
+        semantic = self._start_semantic_lookup(cache_lookup)
+        
         # Prepare messages for API
         messages = context.get_messages_for_api()
         
         # Calculate and manage context size
-        context_tokens = self.calculate_context_tokens(messages)
+        context_tokens = self.calculate_context_tokens(context)
         if context_tokens > self.max_context_tokens:
             self.logger.info(
                 f"Context exceeds limit ({context_tokens} > {self.max_context_tokens}), truncating",
@@ -318,26 +571,63 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
                 self.logger.error(f"Unexpected error: {e}", extra={"correlation_id": correlation_id})
                 raise
         
-        return await self.execute_with_resilience(_make_request, correlation_id)
+        request = asyncio.ensure_future(self.execute_with_resilience(_make_request, correlation_id))
+        response: Optional[LLMResponse] = None
+        cache_hit = False
+        try:
+            cache_hit = await self._semantic_hit_first(semantic, request)
+            if not cache_hit:
+                response = await request
+        finally:
+            if cache_lookup is not None and not cache_hit:
+                complete = response is not None and response.finish_reason == "stop"
+                self._finish_cache_miss(
+                    cache_lookup,
+                    semantic,
+                    context,
+                    response.content if complete else None,
+                    self.model
+                )
+        
+        if cache_hit:
+            self.response_cache.record(cache_lookup)
+            return self._cached_response(cache_lookup, correlation_id, started_at)
+        return response
     
     async def stream_response(
         self,
         context: ConversationContext,
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        use_cache: bool = True
     ) -> AsyncIterator[str]:
-        """Stream response from OpenAI API for reduced latency."""
+        """
+        Stream response from OpenAI API for reduced latency; cached answers arrive as one chunk.
+        
+        Only a stream that finished normally is cached, not one the caller
+        stopped reading or that hit the token limit.
+        """
         if correlation_id is None:
             correlation_id = self._generate_correlation_id()
         
+        cache_lookup = self._lookup_cached_response(context) if use_cache else None
+        if cache_lookup is not None and cache_lookup.entry is not None:
+            self.response_cache.record(cache_lookup)
+            yield cache_lookup.entry.content
+            return
+        semantic = self._start_semantic_lookup(cache_lookup)
+        
         # Prepare messages for API
         messages = context.get_messages_for_api()
         
         # Calculate and manage context size
-        context_tokens = self.calculate_context_tokens(messages)
+        context_tokens = self.calculate_context_tokens(context)
         if context_tokens > self.max_context_tokens:
             messages = self.truncate_context(messages, self.max_context_tokens)
         
+        finish_reason: Optional[str] = None
+        
         async def _stream_request() -> AsyncIterator[str]:
+            nonlocal finish_reason
             try:
                 stream = await self.client.chat.completions.create(
                     model=self.model,
@@ -348,25 +638,59 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
                 )
                 
                 async for chunk in stream:
-                    if chunk.choices and chunk.choices[0].delta.content:
-                        yield chunk.choices[0].delta.content
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                    if choice.delta.content:
+                        yield choice.delta.content
                         
             except Exception as e:
                 self.logger.error(f"Streaming error: {e}", extra={"correlation_id": correlation_id})
                 raise
         
         # Execute streaming with resilience (note: streaming doesn't use circuit breaker)
+        chunks: List[str] = []
+        cached_content: Optional[str] = None
+        content: Optional[str] = None
+        request = _stream_request()
         try:
-            async for content_chunk in _stream_request():
-                yield content_chunk
-        except Exception as e:
-            # Fallback to non-streaming response
-            self.logger.warning(
-                f"Streaming failed, falling back to regular response: {e}",
-                extra={"correlation_id": correlation_id}
-            )
-            response = await self.generate_response(context, correlation_id)
-            yield response.content
+            try:
+                first_chunk = asyncio.ensure_future(request.__anext__())
+                if await self._semantic_hit_first(semantic, first_chunk):
+                    self.response_cache.record(cache_lookup)
+                    cached_content = cache_lookup.entry.content
+                else:
+                    try:
+                        chunks.append(await first_chunk)
+                    except StopAsyncIteration:
+                        pass
+                    else:
+                        yield chunks[0]
+                        async for content_chunk in request:
+                            chunks.append(content_chunk)
+                            yield content_chunk
+                    if finish_reason == "stop":
+                        content = "".join(chunks)
+            except Exception as e:
+                # Fallback to non-streaming response
+                self.logger.warning(
+                    f"Streaming failed, falling back to regular response: {e}",
+                    extra={"correlation_id": correlation_id}
+                )
+                response = await self.generate_response(context, correlation_id, use_cache=False)
+                if response.finish_reason == "stop":
+                    content = response.content
+                yield response.content
+                return
+            
+            if cached_content is not None:
+                yield cached_content
+        finally:
+            await request.aclose()
+            if cache_lookup is not None and cached_content is None:
+                self._finish_cache_miss(cache_lookup, semantic, context, content, self.model)
     
     def generate_fallback_response(self, error_type: str = "general") -> LLMResponse:
         """Generate fallback response for API failures."""
@@ -398,7 +722,8 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
             conversation_id=conversation_id,
             system_prompt=system_prompt or settings.system_prompt,
             max_tokens=max_tokens or self.max_context_tokens,
-            temperature=temperature or self.temperature
+            temperature=temperature or self.temperature,
+            token_counter=self.token_counter
         )
         
         self.conversation_contexts[conversation_id] = context
@@ -413,26 +738,31 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
         Optimize conversation history to maintain context within token limits.
         
         This method can be called periodically to clean up old messages
-        and maintain optimal context size.
+        and maintain optimal context size. The most recent messages that fit
+        in 60% of the context window are kept; older ones are dropped in
+        place, using their cached token counts.
         """
-        messages = context.get_messages_for_api()
-        total_tokens = self.calculate_context_tokens(messages)
+        total_tokens = self.calculate_context_tokens(context)
         
         if total_tokens > self.max_context_tokens * 0.8:  # 80% threshold
             # Keep system prompt and recent important messages
-            optimized_messages = self.truncate_context(messages, int(self.max_context_tokens * 0.6))
+            available_tokens = (
+                int(self.max_context_tokens * 0.6)
+                - (total_tokens - context.message_tokens)
+                - self.max_response_tokens
+            )
+            kept = 0
+            kept_tokens = 0
+            for message in reversed(context.messages):
+                if kept_tokens + message.token_count > available_tokens:
+                    break
+                kept += 1
+                kept_tokens += message.token_count
             
-            # Update context with optimized messages
-            context.messages = []
-            for msg in optimized_messages:
-                if msg["role"] != "system":  # Skip system messages as they're handled separately
-                    context.add_message(
-                        MessageRole(msg["role"]),
-                        msg["content"]
-                    )
+            context.drop_oldest(len(context.messages) - kept)
             
             self.logger.info(
-                f"Optimized conversation history: {total_tokens} -> {self.calculate_context_tokens(optimized_messages)} tokens",
+                f"Optimized conversation history: {total_tokens} -> {context.token_count} tokens",
                 extra={"conversation_id": context.conversation_id}
             )
     
@@ -448,7 +778,8 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
             "active_conversations": len(self.conversation_contexts),
             "model": self.model,
             "max_context_tokens": self.max_context_tokens,
-            "max_response_tokens": self.max_response_tokens
+            "max_response_tokens": self.max_response_tokens,
+            "response_cache": self.response_cache.get_stats() if self.response_cache else None
         }
     
     async def health_check(self) -> bool:
@@ -463,7 +794,7 @@ class OpenAILLMClient(BaseResilientClient[LLMResponse]):
             test_context.add_message(MessageRole.USER, "Hello")
             
             # Make a simple API call
-            response = await self.generate_response(test_context)
+            response = await self.generate_response(test_context, use_cache=False)
             return bool(response.content)
             
         except Exception as e:
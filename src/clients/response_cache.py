@@ -0,0 +1,360 @@
+"""
+Response cache for repeated caller questions.
+
+This module implements the ResponseCache class that remembers LLM answers
+to standalone questions ("what are your hours?") keyed on the normalized
+utterance and the system prompt. A question is answered from the cache
+when it matches a cached one exactly after normalization or, with an
+embedding function, when its embedding is close enough to a cached
+question's. Turns that refer back to the conversation ("is that free?")
+bypass the cache, and callers only store answers given without any
+earlier turns.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from src.metrics import MetricsCollector, get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+# Hesitations dropped before matching
+FILLER_WORDS = frozenset({"um", "uh", "erm", "er", "hmm", "mm"})
+
+# Words that make an utterance depend on earlier turns
+CONTEXT_WORDS = frozenset({
+    "it", "its", "that", "this", "these", "those", "them", "they", "their",
+    "he", "she", "him", "her", "his", "same", "again", "instead",
+    "yes", "no", "yeah", "yep", "nope", "ok", "okay", "sure"
+})
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+Embedder = Callable[[str], Awaitable[np.ndarray]]
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Size, lifetime and matching rules of the response cache."""
+    max_entries: int = 512
+    ttl_seconds: float = 3600.0
+    # Cosine similarity needed for a semantic match; 1.0 disables semantic lookup
+    similarity_threshold: float = 0.92
+    # Utterances longer than this are unlikely to repeat and are not cached
+    max_words: int = 30
+    context_words: FrozenSet[str] = CONTEXT_WORDS
+    embedding_model: str = "text-embedding-3-small"
+    # Seconds an embedding request may add to a cache miss
+    embedding_timeout: float = 1.0
+
+
+@dataclass
+class CacheEntry:
+    """A cached answer and its usage."""
+    key: CacheKey
+    utterance: str
+    content: str
+    model: str
+    created_at: float = field(default_factory=time.monotonic)
+    embedding: Optional[np.ndarray] = field(default=None, repr=False)
+    hits: int = 0
+    semantic_hits: int = 0
+    last_hit: Optional[float] = None
+
+
+@dataclass
+class CacheLookup:
+    """Result of a lookup: the matched entry, or what storing the answer needs."""
+    key: CacheKey
+    utterance: str
+    entry: Optional[CacheEntry] = None
+    match: Optional[str] = None
+    embedding: Optional[np.ndarray] = field(default=None, repr=False)
+
+
+def normalize_utterance(text: str) -> List[str]:
+    """Lower-case words of an utterance without punctuation or hesitations."""
+    return [word for word in _WORD_PATTERN.findall(text.lower()) if word not in FILLER_WORDS]
+
+
+class ResponseCache:
+    """
+    LRU cache of LLM answers with a time-to-live and per-entry hit counts.
+    
+    Lookups try the exact normalized utterance first. On an exact miss the
+    utterance is embedded and compared with cached questions under the same
+    system prompt; a failed embedding request just means no semantic match.
+    
+    lookup() runs both steps. Callers that must not wait for the embedding
+    request use lookup_exact() and run lookup_semantic() alongside their own
+    work, then report the outcome with record().
+    """
+    
+    def __init__(
+        self,
+        config: Optional[ResponseCacheConfig] = None,
+        embed: Optional[Embedder] = None,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            config: Cache size, lifetime and matching rules
+            embed: Returns an embedding for a text; None for exact lookup only
+            metrics_collector: Collector for cache metrics, defaults to the global one
+        """
+        self.config = config or ResponseCacheConfig()
+        self.embed = embed if self.config.similarity_threshold < 1.0 else None
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        # Stacked unit embeddings per system prompt, rebuilt after changes
+        self._index: Dict[str, Tuple[List[CacheKey], np.ndarray]] = {}
+    
+    def __len__(self) -> int:
+        """Number of cached answers."""
+        return len(self._entries)
+    
+    @staticmethod
+    def _prompt_hash(system_prompt: Optional[str]) -> str:
+        return hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()[:16]
+    
+    def cacheable(self, utterance: str) -> bool:
+        """
+        Whether an utterance can be answered without the conversation.
+        
+        Args:
+            utterance: Caller's utterance
+        
+        Returns:
+            bool: False for empty or long utterances and ones that refer back
+        """
+        words = normalize_utterance(utterance)
+        if not words or len(words) > self.config.max_words:
+            return False
+        return self.config.context_words.isdisjoint(words)
+    
+    def _expired(self, entry: CacheEntry, now: float) -> bool:
+        return now - entry.created_at > self.config.ttl_seconds
+    
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        self._index.pop(key[0], None)
+    
+    def purge_expired(self) -> int:
+        """
+        Drop entries older than the time-to-live.
+        
+        Returns:
+            int: Entries removed
+        """
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if self._expired(entry, now)]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+    
+    def _nearest(self, prompt_hash: str, embedding: np.ndarray) -> Tuple[Optional[CacheEntry], float]:
+        """Most similar cached question under a system prompt."""
+        index = self._index.get(prompt_hash)
+        if index is None:
+            keys = [
+                key for key, entry in self._entries.items()
+                if key[0] == prompt_hash and entry.embedding is not None
+            ]
+            if not keys:
+                return None, 0.0
+            index = (keys, np.stack([self._entries[key].embedding for key in keys]))
+            self._index[prompt_hash] = index
+        
+        keys, matrix = index
+        similarities = matrix @ embedding
+        best = int(np.argmax(similarities))
+        return self._entries[keys[best]], float(similarities[best])
+    
+    async def _embed(self, utterance: str) -> Optional[np.ndarray]:
+        try:
+            embedding = np.asarray(await self.embed(utterance), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Response cache embedding failed: {e}", extra={"error": str(e)})
+            self.metrics_collector.increment_counter("llm_cache_embedding_failures_total")
+            return None
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else None
+    
+    async def lookup(self, system_prompt: Optional[str], utterance: str) -> Optional[CacheLookup]:
+        """
+        Find a cached answer for an utterance.
+        
+        Args:
+            system_prompt: System prompt the answer must have been given under
+            utterance: Caller's utterance
+        
+        Returns:
+            CacheLookup with entry set on a hit, or None if the utterance bypasses the cache
+        """
+        lookup = self.lookup_exact(system_prompt, utterance)
+        if lookup is None:
+            return None
+        if lookup.entry is None and self.embed is not None:
+            await self.lookup_semantic(lookup)
+        self.record(lookup)
+        return lookup
+    
+    def lookup_exact(self, system_prompt: Optional[str], utterance: str) -> Optional[CacheLookup]:
+        """
+        Find a cached answer to the same normalized utterance, without recording the outcome.
+        
+        Args:
+            system_prompt: System prompt the answer must have been given under
+            utterance: Caller's utterance
+        
+        Returns:
+            CacheLookup with entry set on a hit, or None if the utterance bypasses the cache
+        """
+        if not self.cacheable(utterance):
+            self.bypasses += 1
+            self.metrics_collector.increment_counter("llm_cache_bypasses_total")
+            return None
+        
+        key = (self._prompt_hash(system_prompt), " ".join(normalize_utterance(utterance)))
+        lookup = CacheLookup(key=key, utterance=utterance)
+        
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry, time.monotonic()):
+            self._remove(key)
+            entry = None
+        if entry is not None:
+            lookup.entry = entry
+            lookup.match = "exact"
+        return lookup
+    
+    async def lookup_semantic(self, lookup: CacheLookup) -> CacheLookup:
+        """
+        Embed a missed utterance and match it against similar cached questions.
+        
+        The embedding is kept on the lookup for store(). The outcome is not
+        recorded.
+        
+        Args:
+            lookup: Exact miss returned by lookup_exact()
+        
+        Returns:
+            The same lookup, with entry set on a semantic match
+        """
+        if self.embed is None:
+            return lookup
+        lookup.embedding = await self._embed(lookup.utterance)
+        if lookup.embedding is None:
+            return lookup
+        
+        nearest, similarity = self._nearest(lookup.key[0], lookup.embedding)
+        if nearest is not None and similarity >= self.config.similarity_threshold:
+            if self._expired(nearest, time.monotonic()):
+                self._remove(nearest.key)
+            else:
+                lookup.entry = nearest
+                lookup.match = "semantic"
+        return lookup
+    
+    def record(self, lookup: CacheLookup) -> None:
+        """
+        Count a lookup as a hit if its entry was used to answer, otherwise as a miss.
+        
+        Args:
+            lookup: Lookup returned by lookup_exact() or lookup_semantic()
+        """
+        entry = lookup.entry
+        if entry is None:
+            self.misses += 1
+            self.metrics_collector.increment_counter("llm_cache_misses_total")
+            return
+        
+        entry.hits += 1
+        if lookup.match == "semantic":
+            entry.semantic_hits += 1
+        entry.last_hit = time.monotonic()
+        if entry.key in self._entries:
+            self._entries.move_to_end(entry.key)
+        self.hits += 1
+        self.metrics_collector.increment_counter("llm_cache_hits_total", labels={"match": lookup.match})
+    
+    def store(self, lookup: CacheLookup, content: str, model: str) -> CacheEntry:
+        """
+        Cache the answer to a missed lookup, evicting the least recently used entry if full.
+        
+        Args:
+            lookup: Miss returned by lookup()
+            content: Answer text
+            model: Model that produced the answer
+        
+        Returns:
+            CacheEntry: The new entry
+        """
+        if lookup.key in self._entries:
+            self._remove(lookup.key)
+        self.purge_expired()
+        while len(self._entries) >= self.config.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.metrics_collector.increment_counter("llm_cache_evictions_total")
+        
+        entry = CacheEntry(
+            key=lookup.key,
+            utterance=lookup.utterance,
+            content=content,
+            model=model,
+            embedding=lookup.embedding
+        )
+        self._entries[lookup.key] = entry
+        self._index.pop(lookup.key[0], None)
+        self.metrics_collector.set_gauge("llm_cache_entries", len(self._entries))
+        return entry
+    
+    def clear(self) -> None:
+        """Remove every cached answer."""
+        self._entries.clear()
+        self._index.clear()
+        self.metrics_collector.set_gauge("llm_cache_entries", 0)
+    
+    def get_stats(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Get hit rates and the most used entries.
+        
+        Args:
+            top: Number of entries to list by hit count
+        
+        Returns:
+            Dict with totals and the top entries
+        """
+        lookups = self.hits + self.misses
+        most_used = sorted(self._entries.values(), key=lambda entry: entry.hits, reverse=True)[:top]
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "top_entries": [
+                {
+                    "utterance": entry.utterance,
+                    "hits": entry.hits,
+                    "semantic_hits": entry.semantic_hits,
+                    "age": time.monotonic() - entry.created_at
+                }
+                for entry in most_used
+            ]
+        }
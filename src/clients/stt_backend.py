@@ -0,0 +1,313 @@
+"""Speech-to-text backend interface and provider failover."""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+
+from src.admission import LatencyWindow
+from src.metrics import MetricsCollector, get_metrics_collector
+
+if TYPE_CHECKING:
+    from src.clients.deepgram_stt import StreamingConfig, TranscriptionResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class STTBackend(ABC):
+    """
+    What the call pipeline needs from a speech-to-text engine.
+    
+    Batch transcription takes a complete utterance; streaming transcription
+    takes audio as it arrives and yields interim and final results. Results
+    from finalize_stream() are marked from_finalize in their metadata.
+    """
+    
+    name: str = "stt"
+    streaming_config: "StreamingConfig"
+    
+    @abstractmethod
+    async def transcribe_batch(
+        self,
+        audio_data: bytes,
+        mimetype: str = "audio/wav",
+        options: Optional[Dict[str, Any]] = None
+    ) -> "TranscriptionResult":
+        """Transcribe a complete recording."""
+    
+    @abstractmethod
+    def transcribe_stream(
+        self,
+        audio_stream: AsyncIterator[bytes],
+        connection_id: Optional[str] = None
+    ) -> AsyncIterator["TranscriptionResult"]:
+        """Transcribe audio as it arrives."""
+    
+    async def finalize_stream(self, connection_id: str) -> bool:
+        """Flush final results for the audio streamed so far; False if unsupported."""
+        return False
+    
+    def is_available(self) -> bool:
+        """Whether requests are currently expected to succeed."""
+        return True
+    
+    async def health_check(self) -> bool:
+        """Check that the backend can serve requests."""
+        return True
+    
+    def get_health_status(self) -> Dict[str, Any]:
+        """Get the backend's health status."""
+        return {"service": self.name, "healthy": self.is_available()}
+    
+    async def close(self) -> None:
+        """Release the backend's resources."""
+
+
+class FailoverSTTClient(STTBackend):
+    """
+    Sends speech-to-text work to a primary backend, or a fallback while it is unusable.
+    
+    The primary is skipped while its circuit breaker is open, and for
+    recovery_interval seconds after its p95 batch latency exceeds
+    latency_threshold or a stream on it fails. A batch request that fails
+    on the primary is retried on the fallback; a failed stream continues on
+    the fallback with the rest of its audio.
+    """
+    
+    # Latency samples needed before the p95 is trusted
+    MIN_LATENCY_SAMPLES = 5
+    
+    def __init__(
+        self,
+        primary: STTBackend,
+        fallback: STTBackend,
+        latency_threshold: float = 2.0,
+        recovery_interval: float = 30.0,
+        window_size: int = 20,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the failover client.
+        
+        Args:
+            primary: Preferred backend, e.g. Deepgram
+            fallback: Backend used while the primary is unusable
+            latency_threshold: Primary p95 batch latency in seconds above
+                which the fallback takes over
+            recovery_interval: Seconds before a suspended primary is tried again
+            window_size: Primary latency samples kept for the p95
+            metrics_collector: Collector for failover metrics, defaults to the global one
+        """
+        self.primary = primary
+        self.fallback = fallback
+        self.latency_threshold = latency_threshold
+        self.recovery_interval = recovery_interval
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        self.name = f"{primary.name}+{fallback.name}"
+        
+        self.latency_window = LatencyWindow(window_size)
+        self.suspended_until = 0.0
+        self._using_fallback = False
+        self._stream_backends: Dict[str, STTBackend] = {}
+    
+    @property
+    def streaming_config(self) -> "StreamingConfig":
+        """Streaming configuration of the primary backend."""
+        return self.primary.streaming_config
+    
+    @property
+    def using_fallback(self) -> bool:
+        """Whether the last backend chosen was the fallback."""
+        return self._using_fallback
+    
+    def suspend_primary(self, reason: str) -> None:
+        """
+        Route new work to the fallback for recovery_interval seconds.
+        
+        Args:
+            reason: Why the primary is being skipped, for logs and metrics
+        """
+        self.suspended_until = time.monotonic() + self.recovery_interval
+        self.latency_window.samples.clear()
+        logger.warning(
+            f"Suspending {self.primary.name} STT for {self.recovery_interval:.0f}s: {reason}",
+            extra={"primary": self.primary.name, "fallback": self.fallback.name, "reason": reason}
+        )
+        self.metrics_collector.increment_counter(
+            "stt_primary_suspensions_total",
+            labels={"reason": reason}
+        )
+    
+    def _select(self) -> STTBackend:
+        """Pick the backend for a new request."""
+        use_fallback = time.monotonic() < self.suspended_until or not self.primary.is_available()
+        if use_fallback != self._using_fallback:
+            self._using_fallback = use_fallback
+            backend = self.fallback if use_fallback else self.primary
+            logger.info(
+                f"STT switched to {backend.name}",
+                extra={"backend": backend.name}
+            )
+            self.metrics_collector.increment_counter(
+                "stt_backend_switches_total",
+                labels={"backend": backend.name}
+            )
+            self.metrics_collector.set_gauge("stt_fallback_active", 1 if use_fallback else 0)
+        return self.fallback if use_fallback else self.primary
+    
+    def _record_primary_latency(self, latency: float) -> None:
+        self.latency_window.add(latency)
+        if len(self.latency_window) < self.MIN_LATENCY_SAMPLES:
+            return
+        p95 = self.latency_window.percentile(95)
+        if p95 is not None and p95 > self.latency_threshold:
+            self.suspend_primary("latency")
+    
+    async def transcribe_batch(
+        self,
+        audio_data: bytes,
+        mimetype: str = "audio/wav",
+        options: Optional[Dict[str, Any]] = None
+    ) -> "TranscriptionResult":
+        """
+        Transcribe a complete recording on the selected backend.
+        
+        Args:
+            audio_data: Audio data bytes
+            mimetype: MIME type of audio data
+            options: Additional transcription options
+        
+        Returns:
+            TranscriptionResult: Transcription result
+        
+        Raises:
+            ValueError: If audio data is invalid or unsafe
+        """
+        backend = self._select()
+        if backend is self.fallback:
+            return await self.fallback.transcribe_batch(audio_data, mimetype, options)
+        
+        start = time.monotonic()
+        try:
+            result = await self.primary.transcribe_batch(audio_data, mimetype, options)
+        except ValueError:
+            # Invalid audio fails the same way everywhere
+            raise
+        except Exception as e:
+            logger.warning(
+                f"{self.primary.name} batch transcription failed, retrying on {self.fallback.name}: {e}",
+                extra={"primary": self.primary.name, "error": str(e)}
+            )
+            self.metrics_collector.increment_counter(
+                "stt_fallback_requests_total",
+                labels={"mode": "batch"}
+            )
+            return await self.fallback.transcribe_batch(audio_data, mimetype, options)
+        
+        self._record_primary_latency(time.monotonic() - start)
+        return result
+    
+    async def transcribe_stream(
+        self,
+        audio_stream: AsyncIterator[bytes],
+        connection_id: Optional[str] = None
+    ) -> AsyncIterator["TranscriptionResult"]:
+        """
+        Transcribe audio as it arrives, moving to the fallback if the primary stream fails.
+        
+        Args:
+            audio_stream: Async iterator of audio data chunks
+            connection_id: Optional connection identifier
+        
+        Yields:
+            TranscriptionResult: Streaming transcription results
+        """
+        backend = self._select()
+        key = connection_id or ""
+        self._stream_backends[key] = backend
+        try:
+            try:
+                async for result in backend.transcribe_stream(audio_stream, connection_id=connection_id):
+                    yield result
+                return
+            except Exception as e:
+                if backend is self.fallback:
+                    raise
+                self.suspend_primary("stream_error")
+                logger.warning(
+                    f"{self.primary.name} stream {connection_id} failed, continuing on {self.fallback.name}: {e}",
+                    extra={"connection_id": connection_id, "error": str(e)}
+                )
+                self.metrics_collector.increment_counter(
+                    "stt_fallback_requests_total",
+                    labels={"mode": "stream"}
+                )
+            
+            # The frames not yet sent carry on to the fallback
+            self._stream_backends[key] = self.fallback
+            async for result in self.fallback.transcribe_stream(audio_stream, connection_id=connection_id):
+                yield result
+        finally:
+            self._stream_backends.pop(key, None)
+    
+    async def finalize_stream(self, connection_id: str) -> bool:
+        """Flush final results on whichever backend serves the stream."""
+        backend = self._stream_backends.get(connection_id)
+        if backend is None:
+            return False
+        return await backend.finalize_stream(connection_id)
+    
+    async def warm_up(self) -> None:
+        """Prepare the fallback ahead of need, e.g. load a local model; failures are logged."""
+        warm_up = getattr(self.fallback, "warm_up", None)
+        if warm_up is None:
+            return
+        try:
+            await warm_up()
+        except Exception as e:
+            logger.error(
+                f"STT fallback {self.fallback.name} failed to start: {e}",
+                extra={"fallback": self.fallback.name, "error": str(e)}
+            )
+    
+    async def start_connection_pool(self, config: Any = None) -> None:
+        """Start the primary's connection pool, if it has one."""
+        start_pool = getattr(self.primary, "start_connection_pool", None)
+        if start_pool is not None:
+            await start_pool(config)
+    
+    def is_available(self) -> bool:
+        """Whether either backend is available."""
+        return self.primary.is_available() or self.fallback.is_available()
+    
+    async def health_check(self) -> bool:
+        """Healthy while either backend is."""
+        return await self.primary.health_check() or await self.fallback.health_check()
+    
+    def get_health_status(self) -> Dict[str, Any]:
+        """
+        Get health status of both backends.
+        
+        The reported circuit breaker state is the primary's, except that an
+        open primary is reported closed while the fallback can serve, so
+        admission control keeps accepting calls.
+        """
+        primary_status = self.primary.get_health_status()
+        breaker_state = primary_status.get("circuit_breaker_state")
+        if breaker_state == "open" and self.fallback.is_available():
+            breaker_state = "closed"
+        return {
+            "service": self.name,
+            "healthy": self.is_available(),
+            "circuit_breaker_state": breaker_state,
+            "active_backend": self.fallback.name if self._using_fallback else self.primary.name,
+            "primary_suspended": time.monotonic() < self.suspended_until,
+            "primary": primary_status,
+            "fallback": self.fallback.get_health_status()
+        }
+    
+    async def close(self) -> None:
+        """Close both backends."""
+        await self.primary.close()
+        await self.fallback.close()
@@ -0,0 +1,123 @@
+"""Token counting for chat model prompts."""
+
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Chat formatting overhead, as in OpenAI's guide to counting chat tokens:
+# each message is wrapped in <|start|>{role}<|message|>...<|end|>, and the
+# reply is primed with <|start|>assistant<|message|>
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+# Encoding used for models tiktoken does not know
+DEFAULT_ENCODING = "cl100k_base"
+
+
+class TokenCounter:
+    """
+    Counts tokens with a model's BPE encoding.
+    
+    Without an encoding, counts are estimated at four characters per token,
+    which is typically off by 20-40% for conversational text. Counts of
+    recently seen texts are cached, so re-counting a prompt only encodes
+    the texts that changed.
+    """
+    
+    def __init__(self, encoding: Any = None, cache_size: int = 4096):
+        """
+        Initialize the counter.
+        
+        Args:
+            encoding: tiktoken Encoding, or None to estimate
+            cache_size: Texts whose counts are cached
+        """
+        self.encoding = encoding
+        self._count_cached = lru_cache(maxsize=cache_size)(self._count)
+    
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's encoding rather than an estimate."""
+        return self.encoding is not None
+    
+    def _count(self, text: str) -> int:
+        if self.encoding is None:
+            return len(text) // 4
+        # Special-token strings in user text are counted as ordinary text
+        return len(self.encoding.encode(text, disallowed_special=()))
+    
+    def count(self, text: str) -> int:
+        """
+        Count the tokens of a text.
+        
+        Args:
+            text: Text to count
+        
+        Returns:
+            int: Number of tokens
+        """
+        return self._count_cached(text)
+    
+    def count_message(self, role: str, content: str) -> int:
+        """
+        Count the tokens a chat message adds to a prompt.
+        
+        Args:
+            role: Message role
+            content: Message content
+        
+        Returns:
+            int: Number of tokens, including chat formatting
+        """
+        return TOKENS_PER_MESSAGE + self.count(role) + self.count(content)
+    
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Count the prompt tokens of API-formatted messages.
+        
+        Args:
+            messages: Messages with role and content
+        
+        Returns:
+            int: Number of prompt tokens, including reply priming
+        """
+        return sum(self.count_message(message["role"], message["content"]) for message in messages) + TOKENS_PER_REPLY
+
+
+def _load_encoding(model: str) -> Optional[Any]:
+    """Load the tiktoken encoding for a model, or None if it is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed, estimating token counts at 4 characters per token")
+        return None
+    
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        # Encodings are downloaded on first use unless cached locally
+        logger.warning(
+            f"Could not load tiktoken encoding for {model}, estimating token counts: {e}",
+            extra={"model": model}
+        )
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(model: str = "gpt-4") -> TokenCounter:
+    """
+    Get the shared token counter for a model.
+    
+    Args:
+        model: Chat model name
+    
+    Returns:
+        TokenCounter: Counter using the model's encoding when available
+    """
+    return TokenCounter(_load_encoding(model))
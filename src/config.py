@@ -8,6 +8,7 @@ from typing import Optional, List, Dict, Any, Union
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
+from src.audio.ring_buffer import OverflowPolicy
 from src.security import (
     generate_secret_key, 
     validate_secret_key, 
@@ -203,6 +204,116 @@ class Settings(BaseSettings):
         description="Maximum response latency in seconds"
     )
     
+    enable_streaming_pipeline: bool = Field(
+        default=False,
+        description="Stream STT finals into the LLM and speak each sentence as it is generated"
+    )
+    
+    enable_persistent_stt: bool = Field(
+        default=False,
+        description="Keep one streaming STT connection open per call and push caller audio to it as it arrives"
+    )
+    
+    enable_local_stt_fallback: bool = Field(
+        default=False,
+        description="Transcribe on a local CPU Whisper model while Deepgram is failing or slow (needs the local-stt extra)"
+    )
+    
+    local_stt_model: str = Field(
+        default="tiny.en",
+        description="faster-whisper model name or directory for the local STT fallback"
+    )
+    
+    local_stt_latency_threshold: float = Field(
+        default=2.0,
+        gt=0,
+        description="Deepgram p95 batch latency in seconds above which the local STT fallback takes over"
+    )
+    
+    deepgram_pool_max_idle: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Most pre-opened Deepgram streaming connections kept idle; 0 disables the pool"
+    )
+    
+    deepgram_pool_min_idle: int = Field(
+        default=1,
+        ge=0,
+        le=64,
+        description="Fewest pre-opened Deepgram streaming connections kept idle when the pool is enabled"
+    )
+    
+    enable_speculative_llm: bool = Field(
+        default=False,
+        description="Start the LLM on stable interim transcripts (streaming pipeline only)"
+    )
+    
+    speculation_similarity_threshold: float = Field(
+        default=0.85,
+        ge=0.0,
+        le=1.0,
+        description="Minimum interim/final transcript similarity for keeping a speculative response"
+    )
+    
+    enable_llm_response_cache: bool = Field(
+        default=False,
+        description="Answer repeated standalone caller questions from a cache instead of the LLM"
+    )
+    
+    llm_cache_max_entries: int = Field(
+        default=512,
+        ge=1,
+        description="Most answers kept in the LLM response cache; the least recently used are evicted"
+    )
+    
+    llm_cache_ttl_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Seconds a cached LLM answer stays valid"
+    )
+    
+    llm_cache_similarity_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Embedding cosine similarity for answering a differently worded question from the cache; 1.0 matches exact wording only"
+    )
+    
+    llm_cache_embedding_model: str = Field(
+        default="text-embedding-3-small",
+        description="OpenAI embedding model for similar-question lookup in the LLM response cache"
+    )
+    
+    enable_filler_audio: bool = Field(
+        default=False,
+        description="Play a cached acknowledgement clip when response audio has not started within max_response_latency"
+    )
+    
+    orchestrator_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of orchestrator worker processes; calls are sharded across them when greater than 1"
+    )
+    
+    admission_min_concurrent_calls: int = Field(
+        default=1,
+        ge=1,
+        description="Lowest concurrency limit adaptive admission control may shed down to"
+    )
+    
+    admission_queue_size: int = Field(
+        default=0,
+        ge=0,
+        description="New calls that may wait for a free slot instead of being rejected (0 disables queueing)"
+    )
+    
+    admission_queue_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Maximum seconds a queued call waits for admission"
+    )
+    
     context_window_size: int = Field(
         default=4000,
         gt=0,
@@ -285,6 +396,17 @@ class Settings(BaseSettings):
         description="Prometheus metrics port"
     )
     
+    enable_slow_callback_tracking: bool = Field(
+        default=False,
+        description="Time every event loop callback and log those that block the loop; wraps asyncio internals process-wide"
+    )
+    
+    slow_callback_threshold: float = Field(
+        default=0.1,
+        gt=0,
+        description="Seconds an event loop callback may run before it is logged as slow"
+    )
+    
     sentry_dsn: Optional[str] = Field(
         default=None,
         description="Sentry DSN for error tracking"
@@ -371,6 +493,17 @@ class Settings(BaseSettings):
         description="Audio buffer size in milliseconds"
     )
     
+    audio_buffer_max_ms: int = Field(
+        default=30000,
+        gt=0,
+        description="Maximum inbound audio buffered per call in milliseconds"
+    )
+    
+    audio_buffer_overflow_policy: OverflowPolicy = Field(
+        default=OverflowPolicy.DROP_OLDEST,
+        description="Inbound buffer overflow policy (drop_oldest or reject)"
+    )
+    
     vad_threshold: float = Field(
         default=0.5,
         ge=0.0,
@@ -378,6 +511,24 @@ class Settings(BaseSettings):
         description="Voice Activity Detection threshold"
     )
     
+    vad_silence_ms: int = Field(
+        default=600,
+        gt=0,
+        description="Trailing silence in milliseconds that ends an utterance"
+    )
+    
+    outbound_jitter_buffer_ms: int = Field(
+        default=60,
+        ge=20,
+        description="Outbound audio queued before playout starts or resumes after an underrun"
+    )
+    
+    outbound_max_buffer_ms: int = Field(
+        default=2000,
+        ge=20,
+        description="Maximum outbound audio queued ahead of playout before TTS is held back"
+    )
+    
     # =============================================================================
     # CONVERSATION CONFIGURATION
     # =============================================================================
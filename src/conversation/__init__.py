@@ -18,6 +18,9 @@ from .dialogue_manager import (
     ConversationMetrics,
     ConversationPhase
 )
+from .sentence_splitter import SentenceSplitter
+from .speculation import SpeculativeGeneration, transcript_similarity
+from .filler import FillerClipCache, DEFAULT_FILLER_PHRASES
 
 __all__ = [
     "ConversationState",
@@ -28,5 +31,10 @@ __all__ = [
     "ConversationTurn",
     "ConversationSummary",
     "ConversationMetrics",
-    "ConversationPhase"
+    "ConversationPhase",
+    "SentenceSplitter",
+    "SpeculativeGeneration",
+    "transcript_similarity",
+    "FillerClipCache",
+    "DEFAULT_FILLER_PHRASES"
 ]
\ No newline at end of file
@@ -17,6 +17,7 @@ from uuid import uuid4
 from src.clients.base import BaseResilientClient
 from src.clients.openai_llm import OpenAILLMClient, ConversationContext, MessageRole, LLMResponse
 from src.conversation.state_machine import ConversationStateMachine, ConversationState
+from src.conversation.speculation import SpeculativeGeneration
 from src.config import get_settings
 
 
@@ -95,6 +96,7 @@ class ConversationMetrics:
     total_processing_time: float = 0.0
     stt_latency: float = 0.0
     llm_latency: float = 0.0
+    llm_first_token_latency: float = 0.0
     tts_latency: float = 0.0
     error_count: int = 0
     interruption_count: int = 0
@@ -119,6 +121,7 @@ class ConversationMetrics:
             "total_processing_time": self.total_processing_time,
             "stt_latency": self.stt_latency,
             "llm_latency": self.llm_latency,
+            "llm_first_token_latency": self.llm_first_token_latency,
             "tts_latency": self.tts_latency,
             "error_count": self.error_count,
             "interruption_count": self.interruption_count,
@@ -357,6 +360,177 @@ class DialogueManager:
                 self.conversation_turns.append(error_turn)
                 return fallback_response.content, error_turn
     
+    def create_speculation(self, user_input: str) -> SpeculativeGeneration:
+        """
+        Start generating a response to an interim transcript.
+        
+        The conversation history is not modified; pass the speculation to
+        stream_user_input() to commit it, or cancel() it.
+        
+        Args:
+            user_input: Interim transcript
+        
+        Returns:
+            Running SpeculativeGeneration
+        """
+        return SpeculativeGeneration(
+            self.llm_client,
+            self.conversation_context,
+            user_input,
+            correlation_id=self._generate_correlation_id()
+        ).start()
+    
+    async def stream_user_input(
+        self,
+        user_input: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        speculation: Optional[SpeculativeGeneration] = None
+    ) -> AsyncIterator[str]:
+        """
+        Process user input and stream the assistant response as it is generated.
+        
+        The streaming counterpart of process_user_input: response text is
+        yielded in LLM-sized fragments, and the assistant message and
+        conversation turn are recorded once the stream completes.
+        
+        Args:
+            user_input: The user's input text
+            metadata: Additional metadata for the turn
+            speculation: Response already being generated from an interim
+                transcript; its fragments are used instead of a new LLM request
+        
+        Yields:
+            Response text fragments
+        """
+        async with self.processing_lock:
+            start_time = time.time()
+            turn_id = str(uuid4())
+            if speculation is not None:
+                self.current_correlation_id = speculation.correlation_id
+            else:
+                self.current_correlation_id = self._generate_correlation_id()
+            response_parts: List[str] = []
+            first_token_latency: Optional[float] = None
+            error: Optional[Exception] = None
+            used_fallback = False
+            interrupted = False
+            
+            logger.info(
+                f"Streaming response for user input: {user_input[:100]}...",
+                extra={
+                    "conversation_id": self.conversation_id,
+                    "turn_id": turn_id,
+                    "correlation_id": self.current_correlation_id
+                }
+            )
+            
+            try:
+                self.current_phase = ConversationPhase.UNDERSTANDING
+                
+                if self.conversation_context:
+                    self.conversation_context.add_message(
+                        MessageRole.USER,
+                        user_input,
+                        metadata={"turn_id": turn_id, "timestamp": time.time()}
+                    )
+                
+                await self._manage_context_size()
+                
+                self.current_phase = ConversationPhase.GENERATION
+                llm_start_time = time.time()
+                
+                if speculation is not None:
+                    fragment_source = speculation.fragments()
+                else:
+                    fragment_source = self.llm_client.stream_response(
+                        self.conversation_context,
+                        correlation_id=self.current_correlation_id
+                    )
+                
+                async for fragment in fragment_source:
+                    if not fragment:
+                        continue
+                    if first_token_latency is None:
+                        first_token_latency = time.time() - llm_start_time
+                        self.metrics.llm_first_token_latency = first_token_latency
+                    response_parts.append(fragment)
+                    yield fragment
+                
+                self.metrics.llm_latency = time.time() - llm_start_time
+            
+            except Exception as e:
+                error = e
+                self.metrics.error_count += 1
+                logger.error(
+                    f"Error streaming response: {e}",
+                    extra={
+                        "conversation_id": self.conversation_id,
+                        "turn_id": turn_id,
+                        "error": str(e),
+                        "correlation_id": self.current_correlation_id
+                    }
+                )
+                
+                # Only substitute a fallback if nothing has been spoken yet
+                if not response_parts:
+                    fallback_response = self.llm_client.generate_fallback_response("general")
+                    self.metrics.fallback_responses += 1
+                    used_fallback = True
+                    response_parts.append(fallback_response.content)
+                    yield fallback_response.content
+            
+            except (asyncio.CancelledError, GeneratorExit):
+                # Barge-in: the consumer stopped listening; the turn is still
+                # recorded so record_interruption() can trim it to what was spoken
+                interrupted = True
+                raise
+            
+            finally:
+                if speculation is not None:
+                    speculation.cancel()
+                
+                response_text = "".join(response_parts)
+                
+                if self.conversation_context and response_text and not used_fallback:
+                    self.conversation_context.add_message(
+                        MessageRole.ASSISTANT,
+                        response_text,
+                        metadata={"turn_id": turn_id, "timestamp": time.time()}
+                    )
+                
+                processing_time = time.time() - start_time
+                turn_metadata = {
+                    **(metadata or {}),
+                    "streamed": True,
+                    "llm_latency": self.metrics.llm_latency,
+                    "llm_first_token_latency": first_token_latency,
+                    "correlation_id": self.current_correlation_id
+                }
+                if error is not None:
+                    turn_metadata["error"] = str(error)
+                    turn_metadata["fallback"] = used_fallback
+                if interrupted:
+                    turn_metadata["generation_cancelled"] = True
+                if speculation is not None:
+                    turn_metadata["speculative"] = True
+                    turn_metadata["speculative_input"] = speculation.user_input
+                
+                self.conversation_turns.append(ConversationTurn(
+                    turn_id=turn_id,
+                    user_input=user_input,
+                    assistant_response=response_text,
+                    timestamp=datetime.now(UTC),
+                    processing_time=processing_time,
+                    metadata=turn_metadata
+                ))
+                
+                if error is None:
+                    self.metrics.total_turns += 1
+                    self.metrics.update_response_time(processing_time)
+                    self.metrics.total_processing_time += processing_time
+                
+                self.current_phase = ConversationPhase.RESPONSE
+    
     async def _manage_context_size(self) -> None:
         """Manage conversation context size and perform summarization if needed."""
         if not self.conversation_context:
@@ -367,8 +541,7 @@ class DialogueManager:
             await self._summarize_conversation()
         
         # Check if we need to optimize based on token count
-        messages = self.conversation_context.get_messages_for_api()
-        total_tokens = self.llm_client.calculate_context_tokens(messages)
+        total_tokens = self.llm_client.calculate_context_tokens(self.conversation_context)
         
         if total_tokens > self.max_context_tokens * 0.8:  # 80% threshold
             logger.info(
@@ -403,7 +576,7 @@ class DialogueManager:
             )
             
             # Generate summary
-            summary_response = await self.llm_client.generate_response(summary_context)
+            summary_response = await self.llm_client.generate_response(summary_context, use_cache=False)
             self.conversation_summary = summary_response.content
             
             # Update conversation context with summary
@@ -580,14 +753,51 @@ class DialogueManager:
             extra={"conversation_id": self.conversation_id}
         )
     
-    def record_interruption(self) -> None:
-        """Record user interruption event."""
+    def record_interruption(self, spoken_response: Optional[str] = None) -> None:
+        """
+        Record user interruption event.
+        
+        When the caller barges in while a response is being spoken, pass the
+        part of the response that was actually played. The last turn and the
+        assistant message in the LLM context are trimmed to it, so the model
+        does not assume the caller heard the rest.
+        
+        Args:
+            spoken_response: Text of the response that reached the caller
+        """
         self.metrics.interruption_count += 1
+        
+        if spoken_response is not None and self.conversation_turns:
+            last_turn = self.conversation_turns[-1]
+            if spoken_response != last_turn.assistant_response:
+                last_turn.metadata["interrupted"] = True
+                last_turn.metadata["generated_response"] = last_turn.assistant_response
+                last_turn.assistant_response = spoken_response
+                self._truncate_assistant_message(last_turn.turn_id, spoken_response)
+        
         logger.info(
             "User interruption recorded",
-            extra={"conversation_id": self.conversation_id}
+            extra={
+                "conversation_id": self.conversation_id,
+                "spoken_length": len(spoken_response) if spoken_response is not None else None
+            }
         )
     
+    def _truncate_assistant_message(self, turn_id: str, spoken_response: str) -> None:
+        """Replace (or drop, if nothing was spoken) the assistant message for a turn."""
+        if not self.conversation_context:
+            return
+        
+        context = self.conversation_context
+        for index in range(len(context.messages) - 1, -1, -1):
+            message = context.messages[index]
+            if message.role == MessageRole.ASSISTANT and (message.metadata or {}).get("turn_id") == turn_id:
+                if spoken_response:
+                    context.replace_message(index, spoken_response)
+                else:
+                    context.remove_message(index)
+                break
+    
     def end_conversation(self) -> ConversationSummary:
         """
         End the conversation and return final summary.
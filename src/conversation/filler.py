@@ -0,0 +1,101 @@
+"""
+Precomputed filler audio for masking response latency.
+
+This module implements the FillerClipCache class that synthesizes short
+acknowledgement clips ("mm-hm", "one moment") once at startup and keeps them
+in memory as PCM, so they can be played instantly when a response is slow to
+start without another TTS round trip.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Sequence
+
+from src.clients.cartesia_tts import CartesiaTTSClient, VoiceConfig, AudioConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FILLER_PHRASES = ("Mm-hm.", "One moment.", "Let me check.")
+
+
+class FillerClipCache:
+    """
+    In-memory PCM clips played while the caller waits for a response.
+    
+    Clips are handed out round-robin so consecutive slow turns do not repeat
+    the same phrase. An empty cache (not loaded, or every synthesis failed)
+    simply yields no clip.
+    """
+    
+    def __init__(self, phrases: Sequence[str] = DEFAULT_FILLER_PHRASES):
+        """
+        Initialize the cache.
+        
+        Args:
+            phrases: Acknowledgement phrases to synthesize
+        """
+        self.phrases = tuple(phrases)
+        self._clips: List[bytes] = []
+        self._next = 0
+    
+    def __len__(self) -> int:
+        """Number of clips available."""
+        return len(self._clips)
+    
+    async def load(
+        self,
+        tts_client: CartesiaTTSClient,
+        voice_config: VoiceConfig,
+        audio_config: AudioConfig
+    ) -> int:
+        """
+        Synthesize every phrase and cache the audio.
+        
+        Args:
+            tts_client: TTS client used for synthesis
+            voice_config: Voice matching normal responses
+            audio_config: Headerless PCM format matching normal responses
+        
+        Returns:
+            Number of clips cached
+        """
+        results = await asyncio.gather(
+            *(
+                tts_client.synthesize_batch(phrase, voice_config=voice_config, audio_config=audio_config)
+                for phrase in self.phrases
+            ),
+            return_exceptions=True
+        )
+        
+        clips = []
+        for phrase, result in zip(self.phrases, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to synthesize filler clip '{phrase}': {result}",
+                    extra={"phrase": phrase, "error": str(result)}
+                )
+            elif result.audio_data:
+                clips.append(result.audio_data)
+        
+        self._clips = clips
+        self._next = 0
+        logger.info(
+            f"Cached {len(clips)} filler clips",
+            extra={"clip_count": len(clips), "clip_bytes": sum(len(clip) for clip in clips)}
+        )
+        return len(clips)
+    
+    def next_clip(self) -> Optional[bytes]:
+        """
+        Get the next clip in rotation.
+        
+        Returns:
+            PCM audio, or None if no clips are cached
+        """
+        if not self._clips:
+            return None
+        clip = self._clips[self._next % len(self._clips)]
+        self._next += 1
+        return clip
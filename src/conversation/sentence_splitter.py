@@ -0,0 +1,108 @@
+"""
+Incremental sentence splitting for streamed LLM output.
+
+This module implements the SentenceSplitter class that turns a stream of
+LLM token deltas into speakable sentences, so each sentence can be sent to
+TTS as soon as it is complete instead of waiting for the whole response.
+"""
+
+import re
+from typing import List, Optional
+
+
+class SentenceSplitter:
+    """
+    Split streamed text into sentences suitable for speech synthesis.
+    
+    Text is fed in arbitrary fragments (as produced by a streaming LLM).
+    A sentence is emitted once its terminating punctuation is followed by
+    whitespace, which avoids splitting decimals ("3.5") or ellipses that are
+    still being generated. Very short sentences are merged with the next one
+    and overly long runs without punctuation are split at a word boundary.
+    """
+    
+    # Terminal punctuation, optional closing quotes/brackets, then whitespace
+    _BOUNDARY = re.compile(r'([.!?]+["\')\]]*)(\s+)')
+    
+    # Abbreviations that end with a period but do not end a sentence
+    _ABBREVIATIONS = frozenset({
+        "dr.", "mr.", "mrs.", "ms.", "st.", "vs.", "etc.", "e.g.", "i.e.", "no.", "jr.", "sr."
+    })
+    
+    def __init__(self, min_length: int = 16, max_length: int = 250):
+        """
+        Initialize the splitter.
+        
+        Args:
+            min_length: Minimum sentence length in characters before emitting
+            max_length: Maximum buffered characters before forcing a split
+        """
+        self.min_length = min_length
+        self.max_length = max_length
+        self._buffer = ""
+    
+    def feed(self, text: str) -> List[str]:
+        """
+        Add a text fragment and return any sentences completed by it.
+        
+        Args:
+            text: Text fragment from the LLM stream
+        
+        Returns:
+            List of complete sentences (possibly empty)
+        """
+        self._buffer += text
+        sentences: List[str] = []
+        search_from = 0
+        
+        while True:
+            match = self._BOUNDARY.search(self._buffer, search_from)
+            if not match:
+                break
+            
+            candidate = self._buffer[:match.end(1)].strip()
+            if self._ends_with_abbreviation(candidate) or len(candidate) < self.min_length:
+                search_from = match.end()
+                continue
+            
+            sentences.append(candidate)
+            self._buffer = self._buffer[match.end():]
+            search_from = 0
+        
+        if len(self._buffer) > self.max_length:
+            forced = self._force_split()
+            if forced:
+                sentences.append(forced)
+        
+        return sentences
+    
+    def flush(self) -> Optional[str]:
+        """
+        Return any remaining buffered text as a final sentence.
+        
+        Returns:
+            Remaining text, or None if the buffer is empty
+        """
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder or None
+    
+    def _ends_with_abbreviation(self, candidate: str) -> bool:
+        """Check whether the candidate sentence ends with a known abbreviation."""
+        last_word = candidate.rsplit(None, 1)[-1].lower() if candidate else ""
+        return last_word in self._ABBREVIATIONS
+    
+    def _force_split(self) -> Optional[str]:
+        """Split an overlong buffer at the last clause or word boundary."""
+        window = self._buffer[:self.max_length]
+        cut = max(window.rfind(", "), window.rfind("; "), window.rfind(": "))
+        if cut > 0:
+            cut += 1  # Keep the punctuation with the emitted part
+        else:
+            cut = window.rfind(" ")
+        if cut <= 0:
+            return None
+        
+        head = self._buffer[:cut].strip()
+        self._buffer = self._buffer[cut:].lstrip()
+        return head or None
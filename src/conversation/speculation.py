@@ -0,0 +1,160 @@
+"""
+Speculative LLM generation on interim transcripts.
+
+This module implements the SpeculativeGeneration class that starts streaming
+an LLM response from a stable interim transcript, before the final STT
+result arrives. When the final transcript matches closely enough, the
+buffered response is used as-is and the turn skips a full LLM round trip;
+otherwise the speculation is cancelled and the response is regenerated.
+"""
+
+import asyncio
+import copy
+import logging
+import re
+import time
+from difflib import SequenceMatcher
+from typing import AsyncIterator, List, Optional
+
+from src.clients.openai_llm import OpenAILLMClient, ConversationContext, MessageRole
+
+
+logger = logging.getLogger(__name__)
+
+
+_WORD = re.compile(r"[\w']+")
+
+
+def normalize_transcript(text: str) -> List[str]:
+    """Lower-case words of a transcript with punctuation removed."""
+    return _WORD.findall(text.lower())
+
+
+def transcript_similarity(first: str, second: str) -> float:
+    """
+    Word-level similarity of two transcripts.
+    
+    Args:
+        first: First transcript
+        second: Second transcript
+    
+    Returns:
+        Ratio between 0.0 and 1.0; punctuation and case are ignored
+    """
+    first_words = normalize_transcript(first)
+    second_words = normalize_transcript(second)
+    if not first_words and not second_words:
+        return 1.0
+    return SequenceMatcher(None, first_words, second_words, autojunk=False).ratio()
+
+
+class SpeculativeGeneration:
+    """
+    LLM response streamed ahead of the final transcript.
+    
+    Generation runs against a copy of the conversation context with the
+    interim transcript appended, so a discarded speculation leaves no trace
+    in the conversation history. Fragments are buffered until the turn
+    commits to the speculation and reads them with fragments().
+    """
+    
+    def __init__(
+        self,
+        llm_client: OpenAILLMClient,
+        context: ConversationContext,
+        user_input: str,
+        correlation_id: Optional[str] = None
+    ):
+        """
+        Initialize the speculation.
+        
+        Args:
+            llm_client: LLM client used for generation
+            context: Conversation context before the user's turn; it is copied
+            user_input: Interim transcript to answer
+            correlation_id: Request correlation ID
+        """
+        self.llm_client = llm_client
+        self.user_input = user_input
+        self.correlation_id = correlation_id
+        
+        self.context = copy.copy(context)
+        self.context.messages = list(context.messages)
+        self.context.add_message(MessageRole.USER, user_input)
+        
+        self.started_at = time.time()
+        self.first_token_latency: Optional[float] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._error: Optional[Exception] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> "SpeculativeGeneration":
+        """Start generating in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._generate())
+        return self
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the speculation was cancelled."""
+        return self._task is not None and self._task.cancelled()
+    
+    def matches(self, final_text: str, threshold: float) -> bool:
+        """
+        Check whether the final transcript is close enough to reuse the response.
+        
+        Args:
+            final_text: Final transcript
+            threshold: Minimum transcript_similarity() to accept
+        
+        Returns:
+            True if the speculation can be kept
+        """
+        return transcript_similarity(self.user_input, final_text) >= threshold
+    
+    def cancel(self) -> None:
+        """Stop generation and discard buffered fragments."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+    
+    async def fragments(self) -> AsyncIterator[str]:
+        """
+        Yield the generated response, including fragments buffered so far.
+        
+        Yields:
+            Response text fragments
+        
+        Raises:
+            Exception: The error that ended generation, if any
+        """
+        self.start()
+        while True:
+            fragment = await self._queue.get()
+            if fragment is None:
+                break
+            yield fragment
+        if self._error is not None:
+            raise self._error
+    
+    async def _generate(self) -> None:
+        """Stream the LLM response into the buffer."""
+        try:
+            async for fragment in self.llm_client.stream_response(
+                self.context,
+                correlation_id=self.correlation_id
+            ):
+                if not fragment:
+                    continue
+                if self.first_token_latency is None:
+                    self.first_token_latency = time.time() - self.started_at
+                self._queue.put_nowait(fragment)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error = e
+            logger.warning(
+                f"Speculative generation failed: {e}",
+                extra={"correlation_id": self.correlation_id, "error": str(e)}
+            )
+        finally:
+            self._queue.put_nowait(None)
@@ -0,0 +1,165 @@
+"""
+Bounded thread pool for blocking work called from the event loop.
+
+This module implements the BlockingExecutor class that housekeeping code
+(system resource sampling, file exports, synchronous health checks) uses to
+run blocking calls off the event loop. The number of calls in flight is
+capped so a backlog of housekeeping cannot grow without bound, and every
+call is timed per task name so slow offloaded work stays visible.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from src.metrics import MetricsCollector, get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """
+    Shared thread pool with bounded admission and per-task timing.
+    
+    At most max_workers calls run at once and at most max_pending more wait
+    for a thread; further callers wait on the event loop, without holding a
+    thread, until a slot frees up. Timeouts are counted under the "timeout"
+    status; a timed-out call's duration is recorded once its thread finishes.
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 32,
+        thread_name_prefix: str = "blocking",
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the executor.
+        
+        Args:
+            max_workers: Worker threads
+            max_pending: Calls allowed to queue for a worker thread
+            thread_name_prefix: Prefix of worker thread names
+            metrics_collector: Collector for timing metrics, defaults to the global one
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+    
+    def _admission(self) -> asyncio.Semaphore:
+        """Admission semaphore of the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_pending)
+            self._slots_loop = loop
+        return self._slots
+    
+    @property
+    def in_flight(self) -> int:
+        """Calls submitted and not yet finished."""
+        return self._in_flight
+    
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        task_name: str,
+        timeout: Optional[float] = None
+    ) -> T:
+        """
+        Run a blocking callable in the pool.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            task_name: Label for the timing metrics
+            timeout: Seconds to wait for the result; the thread is not interrupted on timeout
+        
+        Returns:
+            Return value of func
+        
+        Raises:
+            asyncio.TimeoutError: If timeout elapses first
+            Exception: Whatever func raises
+        """
+        labels = {"task": task_name}
+        submitted = time.perf_counter()
+        
+        def timed_call() -> T:
+            # Timed on the worker thread so a call that outlives its timeout
+            # still records how long it actually ran
+            started = time.perf_counter()
+            self.metrics_collector.record_timer("executor_queue_wait", started - submitted, labels)
+            try:
+                return func(*args)
+            finally:
+                self.metrics_collector.record_timer("executor_task_duration", time.perf_counter() - started, labels)
+        
+        async with self._admission():
+            self._in_flight += 1
+            self.metrics_collector.set_gauge("executor_in_flight", self._in_flight)
+            status = "error"
+            try:
+                future = asyncio.get_running_loop().run_in_executor(self._pool, timed_call)
+                result = await asyncio.wait_for(future, timeout) if timeout is not None else await future
+                status = "success"
+                return result
+            except asyncio.TimeoutError:
+                status = "timeout"
+                logger.warning(
+                    f"Blocking task {task_name} timed out after {timeout}s",
+                    extra={"task": task_name}
+                )
+                raise
+            finally:
+                self._in_flight -= 1
+                self.metrics_collector.set_gauge("executor_in_flight", self._in_flight)
+                self.metrics_collector.increment_counter(
+                    "executor_tasks_total",
+                    labels={"task": task_name, "status": status}
+                )
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads.
+        
+        Args:
+            wait: Wait for running calls to finish
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global executor instance, created on first use
+_blocking_executor: Optional[BlockingExecutor] = None
+
+
+def get_blocking_executor() -> BlockingExecutor:
+    """Get global blocking executor instance."""
+    global _blocking_executor
+    if _blocking_executor is None:
+        _blocking_executor = BlockingExecutor()
+    return _blocking_executor
+
+
+def shutdown_blocking_executor(wait: bool = True) -> None:
+    """
+    Shut down the global blocking executor; a later get_blocking_executor() creates a new one.
+    
+    Args:
+        wait: Wait for running calls to finish
+    """
+    global _blocking_executor
+    if _blocking_executor is not None:
+        _blocking_executor.shutdown(wait=wait)
+        _blocking_executor = None
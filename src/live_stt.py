@@ -0,0 +1,294 @@
+"""
+Per-call streaming transcription.
+
+This module implements the LiveTranscriber class that keeps one streaming
+STT connection open for the whole call. Caller audio is pushed to it frame
+by frame as it arrives, so when the caller stops speaking the audio is
+already with the provider; ending a turn only needs a finalize request and
+the final results it flushes, instead of a new connection or an upload of
+the whole utterance.
+"""
+
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+from src.clients.deepgram_stt import TranscriptionResult, WordTimings
+from src.clients.stt_backend import STTBackend
+from src.metrics import MetricsCollector, get_metrics_collector
+
+
+logger = logging.getLogger(__name__)
+
+# Frame queue markers
+_FINALIZE = object()
+_CLOSE = None
+
+
+class _FrameSource:
+    """
+    Async iterator over queued frames; finalize requests go out in order with them.
+    
+    A plain iterator rather than an async generator, so that a send task
+    cancelled by a reconnecting client leaves it usable for the next connection.
+    """
+    
+    def __init__(self, frames: asyncio.Queue, stt_client: STTBackend, connection_id: str):
+        self.frames = frames
+        self.stt_client = stt_client
+        self.connection_id = connection_id
+        self.finished = False
+    
+    def __aiter__(self) -> "_FrameSource":
+        return self
+    
+    async def __anext__(self) -> bytes:
+        while not self.finished:
+            item = await self.frames.get()
+            if item is _CLOSE:
+                self.finished = True
+                break
+            if item is not _FINALIZE:
+                return item
+            finalize = getattr(self.stt_client, "finalize_stream", None)
+            if finalize is not None:
+                await finalize(self.connection_id)
+        raise StopAsyncIteration
+
+
+class LiveTranscriber:
+    """
+    A call's long-lived STT stream and the finals of its current utterance.
+    
+    Final segments are collected as they arrive; finalize_utterance() flushes
+    the provider and returns the utterance's transcript, starting the next
+    one. Stream positions are seconds of audio pushed, which is what the
+    provider's result timestamps count. A stream the provider ends or that
+    fails is marked closed and is not reopened; the owner replaces it.
+    """
+    
+    # Finals ending this close to the audio pushed are taken to cover it
+    END_TOLERANCE_SECONDS = 0.1
+    
+    def __init__(
+        self,
+        stt_client: STTBackend,
+        connection_id: str,
+        bytes_per_second: int,
+        max_queued_frames: int = 250,
+        on_transcript: Optional[Callable[[str, bool], None]] = None,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the transcriber; call start() to open the stream.
+        
+        Args:
+            stt_client: Speech-to-text client
+            connection_id: Identifier of the streaming connection
+            bytes_per_second: Byte rate of the pushed audio
+            max_queued_frames: Frames buffered while the connection is slow;
+                newer frames are dropped once it is full
+            on_transcript: Called with the utterance transcript so far and
+                whether its latest segment is final, on every non-empty result
+            metrics_collector: Collector for stream metrics, defaults to the global one
+        """
+        self.stt_client = stt_client
+        self.connection_id = connection_id
+        self.bytes_per_second = bytes_per_second
+        self.on_transcript = on_transcript
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        
+        self.pushed_bytes = 0
+        self.dropped_frames = 0
+        self.closed = False
+        self.error: Optional[Exception] = None
+        
+        self._frames: asyncio.Queue = asyncio.Queue(maxsize=max_queued_frames)
+        self._reader: Optional[asyncio.Task] = None
+        self._segments: List[TranscriptionResult] = []
+        self._interim: Optional[str] = None
+        self._utterance_start = 0.0
+        self._final_end = 0.0
+        self._finalize_acked = False
+        self._progress = asyncio.Event()
+    
+    @property
+    def position(self) -> float:
+        """Seconds of audio pushed so far."""
+        return self.pushed_bytes / self.bytes_per_second
+    
+    def start(self) -> None:
+        """Open the stream in a background reader task."""
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+    
+    def push(self, frame: bytes) -> bool:
+        """
+        Queue a frame of caller audio for the stream.
+        
+        Args:
+            frame: Audio in the stream's format
+        
+        Returns:
+            False if the stream is closed or the frame was dropped
+        """
+        if self.closed:
+            return False
+        try:
+            self._frames.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.dropped_frames += 1
+            self.metrics_collector.increment_counter("stt_live_frames_dropped_total")
+            return False
+        self.pushed_bytes += len(frame)
+        return True
+    
+    def begin_utterance(self, lookback_seconds: float = 0.0) -> None:
+        """
+        Mark where the next utterance starts; earlier finals are not part of it.
+        
+        Args:
+            lookback_seconds: How far before the current position speech began
+        """
+        self._utterance_start = max(0.0, self.position - lookback_seconds)
+    
+    def transcript(self) -> str:
+        """Transcript of the current utterance: its finals and the pending interim."""
+        parts = [segment.text.strip() for segment in self._segments]
+        if self._interim:
+            parts.append(self._interim)
+        return " ".join(parts)
+    
+    async def finalize_utterance(self, timeout: float) -> TranscriptionResult:
+        """
+        Flush the stream and take the current utterance's transcript.
+        
+        Waits until the provider acknowledges the finalize request or its
+        finals cover all audio pushed so far, at most timeout seconds.
+        
+        Args:
+            timeout: Maximum seconds to wait for final results
+        
+        Returns:
+            TranscriptionResult combining the utterance's final segments
+        """
+        # Never satisfied by an empty stream's zero position
+        target = max(self.position - self.END_TOLERANCE_SECONDS, 1e-9)
+        self._finalize_acked = False
+        if not self.closed:
+            try:
+                self._frames.put_nowait(_FINALIZE)
+            except asyncio.QueueFull:
+                pass
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not (self.closed or self._finalize_acked or self._final_end >= target):
+            self._progress.clear()
+            try:
+                await asyncio.wait_for(self._progress.wait(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                self.metrics_collector.increment_counter("stt_finalize_timeouts_total")
+                logger.warning(
+                    f"Timed out waiting for final transcript on {self.connection_id}",
+                    extra={"connection_id": self.connection_id, "timeout": timeout}
+                )
+                break
+        
+        return self._take_utterance()
+    
+    def _take_utterance(self) -> TranscriptionResult:
+        """Merge and reset the current utterance's final segments."""
+        segments = [
+            segment for segment in self._segments
+            if not segment.end_time or segment.end_time > self._utterance_start
+        ]
+        self._segments = []
+        self._interim = None
+        
+        if not segments:
+            return TranscriptionResult(
+                text="",
+                confidence=0.0,
+                language=self.stt_client.streaming_config.language,
+                duration=0.0
+            )
+        
+        return TranscriptionResult(
+            text=" ".join(segment.text.strip() for segment in segments),
+            confidence=sum(segment.confidence for segment in segments) / len(segments),
+            language=segments[0].language,
+            duration=sum(segment.duration for segment in segments),
+            is_final=True,
+            start_time=segments[0].start_time,
+            end_time=segments[-1].end_time,
+            words=WordTimings.concat(segment.words for segment in segments)
+        )
+    
+    async def _read(self) -> None:
+        """Consume results until the stream ends."""
+        try:
+            frames = _FrameSource(self._frames, self.stt_client, self.connection_id)
+            async for result in self.stt_client.transcribe_stream(frames, connection_id=self.connection_id):
+                self._on_result(result)
+            if not self.closed:
+                logger.warning(
+                    f"Live transcription stream {self.connection_id} was closed by the provider",
+                    extra={"connection_id": self.connection_id}
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error = e
+            self.metrics_collector.increment_counter("stt_live_stream_errors_total")
+            logger.error(
+                f"Live transcription stream {self.connection_id} failed: {e}",
+                extra={"connection_id": self.connection_id, "error": str(e)}
+            )
+        finally:
+            self.closed = True
+            self._progress.set()
+    
+    def _on_result(self, result: TranscriptionResult) -> None:
+        """Fold one streaming result into the current utterance."""
+        text = result.text.strip()
+        if result.is_final:
+            if text:
+                self._segments.append(result)
+            self._interim = None
+            self._final_end = max(self._final_end, result.end_time)
+            if result.metadata.get("from_finalize"):
+                self._finalize_acked = True
+            self._progress.set()
+        else:
+            self._interim = text or None
+        
+        if text and self.on_transcript is not None:
+            self.on_transcript(self.transcript(), result.is_final)
+    
+    async def close(self, timeout: float = 2.0) -> None:
+        """
+        End the stream, letting queued audio drain for up to timeout seconds.
+        
+        Args:
+            timeout: Seconds to wait for the stream to finish before cancelling it
+        """
+        if self._reader is None:
+            self.closed = True
+            return
+        
+        if not self.closed:
+            try:
+                self._frames.put_nowait(_CLOSE)
+            except asyncio.QueueFull:
+                pass
+        self.closed = True
+        
+        reader, self._reader = self._reader, None
+        _, pending = await asyncio.wait({reader}, timeout=timeout)
+        if pending:
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
@@ -23,6 +23,7 @@ import yaml
 from livekit import api, rtc
 from livekit.api import AccessToken, VideoGrants
 
+from src.audio.codec import SIP_CODECS, AudioFormatSpec
 from src.config import get_settings
 from src.metrics import get_metrics_collector, timer
 from src.orchestrator import CallContext, CallOrchestrator
@@ -134,6 +135,41 @@ class SIPTrunkHealth:
         }
 
 
+class LiveKitAudioSink:
+    """
+    Outbound audio sink that publishes PCM16 frames to a LiveKit audio source.
+    
+    Instances are callable with one frame of audio, so they can be returned
+    from the orchestrator's audio_sink_factory for a call's published track.
+    """
+    
+    def __init__(self, source: rtc.AudioSource):
+        """
+        Initialize the sink.
+        
+        Args:
+            source: Audio source backing the call's published track
+        """
+        self.source = source
+    
+    async def __call__(self, frame: bytes) -> None:
+        """
+        Capture one frame on the audio source.
+        
+        Args:
+            frame: PCM16 audio at the source's sample rate and channel count
+        """
+        samples_per_channel = len(frame) // (2 * self.source.num_channels)
+        await self.source.capture_frame(
+            rtc.AudioFrame(
+                data=frame,
+                sample_rate=self.source.sample_rate,
+                num_channels=self.source.num_channels,
+                samples_per_channel=samples_per_channel
+            )
+        )
+
+
 class LiveKitSIPIntegration:
     """
     LiveKit SIP Integration manager.
@@ -583,6 +619,9 @@ class LiveKitSIPIntegration:
             call_id = str(uuid4())
             room_name = f"voice-ai-call-{call_id}"
             
+            # Negotiate the call's wire format; the orchestrator transcodes it
+            audio_format = self._get_audio_format()
+            
             # Create call metadata
             call_metadata = CallMetadata(
                 call_id=call_id,
@@ -615,7 +654,8 @@ class LiveKitSIPIntegration:
                     "trunk_name": trunk_name,
                     "codec_used": call_metadata.codec_used,
                     "custom_headers": call_metadata.custom_headers
-                }
+                },
+                audio_format=audio_format
             )
             
             # Update statistics
@@ -675,12 +715,21 @@ class LiveKitSIPIntegration:
             logger.error(f"Error handling call end: {e}")
     
     def _get_preferred_codec(self) -> str:
-        """Get the preferred audio codec."""
+        """Get the preferred audio codec the pipeline can transcode."""
         for codec in self.audio_codecs:
-            if codec.enabled:
+            if codec.enabled and codec.name.upper() in SIP_CODECS:
                 return codec.name
         return "PCMU"  # Default fallback
     
+    def _get_audio_format(self) -> AudioFormatSpec:
+        """Get the wire format of the preferred audio codec."""
+        for codec in self.audio_codecs:
+            if codec.enabled:
+                audio_format = AudioFormatSpec.for_sip_codec(codec.name, codec.sample_rate, codec.channels)
+                if audio_format is not None:
+                    return audio_format
+        return AudioFormatSpec.for_sip_codec("PCMU", 8000)
+    
     def add_event_handler(self, event_type: LiveKitEventType, handler: Callable) -> None:
         """Add event handler for LiveKit events."""
         self.event_handlers[event_type].append(handler)
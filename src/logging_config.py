@@ -1,8 +1,12 @@
 """Centralized logging configuration with structured JSON format."""
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
@@ -65,6 +69,38 @@ class CorrelationFilter(logging.Filter):
         return True
 
 
+class RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that defers formatting to the listener thread.
+    
+    Only the message is resolved on the calling thread (its arguments may
+    change once the call returns); sanitizing, formatting, including
+    exception tracebacks, and the write happen on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record with its message merged with its arguments."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listener draining the log queue, replaced on each setup_logging() call
+_queue_listener: Optional[QueueListener] = None
+
+
+def stop_log_listener() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_log_listener)
+
+
 def setup_logging(settings: Settings) -> None:
     """Set up centralized logging configuration."""
     
@@ -73,6 +109,7 @@ def setup_logging(settings: Settings) -> None:
     root_logger.setLevel(getattr(logging, settings.log_level.upper()))
     
     # Remove existing handlers
+    stop_log_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -93,7 +130,13 @@ def setup_logging(settings: Settings) -> None:
     sensitive_filter = SensitiveDataFilter()
     console_handler.addFilter(sensitive_filter)
     
-    root_logger.addHandler(console_handler)
+    # Sanitize, format and write on a listener thread so logging call
+    # sites on the event loop only pay for an enqueue
+    global _queue_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _queue_listener.start()
+    root_logger.addHandler(RecordQueueHandler(log_queue))
     
     # Set specific logger levels
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -15,11 +15,13 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config_loader import load_configuration, ConfigurationError, print_configuration_report
+from src.executor import get_blocking_executor, shutdown_blocking_executor
 from src.health import check_health
 from src.logging_config import setup_logging, LoggerMixin
 from src.livekit_integration import get_livekit_integration, shutdown_livekit_integration
 from src.webhooks import start_webhook_handler, stop_webhook_handler, setup_webhook_routes
 from src.orchestrator import CallOrchestrator
+from src.worker_pool import OrchestratorWorkerPool
 from src.clients.deepgram_stt import DeepgramSTTClient
 from src.clients.openai_llm import OpenAILLMClient
 from src.clients.cartesia_tts import CartesiaTTSClient
@@ -27,6 +29,7 @@ from src.monitoring.health_monitor import HealthMonitor, ComponentType
 from src.monitoring.alerting import AlertManager, WebhookChannel, LogChannel
 from src.monitoring.metrics_exporter import MetricsExportManager, PrometheusExporter, JSONExporter
 from src.monitoring.dashboard import DashboardManager
+from src.monitoring.loop_monitor import EventLoopMonitor
 
 try:
     from fastapi import FastAPI
@@ -58,6 +61,7 @@ class VoiceAIAgent(LoggerMixin):
         self.alert_manager = None
         self.metrics_exporter = None
         self.dashboard_manager = None
+        self.loop_monitor = None
         
         # Initialize components list for tracking
         self.initialized_components: List[str] = []
@@ -224,7 +228,7 @@ class VoiceAIAgent(LoggerMixin):
             # Step 4: Perform startup health checks
             print("🏥 Performing startup health checks...")
             try:
-                health = check_health()
+                health = await get_blocking_executor().run(check_health, task_name="startup_health_check")
                 logger.info(f"Health check completed with status: {health['status']}")
                 
                 if health["status"] == "healthy":
@@ -277,12 +281,17 @@ class VoiceAIAgent(LoggerMixin):
             # Step 6: Initialize call orchestrator
             print("🎭 Initializing call orchestrator...")
             try:
-                self.orchestrator = CallOrchestrator(
-                    stt_client=stt_client,
-                    llm_client=llm_client,
-                    tts_client=tts_client,
-                    max_concurrent_calls=getattr(self.settings, 'max_concurrent_calls', 10)
-                )
+                if self.settings.orchestrator_workers > 1:
+                    self.orchestrator = OrchestratorWorkerPool(self.settings.orchestrator_workers)
+                    await self.orchestrator.start()
+                else:
+                    self.orchestrator = CallOrchestrator.from_settings(
+                        self.settings,
+                        stt_client=stt_client,
+                        llm_client=llm_client,
+                        tts_client=tts_client
+                    )
+                    await self.orchestrator.start()
                 logger.info("Call orchestrator initialized")
                 print("✅ Call orchestrator initialized")
                 self.initialized_components.append("orchestrator")
@@ -366,6 +375,15 @@ class VoiceAIAgent(LoggerMixin):
                     "orchestrator", ComponentType.ORCHESTRATOR, orchestrator_health_check
                 )
                 
+                # Event loop lag, pending tasks and slow callbacks
+                self.loop_monitor = EventLoopMonitor(
+                    slow_callback_threshold=self.settings.slow_callback_threshold,
+                    track_slow_callbacks=self.settings.enable_slow_callback_tracking
+                )
+                self.health_monitor.register_component(
+                    "event_loop", ComponentType.EVENT_LOOP, self.loop_monitor.health_check
+                )
+                
                 # Initialize alert manager
                 self.alert_manager = AlertManager(check_interval=60.0)
                 
@@ -401,6 +419,7 @@ class VoiceAIAgent(LoggerMixin):
                 )
                 
                 # Start monitoring services
+                await self.loop_monitor.start_monitoring()
                 await self.health_monitor.start_monitoring()
                 await self.alert_manager.start_monitoring()
                 await self.metrics_exporter.start_exporting()
@@ -675,6 +694,9 @@ class VoiceAIAgent(LoggerMixin):
                 if self.health_monitor:
                     await self.health_monitor.stop_monitoring()
                 
+                if self.loop_monitor:
+                    await self.loop_monitor.stop_monitoring()
+                
                 print("✅ Monitoring system shutdown")
             except Exception as e:
                 logger.error(f"Error shutting down monitoring system: {e}")
@@ -699,6 +721,7 @@ class VoiceAIAgent(LoggerMixin):
                 logger.error(f"Error during shutdown task completion: {e}")
         
         # Final cleanup
+        shutdown_blocking_executor(wait=False)
         self.running = False
         self.startup_complete = False
         
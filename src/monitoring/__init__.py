@@ -4,6 +4,7 @@ from .health_monitor import HealthMonitor, HealthStatus, ComponentHealth, System
 from .metrics_exporter import MetricsExportManager, PrometheusExporter, JSONExporter
 from .alerting import AlertManager, Alert, AlertSeverity, AlertStatus
 from .dashboard import DashboardManager, Dashboard, DashboardPanel, DashboardMetric
+from .loop_monitor import EventLoopMonitor
 
 __all__ = [
     "HealthMonitor",
@@ -21,5 +22,6 @@ __all__ = [
     "DashboardManager",
     "Dashboard",
     "DashboardPanel",
-    "DashboardMetric"
+    "DashboardMetric",
+    "EventLoopMonitor"
 ]
\ No newline at end of file
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from src.config import get_settings
+from src.executor import get_blocking_executor
 from src.metrics import get_metrics_collector
 from src.monitoring.health_monitor import HealthMonitor, SystemHealth, ComponentHealth, HealthStatus
 from src.monitoring.alerting import AlertManager, Alert, AlertSeverity
@@ -18,6 +19,14 @@ from src.monitoring.alerting import AlertManager, Alert, AlertSeverity
 logger = logging.getLogger(__name__)
 
 
+def _sample_system_resources() -> Tuple[float, Any, Any]:
+    """Read CPU, memory and disk usage; psutil reads /proc, so call this off the event loop."""
+    import psutil
+    
+    # CPU usage since the previous call; a sampling interval would block the caller
+    return psutil.cpu_percent(interval=None), psutil.virtual_memory(), psutil.disk_usage('/')
+
+
 @dataclass
 class DashboardMetric:
     """Individual dashboard metric with visualization metadata."""
@@ -686,10 +695,11 @@ class DashboardManager:
     
     async def _update_system_resources_panel(self, panel: DashboardPanel) -> None:
         """Update system resources panel."""
-        import psutil
+        cpu_percent, memory, disk = await get_blocking_executor().run(
+            _sample_system_resources, task_name="dashboard_system_resources"
+        )
         
         # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
         panel.metrics.append(DashboardMetric(
             name="cpu_usage",
             value=cpu_percent,
@@ -702,7 +712,6 @@ class DashboardManager:
         ))
         
         # Memory usage
-        memory = psutil.virtual_memory()
         panel.metrics.extend([
             DashboardMetric(
                 name="memory_usage",
@@ -725,7 +734,6 @@ class DashboardManager:
         ])
         
         # Disk usage
-        disk = psutil.disk_usage('/')
         panel.metrics.extend([
             DashboardMetric(
                 name="disk_usage",
@@ -780,7 +788,7 @@ class DashboardManager:
         import psutil
         
         # Network I/O
-        net_io = psutil.net_io_counters()
+        net_io = await get_blocking_executor().run(psutil.net_io_counters, task_name="dashboard_network")
         panel.metrics.extend([
             DashboardMetric(
                 name="network_bytes_sent",
@@ -34,6 +34,7 @@ class ComponentType(str, Enum):
     LIVEKIT = "livekit"
     SYSTEM = "system"
     ORCHESTRATOR = "orchestrator"
+    EVENT_LOOP = "event_loop"
 
 
 @dataclass
@@ -304,7 +305,7 @@ class HealthMonitor:
                 component_name=component_name,
                 status=HealthStatus.UNHEALTHY,
                 last_check=datetime.now(UTC),
-                response_time_ms=self.component_timeout * 1000,
+                response_time_ms=(time.time() - start_time) * 1000,
                 success_rate=0.0,
                 error_rate=100.0,
                 details={"timeout": True},
@@ -334,11 +335,18 @@ class HealthMonitor:
             1 if component_health.status == HealthStatus.HEALTHY else 0,
             labels={"component": component_name, "type": component_info["type"].value}
         )
-        self.metrics_collector.record_histogram(
-            f"component_health_response_time_ms",
-            component_health.response_time_ms,
-            labels={"component": component_name}
-        )
+        if component_health.details.get("timeout"):
+            # A timed-out check has no response time, only how long it was waited for
+            self.metrics_collector.increment_counter(
+                "component_health_check_timeouts_total",
+                labels={"component": component_name}
+            )
+        else:
+            self.metrics_collector.record_histogram(
+                f"component_health_response_time_ms",
+                component_health.response_time_ms,
+                labels={"component": component_name}
+            )
         
         logger.debug(
             f"Health check completed for {component_name}",
@@ -0,0 +1,288 @@
+"""Event-loop health monitoring: scheduling lag, pending tasks and slow callbacks."""
+
+import asyncio
+import logging
+import re
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from src.metrics import MetricsCollector, get_metrics_collector
+from .health_monitor import HealthStatus
+
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TASK_NAME = re.compile(r"^Task-\d+$")
+
+
+def task_group_name(task: asyncio.Task) -> str:
+    """
+    Get the name a task is counted under.
+    
+    Tasks left with asyncio's default "Task-<n>" name are grouped by the
+    qualified name of their coroutine so that counts stay meaningful.
+    
+    Args:
+        task: Task to name
+    
+    Returns:
+        Group name
+    """
+    name = task.get_name()
+    if _DEFAULT_TASK_NAME.match(name):
+        coro = task.get_coro()
+        return getattr(coro, "__qualname__", None) or type(coro).__name__
+    return name
+
+
+def _describe_handle(handle: asyncio.Handle) -> str:
+    """Name the code a loop callback runs, resolving task steps to their task."""
+    callback = handle._callback
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        return task_group_name(owner)
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+class EventLoopMonitor:
+    """
+    Samples the health of the running event loop.
+    
+    A sampler task sleeps for sample_interval and records how late it woke
+    up; that overshoot is the time other callbacks held the loop. Every
+    report_interval the lag percentiles and the number of pending tasks,
+    grouped by name, are exported as gauges.
+    
+    With track_slow_callbacks, each loop callback is also timed while the
+    monitor runs and those exceeding slow_callback_threshold are counted and
+    logged with the task or function that ran. This wraps asyncio.Handle._run
+    for the whole process, so it is off by default and the original is put
+    back when monitoring stops.
+    """
+    
+    def __init__(
+        self,
+        sample_interval: float = 0.1,
+        report_interval: float = 5.0,
+        window_size: int = 600,
+        slow_callback_threshold: float = 0.1,
+        lag_degraded_threshold: float = 0.05,
+        lag_unhealthy_threshold: float = 0.5,
+        track_slow_callbacks: bool = False,
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize the event loop monitor.
+        
+        Args:
+            sample_interval: Seconds between lag samples
+            report_interval: Seconds between metric exports
+            window_size: Number of recent lag samples kept for percentiles
+            slow_callback_threshold: Callback duration in seconds flagged as slow
+            lag_degraded_threshold: p99 lag in seconds reported as degraded
+            lag_unhealthy_threshold: p99 lag in seconds reported as unhealthy
+            track_slow_callbacks: Time every loop callback by wrapping asyncio.Handle._run
+            metrics_collector: Collector for exported metrics, defaults to the global one
+        """
+        self.sample_interval = sample_interval
+        self.report_interval = report_interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.lag_degraded_threshold = lag_degraded_threshold
+        self.lag_unhealthy_threshold = lag_unhealthy_threshold
+        self.track_slow_callbacks = track_slow_callbacks
+        self.metrics_collector = metrics_collector or get_metrics_collector()
+        
+        self.lag_samples: Deque[float] = deque(maxlen=window_size)
+        self.slow_callbacks: Counter = Counter()
+        self.is_monitoring = False
+        self.monitoring_task: Optional[asyncio.Task] = None
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._original_handle_run: Optional[Callable[[asyncio.Handle], None]] = None
+        self._timed_handle_run: Optional[Callable[[asyncio.Handle], None]] = None
+        self._reported_task_names: set = set()
+    
+    async def start_monitoring(self) -> None:
+        """Start sampling the running loop and, if enabled, timing its callbacks."""
+        if self.is_monitoring:
+            logger.warning("Event loop monitoring is already running")
+            return
+        
+        self.is_monitoring = True
+        self._loop = asyncio.get_running_loop()
+        if self.track_slow_callbacks:
+            self._install_callback_timer()
+        self.monitoring_task = asyncio.create_task(self._monitoring_loop())
+        
+        logger.info(
+            f"Started event loop monitoring with {self.sample_interval}s sample interval",
+            extra={
+                "track_slow_callbacks": self.track_slow_callbacks,
+                "slow_callback_threshold": self.slow_callback_threshold
+            }
+        )
+    
+    async def stop_monitoring(self) -> None:
+        """Stop sampling and restore untimed callback execution."""
+        if not self.is_monitoring:
+            return
+        
+        self.is_monitoring = False
+        self._remove_callback_timer()
+        
+        if self.monitoring_task:
+            self.monitoring_task.cancel()
+            try:
+                await self.monitoring_task
+            except asyncio.CancelledError:
+                pass
+            self.monitoring_task = None
+        
+        logger.info("Stopped event loop monitoring")
+    
+    def _install_callback_timer(self) -> None:
+        """Wrap Handle._run so every callback on the monitored loop is timed."""
+        if self._original_handle_run is not None:
+            return
+        
+        original = asyncio.Handle._run
+        monitor = self
+        
+        def timed_run(handle: asyncio.Handle) -> None:
+            start = time.perf_counter()
+            try:
+                original(handle)
+            finally:
+                duration = time.perf_counter() - start
+                if (
+                    monitor.is_monitoring
+                    and duration >= monitor.slow_callback_threshold
+                    and handle._loop is monitor._loop
+                ):
+                    monitor._record_slow_callback(handle, duration)
+        
+        self._original_handle_run = original
+        self._timed_handle_run = timed_run
+        asyncio.Handle._run = timed_run
+    
+    def _remove_callback_timer(self) -> None:
+        """Restore the Handle._run replaced by _install_callback_timer."""
+        if self._original_handle_run is None:
+            return
+        
+        if asyncio.Handle._run is self._timed_handle_run:
+            asyncio.Handle._run = self._original_handle_run
+        else:
+            # Something wrapped Handle._run after us; restoring would drop its wrapper
+            logger.warning("asyncio.Handle._run was replaced while monitoring, leaving it in place")
+        self._original_handle_run = None
+        self._timed_handle_run = None
+    
+    def _record_slow_callback(self, handle: asyncio.Handle, duration: float) -> None:
+        """Count and log a callback that held the loop too long."""
+        callback = _describe_handle(handle)
+        self.slow_callbacks[callback] += 1
+        self.metrics_collector.increment_counter("event_loop_slow_callbacks_total", labels={"callback": callback})
+        self.metrics_collector.record_histogram("event_loop_slow_callback_seconds", duration)
+        logger.warning(
+            f"Event loop blocked for {duration * 1000:.1f}ms by {callback}",
+            extra={"callback": callback, "duration_ms": duration * 1000}
+        )
+    
+    async def _monitoring_loop(self) -> None:
+        """Sample scheduling lag and export metrics until stopped."""
+        loop = asyncio.get_running_loop()
+        next_report = loop.time() + self.report_interval
+        while self.is_monitoring:
+            expected = loop.time() + self.sample_interval
+            await asyncio.sleep(self.sample_interval)
+            now = loop.time()
+            self.lag_samples.append(max(0.0, now - expected))
+            
+            if now >= next_report:
+                next_report = now + self.report_interval
+                try:
+                    self.report()
+                except Exception as e:
+                    logger.error(f"Error reporting event loop metrics: {e}")
+    
+    def lag_percentiles(self) -> Dict[str, float]:
+        """
+        Get scheduling lag percentiles over the sample window.
+        
+        Returns:
+            Dictionary with p50, p99 and max lag in seconds
+        """
+        if not self.lag_samples:
+            return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+        
+        samples = sorted(self.lag_samples)
+        last = len(samples) - 1
+        return {
+            "p50": samples[int(last * 0.5)],
+            "p99": samples[int(last * 0.99)],
+            "max": samples[last]
+        }
+    
+    def pending_tasks(self) -> Dict[str, int]:
+        """
+        Count the monitored loop's unfinished tasks by group name.
+        
+        Returns:
+            Dictionary mapping task group name to count, largest first
+        """
+        loop = self._loop or asyncio.get_running_loop()
+        counts = Counter(task_group_name(task) for task in asyncio.all_tasks(loop))
+        return dict(counts.most_common())
+    
+    def report(self) -> None:
+        """Export lag percentiles and pending task counts as gauges."""
+        for quantile, lag in self.lag_percentiles().items():
+            self.metrics_collector.set_gauge("event_loop_lag_seconds", lag, labels={"quantile": quantile})
+        
+        tasks = self.pending_tasks()
+        self.metrics_collector.set_gauge("event_loop_pending_tasks", sum(tasks.values()))
+        # Zero names that have gone away so their gauges do not go stale
+        for name in self._reported_task_names - tasks.keys():
+            self.metrics_collector.set_gauge("event_loop_tasks_by_name", 0, labels={"task": name})
+        for name, count in tasks.items():
+            self.metrics_collector.set_gauge("event_loop_tasks_by_name", count, labels={"task": name})
+        self._reported_task_names = set(tasks)
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Health check for registration with HealthMonitor.
+        
+        Returns:
+            Health result graded on p99 scheduling lag
+        """
+        lag = self.lag_percentiles()
+        tasks = self.pending_tasks()
+        
+        if lag["p99"] >= self.lag_unhealthy_threshold:
+            status = HealthStatus.UNHEALTHY
+        elif lag["p99"] >= self.lag_degraded_threshold:
+            status = HealthStatus.DEGRADED
+        else:
+            status = HealthStatus.HEALTHY
+        
+        top_tasks: List[str] = list(tasks)[:10]
+        return {
+            "status": status.value,
+            "success_rate": 100.0,
+            "error_rate": 0.0,
+            "details": {
+                "lag_p50_ms": lag["p50"] * 1000,
+                "lag_p99_ms": lag["p99"] * 1000,
+                "lag_max_ms": lag["max"] * 1000,
+                "samples": len(self.lag_samples),
+                "pending_tasks": sum(tasks.values()),
+                "tasks_by_name": {name: tasks[name] for name in top_tasks},
+                "slow_callbacks": dict(self.slow_callbacks.most_common(10))
+            },
+            "error_message": (
+                None if status == HealthStatus.HEALTHY
+                else f"Event loop p99 lag {lag['p99'] * 1000:.1f}ms"
+            )
+        }
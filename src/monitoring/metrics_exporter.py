@@ -13,6 +13,7 @@ from urllib.parse import urljoin
 import httpx
 
 from src.config import get_settings
+from src.executor import get_blocking_executor
 from src.metrics import get_metrics_collector
 
 
@@ -407,11 +408,7 @@ class JSONExporter(MetricsExporter):
             # Export to file
             if self.file_path:
                 try:
-                    import os
-                    os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-                    
-                    with open(self.file_path, 'w') as f:
-                        json.dump(json_data, f, indent=2)
+                    await get_blocking_executor().run(self._write_file, json_data, task_name="metrics_json_export")
                 except Exception as e:
                     logger.error(f"File export error: {e}")
                     success = False
@@ -422,6 +419,14 @@ class JSONExporter(MetricsExporter):
             logger.error(f"JSON export failed: {e}")
             return False
     
+    def _write_file(self, json_data: Dict[str, Any]) -> None:
+        """Write a snapshot to the export file (blocking)."""
+        import os
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        
+        with open(self.file_path, 'w') as f:
+            json.dump(json_data, f, indent=2)
+    
     async def health_check(self) -> bool:
         """Check if JSON exporter is healthy."""
         if self.endpoint_url and self.http_client:
@@ -8,19 +8,38 @@ coordinator for managing the entire call lifecycle and component interactions.
 import asyncio
 import logging
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
 from datetime import datetime, UTC
 from enum import Enum
-from typing import Any, Dict, List, Optional, AsyncIterator, Callable
+from typing import Any, Deque, Dict, List, Optional, AsyncIterator, Callable, Sequence, Set, Tuple
 from uuid import uuid4
 
-from src.clients.deepgram_stt import DeepgramSTTClient, TranscriptionResult
+from src.clients.deepgram_stt import TranscriptionResult, WordTimings
+from src.clients.deepgram_pool import LivePoolConfig
+from src.clients.local_stt import LocalWhisperSTT
+from src.clients.stt_backend import FailoverSTTClient, STTBackend
 from src.clients.openai_llm import OpenAILLMClient, ConversationContext
-from src.clients.cartesia_tts import CartesiaTTSClient, VoiceConfig, AudioConfig
+from src.clients.response_cache import ResponseCacheConfig
+from src.clients.cartesia_tts import (
+    CartesiaTTSClient, VoiceConfig, AudioConfig, AudioFormat, AudioEncoding
+)
 from src.conversation.state_machine import ConversationStateMachine, ConversationState
 from src.conversation.dialogue_manager import DialogueManager
-from src.config import get_settings
+from src.conversation.sentence_splitter import SentenceSplitter
+from src.conversation.speculation import SpeculativeGeneration, normalize_transcript
+from src.audio.vad import VoiceActivityDetector, VADConfig, VADEvent
+from src.audio.ring_buffer import AudioRingBuffer, OverflowPolicy
+from src.audio.outbound import AudioSink, OutboundAudioConfig, OutboundAudioStream
+from src.audio.codec import AudioFormatSpec, AudioTranscoder, Codec, transcoding_sink, wrap_wav
+from src.conversation.filler import FillerClipCache, DEFAULT_FILLER_PHRASES
+from src.admission import AdmissionController, AdmissionConfig
+from src.config import Settings, get_settings
 from src.metrics import get_metrics_collector, timer
+from src.tracing import TurnStage, TurnTrace
+from src.executor import get_blocking_executor
+from src.live_stt import LiveTranscriber
 from src.health import check_health
 
 
@@ -54,6 +73,8 @@ class CallContext:
     start_time: datetime
     livekit_room: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Negotiated wire format of the call's audio; None means pipeline PCM16
+    audio_format: Optional[AudioFormatSpec] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -62,10 +83,15 @@ class CallContext:
             "caller_number": self.caller_number,
             "start_time": self.start_time.isoformat(),
             "livekit_room": self.livekit_room,
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "audio_format": self.audio_format.to_dict() if self.audio_format else None
         }
 
 
+# Completed turn traces kept per call
+MAX_TURN_TRACES = 50
+
+
 @dataclass
 class CallMetrics:
     """Metrics for call performance monitoring."""
@@ -84,6 +110,8 @@ class CallMetrics:
     reconnections: int = 0
     bytes_received: int = 0
     bytes_sent: int = 0
+    audio_bytes_dropped: int = 0
+    turn_traces: Deque[TurnTrace] = field(default_factory=lambda: deque(maxlen=MAX_TURN_TRACES))
     
     @property
     def success_rate(self) -> float:
@@ -116,10 +144,266 @@ class CallMetrics:
             "interruptions": self.interruptions,
             "reconnections": self.reconnections,
             "bytes_received": self.bytes_received,
-            "bytes_sent": self.bytes_sent
+            "bytes_sent": self.bytes_sent,
+            "audio_bytes_dropped": self.audio_bytes_dropped,
+            "turn_traces": [trace.to_dict() for trace in self.turn_traces]
         }
 
 
+@dataclass
+class ResponsePlayback:
+    """
+    Tracks how much of the current response has been played to the caller.
+    
+    Each sentence is recorded with the outbound stream offsets its audio
+    spans, so the stream's played offset maps back to sentences no matter
+    how far ahead of playout the audio was queued.
+    """
+    task: Optional[asyncio.Task] = None
+    sentences: List[str] = field(default_factory=list)
+    sentence_starts: List[int] = field(default_factory=list)
+    sentence_ends: List[int] = field(default_factory=list)
+    
+    # Average speaking rate used to estimate how far into a sentence playback got
+    WORDS_PER_SECOND = 2.5
+    
+    def begin_sentence(self, sentence: str) -> None:
+        """Start tracking a sentence; it is placed once its audio is queued."""
+        self.sentences.append(sentence)
+    
+    def audio_queued(self, offset: int) -> None:
+        """
+        Record where the current sentence's audio starts, on its first chunk.
+        
+        Args:
+            offset: Outbound stream offset of the chunk about to be written
+        """
+        if len(self.sentence_starts) < len(self.sentences):
+            self.sentence_starts.append(offset)
+    
+    def finish_sentence(self, offset: int) -> None:
+        """
+        Record where the current sentence's audio ends.
+        
+        Args:
+            offset: Outbound stream offset after the sentence's last chunk
+        """
+        if len(self.sentence_starts) < len(self.sentences):
+            # No audio was produced for it
+            self.sentences.pop()
+        elif len(self.sentence_ends) < len(self.sentence_starts):
+            self.sentence_ends.append(offset)
+    
+    def spoken_text(self, played_offset: int, bytes_per_second: int) -> str:
+        """
+        Estimate the text the caller has heard so far.
+        
+        Args:
+            played_offset: Outbound stream offset played so far
+            bytes_per_second: Playback rate of the outbound stream
+        
+        Returns:
+            Fully played sentences plus the words of the sentence being
+            played that its played audio covers
+        """
+        parts = []
+        for index, start in enumerate(self.sentence_starts):
+            if played_offset <= start:
+                break
+            end = self.sentence_ends[index] if index < len(self.sentence_ends) else None
+            if end is not None and played_offset >= end:
+                parts.append(self.sentences[index])
+                continue
+            
+            words = self.sentences[index].split()
+            if end is not None:
+                # Finished sentences are played at a roughly even word rate
+                word_count = len(words) * (played_offset - start) // (end - start)
+            elif bytes_per_second > 0:
+                played_seconds = (played_offset - start) / bytes_per_second
+                word_count = min(len(words), int(played_seconds * self.WORDS_PER_SECOND))
+            else:
+                word_count = 0
+            if word_count:
+                parts.append(" ".join(words[:word_count]))
+            break
+        return " ".join(parts)
+
+
+class CallSession:
+    """
+    All per-call state owned by the orchestrator.
+    
+    One session object replaces a family of dicts keyed by call ID, so the
+    audio hot path does a single lookup per frame and teardown cannot miss
+    a piece of state. __slots__ keeps the per-call footprint small when
+    thousands of calls are active.
+    """
+    
+    __slots__ = (
+        "call_id",
+        "context",
+        "metrics",
+        "state_machine",
+        "dialogue_manager",
+        "audio_stream",
+        "audio_state",
+        "audio_buffer",
+        "spare_buffer",
+        "vad",
+        "audio_output",
+        "inbound_transcoder",
+        "outbound_transcoder",
+        "processing_lock",
+        "turn_tasks",
+        "playback",
+        "speculation",
+        "last_interim",
+        "filler_task",
+        "live_stt",
+        "pending_trace",
+        "trace",
+        "turns_traced",
+        "closed"
+    )
+    
+    def __init__(
+        self,
+        context: CallContext,
+        state_machine: ConversationStateMachine,
+        dialogue_manager: DialogueManager,
+        audio_buffer: AudioRingBuffer,
+        spare_buffer: AudioRingBuffer,
+        vad: VoiceActivityDetector,
+        audio_output: OutboundAudioStream,
+        inbound_transcoder: Optional[AudioTranscoder] = None,
+        outbound_transcoder: Optional[AudioTranscoder] = None
+    ):
+        """
+        Initialize the session.
+        
+        Args:
+            context: Call context
+            state_machine: Conversation state machine for the call
+            dialogue_manager: Dialogue manager for the call
+            audio_buffer: Buffer receiving inbound audio
+            spare_buffer: Buffer swapped in when an utterance is detached
+            vad: Voice activity detector for the call
+            audio_output: Paced outbound audio stream for the call
+            inbound_transcoder: Converts caller audio to the pipeline format
+            outbound_transcoder: Converts synthesized audio to the call's rate
+        """
+        self.call_id = context.call_id
+        self.context = context
+        self.metrics = CallMetrics(call_id=context.call_id, start_time=context.start_time)
+        self.state_machine = state_machine
+        self.dialogue_manager = dialogue_manager
+        self.audio_stream: Optional[AsyncIterator[bytes]] = None
+        self.audio_state = AudioStreamState.IDLE
+        self.audio_buffer = audio_buffer
+        # None while the spare holds an utterance waiting to be processed
+        self.spare_buffer: Optional[AudioRingBuffer] = spare_buffer
+        self.vad = vad
+        self.audio_output = audio_output
+        self.inbound_transcoder = inbound_transcoder
+        self.outbound_transcoder = outbound_transcoder
+        self.processing_lock = asyncio.Lock()
+        # Turn tasks run in the background so audio keeps flowing (and barge-in
+        # can be detected) while a response is generated and spoken
+        self.turn_tasks: Set[asyncio.Task] = set()
+        self.playback: Optional[ResponsePlayback] = None
+        # Speculative LLM response started from an interim transcript
+        self.speculation: Optional[SpeculativeGeneration] = None
+        self.last_interim: Optional[str] = None
+        # Plays a filler clip if the response is slow to start
+        self.filler_task: Optional[asyncio.Task] = None
+        # Call-long STT stream, when the orchestrator uses persistent STT
+        self.live_stt: Optional[LiveTranscriber] = None
+        # Trace of the utterance being received, and of the turn being answered
+        self.pending_trace: Optional[TurnTrace] = None
+        self.trace: Optional[TurnTrace] = None
+        self.turns_traced = 0
+        self.closed = False
+    
+    def add_turn_task(self, task: asyncio.Task) -> None:
+        """Track a turn task until it finishes."""
+        self.turn_tasks.add(task)
+        task.add_done_callback(self.turn_tasks.discard)
+    
+    def begin_trace(self) -> TurnTrace:
+        """Start tracing a new turn."""
+        trace = TurnTrace(call_id=self.call_id, turn_index=self.turns_traced)
+        self.turns_traced += 1
+        return trace
+    
+    def detach_utterance(self) -> AudioRingBuffer:
+        """
+        Swap in the spare buffer so new audio does not touch the utterance.
+        
+        If the spare still holds an earlier utterance waiting for its turn,
+        a new buffer of the same size is swapped in instead.
+        
+        Returns:
+            The buffer holding the utterance; it stays valid until it is
+            passed to release_utterance()
+        """
+        utterance = self.audio_buffer
+        spare = self.spare_buffer
+        if spare is None:
+            spare = AudioRingBuffer(utterance.capacity, utterance.policy)
+        else:
+            spare.clear()
+        self.audio_buffer = spare
+        self.spare_buffer = None
+        return utterance
+    
+    def release_utterance(self, utterance: AudioRingBuffer) -> None:
+        """
+        Return a processed utterance buffer for reuse as the spare.
+        
+        Args:
+            utterance: Buffer returned by detach_utterance()
+        """
+        utterance.clear()
+        if self.spare_buffer is None and not self.closed:
+            self.spare_buffer = utterance
+    
+    def close(self) -> List[asyncio.Task]:
+        """
+        Release the session's resources.
+        
+        Cancels every turn task except the caller's own, stops outbound
+        playout, drops buffered audio and the inbound stream. Closing twice
+        is a no-op.
+        
+        Returns:
+            The turn tasks that were cancelled
+        """
+        if self.closed:
+            return []
+        self.closed = True
+        
+        current_task = asyncio.current_task()
+        cancelled = [task for task in self.turn_tasks if task is not current_task]
+        for task in cancelled:
+            task.cancel()
+        self.turn_tasks.clear()
+        
+        if self.speculation is not None:
+            self.speculation.cancel()
+            self.speculation = None
+        if self.filler_task is not None:
+            self.filler_task.cancel()
+            self.filler_task = None
+        self.audio_output.close()
+        self.audio_buffer.clear()
+        if self.spare_buffer is not None:
+            self.spare_buffer.clear()
+        self.audio_stream = None
+        self.playback = None
+        return cancelled
+
+
 @dataclass
 class HealthStatus:
     """Health status for the orchestrator."""
@@ -152,14 +436,31 @@ class CallOrchestrator:
     - Metrics collection and performance monitoring
     """
     
+    # Interim transcripts shorter than this are too ambiguous to speculate on
+    SPECULATION_MIN_WORDS = 2
+    
     def __init__(
         self,
-        stt_client: DeepgramSTTClient,
+        stt_client: STTBackend,
         llm_client: OpenAILLMClient,
         tts_client: CartesiaTTSClient,
         max_concurrent_calls: int = 10,
         audio_buffer_size: int = 1024,
-        response_timeout: float = 30.0
+        response_timeout: float = 30.0,
+        streaming_mode: bool = False,
+        speculative_llm: bool = False,
+        speculation_similarity: float = 0.85,
+        vad_config: Optional[VADConfig] = None,
+        max_buffered_audio_ms: int = 30000,
+        buffer_overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        admission_config: Optional[AdmissionConfig] = None,
+        outbound_audio_config: Optional[OutboundAudioConfig] = None,
+        audio_sink_factory: Optional[Callable[[CallContext], Optional[AudioSink]]] = None,
+        filler_deadline: Optional[float] = None,
+        filler_phrases: Sequence[str] = DEFAULT_FILLER_PHRASES,
+        persistent_stt: bool = False,
+        stt_finalize_timeout: float = 1.0,
+        stt_pool_config: Optional[LivePoolConfig] = None
     ):
         """
         Initialize the CallOrchestrator.
@@ -171,6 +472,31 @@ class CallOrchestrator:
             max_concurrent_calls: Maximum concurrent calls to handle
             audio_buffer_size: Audio buffer size in bytes
             response_timeout: Response timeout in seconds
+            streaming_mode: Use the streaming STT -> LLM -> TTS turn pipeline
+            speculative_llm: In streaming mode, start the LLM on stable interim
+                transcripts instead of waiting for the final one
+            speculation_similarity: Minimum interim/final transcript similarity
+                for keeping a speculative response
+            vad_config: Voice activity detection settings used for endpointing
+            max_buffered_audio_ms: Maximum inbound audio buffered per call
+            buffer_overflow_policy: What to do when the inbound buffer is full
+            admission_config: Adaptive admission control settings; the
+                concurrency limit never exceeds max_concurrent_calls
+            outbound_audio_config: Framing and jitter buffer settings for
+                audio sent to the caller
+            audio_sink_factory: Returns the sink (e.g. a LiveKit audio source)
+                that receives a call's outbound frames
+            filler_deadline: Seconds after the end of the caller's speech
+                before a filler clip is played if no response audio has
+                started; None disables filler audio
+            filler_phrases: Acknowledgement phrases synthesized by start()
+            persistent_stt: Keep one streaming STT connection open per call
+                and push caller audio to it as it arrives, instead of
+                sending each utterance once it has ended
+            stt_finalize_timeout: With persistent STT, maximum seconds to wait
+                for final results after the end of an utterance
+            stt_pool_config: Keep pre-opened streaming STT connections sized
+                by this config, started by start(); None opens each on demand
         """
         self.stt_client = stt_client
         self.llm_client = llm_client
@@ -178,20 +504,34 @@ class CallOrchestrator:
         self.max_concurrent_calls = max_concurrent_calls
         self.audio_buffer_size = audio_buffer_size
         self.response_timeout = response_timeout
+        self.streaming_mode = streaming_mode
+        self.speculative_llm = speculative_llm
+        self.speculation_similarity = speculation_similarity
         
         # Load settings
         self.settings = get_settings()
+        self.vad_config = vad_config or VADConfig()
+        self.max_buffered_audio_ms = max_buffered_audio_ms
+        self.buffer_overflow_policy = OverflowPolicy(buffer_overflow_policy)
+        self.outbound_audio_config = outbound_audio_config or OutboundAudioConfig(
+            sample_rate=self.vad_config.sample_rate
+        )
+        self.audio_sink_factory = audio_sink_factory
+        # VAD and STT run on PCM16 at the VAD rate; TTS produces PCM16 at the
+        # outbound rate. Calls negotiated in other formats are transcoded.
+        self.pipeline_audio_format = AudioFormatSpec(sample_rate=self.vad_config.sample_rate)
+        self.tts_audio_format = AudioFormatSpec(
+            sample_rate=self.outbound_audio_config.sample_rate,
+            channels=self.outbound_audio_config.channels
+        )
+        self.filler_deadline = filler_deadline
+        self.filler_clips = FillerClipCache(filler_phrases)
+        self.persistent_stt = persistent_stt
+        self.stt_finalize_timeout = stt_finalize_timeout
+        self.stt_pool_config = stt_pool_config
         
-        # Active calls management
-        self.active_calls: Dict[str, CallContext] = {}
-        self.call_metrics: Dict[str, CallMetrics] = {}
-        self.call_state_machines: Dict[str, ConversationStateMachine] = {}
-        self.dialogue_managers: Dict[str, DialogueManager] = {}
-        
-        # Audio stream management
-        self.audio_streams: Dict[str, AsyncIterator[bytes]] = {}
-        self.audio_stream_states: Dict[str, AudioStreamState] = {}
-        self.audio_buffers: Dict[str, List[bytes]] = {}
+        # Active calls management: all per-call state lives in one session
+        self.sessions: Dict[str, CallSession] = {}
         
         # Metrics and monitoring
         self.metrics_collector = get_metrics_collector()
@@ -206,17 +546,114 @@ class CallOrchestrator:
         
         # Concurrency control
         self.call_semaphore = asyncio.Semaphore(max_concurrent_calls)
-        self.processing_locks: Dict[str, asyncio.Lock] = {}
+        self.admission_controller = AdmissionController(
+            max_concurrent_calls,
+            admission_config,
+            clients={"stt": stt_client, "llm": llm_client, "tts": tts_client}
+        )
         
         logger.info(
             "CallOrchestrator initialized",
             extra={
                 "max_concurrent_calls": max_concurrent_calls,
                 "audio_buffer_size": audio_buffer_size,
-                "response_timeout": response_timeout
+                "response_timeout": response_timeout,
+                "streaming_mode": streaming_mode,
+                "persistent_stt": persistent_stt
             }
         )
     
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        stt_client: STTBackend,
+        llm_client: OpenAILLMClient,
+        tts_client: CartesiaTTSClient
+    ) -> "CallOrchestrator":
+        """
+        Create an orchestrator configured from application settings.
+        
+        Args:
+            settings: Application settings
+            stt_client: Speech-to-text client
+            llm_client: Language model client
+            tts_client: Text-to-speech client
+        
+        Returns:
+            Configured CallOrchestrator
+        """
+        if settings.enable_local_stt_fallback:
+            stt_client = FailoverSTTClient(
+                stt_client,
+                LocalWhisperSTT(settings.local_stt_model, streaming_config=stt_client.streaming_config),
+                latency_threshold=settings.local_stt_latency_threshold
+            )
+        if settings.enable_llm_response_cache:
+            llm_client.enable_response_cache(ResponseCacheConfig(
+                max_entries=settings.llm_cache_max_entries,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+                similarity_threshold=settings.llm_cache_similarity_threshold,
+                embedding_model=settings.llm_cache_embedding_model
+            ))
+        
+        return cls(
+            stt_client=stt_client,
+            llm_client=llm_client,
+            tts_client=tts_client,
+            max_concurrent_calls=getattr(settings, 'max_concurrent_calls', 10),
+            streaming_mode=settings.enable_streaming_pipeline,
+            speculative_llm=settings.enable_speculative_llm,
+            speculation_similarity=settings.speculation_similarity_threshold,
+            vad_config=VADConfig(
+                sample_rate=settings.audio_sample_rate,
+                threshold=settings.vad_threshold,
+                speech_end_ms=settings.vad_silence_ms,
+                speech_pad_ms=settings.audio_buffer_ms
+            ),
+            max_buffered_audio_ms=settings.audio_buffer_max_ms,
+            buffer_overflow_policy=settings.audio_buffer_overflow_policy,
+            admission_config=AdmissionConfig.from_latency_budget(
+                settings.max_response_latency,
+                min_limit=settings.admission_min_concurrent_calls,
+                queue_size=settings.admission_queue_size,
+                queue_timeout=settings.admission_queue_timeout
+            ),
+            outbound_audio_config=OutboundAudioConfig(
+                sample_rate=settings.audio_sample_rate,
+                channels=settings.audio_channels,
+                jitter_buffer_ms=settings.outbound_jitter_buffer_ms,
+                max_buffer_ms=settings.outbound_max_buffer_ms
+            ),
+            filler_deadline=settings.max_response_latency if settings.enable_filler_audio else None,
+            persistent_stt=settings.enable_persistent_stt,
+            stt_pool_config=cls._stt_pool_config(settings)
+        )
+    
+    @staticmethod
+    def _stt_pool_config(settings: Settings) -> Optional[LivePoolConfig]:
+        """Connection pool config when streaming STT is used and the pool is enabled."""
+        uses_streaming = settings.enable_streaming_pipeline or settings.enable_persistent_stt
+        if not uses_streaming or settings.deepgram_pool_max_idle <= 0:
+            return None
+        return LivePoolConfig(
+            min_idle=min(settings.deepgram_pool_min_idle, settings.deepgram_pool_max_idle),
+            max_idle=settings.deepgram_pool_max_idle
+        )
+    
+    async def start(self) -> None:
+        """Prepare resources that need the event loop, such as filler clips."""
+        if isinstance(self.stt_client, FailoverSTTClient):
+            await self.stt_client.warm_up()
+        if self.stt_pool_config is not None:
+            await self.stt_client.start_connection_pool(self.stt_pool_config)
+        if self.filler_deadline is not None:
+            await self.filler_clips.load(
+                self.tts_client,
+                self._create_voice_config(),
+                self._create_stream_audio_config()
+            )
+    
     async def handle_call_start(self, call_context: CallContext) -> None:
         """
         Handle incoming call start event.
@@ -226,13 +663,19 @@ class CallOrchestrator:
         """
         call_id = call_context.call_id
         
-        # Check concurrent call limit
-        if len(self.active_calls) >= self.max_concurrent_calls:
+        # Adaptive admission: concurrency limit follows provider latency and health
+        decision = await self.admission_controller.acquire(call_id)
+        if not decision.admitted:
             logger.warning(
-                f"Maximum concurrent calls reached, rejecting call {call_id}",
-                extra={"call_id": call_id, "active_calls": len(self.active_calls)}
+                f"Admission denied for call {call_id}: {decision.reason.value}",
+                extra={
+                    "call_id": call_id,
+                    "active_calls": len(self.sessions),
+                    "admission_limit": decision.limit,
+                    "wait_time": decision.wait_time
+                }
             )
-            await self._handle_call_rejection(call_context, "max_concurrent_calls_reached")
+            await self._handle_call_rejection(call_context, decision.reason.value)
             return
         
         async with self.call_semaphore:
@@ -246,18 +689,8 @@ class CallOrchestrator:
                     }
                 )
                 
-                # Initialize call tracking
-                self.active_calls[call_id] = call_context
-                self.call_metrics[call_id] = CallMetrics(
-                    call_id=call_id,
-                    start_time=call_context.start_time
-                )
-                self.processing_locks[call_id] = asyncio.Lock()
-                
                 # Initialize conversation components
                 state_machine = ConversationStateMachine(ConversationState.LISTENING)
-                self.call_state_machines[call_id] = state_machine
-                
                 dialogue_manager = DialogueManager(
                     conversation_id=call_id,
                     llm_client=self.llm_client,
@@ -265,11 +698,26 @@ class CallOrchestrator:
                     max_context_turns=self.settings.context_window_size // 100,  # Rough estimate
                     max_context_tokens=self.settings.context_window_size
                 )
-                self.dialogue_managers[call_id] = dialogue_manager
                 
-                # Initialize audio stream management
-                self.audio_stream_states[call_id] = AudioStreamState.IDLE
-                self.audio_buffers[call_id] = []
+                # Initialize call tracking and audio stream management
+                wire_format = call_context.audio_format
+                inbound_transcoder = None
+                if wire_format is not None and wire_format != self.pipeline_audio_format:
+                    inbound_transcoder = AudioTranscoder(wire_format, self.pipeline_audio_format)
+                audio_output, outbound_transcoder = self._create_audio_output(call_context)
+                self.sessions[call_id] = CallSession(
+                    context=call_context,
+                    state_machine=state_machine,
+                    dialogue_manager=dialogue_manager,
+                    audio_buffer=self._create_audio_buffer(),
+                    spare_buffer=self._create_audio_buffer(),
+                    vad=VoiceActivityDetector(self.vad_config),
+                    audio_output=audio_output,
+                    inbound_transcoder=inbound_transcoder,
+                    outbound_transcoder=outbound_transcoder
+                )
+                if self.persistent_stt:
+                    self._open_live_stt(self.sessions[call_id])
                 
                 # Update metrics
                 self.total_calls_handled += 1
@@ -279,7 +727,7 @@ class CallOrchestrator:
                 )
                 self.metrics_collector.set_gauge(
                     "active_calls_current",
-                    len(self.active_calls)
+                    len(self.sessions)
                 )
                 
                 # Execute call start handlers
@@ -305,29 +753,51 @@ class CallOrchestrator:
             call_id: Call identifier
             audio_data: Raw audio data bytes
         """
-        if call_id not in self.active_calls:
+        session = self.sessions.get(call_id)
+        if session is None:
             logger.warning(f"Received audio for unknown call {call_id}")
             return
         
         try:
             # Update metrics
-            self.call_metrics[call_id].bytes_received += len(audio_data)
-            self.metrics_collector.record_histogram(
-                "audio_chunk_size_bytes",
-                len(audio_data),
-                labels={"call_id": call_id}
-            )
+            session.metrics.bytes_received += len(audio_data)
+            self.metrics_collector.record_histogram("audio_chunk_size_bytes", len(audio_data))
+            
+            # Decode/resample the negotiated wire format to pipeline PCM16
+            if session.inbound_transcoder is not None:
+                audio_data = session.inbound_transcoder.convert(audio_data)
             
             # Buffer audio data
-            self.audio_buffers[call_id].append(audio_data)
+            audio_buffer = session.audio_buffer
+            dropped_before = audio_buffer.dropped_bytes
+            audio_buffer.write(audio_data)
+            if audio_buffer.dropped_bytes > dropped_before:
+                self._record_dropped_audio(session, audio_buffer.dropped_bytes - dropped_before)
+            
+            # The live STT stream hears everything, so its timestamps follow the call
+            if session.live_stt is not None:
+                session.live_stt.push(audio_data)
             
-            # Update audio stream state
-            self.audio_stream_states[call_id] = AudioStreamState.RECEIVING
+            # Run endpointing; STT/LLM only run once the utterance has ended
+            events = session.vad.process(audio_data)
             
-            # Process audio if we have enough buffered data or timeout
-            if (len(self.audio_buffers[call_id]) >= 10 or  # Buffer threshold
-                self.audio_stream_states[call_id] == AudioStreamState.RECEIVING):
-                await self._process_audio_buffer(call_id)
+            if VADEvent.SPEECH_START in events:
+                session.pending_trace = session.begin_trace()
+                session.pending_trace.mark(TurnStage.AUDIO_IN)
+                if session.live_stt is not None:
+                    session.live_stt.begin_utterance(
+                        (self.vad_config.speech_start_ms + self.vad_config.speech_pad_ms) / 1000
+                    )
+                session.audio_state = AudioStreamState.RECEIVING
+                self.metrics_collector.increment_counter("vad_speech_segments_total")
+                if session.state_machine.current_state == ConversationState.SPEAKING:
+                    await self._handle_barge_in(session)
+            
+            if VADEvent.SPEECH_END in events:
+                self._start_turn(session)
+            elif not session.vad.is_speaking:
+                # Between utterances keep only the padding that precedes speech onset
+                audio_buffer.trim(self.vad_config.speech_pad_bytes)
                 
         except Exception as e:
             logger.error(
@@ -336,6 +806,105 @@ class CallOrchestrator:
             )
             await self._handle_audio_error(call_id, e)
     
+    def _start_turn(self, session: CallSession) -> None:
+        """
+        Process the buffered utterance in a background turn task.
+        
+        The utterance is detached here, at the endpoint, so the silence that
+        follows cannot trim it while the task waits for an earlier turn.
+        
+        Args:
+            session: Call session
+        """
+        trace = session.pending_trace or session.begin_trace()
+        session.pending_trace = None
+        trace.mark(TurnStage.ENDPOINT)
+        utterance = session.detach_utterance()
+        session.add_turn_task(asyncio.create_task(
+            self._process_audio_buffer(session.call_id, trace, utterance=utterance)
+        ))
+    
+    async def _handle_barge_in(self, session: CallSession) -> None:
+        """
+        Stop the response being spoken because the caller started talking.
+        
+        Cancels the turn task, which aborts TTS synthesis and any LLM
+        generation still streaming, trims the assistant turn to what the
+        caller actually heard and returns to listening.
+        
+        Args:
+            session: Call session
+        """
+        call_id = session.call_id
+        playback = session.playback
+        if playback is None or playback.task is None or playback.task.done():
+            return
+        
+        # Silence the caller's audio immediately, then stop generating more
+        played_offset = session.audio_output.bytes_played
+        session.audio_output.clear()
+        playback.task.cancel()
+        await asyncio.wait([playback.task])
+        if session.outbound_transcoder is not None:
+            # Start the next response without the cut-off one's filter state
+            session.outbound_transcoder.reset()
+        if not playback.task.cancelled():
+            # The response finished before the cancellation landed
+            return
+        
+        spoken_text = playback.spoken_text(played_offset, session.audio_output.bytes_per_second)
+        session.dialogue_manager.record_interruption(spoken_text)
+        session.metrics.interruptions += 1
+        self.metrics_collector.increment_counter("barge_in_total")
+        
+        state_machine = session.state_machine
+        if state_machine.current_state == ConversationState.SPEAKING:
+            await state_machine.transition_to(
+                ConversationState.LISTENING,
+                trigger="barge_in"
+            )
+        session.audio_state = AudioStreamState.RECEIVING
+        
+        logger.info(
+            f"Caller barged in on call {call_id}",
+            extra={
+                "call_id": call_id,
+                "spoken_length": len(spoken_text)
+            }
+        )
+    
+    def _create_audio_buffer(self) -> AudioRingBuffer:
+        """Create an inbound audio buffer sized from the orchestrator settings."""
+        return AudioRingBuffer.for_duration(
+            self.max_buffered_audio_ms,
+            self.vad_config.sample_rate,
+            policy=self.buffer_overflow_policy
+        )
+    
+    def _record_dropped_audio(self, session: CallSession, dropped_bytes: int) -> None:
+        """
+        Record inbound audio lost to buffer overflow.
+        
+        Args:
+            session: Call session
+            dropped_bytes: Number of bytes dropped by the last write
+        """
+        call_id = session.call_id
+        session.metrics.audio_bytes_dropped += dropped_bytes
+        self.metrics_collector.increment_counter(
+            "audio_buffer_dropped_bytes_total",
+            dropped_bytes,
+            {"policy": self.buffer_overflow_policy.value}
+        )
+        logger.warning(
+            f"Inbound audio buffer full for call {call_id}, dropped {dropped_bytes} bytes",
+            extra={
+                "call_id": call_id,
+                "dropped_bytes": dropped_bytes,
+                "policy": self.buffer_overflow_policy.value
+            }
+        )
+    
     async def handle_call_end(self, call_context: CallContext) -> None:
         """
         Handle call end event.
@@ -351,33 +920,26 @@ class CallOrchestrator:
                 extra={"call_id": call_id}
             )
             
+            session = self.sessions.get(call_id)
+            
             # Update call metrics
-            if call_id in self.call_metrics:
-                metrics = self.call_metrics[call_id]
+            if session is not None:
+                metrics = session.metrics
                 metrics.end_time = datetime.now(UTC)
                 metrics.total_duration = (metrics.end_time - metrics.start_time).total_seconds()
                 
                 # Record final metrics
-                self.metrics_collector.record_timer(
-                    "call_duration_seconds",
-                    metrics.total_duration,
-                    labels={"call_id": call_id}
-                )
-                self.metrics_collector.record_histogram(
-                    "call_turns_total",
-                    metrics.total_turns,
-                    labels={"call_id": call_id}
-                )
+                self.metrics_collector.record_timer("call_duration_seconds", metrics.total_duration)
+                self.metrics_collector.record_histogram("call_turns_total", metrics.total_turns)
+                self.metrics_collector.record_histogram("call_success_rate", metrics.success_rate)
                 self.metrics_collector.record_histogram(
-                    "call_success_rate",
-                    metrics.success_rate,
-                    labels={"call_id": call_id}
+                    "call_outbound_audio_underruns",
+                    session.audio_output.stats.underruns
                 )
             
             # End conversation
-            if call_id in self.dialogue_managers:
-                dialogue_manager = self.dialogue_managers[call_id]
-                conversation_summary = dialogue_manager.end_conversation()
+            if session is not None:
+                conversation_summary = session.dialogue_manager.end_conversation()
                 
                 logger.info(
                     f"Call {call_id} conversation summary",
@@ -396,7 +958,7 @@ class CallOrchestrator:
             self.metrics_collector.increment_counter("calls_completed_total")
             self.metrics_collector.set_gauge(
                 "active_calls_current",
-                len(self.active_calls)
+                len(self.sessions)
             )
             
             # Execute call end handlers
@@ -415,22 +977,37 @@ class CallOrchestrator:
             self.failed_calls += 1
             self.metrics_collector.increment_counter("calls_failed_total")
     
-    async def _process_audio_buffer(self, call_id: str) -> None:
+    async def _process_audio_buffer(
+        self,
+        call_id: str,
+        trace: Optional[TurnTrace] = None,
+        utterance: Optional[AudioRingBuffer] = None
+    ) -> None:
         """
         Process buffered audio data for a call.
         
         Args:
             call_id: Call identifier
+            trace: Latency trace of the turn, started when speech was detected
+            utterance: Detached buffer holding the utterance; the session's
+                current buffer is detached when not given
         """
-        if call_id not in self.active_calls:
+        session = self.sessions.get(call_id)
+        if session is None:
             return
+        if trace is None:
+            trace = session.begin_trace()
+            trace.mark(TurnStage.ENDPOINT)
         
-        async with self.processing_locks[call_id]:
+        async with session.processing_lock:
+            session.playback = ResponsePlayback(task=asyncio.current_task())
+            session.trace = trace
+            metrics = session.metrics
+            state_machine = session.state_machine
+            dialogue_manager = session.dialogue_manager
             try:
                 # Update state
-                self.audio_stream_states[call_id] = AudioStreamState.PROCESSING
-                state_machine = self.call_state_machines[call_id]
-                dialogue_manager = self.dialogue_managers[call_id]
+                session.audio_state = AudioStreamState.PROCESSING
                 
                 # Transition to processing state
                 await state_machine.transition_to(
@@ -438,29 +1015,51 @@ class CallOrchestrator:
                     trigger="audio_received"
                 )
                 
-                # Combine buffered audio
-                audio_buffer = self.audio_buffers[call_id]
-                if not audio_buffer:
+                # New audio goes to the spare buffer while STT reads the
+                # utterance through a zero-copy view
+                if utterance is None:
+                    utterance = session.detach_utterance()
+                if not len(utterance):
                     return
                 
-                combined_audio = b''.join(audio_buffer)
-                self.audio_buffers[call_id] = []  # Clear buffer
+                combined_audio = utterance.view()
+                self._arm_filler(session)
                 
                 # Process audio through STT
-                with timer("stt_processing_duration", {"call_id": call_id}):
+                with timer("stt_processing_duration"):
                     stt_start = time.time()
-                    transcription_result = await self.stt_client.transcribe_batch(
-                        combined_audio,
-                        mimetype="audio/wav"
-                    )
+                    live_stt = session.live_stt
+                    if live_stt is not None and live_stt.closed:
+                        # The provider ended the stream, so it has not heard
+                        # this utterance; transcribe it from the buffer instead
+                        await self._reopen_live_stt(session)
+                        live_stt = None
+                    if live_stt is not None:
+                        transcription_result = await live_stt.finalize_utterance(
+                            self.stt_finalize_timeout
+                        )
+                    elif self.streaming_mode:
+                        transcription_result = await self._transcribe_streaming(
+                            call_id,
+                            combined_audio,
+                            session if self.speculative_llm else None
+                        )
+                    else:
+                        transcription_result = await self.stt_client.transcribe_batch(
+                            wrap_wav(combined_audio, self.pipeline_audio_format),
+                            mimetype="audio/wav"
+                        )
                     stt_latency = time.time() - stt_start
+                trace.mark(TurnStage.STT_FINAL)
                 
                 # Update metrics
-                self.call_metrics[call_id].stt_latency = stt_latency
+                metrics.stt_latency = stt_latency
                 dialogue_manager.update_service_latency('stt', stt_latency)
+                self.admission_controller.record_latency('stt', stt_latency)
                 
                 # Skip processing if transcription is empty or low confidence
                 if not transcription_result.text.strip() or transcription_result.confidence < 0.5:
+                    self._take_speculation(session, None)
                     logger.debug(
                         f"Skipping low-quality transcription for call {call_id}",
                         extra={
@@ -485,29 +1084,62 @@ class CallOrchestrator:
                     }
                 )
                 
-                # Process through dialogue manager
-                with timer("dialogue_processing_duration", {"call_id": call_id}):
-                    response_text, conversation_turn = await dialogue_manager.process_user_input(
-                        transcription_result.text,
-                        metadata={
-                            "transcription_confidence": transcription_result.confidence,
-                            "stt_latency": stt_latency
-                        }
-                    )
-                
-                # Update turn metrics
-                self.call_metrics[call_id].total_turns += 1
-                self.call_metrics[call_id].successful_turns += 1
-                self.call_metrics[call_id].llm_latency = dialogue_manager.metrics.llm_latency
+                turn_metadata = {
+                    "transcription_confidence": transcription_result.confidence,
+                    "stt_latency": stt_latency
+                }
                 
-                # Transition to speaking state
-                await state_machine.transition_to(
-                    ConversationState.SPEAKING,
-                    trigger="response_generated"
-                )
+                if self.streaming_mode:
+                    speculation = self._take_speculation(session, transcription_result.text)
+                    
+                    # LLM tokens are split into sentences and spoken as they arrive
+                    with timer("dialogue_processing_duration"):
+                        await self._stream_turn_response(
+                            call_id,
+                            transcription_result.text,
+                            turn_metadata,
+                            speculation
+                        )
+                    
+                    metrics.total_turns += 1
+                    metrics.successful_turns += 1
+                    metrics.llm_latency = dialogue_manager.metrics.llm_latency
+                    # Callers wait on the first token, not the whole generation
+                    self.admission_controller.record_latency(
+                        'llm',
+                        dialogue_manager.metrics.llm_first_token_latency
+                    )
+                else:
+                    # Process through dialogue manager
+                    with timer("dialogue_processing_duration"):
+                        response_text, conversation_turn = await dialogue_manager.process_user_input(
+                            transcription_result.text,
+                            metadata=turn_metadata
+                        )
+                    # The whole response arrives at once, so its first token is its last
+                    trace.mark(TurnStage.LLM_FIRST_TOKEN)
+                    trace.mark(TurnStage.LLM_DONE)
+                    
+                    # Update turn metrics
+                    metrics.total_turns += 1
+                    metrics.successful_turns += 1
+                    metrics.llm_latency = dialogue_manager.metrics.llm_latency
+                    self.admission_controller.record_latency('llm', dialogue_manager.metrics.llm_latency)
+                    
+                    # Transition to speaking state
+                    await state_machine.transition_to(
+                        ConversationState.SPEAKING,
+                        trigger="response_generated"
+                    )
+                    
+                    # Generate audio response
+                    await self._generate_audio_response(call_id, response_text)
                 
-                # Generate audio response
-                await self._generate_audio_response(call_id, response_text)
+                # Stay in SPEAKING (and interruptible) until the caller has heard it all
+                await session.audio_output.drain()
+                first_frame_at = session.audio_output.stats.first_frame_at
+                if first_frame_at is not None and first_frame_at >= trace.marks[TurnStage.ENDPOINT]:
+                    trace.mark(TurnStage.AUDIO_OUT_FIRST_FRAME, first_frame_at)
                 
                 # Transition back to listening
                 await state_machine.transition_to(
@@ -515,7 +1147,7 @@ class CallOrchestrator:
                     trigger="response_completed"
                 )
                 
-                self.audio_stream_states[call_id] = AudioStreamState.IDLE
+                session.audio_state = AudioStreamState.IDLE
                 
             except Exception as e:
                 logger.error(
@@ -523,12 +1155,11 @@ class CallOrchestrator:
                     extra={"call_id": call_id, "error": str(e)}
                 )
                 
+                self._take_speculation(session, None)
+                
                 # Update error metrics
-                self.call_metrics[call_id].failed_turns += 1
-                self.metrics_collector.increment_counter(
-                    "audio_processing_errors_total",
-                    labels={"call_id": call_id}
-                )
+                metrics.failed_turns += 1
+                self.metrics_collector.increment_counter("audio_processing_errors_total")
                 
                 # Force transition back to listening state
                 await state_machine.force_transition(
@@ -536,7 +1167,418 @@ class CallOrchestrator:
                     trigger="error_recovery"
                 )
                 
-                self.audio_stream_states[call_id] = AudioStreamState.ERROR
+                session.audio_state = AudioStreamState.ERROR
+            
+            finally:
+                if utterance is not None:
+                    session.release_utterance(utterance)
+                self._cancel_filler(session)
+                session.trace = None
+                metrics.turn_traces.append(trace)
+                trace.record(self.metrics_collector)
+    
+    async def _transcribe_streaming(
+        self,
+        call_id: str,
+        audio_data: memoryview,
+        speculation_session: Optional[CallSession] = None
+    ) -> TranscriptionResult:
+        """
+        Transcribe an utterance over a live STT stream and merge its final segments.
+        
+        Args:
+            call_id: Call identifier
+            audio_data: Raw utterance audio
+            speculation_session: Session to start speculative LLM generation
+                for as the transcript stabilizes, if any
+        
+        Returns:
+            TranscriptionResult combining all final segments
+        """
+        async def audio_source() -> AsyncIterator[bytes]:
+            chunk_size = max(1, self.audio_buffer_size)
+            for offset in range(0, len(audio_data), chunk_size):
+                yield audio_data[offset:offset + chunk_size]
+        
+        final_segments: List[TranscriptionResult] = []
+        async for result in self.stt_client.transcribe_stream(
+            audio_source(),
+            connection_id=f"{call_id}_{uuid4().hex[:8]}"
+        ):
+            if result.is_final and result.text.strip():
+                final_segments.append(result)
+            
+            if speculation_session is not None and result.text.strip():
+                # Finals so far plus the segment still being recognized
+                parts = [segment.text.strip() for segment in final_segments]
+                if not result.is_final:
+                    parts.append(result.text.strip())
+                self._update_speculation(speculation_session, " ".join(parts), result.is_final)
+        
+        if not final_segments:
+            return TranscriptionResult(
+                text="",
+                confidence=0.0,
+                language=self.stt_client.streaming_config.language,
+                duration=0.0
+            )
+        
+        return TranscriptionResult(
+            text=" ".join(segment.text.strip() for segment in final_segments),
+            confidence=sum(segment.confidence for segment in final_segments) / len(final_segments),
+            language=final_segments[0].language,
+            duration=sum(segment.duration for segment in final_segments),
+            is_final=True,
+            start_time=final_segments[0].start_time,
+            end_time=final_segments[-1].end_time,
+            words=WordTimings.concat(segment.words for segment in final_segments)
+        )
+    
+    def _open_live_stt(self, session: CallSession) -> LiveTranscriber:
+        """
+        Open the call-long STT stream for a session.
+        
+        Args:
+            session: Call session
+        
+        Returns:
+            The started LiveTranscriber, also stored on the session
+        """
+        def on_transcript(transcript: str, is_final: bool) -> None:
+            # Only speculate on the utterance being received or finalized; a
+            # turn past STT has not yet added its response to the history
+            trace = session.trace
+            speculate = self.streaming_mode and self.speculative_llm
+            if speculate and (trace is None or TurnStage.STT_FINAL not in trace.marks):
+                self._update_speculation(session, transcript, is_final)
+        
+        session.live_stt = LiveTranscriber(
+            self.stt_client,
+            connection_id=f"{session.call_id}_live",
+            bytes_per_second=self.pipeline_audio_format.bytes_per_second,
+            on_transcript=on_transcript,
+            metrics_collector=self.metrics_collector
+        )
+        session.live_stt.start()
+        return session.live_stt
+    
+    async def _reopen_live_stt(self, session: CallSession) -> None:
+        """
+        Replace a call's live STT stream after the provider has ended it.
+        
+        Args:
+            session: Call session whose live_stt is closed
+        """
+        ended = session.live_stt
+        logger.warning(
+            f"Live STT stream for call {session.call_id} ended, reopening",
+            extra={
+                "call_id": session.call_id,
+                "error": str(ended.error) if ended.error is not None else None
+            }
+        )
+        self.metrics_collector.increment_counter("stt_live_stream_reopens_total")
+        await ended.close()
+        if session.closed:
+            return
+        self._open_live_stt(session)
+    
+    def _update_speculation(self, session: CallSession, transcript: str, is_final: bool) -> None:
+        """
+        Start (or restart) speculative generation once the transcript is stable.
+        
+        A transcript is stable when it ends on a final segment or when two
+        consecutive interim results agree word for word.
+        
+        Args:
+            session: Call session
+            transcript: Transcript of the utterance so far
+            is_final: Whether the latest segment is final
+        """
+        words = normalize_transcript(transcript)
+        previous = session.last_interim
+        session.last_interim = transcript
+        
+        stable = is_final or (previous is not None and normalize_transcript(previous) == words)
+        if not stable or len(words) < self.SPECULATION_MIN_WORDS:
+            return
+        
+        current = session.speculation
+        if current is not None:
+            if current.matches(transcript, self.speculation_similarity):
+                return
+            current.cancel()
+            self.metrics_collector.increment_counter("llm_speculation_restarts_total")
+        
+        session.speculation = session.dialogue_manager.create_speculation(transcript)
+        self.metrics_collector.increment_counter("llm_speculation_started_total")
+        logger.debug(
+            f"Started speculative response for call {session.call_id}",
+            extra={"call_id": session.call_id, "text": transcript[:100]}
+        )
+    
+    def _take_speculation(
+        self,
+        session: CallSession,
+        final_text: Optional[str]
+    ) -> Optional[SpeculativeGeneration]:
+        """
+        Resolve the session's speculation against the final transcript.
+        
+        Args:
+            session: Call session
+            final_text: Final transcript, or None to discard the speculation
+        
+        Returns:
+            The speculation if it can be used for this turn, otherwise None
+        """
+        speculation = session.speculation
+        session.speculation = None
+        session.last_interim = None
+        if speculation is None:
+            return None
+        
+        if final_text is not None and speculation.matches(final_text, self.speculation_similarity):
+            self.metrics_collector.increment_counter("llm_speculation_hits_total")
+            return speculation
+        
+        speculation.cancel()
+        if final_text is not None:
+            self.metrics_collector.increment_counter("llm_speculation_misses_total")
+        return None
+    
+    async def _stream_turn_response(
+        self,
+        call_id: str,
+        user_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        speculation: Optional[SpeculativeGeneration] = None
+    ) -> str:
+        """
+        Stream the LLM response into TTS sentence by sentence.
+        
+        The LLM keeps generating while earlier sentences are being
+        synthesized, so the first audio is sent before the response is
+        complete.
+        
+        Args:
+            call_id: Call identifier
+            user_text: Transcribed user utterance
+            metadata: Additional turn metadata
+            speculation: Response already generated from an interim transcript
+        
+        Returns:
+            Full response text
+        """
+        session = self.sessions[call_id]
+        dialogue_manager = session.dialogue_manager
+        state_machine = session.state_machine
+        playback = session.playback
+        trace = session.trace
+        sentence_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        response_parts: List[str] = []
+        turn_start = time.time()
+        
+        async def produce_sentences() -> None:
+            splitter = SentenceSplitter()
+            try:
+                # aclosing() ends the dialogue stream promptly if the turn is cancelled
+                async with aclosing(dialogue_manager.stream_user_input(
+                    user_text,
+                    metadata=metadata,
+                    speculation=speculation
+                )) as fragments:
+                    async for fragment in fragments:
+                        if trace is not None:
+                            trace.mark(TurnStage.LLM_FIRST_TOKEN)
+                        response_parts.append(fragment)
+                        for sentence in splitter.feed(fragment):
+                            await sentence_queue.put(sentence)
+                if trace is not None:
+                    trace.mark(TurnStage.LLM_DONE)
+                remainder = splitter.flush()
+                if remainder:
+                    await sentence_queue.put(remainder)
+            finally:
+                await sentence_queue.put(None)
+        
+        async def speak_sentences() -> None:
+            first_audio_sent = False
+            while True:
+                sentence = await sentence_queue.get()
+                if sentence is None:
+                    break
+                
+                tts_start = time.time()
+                playback.begin_sentence(sentence)
+                async for audio_chunk in self.tts_client.synthesize_stream(
+                    sentence,
+                    voice_config=self._create_voice_config(),
+                    audio_config=self._create_stream_audio_config()
+                ):
+                    if not first_audio_sent:
+                        first_audio_sent = True
+                        self._cancel_filler(session)
+                        if trace is not None:
+                            trace.mark(TurnStage.TTS_FIRST_BYTE)
+                        first_audio_latency = time.time() - turn_start
+                        tts_latency = time.time() - tts_start
+                        session.metrics.tts_latency = tts_latency
+                        dialogue_manager.update_service_latency('tts', tts_latency)
+                        self.admission_controller.record_latency('tts', tts_latency)
+                        self.metrics_collector.record_timer(
+                            "turn_first_audio_latency",
+                            first_audio_latency
+                        )
+                        await state_machine.transition_to(
+                            ConversationState.SPEAKING,
+                            trigger="response_streaming"
+                        )
+                    playback.audio_queued(session.audio_output.bytes_written)
+                    await self._send_audio(call_id, audio_chunk)
+                playback.finish_sentence(session.audio_output.bytes_written)
+        
+        producer = asyncio.create_task(produce_sentences())
+        try:
+            await speak_sentences()
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+        
+        if state_machine.current_state != ConversationState.SPEAKING:
+            # Nothing was synthesized; still complete the turn cycle
+            await state_machine.transition_to(
+                ConversationState.SPEAKING,
+                trigger="response_generated"
+            )
+        
+        response_text = "".join(response_parts)
+        logger.info(
+            f"Streamed response for call {call_id}",
+            extra={
+                "call_id": call_id,
+                "text_length": len(response_text),
+                "turn_duration": time.time() - turn_start
+            }
+        )
+        return response_text
+    
+    def _create_audio_output(self, call_context: CallContext) -> Tuple[OutboundAudioStream, Optional[AudioTranscoder]]:
+        """
+        Create the paced outbound stream for a call.
+        
+        Frames are paced as PCM16 at the call's wire rate. When TTS runs at a
+        different rate the returned transcoder resamples chunks before they are
+        queued; G.711 calls additionally encode each frame as it is published.
+        
+        Args:
+            call_context: Call context with the negotiated audio format
+        
+        Returns:
+            Tuple of (outbound stream, resampling transcoder or None)
+        """
+        sink = self.audio_sink_factory(call_context) if self.audio_sink_factory else None
+        wire_format = call_context.audio_format
+        if wire_format is None:
+            return OutboundAudioStream(sink, self.outbound_audio_config), None
+        
+        paced_format = AudioFormatSpec(sample_rate=wire_format.sample_rate, channels=wire_format.channels)
+        if sink is not None and wire_format.codec is not Codec.PCM16:
+            sink = transcoding_sink(sink, AudioTranscoder(paced_format, wire_format))
+        
+        outbound_transcoder = None
+        if paced_format != self.tts_audio_format:
+            outbound_transcoder = AudioTranscoder(self.tts_audio_format, paced_format)
+        config = replace(
+            self.outbound_audio_config,
+            sample_rate=paced_format.sample_rate,
+            channels=paced_format.channels
+        )
+        return OutboundAudioStream(sink, config), outbound_transcoder
+    
+    def _create_voice_config(self) -> VoiceConfig:
+        """Create the voice configuration used for responses."""
+        return VoiceConfig(
+            voice_id=self.settings.cartesia_voice_id,
+            speed=1.0,
+            language="en"
+        )
+    
+    def _create_stream_audio_config(self) -> AudioConfig:
+        """Create the headerless PCM configuration used for streamed responses."""
+        return AudioConfig(
+            format=AudioFormat.RAW,
+            sample_rate=self.settings.audio_sample_rate,
+            encoding=AudioEncoding.PCM_S16LE
+        )
+    
+    async def _send_audio(self, call_id: str, audio_data: bytes) -> None:
+        """
+        Queue synthesized audio for paced delivery to the caller.
+        
+        Waits when the call's jitter buffer is full, so TTS never runs more
+        than max_buffer_ms ahead of playout.
+        
+        Args:
+            call_id: Call identifier
+            audio_data: Audio bytes to send
+        """
+        session = self.sessions.get(call_id)
+        if session is None:
+            return
+        
+        if session.outbound_transcoder is not None:
+            audio_data = session.outbound_transcoder.convert(audio_data)
+        session.metrics.bytes_sent += len(audio_data)
+        await session.audio_output.write(audio_data)
+    
+    def _arm_filler(self, session: CallSession) -> None:
+        """Schedule a filler clip for when the turn's response is slow to start."""
+        if self.filler_deadline is None or not len(self.filler_clips):
+            return
+        self._cancel_filler(session)
+        session.filler_task = asyncio.create_task(self._play_filler(session, self.filler_deadline))
+    
+    async def _play_filler(self, session: CallSession, delay: float) -> None:
+        """
+        Play the next filler clip after a delay.
+        
+        Args:
+            session: Call session
+            delay: Seconds to wait before playing
+        """
+        await asyncio.sleep(delay)
+        clip = self.filler_clips.next_clip()
+        if clip is None:
+            return
+        
+        self.metrics_collector.increment_counter("filler_audio_played_total")
+        logger.debug(
+            f"Playing filler audio for call {session.call_id}",
+            extra={"call_id": session.call_id, "deadline": delay}
+        )
+        await self._send_audio(session.call_id, clip)
+        # Ends the clip as its own response so playout does not count an underrun
+        await session.audio_output.drain()
+    
+    def _cancel_filler(self, session: CallSession) -> None:
+        """
+        Cancel the turn's pending filler clip and cut off one already playing.
+        
+        Called the moment real response audio is ready, and when the turn ends.
+        """
+        task = session.filler_task
+        if task is None:
+            return
+        session.filler_task = None
+        task.cancel()
+        # No response audio is queued yet, so anything buffered is filler
+        session.audio_output.clear()
     
     async def _generate_audio_response(self, call_id: str, response_text: str) -> None:
         """
@@ -547,20 +1589,12 @@ class CallOrchestrator:
             response_text: Text to convert to speech
         """
         try:
-            # Create voice and audio configurations
-            voice_config = VoiceConfig(
-                voice_id=self.settings.cartesia_voice_id,
-                speed=1.0,
-                language="en"
-            )
-            
-            audio_config = AudioConfig(
-                format=self.tts_client.AudioFormat.WAV,
-                sample_rate=self.settings.audio_sample_rate
-            )
+            # Create voice and audio configurations; raw PCM feeds the outbound frames directly
+            voice_config = self._create_voice_config()
+            audio_config = self._create_stream_audio_config()
             
             # Generate TTS audio
-            with timer("tts_processing_duration", {"call_id": call_id}):
+            with timer("tts_processing_duration"):
                 tts_start = time.time()
                 tts_response = await self.tts_client.synthesize_batch(
                     response_text,
@@ -570,11 +1604,11 @@ class CallOrchestrator:
                 tts_latency = time.time() - tts_start
             
             # Update metrics
-            self.call_metrics[call_id].tts_latency = tts_latency
-            self.call_metrics[call_id].bytes_sent += len(tts_response.audio_data)
+            session = self.sessions[call_id]
+            session.metrics.tts_latency = tts_latency
             
-            dialogue_manager = self.dialogue_managers[call_id]
-            dialogue_manager.update_service_latency('tts', tts_latency)
+            session.dialogue_manager.update_service_latency('tts', tts_latency)
+            self.admission_controller.record_latency('tts', tts_latency)
             
             logger.info(
                 f"Generated TTS response for call {call_id}",
@@ -586,12 +1620,19 @@ class CallOrchestrator:
                 }
             )
             
-            # TODO: Send audio to LiveKit (will be implemented in future tasks)
-            # For now, we just log that we would send the audio
-            logger.debug(
-                f"Would send {len(tts_response.audio_data)} bytes of audio to LiveKit for call {call_id}"
-            )
+            self._cancel_filler(session)
+            if session.trace is not None:
+                session.trace.mark(TurnStage.TTS_FIRST_BYTE)
+            playback = session.playback
+            if playback is not None:
+                playback.begin_sentence(response_text)
+                playback.audio_queued(session.audio_output.bytes_written)
             
+            await self._send_audio(call_id, tts_response.audio_data)
+            
+            if playback is not None:
+                playback.finish_sentence(session.audio_output.bytes_written)
+        
         except Exception as e:
             logger.error(
                 f"Error generating audio response for call {call_id}: {e}",
@@ -607,22 +1648,16 @@ class CallOrchestrator:
             call_id: Call identifier
         """
         try:
-            # Remove from active calls
-            self.active_calls.pop(call_id, None)
+            # Removing the session drops every piece of per-call state at once;
+            # close() stops any turn still running and releases audio buffers
+            session = self.sessions.pop(call_id, None)
+            if session is not None:
+                session.close()
+                if session.live_stt is not None:
+                    await session.live_stt.close()
             
-            # Clean up state machine
-            self.call_state_machines.pop(call_id, None)
-            
-            # Clean up dialogue manager
-            self.dialogue_managers.pop(call_id, None)
-            
-            # Clean up audio resources
-            self.audio_streams.pop(call_id, None)
-            self.audio_stream_states.pop(call_id, None)
-            self.audio_buffers.pop(call_id, None)
-            
-            # Clean up processing locks
-            self.processing_locks.pop(call_id, None)
+            # Free the admission slot (no-op for calls that were never admitted)
+            self.admission_controller.release(call_id)
             
             logger.debug(f"Cleaned up resources for call {call_id}")
             
@@ -692,10 +1727,12 @@ class CallOrchestrator:
             extra={"call_id": call_id, "error": str(error)}
         )
         
-        self.audio_stream_states[call_id] = AudioStreamState.ERROR
+        session = self.sessions.get(call_id)
+        if session is not None:
+            session.audio_state = AudioStreamState.ERROR
         self.metrics_collector.increment_counter(
             "audio_errors_total",
-            labels={"call_id": call_id, "error_type": type(error).__name__}
+            labels={"error_type": type(error).__name__}
         )
     
     async def _execute_call_start_handlers(self, call_context: CallContext) -> None:
@@ -747,7 +1784,9 @@ class CallOrchestrator:
                 "stt_client": await self.stt_client.health_check(),
                 "llm_client": await self.llm_client.health_check(),
                 "tts_client": await self.tts_client.health_check(),
-                "system": check_health()["status"] == "healthy"
+                "system": (
+                    await get_blocking_executor().run(check_health, task_name="system_health_check")
+                )["status"] == "healthy"
             }
             
             # Overall health
@@ -756,7 +1795,7 @@ class CallOrchestrator:
             
             # Additional details
             details = {
-                "active_calls": len(self.active_calls),
+                "active_calls": len(self.sessions),
                 "total_calls_handled": self.total_calls_handled,
                 "successful_calls": self.successful_calls,
                 "failed_calls": self.failed_calls,
@@ -764,7 +1803,8 @@ class CallOrchestrator:
                     self.successful_calls / max(1, self.total_calls_handled)
                 ),
                 "max_concurrent_calls": self.max_concurrent_calls,
-                "audio_buffer_size": self.audio_buffer_size
+                "audio_buffer_size": self.audio_buffer_size,
+                "admission": self.admission_controller.get_status()
             }
             
             return HealthStatus(
@@ -796,8 +1836,9 @@ class CallOrchestrator:
             Dictionary containing call metrics
         """
         if call_id:
-            if call_id in self.call_metrics:
-                return self.call_metrics[call_id].to_dict()
+            session = self.sessions.get(call_id)
+            if session is not None:
+                return session.metrics.to_dict()
             else:
                 return {}
         
@@ -806,13 +1847,13 @@ class CallOrchestrator:
             "total_calls": self.total_calls_handled,
             "successful_calls": self.successful_calls,
             "failed_calls": self.failed_calls,
-            "active_calls": len(self.active_calls),
+            "active_calls": len(self.sessions),
             "success_rate": (
                 self.successful_calls / max(1, self.total_calls_handled)
             ),
             "individual_calls": {
-                call_id: metrics.to_dict()
-                for call_id, metrics in self.call_metrics.items()
+                call_id: session.metrics.to_dict()
+                for call_id, session in self.sessions.items()
             }
         }
     
@@ -825,12 +1866,13 @@ class CallOrchestrator:
         """
         return [
             {
-                **call_context.to_dict(),
-                "state": self.call_state_machines[call_id].current_state.value,
-                "audio_state": self.audio_stream_states[call_id].value,
-                "metrics": self.call_metrics[call_id].to_dict()
+                **session.context.to_dict(),
+                "state": session.state_machine.current_state.value,
+                "audio_state": session.audio_state.value,
+                "metrics": session.metrics.to_dict(),
+                "audio_output": session.audio_output.stats.to_dict()
             }
-            for call_id, call_context in self.active_calls.items()
+            for session in self.sessions.values()
         ]
     
     async def close(self) -> None:
@@ -839,10 +1881,8 @@ class CallOrchestrator:
             logger.info("Closing CallOrchestrator")
             
             # End all active calls
-            active_call_ids = list(self.active_calls.keys())
-            for call_id in active_call_ids:
-                call_context = self.active_calls[call_id]
-                await self.handle_call_end(call_context)
+            for session in list(self.sessions.values()):
+                await self.handle_call_end(session.context)
             
             # Close client connections
             await self.stt_client.close()
@@ -2,8 +2,10 @@
 
 import hashlib
 import logging
+import mmap
 import re
 import secrets
+import struct
 from typing import Any, Dict, List, Optional, Set, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -36,6 +38,68 @@ class AudioValidationResult:
     error_message: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class PCMFormat:
+    """Declared format of headerless PCM audio."""
+    sample_rate: int
+    channels: int = 1
+    sample_width: int = 2
+    
+    @property
+    def block_align(self) -> int:
+        """Bytes per frame."""
+        return self.channels * self.sample_width
+    
+    @property
+    def bytes_per_second(self) -> int:
+        """Byte rate of the audio."""
+        return self.sample_rate * self.block_align
+
+
+# WAVE format tags whose data is fixed-size frames of samples
+_FRAME_FORMAT_TAGS = {
+    0x0001,  # PCM
+    0x0003,  # IEEE float
+    0x0006,  # A-law
+    0x0007,  # mu-law
+    0xFFFE,  # extensible
+}
+
+
+@dataclass
+class WavInfo:
+    """Format and data location declared by a WAVE header."""
+    format_tag: int
+    channels: int
+    sample_rate: int
+    byte_rate: int
+    block_align: int
+    bits_per_sample: int
+    data_offset: int
+    # None when the header leaves the length open, as streamed files do
+    data_size: Optional[int]
+    
+    @property
+    def is_pcm(self) -> bool:
+        """Whether the data is whole frames of samples rather than a compressed codec."""
+        return self.format_tag in _FRAME_FORMAT_TAGS
+    
+    def duration(self, available: int) -> float:
+        """
+        Seconds of audio in the data chunk.
+        
+        Args:
+            available: Bytes present after the data chunk header
+        
+        Returns:
+            Duration of the declared data, or of what is present if less
+        """
+        data_size = available if self.data_size is None else min(self.data_size, available)
+        # For sample formats the rate follows from the format, not the header's claim
+        byte_rate = self.sample_rate * self.block_align if self.is_pcm else self.byte_rate
+        return data_size / byte_rate if byte_rate else 0.0
+
+
 class SecurityConfig:
     """Security configuration constants."""
     
@@ -55,6 +119,10 @@ class SecurityConfig:
     MAX_AUDIO_SIZE_BYTES = 50 * 1024 * 1024  # 50MB
     MIN_AUDIO_SIZE_BYTES = 100  # 100 bytes
     MAX_AUDIO_DURATION_SECONDS = 300  # 5 minutes
+    MAX_AUDIO_HEADER_BYTES = 64 * 1024  # RIFF chunks before the audio data
+    MAX_AUDIO_CHANNELS = 8
+    MIN_SAMPLE_RATE = 4000
+    MAX_SAMPLE_RATE = 384000
     
     # Supported audio formats (magic bytes)
     AUDIO_MAGIC_BYTES = {
@@ -235,25 +303,118 @@ def validate_api_key(api_key: str, key_type: Optional[APIKeyType] = None) -> API
     )
 
 
-def validate_audio_data(audio_data: bytes, max_size: Optional[int] = None) -> AudioValidationResult:
+def parse_wav_header(view: memoryview) -> Optional[WavInfo]:
+    """
+    Walk the RIFF chunks of a WAVE file up to its data chunk.
+    
+    Chunks between fmt and data (LIST, fact, ...) are skipped, so headers
+    of any length are handled. Fields are read in place with struct, so
+    the buffer is never copied.
+    
+    Args:
+        view: Start of the file; may be only a prefix of it
+    
+    Returns:
+        WavInfo, or None if the data chunk header is not within view yet
+    
+    Raises:
+        ValueError: If the header is malformed or declares an invalid format
+    """
+    if len(view) < 12:
+        return None
+    if view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+    
+    fmt: Optional[tuple] = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = view[offset:offset + 4]
+        chunk_size = struct.unpack_from("<I", view, offset + 4)[0]
+        body = offset + 8
+        
+        if chunk_id == b"fmt ":
+            if chunk_size < 16:
+                raise ValueError("WAV fmt chunk is too short")
+            if body + 16 > len(view):
+                return None
+            fmt = struct.unpack_from("<HHIIHH", view, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV data chunk before fmt chunk")
+            format_tag, channels, sample_rate, byte_rate, block_align, bits_per_sample = fmt
+            info = WavInfo(
+                format_tag=format_tag,
+                channels=channels,
+                sample_rate=sample_rate,
+                byte_rate=byte_rate,
+                block_align=block_align,
+                bits_per_sample=bits_per_sample,
+                data_offset=body,
+                # 0 and 0xFFFFFFFF mark a file written before its length was known
+                data_size=None if chunk_size in (0, 0xFFFFFFFF) else chunk_size
+            )
+            _check_wav_format(info)
+            return info
+        
+        offset = body + chunk_size + (chunk_size & 1)
+    
+    return None
+
+
+def _check_wav_format(info: WavInfo) -> None:
+    """Reject formats no real recording declares."""
+    if not 1 <= info.channels <= SecurityConfig.MAX_AUDIO_CHANNELS:
+        raise ValueError(f"Invalid WAV channel count {info.channels}")
+    if not SecurityConfig.MIN_SAMPLE_RATE <= info.sample_rate <= SecurityConfig.MAX_SAMPLE_RATE:
+        raise ValueError(f"Invalid WAV sample rate {info.sample_rate}")
+    if info.is_pcm:
+        if info.bits_per_sample not in (8, 16, 24, 32, 64):
+            raise ValueError(f"Invalid WAV sample width of {info.bits_per_sample} bits")
+        if info.block_align != info.channels * info.bits_per_sample // 8:
+            raise ValueError("WAV block alignment does not match its channels and sample width")
+        if info.data_size is not None and info.data_size % info.block_align:
+            raise ValueError("WAV data is not a whole number of frames")
+    elif info.block_align == 0:
+        raise ValueError("WAV block alignment is zero")
+
+
+def _detect_format(view: memoryview) -> Optional[str]:
+    """Match the leading magic bytes against known containers."""
+    for magic_bytes, format_name in SecurityConfig.AUDIO_MAGIC_BYTES.items():
+        if view[:len(magic_bytes)] == magic_bytes:
+            return format_name
+    return None
+
+
+def validate_audio_data(
+    audio_data: Union[bytes, bytearray, memoryview, mmap.mmap],
+    max_size: Optional[int] = None,
+    pcm_format: Optional[PCMFormat] = None
+) -> AudioValidationResult:
     """
     Validate and sanitize audio data.
     
+    WAVE files are parsed chunk by chunk for their declared format, and raw
+    PCM is checked against pcm_format when given. The buffer is read
+    through a memoryview, so nothing is copied, including for memory-mapped
+    files.
+    
     Args:
-        audio_data: Audio data bytes to validate
+        audio_data: Audio data to validate, any bytes-like buffer
         max_size: Maximum allowed size in bytes
+        pcm_format: Declared format of headerless PCM data
         
     Returns:
         AudioValidationResult: Validation result
     """
-    if not audio_data:
+    file_size = len(audio_data)
+    if not file_size:
         return AudioValidationResult(
             is_valid=False,
             file_size=0,
             error_message="Audio data cannot be empty"
         )
     
-    file_size = len(audio_data)
     max_allowed_size = max_size or SecurityConfig.MAX_AUDIO_SIZE_BYTES
     
     # Check size limits
@@ -271,30 +432,32 @@ def validate_audio_data(audio_data: bytes, max_size: Optional[int] = None) -> Au
             error_message=f"Audio data too large (maximum {max_allowed_size} bytes)"
         )
     
-    # Detect audio format by magic bytes
-    detected_format = None
-    for magic_bytes, format_name in SecurityConfig.AUDIO_MAGIC_BYTES.items():
-        if audio_data.startswith(magic_bytes):
-            detected_format = format_name
-            break
-    
-    # Estimate duration for WAV files (simplified)
-    duration_estimate = None
-    if detected_format == 'wav' and len(audio_data) > 44:  # WAV header is 44 bytes
+    # Released before returning, so a memory-mapped file can be closed afterwards
+    with memoryview(audio_data) as view:
+        detected_format = _detect_format(view)
+        
+        duration_estimate = None
         try:
-            # Extract sample rate from WAV header (bytes 24-27)
-            sample_rate = int.from_bytes(audio_data[24:28], byteorder='little')
-            # Extract bits per sample (bytes 34-35)
-            bits_per_sample = int.from_bytes(audio_data[34:36], byteorder='little')
-            # Extract number of channels (bytes 22-23)
-            channels = int.from_bytes(audio_data[22:24], byteorder='little')
-            
-            if sample_rate > 0 and bits_per_sample > 0 and channels > 0:
-                bytes_per_second = sample_rate * (bits_per_sample // 8) * channels
-                audio_data_size = file_size - 44  # Subtract header size
-                duration_estimate = audio_data_size / bytes_per_second
-        except Exception:
-            pass  # Ignore errors in duration estimation
+            if detected_format == 'wav' and view[8:12] == b"WAVE":
+                info = parse_wav_header(view)
+                if info is None:
+                    raise ValueError("WAV file has no data chunk")
+                available = file_size - info.data_offset
+                if info.data_size is not None and info.data_size > available:
+                    raise ValueError("WAV data chunk is truncated")
+                duration_estimate = info.duration(available)
+            elif detected_format is None and pcm_format is not None:
+                if file_size % pcm_format.block_align:
+                    raise ValueError("PCM data is not a whole number of frames")
+                detected_format = 'pcm'
+                duration_estimate = file_size / pcm_format.bytes_per_second
+        except (ValueError, struct.error) as e:
+            return AudioValidationResult(
+                is_valid=False,
+                file_size=file_size,
+                detected_format=detected_format,
+                error_message=f"Invalid audio header: {e}"
+            )
     
     # Check duration limits
     if duration_estimate and duration_estimate > SecurityConfig.MAX_AUDIO_DURATION_SECONDS:
@@ -314,6 +477,127 @@ def validate_audio_data(audio_data: bytes, max_size: Optional[int] = None) -> Au
     )
 
 
+class StreamingAudioValidator:
+    """
+    Validate audio incrementally as chunks arrive.
+    
+    Applies the checks of validate_audio_data() without holding the audio:
+    only the container header is buffered, up to MAX_AUDIO_HEADER_BYTES,
+    and after that chunks are only counted. Size and duration limits fail
+    as soon as they are crossed, so an oversized upload can be cut off
+    early; checks that need the whole stream run in finish().
+    """
+    
+    def __init__(self, max_size: Optional[int] = None, pcm_format: Optional[PCMFormat] = None):
+        """
+        Initialize the validator.
+        
+        Args:
+            max_size: Maximum allowed size in bytes
+            pcm_format: Declared format of headerless PCM data
+        """
+        self.max_size = max_size or SecurityConfig.MAX_AUDIO_SIZE_BYTES
+        self.pcm_format = pcm_format
+        self.size = 0
+        self.detected_format: Optional[str] = None
+        self.wav_info: Optional[WavInfo] = None
+        self.error_message: Optional[str] = None
+        self._head = bytearray()
+        self._header_done = False
+    
+    @property
+    def duration_estimate(self) -> Optional[float]:
+        """Seconds of audio received so far, once the format is known."""
+        if self.wav_info is not None:
+            return self.wav_info.duration(max(0, self.size - self.wav_info.data_offset))
+        if self.detected_format == 'pcm':
+            return self.size / self.pcm_format.bytes_per_second
+        return None
+    
+    def feed(self, chunk: Union[bytes, bytearray, memoryview]) -> AudioValidationResult:
+        """
+        Account for the next chunk of audio.
+        
+        Args:
+            chunk: Next bytes of the stream
+        
+        Returns:
+            AudioValidationResult for the stream so far; once invalid it stays invalid
+        """
+        if self.error_message is None:
+            self.size += len(chunk)
+            if not self._header_done:
+                self._head += chunk
+                self._parse_head(final=False)
+            self._check_limits()
+        return self._result()
+    
+    def finish(self) -> AudioValidationResult:
+        """
+        Run the checks that need the complete stream.
+        
+        Returns:
+            AudioValidationResult for the whole stream
+        """
+        if self.error_message is None:
+            if not self._header_done:
+                self._parse_head(final=True)
+            if self.size == 0:
+                self.error_message = "Audio data cannot be empty"
+            elif self.size < SecurityConfig.MIN_AUDIO_SIZE_BYTES:
+                self.error_message = f"Audio data too small (minimum {SecurityConfig.MIN_AUDIO_SIZE_BYTES} bytes)"
+            elif self.wav_info is not None and self.wav_info.data_size is not None:
+                if self.wav_info.data_offset + self.wav_info.data_size > self.size:
+                    self.error_message = "Invalid audio header: WAV data chunk is truncated"
+            elif self.detected_format == 'pcm' and self.size % self.pcm_format.block_align:
+                self.error_message = "Invalid audio header: PCM data is not a whole number of frames"
+        return self._result()
+    
+    def _parse_head(self, final: bool) -> None:
+        """Detect the format and parse the WAV header once enough has arrived."""
+        with memoryview(self._head) as view:
+            if len(view) < 12 and not final:
+                return
+            self.detected_format = _detect_format(view)
+            try:
+                if self.detected_format == 'wav' and view[8:12] == b"WAVE":
+                    self.wav_info = parse_wav_header(view)
+                    if self.wav_info is None:
+                        if final:
+                            raise ValueError("WAV file has no data chunk")
+                        if len(view) > SecurityConfig.MAX_AUDIO_HEADER_BYTES:
+                            raise ValueError("WAV header is too long")
+                        return
+                elif self.detected_format is None and self.pcm_format is not None:
+                    self.detected_format = 'pcm'
+            except (ValueError, struct.error) as e:
+                self.error_message = f"Invalid audio header: {e}"
+        
+        self._header_done = True
+        self._head = bytearray()
+    
+    def _check_limits(self) -> None:
+        if self.error_message is not None:
+            return
+        if self.size > self.max_size:
+            self.error_message = f"Audio data too large (maximum {self.max_size} bytes)"
+            return
+        duration = self.duration_estimate
+        if duration and duration > SecurityConfig.MAX_AUDIO_DURATION_SECONDS:
+            self.error_message = (
+                f"Audio duration too long (maximum {SecurityConfig.MAX_AUDIO_DURATION_SECONDS} seconds)"
+            )
+    
+    def _result(self) -> AudioValidationResult:
+        return AudioValidationResult(
+            is_valid=self.error_message is None,
+            file_size=self.size,
+            detected_format=self.detected_format,
+            duration_estimate=self.duration_estimate,
+            error_message=self.error_message
+        )
+
+
 def mask_sensitive_data(data: str, mask_char: str = '*', visible_chars: int = 4) -> str:
     """
     Mask sensitive data for logging.
@@ -0,0 +1,103 @@
+"""
+Per-turn latency tracing.
+
+This module implements the TurnTrace class that records monotonic
+timestamps for each stage of a conversational turn, from the first audio of
+the caller's utterance to the first frame of the response reaching the
+caller. Completed traces are kept per call and their stage spans are
+aggregated into histograms so tail latency can be attributed to a stage.
+"""
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from src.metrics import MetricsCollector
+
+
+class TurnStage(str, Enum):
+    """Points in a turn at which a timestamp is recorded."""
+    AUDIO_IN = "audio_in"
+    ENDPOINT = "endpoint"
+    STT_FINAL = "stt_final"
+    LLM_FIRST_TOKEN = "llm_first_token"
+    LLM_DONE = "llm_done"
+    TTS_FIRST_BYTE = "tts_first_byte"
+    AUDIO_OUT_FIRST_FRAME = "audio_out_first_frame"
+
+
+# Spans aggregated per turn: name -> (start stage, end stage)
+TURN_SPANS: Dict[str, Tuple[TurnStage, TurnStage]] = {
+    "utterance": (TurnStage.AUDIO_IN, TurnStage.ENDPOINT),
+    "stt": (TurnStage.ENDPOINT, TurnStage.STT_FINAL),
+    "llm_first_token": (TurnStage.STT_FINAL, TurnStage.LLM_FIRST_TOKEN),
+    "llm_total": (TurnStage.STT_FINAL, TurnStage.LLM_DONE),
+    "tts_first_byte": (TurnStage.LLM_FIRST_TOKEN, TurnStage.TTS_FIRST_BYTE),
+    "playout_start": (TurnStage.TTS_FIRST_BYTE, TurnStage.AUDIO_OUT_FIRST_FRAME),
+    # What the caller experiences: end of their speech to first response audio
+    "response": (TurnStage.ENDPOINT, TurnStage.AUDIO_OUT_FIRST_FRAME)
+}
+
+
+@dataclass
+class TurnTrace:
+    """Stage timestamps of one conversational turn."""
+    call_id: str
+    turn_index: int
+    marks: Dict[TurnStage, float] = field(default_factory=dict)
+    
+    def mark(self, stage: TurnStage, timestamp: Optional[float] = None) -> None:
+        """
+        Record when a stage was reached; later marks of the same stage are ignored.
+        
+        Args:
+            stage: Stage reached
+            timestamp: time.monotonic() value, defaults to now
+        """
+        if stage not in self.marks:
+            self.marks[stage] = time.monotonic() if timestamp is None else timestamp
+    
+    def span(self, start: TurnStage, end: TurnStage) -> Optional[float]:
+        """
+        Get the time between two stages.
+        
+        Args:
+            start: Starting stage
+            end: Ending stage
+        
+        Returns:
+            Duration in seconds, or None if either stage was not reached
+        """
+        if start not in self.marks or end not in self.marks:
+            return None
+        return self.marks[end] - self.marks[start]
+    
+    def spans(self) -> Dict[str, float]:
+        """Durations of every TURN_SPANS entry whose stages were both reached."""
+        durations = {}
+        for name, (start, end) in TURN_SPANS.items():
+            duration = self.span(start, end)
+            if duration is not None:
+                durations[name] = duration
+        return durations
+    
+    def record(self, metrics_collector: MetricsCollector) -> None:
+        """
+        Aggregate the trace's spans into the turn_stage_latency histogram.
+        
+        Args:
+            metrics_collector: Collector receiving one observation per span
+        """
+        for name, duration in self.spans().items():
+            metrics_collector.record_histogram("turn_stage_latency", duration, labels={"stage": name})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization; offsets are relative to the first mark."""
+        origin = min(self.marks.values(), default=0.0)
+        return {
+            "call_id": self.call_id,
+            "turn_index": self.turn_index,
+            "marks": {stage.value: timestamp - origin for stage, timestamp in self.marks.items()},
+            "spans": self.spans()
+        }
@@ -0,0 +1,550 @@
+"""
+Multi-process worker pool for call orchestration.
+
+This module implements the OrchestratorWorkerPool class that shards calls by
+call_id across several worker processes, each running its own event loop
+and CallOrchestrator. The pool exposes the same call-handling interface as
+CallOrchestrator, so webhook and LiveKit handlers can use either.
+
+Workers talk to the parent over a socketpair with length-prefixed frames.
+Audio frames are sent as raw bytes with a small header; control events and
+queries are pickled.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import signal
+import socket
+import struct
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from src.orchestrator import CallContext, CallOrchestrator, HealthStatus
+
+
+logger = logging.getLogger(__name__)
+
+
+# Frame header: payload length (excluding header) and frame kind
+_FRAME_HEADER = struct.Struct("!IB")
+# Audio payload header: call_id length
+_AUDIO_HEADER = struct.Struct("!H")
+
+
+class FrameKind(IntEnum):
+    """Kinds of frames exchanged with worker processes."""
+    AUDIO = 1
+    CONTROL = 2
+    REPLY = 3
+
+
+def shard_for_call(call_id: str, num_workers: int) -> int:
+    """
+    Map a call to a worker index.
+    
+    CRC32 is stable across processes and restarts, unlike hash().
+    
+    Args:
+        call_id: Call identifier
+        num_workers: Number of workers in the pool
+    
+    Returns:
+        Worker index in [0, num_workers)
+    """
+    return zlib.crc32(call_id.encode("utf-8")) % num_workers
+
+
+def encode_audio_frame(call_id: str, audio_data: bytes) -> bytes:
+    """Build a complete AUDIO frame for a call."""
+    call_id_bytes = call_id.encode("utf-8")
+    payload_length = _AUDIO_HEADER.size + len(call_id_bytes) + len(audio_data)
+    return b"".join((
+        _FRAME_HEADER.pack(payload_length, FrameKind.AUDIO),
+        _AUDIO_HEADER.pack(len(call_id_bytes)),
+        call_id_bytes,
+        audio_data
+    ))
+
+
+def decode_audio_payload(payload: bytes) -> Tuple[str, memoryview]:
+    """Split an AUDIO frame payload into call_id and audio bytes."""
+    (call_id_length,) = _AUDIO_HEADER.unpack_from(payload)
+    start = _AUDIO_HEADER.size
+    call_id = payload[start:start + call_id_length].decode("utf-8")
+    return call_id, memoryview(payload)[start + call_id_length:]
+
+
+def encode_frame(kind: FrameKind, message: Any) -> bytes:
+    """Build a complete pickled CONTROL or REPLY frame."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return _FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[FrameKind, bytes]:
+    """
+    Read one frame from a stream.
+    
+    Raises:
+        asyncio.IncompleteReadError: If the peer closed the connection
+    """
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    payload_length, kind = _FRAME_HEADER.unpack(header)
+    payload = await reader.readexactly(payload_length)
+    return FrameKind(kind), payload
+
+
+def create_worker_orchestrator() -> CallOrchestrator:
+    """Create a CallOrchestrator with real service clients inside a worker."""
+    from src.clients.deepgram_stt import DeepgramSTTClient
+    from src.clients.openai_llm import OpenAILLMClient
+    from src.clients.cartesia_tts import CartesiaTTSClient
+    from src.config import get_settings
+    
+    return CallOrchestrator.from_settings(
+        get_settings(),
+        stt_client=DeepgramSTTClient(),
+        llm_client=OpenAILLMClient(),
+        tts_client=CartesiaTTSClient()
+    )
+
+
+class _WorkerRuntime:
+    """
+    Event loop side of a worker process.
+    
+    A call start that admission would queue runs as background work, since
+    it may wait up to the queue timeout for a slot that only a later
+    call_end frame can free. While a call has background work, its later
+    frames are queued behind it, so each call's frames are still handled in
+    order without stalling audio for the worker's other calls.
+    """
+    
+    def __init__(
+        self,
+        worker_id: int,
+        sock: socket.socket,
+        orchestrator_factory: Callable[[], CallOrchestrator]
+    ):
+        self.worker_id = worker_id
+        self.sock = sock
+        self.orchestrator_factory = orchestrator_factory
+        self.orchestrator: Optional[CallOrchestrator] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        # Events waiting behind a call's queued start
+        self._call_events: Dict[str, Deque[Tuple[str, Any]]] = {}
+        self._call_tasks: Set[asyncio.Task] = set()
+    
+    async def run(self) -> None:
+        """Serve frames from the parent until told to stop or the socket closes."""
+        reader, self.writer = await asyncio.open_connection(sock=self.sock)
+        self.orchestrator = self.orchestrator_factory()
+        await self.orchestrator.start()
+        
+        logger.info(
+            f"Orchestrator worker {self.worker_id} started",
+            extra={"worker_id": self.worker_id}
+        )
+        
+        try:
+            while True:
+                try:
+                    kind, payload = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                
+                if kind == FrameKind.AUDIO:
+                    call_id, audio_data = decode_audio_payload(payload)
+                    events = self._call_events.get(call_id)
+                    if events is not None:
+                        events.append(("audio", audio_data))
+                    else:
+                        await self.orchestrator.handle_audio_received(call_id, audio_data)
+                    continue
+                
+                message = pickle.loads(payload)
+                if message[0] == "stop":
+                    break
+                await self._handle_control(message)
+        finally:
+            for task in self._call_tasks:
+                task.cancel()
+            if self._call_tasks:
+                await asyncio.wait(self._call_tasks)
+            await self.orchestrator.close()
+            self.writer.close()
+            logger.info(
+                f"Orchestrator worker {self.worker_id} stopped",
+                extra={"worker_id": self.worker_id}
+            )
+    
+    async def _handle_control(self, message: Tuple) -> None:
+        """Dispatch a control event or answer a query."""
+        op = message[0]
+        
+        if op in ("call_start", "call_end"):
+            call_id = message[1].call_id
+            if call_id in self._call_events or (
+                op == "call_start" and self.orchestrator.admission_controller.would_queue()
+            ):
+                self._dispatch_call_event(call_id, op, message[1])
+            elif op == "call_start":
+                await self.orchestrator.handle_call_start(message[1])
+            else:
+                await self.orchestrator.handle_call_end(message[1])
+            return
+        
+        request_id = message[1]
+        try:
+            if op == "call_metrics":
+                result = self.orchestrator.get_call_metrics(message[2])
+            elif op == "active_calls":
+                result = self.orchestrator.get_active_calls()
+            elif op == "health":
+                result = await self.orchestrator.get_health_status()
+            else:
+                raise ValueError(f"Unknown worker operation: {op}")
+            reply = (request_id, True, result)
+        except Exception as e:
+            reply = (request_id, False, f"{type(e).__name__}: {e}")
+        
+        self.writer.write(encode_frame(FrameKind.REPLY, reply))
+        await self.writer.drain()
+    
+    def _dispatch_call_event(self, call_id: str, op: str, argument: Any) -> None:
+        """Queue an event behind the call's background work, or start that work."""
+        events = self._call_events.get(call_id)
+        if events is not None:
+            events.append((op, argument))
+            return
+        
+        events = deque([(op, argument)])
+        self._call_events[call_id] = events
+        task = asyncio.create_task(self._run_call_events(call_id, events))
+        self._call_tasks.add(task)
+        task.add_done_callback(self._call_tasks.discard)
+    
+    async def _run_call_events(self, call_id: str, events: Deque[Tuple[str, Any]]) -> None:
+        """Handle a call's queued events in order until none are left."""
+        try:
+            while events:
+                op, argument = events.popleft()
+                try:
+                    if op == "call_start":
+                        await self.orchestrator.handle_call_start(argument)
+                    elif op == "call_end":
+                        await self.orchestrator.handle_call_end(argument)
+                    else:
+                        await self.orchestrator.handle_audio_received(call_id, argument)
+                except Exception as e:
+                    logger.error(
+                        f"Worker {self.worker_id} failed to handle {op} for call {call_id}: {e}",
+                        extra={"worker_id": self.worker_id, "call_id": call_id, "operation": op}
+                    )
+        finally:
+            del self._call_events[call_id]
+
+
+def _worker_main(
+    worker_id: int,
+    sock: socket.socket,
+    orchestrator_factory: Callable[[], CallOrchestrator]
+) -> None:
+    """Process entry point for an orchestrator worker."""
+    # The parent coordinates shutdown; do not die on the terminal's Ctrl+C
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    try:
+        from src.config import get_settings
+        from src.logging_config import setup_logging
+        setup_logging(get_settings())
+    except Exception as e:
+        logging.basicConfig(level=logging.INFO)
+        logger.warning(f"Worker {worker_id} using basic logging: {e}")
+    
+    asyncio.run(_WorkerRuntime(worker_id, sock, orchestrator_factory).run())
+
+
+@dataclass
+class WorkerHandle:
+    """Parent-side handle for a worker process."""
+    worker_id: int
+    process: multiprocessing.process.BaseProcess
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    pending: Dict[int, asyncio.Future] = field(default_factory=dict)
+    reader_task: Optional[asyncio.Task] = None
+    
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker process and its channel are up."""
+        return self.process.is_alive() and not self.writer.is_closing()
+
+
+class OrchestratorWorkerPool:
+    """
+    Shard calls across CallOrchestrator worker processes.
+    
+    Every event for a call (start, audio, end) is routed to the same worker,
+    chosen by CRC32 of the call_id, and frames to a worker are processed in
+    order. Each worker enforces its own max_concurrent_calls, so the pool's
+    capacity is num_workers times the per-worker limit.
+    
+    Unlike CallOrchestrator, get_call_metrics() and get_active_calls() are
+    coroutines because they query every worker.
+    """
+    
+    def __init__(
+        self,
+        num_workers: int,
+        orchestrator_factory: Callable[[], CallOrchestrator] = create_worker_orchestrator,
+        request_timeout: float = 5.0,
+        shutdown_timeout: float = 10.0
+    ):
+        """
+        Initialize the worker pool.
+        
+        Args:
+            num_workers: Number of worker processes
+            orchestrator_factory: Picklable callable that builds the orchestrator
+                inside each worker
+            request_timeout: Timeout in seconds for queries to a worker
+            shutdown_timeout: Time in seconds to wait for workers to exit
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        
+        self.num_workers = num_workers
+        self.orchestrator_factory = orchestrator_factory
+        self.request_timeout = request_timeout
+        self.shutdown_timeout = shutdown_timeout
+        
+        self.workers: List[WorkerHandle] = []
+        self._next_request_id = 0
+        self._context = multiprocessing.get_context("spawn")
+    
+    async def start(self) -> None:
+        """Start all worker processes."""
+        for worker_id in range(self.num_workers):
+            parent_sock, child_sock = socket.socketpair()
+            process = self._context.Process(
+                target=_worker_main,
+                args=(worker_id, child_sock, self.orchestrator_factory),
+                name=f"orchestrator-worker-{worker_id}",
+                daemon=True
+            )
+            process.start()
+            child_sock.close()
+            
+            reader, writer = await asyncio.open_connection(sock=parent_sock)
+            worker = WorkerHandle(worker_id, process, reader, writer)
+            worker.reader_task = asyncio.create_task(self._read_replies(worker))
+            self.workers.append(worker)
+        
+        logger.info(
+            f"Started {self.num_workers} orchestrator workers",
+            extra={"num_workers": self.num_workers}
+        )
+    
+    def worker_for_call(self, call_id: str) -> WorkerHandle:
+        """Return the worker that owns a call."""
+        return self.workers[shard_for_call(call_id, self.num_workers)]
+    
+    async def handle_call_start(self, call_context: CallContext) -> None:
+        """Route a call start event to the owning worker."""
+        await self._send(
+            self.worker_for_call(call_context.call_id),
+            encode_frame(FrameKind.CONTROL, ("call_start", call_context))
+        )
+    
+    async def handle_audio_received(self, call_id: str, audio_data: bytes) -> None:
+        """Forward inbound audio for a call to the owning worker."""
+        await self._send(self.worker_for_call(call_id), encode_audio_frame(call_id, audio_data))
+    
+    async def handle_call_end(self, call_context: CallContext) -> None:
+        """Route a call end event to the owning worker."""
+        await self._send(
+            self.worker_for_call(call_context.call_id),
+            encode_frame(FrameKind.CONTROL, ("call_end", call_context))
+        )
+    
+    async def get_call_metrics(self, call_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get call metrics aggregated across workers.
+        
+        Args:
+            call_id: Specific call ID, or None for all calls
+        
+        Returns:
+            Dictionary containing call metrics
+        """
+        if call_id:
+            return await self._request(self.worker_for_call(call_id), "call_metrics", call_id)
+        
+        results = await self._request_all("call_metrics", None)
+        totals = {"total_calls": 0, "successful_calls": 0, "failed_calls": 0, "active_calls": 0}
+        individual_calls: Dict[str, Any] = {}
+        for result in results.values():
+            for key in totals:
+                totals[key] += result.get(key, 0)
+            individual_calls.update(result.get("individual_calls", {}))
+        
+        return {
+            **totals,
+            "success_rate": totals["successful_calls"] / max(1, totals["total_calls"]),
+            "individual_calls": individual_calls,
+            "workers": len(results)
+        }
+    
+    async def get_active_calls(self) -> List[Dict[str, Any]]:
+        """
+        Get information about active calls on all workers.
+        
+        Returns:
+            List of active call information, tagged with worker_id
+        """
+        results = await self._request_all("active_calls")
+        return [
+            {**call, "worker_id": worker_id}
+            for worker_id, calls in sorted(results.items())
+            for call in calls
+        ]
+    
+    async def get_health_status(self) -> HealthStatus:
+        """
+        Get pool health; healthy only if every worker is up and healthy.
+        
+        Returns:
+            HealthStatus with one component per worker
+        """
+        results = await self._request_all("health")
+        components = {
+            f"worker_{worker.worker_id}": (
+                worker.worker_id in results and results[worker.worker_id].is_healthy
+            )
+            for worker in self.workers
+        }
+        is_healthy = bool(components) and all(components.values())
+        
+        return HealthStatus(
+            is_healthy=is_healthy,
+            status="healthy" if is_healthy else "unhealthy",
+            components=components,
+            last_check=datetime.now(UTC),
+            details={
+                "num_workers": self.num_workers,
+                "alive_workers": sum(1 for worker in self.workers if worker.is_alive),
+                "active_calls": sum(
+                    status.details.get("active_calls", 0) for status in results.values()
+                ),
+                "workers": {
+                    worker_id: status.to_dict() for worker_id, status in results.items()
+                }
+            }
+        )
+    
+    async def shutdown(self) -> None:
+        """Stop all workers, ending their active calls."""
+        loop = asyncio.get_running_loop()
+        
+        for worker in self.workers:
+            if worker.is_alive:
+                try:
+                    await self._send(worker, encode_frame(FrameKind.CONTROL, ("stop",)))
+                except Exception as e:
+                    logger.warning(f"Failed to signal worker {worker.worker_id} to stop: {e}")
+        
+        for worker in self.workers:
+            await loop.run_in_executor(None, worker.process.join, self.shutdown_timeout)
+            if worker.process.is_alive():
+                logger.warning(f"Terminating unresponsive worker {worker.worker_id}")
+                worker.process.terminate()
+            
+            if worker.reader_task:
+                worker.reader_task.cancel()
+                try:
+                    await worker.reader_task
+                except asyncio.CancelledError:
+                    pass
+            worker.writer.close()
+        
+        self.workers.clear()
+        logger.info("Orchestrator worker pool stopped")
+    
+    async def close(self) -> None:
+        """Close the pool (alias of shutdown for CallOrchestrator parity)."""
+        await self.shutdown()
+    
+    async def _send(self, worker: WorkerHandle, frame: bytes) -> None:
+        """Write a frame to a worker, waiting if its socket buffer is full."""
+        if not worker.is_alive:
+            raise ConnectionError(f"Orchestrator worker {worker.worker_id} is not running")
+        worker.writer.write(frame)
+        await worker.writer.drain()
+    
+    async def _request(self, worker: WorkerHandle, op: str, *args: Any) -> Any:
+        """Send a query to a worker and wait for its reply."""
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        future = asyncio.get_running_loop().create_future()
+        worker.pending[request_id] = future
+        
+        try:
+            await self._send(worker, encode_frame(FrameKind.CONTROL, (op, request_id, *args)))
+            return await asyncio.wait_for(future, self.request_timeout)
+        finally:
+            worker.pending.pop(request_id, None)
+    
+    async def _request_all(self, op: str, *args: Any) -> Dict[int, Any]:
+        """Query every worker concurrently; unreachable workers are omitted."""
+        # Snapshot so close() clearing the list cannot misalign the replies
+        workers = list(self.workers)
+        results = await asyncio.gather(
+            *(self._request(worker, op, *args) for worker in workers),
+            return_exceptions=True
+        )
+        
+        replies: Dict[int, Any] = {}
+        for worker, result in zip(workers, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Worker {worker.worker_id} did not answer {op}: {result}",
+                    extra={"worker_id": worker.worker_id, "operation": op}
+                )
+                continue
+            replies[worker.worker_id] = result
+        return replies
+    
+    async def _read_replies(self, worker: WorkerHandle) -> None:
+        """Resolve pending queries from a worker's reply frames."""
+        try:
+            while True:
+                kind, payload = await read_frame(worker.reader)
+                if kind != FrameKind.REPLY:
+                    continue
+                
+                request_id, ok, result = pickle.loads(payload)
+                future = worker.pending.get(request_id)
+                if future is None or future.done():
+                    continue
+                if ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(RuntimeError(result))
+        except asyncio.IncompleteReadError:
+            logger.error(
+                f"Orchestrator worker {worker.worker_id} closed its channel",
+                extra={"worker_id": worker.worker_id}
+            )
+        finally:
+            worker.writer.close()
+            for future in worker.pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError(f"Orchestrator worker {worker.worker_id} exited")
+                    )
@@ -0,0 +1,189 @@
+"""Tests for adaptive admission control."""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.admission import (
+    AdmissionController,
+    AdmissionConfig,
+    RejectionReason,
+    LatencyWindow
+)
+
+
+def make_client(state: str = "closed") -> MagicMock:
+    """Create a client stub reporting a circuit breaker state."""
+    client = MagicMock()
+    client.get_health_status.return_value = {"circuit_breaker_state": state}
+    return client
+
+
+@pytest.fixture
+def config():
+    """Admission config with small sample requirements."""
+    return AdmissionConfig(min_samples=5, adjust_interval=3600)
+
+
+class TestLatencyWindow:
+    """Test rolling latency percentiles."""
+    
+    def test_percentile(self):
+        """Nearest-rank percentiles over the retained window."""
+        window = LatencyWindow(100)
+        for i in range(1, 101):
+            window.add(i / 100)
+        
+        assert window.percentile(95) == pytest.approx(0.95)
+        assert window.percentile(50) == pytest.approx(0.50)
+    
+    def test_window_is_bounded(self):
+        """Old samples fall out of the window."""
+        window = LatencyWindow(3)
+        for latency in [10.0, 0.1, 0.2, 0.3]:
+            window.add(latency)
+        
+        assert len(window) == 3
+        assert window.percentile(100) == pytest.approx(0.3)
+        assert LatencyWindow(3).percentile(95) is None
+
+
+class TestAdmissionController:
+    """Test AdmissionController decisions."""
+    
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit(self, config):
+        """Calls beyond the configured maximum are rejected as at capacity."""
+        controller = AdmissionController(2, config)
+        
+        assert (await controller.acquire("a")).admitted
+        assert (await controller.acquire("b")).admitted
+        decision = await controller.acquire("c")
+        
+        assert not decision.admitted
+        assert decision.reason == RejectionReason.AT_CAPACITY
+        
+        controller.release("a")
+        assert (await controller.acquire("c")).admitted
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_new_calls(self, config):
+        """An open provider circuit breaker sheds all new calls."""
+        controller = AdmissionController(5, config, clients={"llm": make_client("open")})
+        
+        decision = await controller.acquire("a")
+        
+        assert not decision.admitted
+        assert decision.reason == RejectionReason.PROVIDER_UNAVAILABLE
+        assert controller.rejections[RejectionReason.PROVIDER_UNAVAILABLE.value] == 1
+    
+    @pytest.mark.asyncio
+    async def test_slow_provider_lowers_limit(self, config):
+        """p95 over target cuts the limit; rejections then cite the SLA."""
+        controller = AdmissionController(8, config)
+        for _ in range(10):
+            controller.record_latency("llm", config.llm_p95_target * 2)
+        
+        assert controller.adjust_limit() == 6
+        assert controller.adjust_limit() == 4
+        
+        for i in range(4):
+            assert (await controller.acquire(f"call_{i}")).admitted
+        decision = await controller.acquire("call_4")
+        assert decision.reason == RejectionReason.LATENCY_SLA
+    
+    def test_limit_recovers_and_respects_bounds(self, config):
+        """Healthy latency raises the limit back to max; it never drops below min."""
+        config.min_limit = 2
+        controller = AdmissionController(4, config)
+        for _ in range(10):
+            controller.record_latency("tts", config.tts_p95_target * 3)
+        for _ in range(5):
+            controller.adjust_limit()
+        assert controller.limit == 2
+        
+        for _ in range(200):
+            controller.record_latency("tts", config.tts_p95_target * 0.1)
+        for _ in range(5):
+            controller.adjust_limit()
+        assert controller.limit == 4
+    
+    def test_half_open_circuit_counts_as_overload(self, config):
+        """A half-open breaker reduces the limit."""
+        controller = AdmissionController(4, config, clients={"stt": make_client("half_open")})
+        
+        assert controller.adjust_limit() == 3
+    
+    @pytest.mark.asyncio
+    async def test_queued_call_admitted_on_release(self):
+        """With queueing enabled, a waiting call gets the next free slot."""
+        controller = AdmissionController(1, AdmissionConfig(queue_size=1, queue_timeout=5.0))
+        assert (await controller.acquire("a")).admitted
+        
+        waiter = asyncio.create_task(controller.acquire("b"))
+        await asyncio.sleep(0)
+        assert (await controller.acquire("c")).reason == RejectionReason.QUEUE_FULL
+        
+        controller.release("a")
+        decision = await waiter
+        
+        assert decision.admitted
+        assert controller.active == 1
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_after_admission_releases_slot(self):
+        """A waiter cancelled after being granted a slot gives the slot back."""
+        controller = AdmissionController(1, AdmissionConfig(queue_size=1, queue_timeout=5.0))
+        await controller.acquire("a")
+        
+        async def cancelled_after_grant(future, timeout):
+            # As on Python 3.12+, where a cancellation landing after the
+            # future resolved is raised rather than swallowed
+            await future
+            raise asyncio.CancelledError
+        
+        with patch.object(asyncio, "wait_for", cancelled_after_grant):
+            waiter = asyncio.create_task(controller.acquire("b"))
+            await asyncio.sleep(0)
+            controller.release("a")
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        
+        assert controller.active == 0
+        assert (await controller.acquire("c")).admitted
+    
+    @pytest.mark.asyncio
+    async def test_would_queue(self):
+        """would_queue() is true only when acquire() would wait for a slot."""
+        controller = AdmissionController(1, AdmissionConfig(queue_size=1, queue_timeout=5.0))
+        assert not controller.would_queue()
+        await controller.acquire("a")
+        assert controller.would_queue()
+        
+        waiter = asyncio.create_task(controller.acquire("b"))
+        await asyncio.sleep(0)
+        # The queue is full, so the next call is rejected at once
+        assert not controller.would_queue()
+        
+        controller.release("a")
+        await waiter
+        assert not AdmissionController(1).would_queue()
+    
+    @pytest.mark.asyncio
+    async def test_queued_call_times_out(self):
+        """Queued calls are rejected after the queue timeout."""
+        controller = AdmissionController(1, AdmissionConfig(queue_size=2, queue_timeout=0.01))
+        await controller.acquire("a")
+        
+        decision = await controller.acquire("b")
+        
+        assert not decision.admitted
+        assert decision.reason == RejectionReason.QUEUE_TIMEOUT
+        assert controller.get_status()["queued"] == 0
+    
+    def test_from_latency_budget(self):
+        """The response budget is split across the three providers."""
+        config = AdmissionConfig.from_latency_budget(2.0, queue_size=3)
+        
+        assert config.stt_p95_target + config.llm_p95_target + config.tts_p95_target == pytest.approx(2.0)
+        assert config.queue_size == 3
@@ -0,0 +1,3 @@
+"""
+Tests for audio processing components.
+"""
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""Tests for audio format conversion."""
+
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from src.audio.codec import (
+    AudioFormatSpec,
+    AudioTranscoder,
+    Codec,
+    decode_samples,
+    encode_samples,
+    resample,
+    unwrap_wav,
+    wrap_wav
+)
+
+
+def tone(sample_rate, duration=0.1, frequency=440.0, amplitude=8000):
+    """PCM16 sine tone."""
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    return (np.sin(2 * np.pi * frequency * t) * amplitude).astype(np.int16)
+
+
+class TestG711:
+    """Test μ-law and A-law conversion."""
+    
+    @pytest.mark.parametrize("codec", [Codec.MULAW, Codec.ALAW])
+    def test_round_trip_error_is_bounded(self, codec):
+        """Companding keeps the error within a few percent of the signal."""
+        samples = tone(8000)
+        
+        decoded = decode_samples(encode_samples(samples, codec), codec)
+        
+        error = np.abs(decoded.astype(np.int32) - samples)
+        assert error.max() <= np.abs(samples).max() * 0.04
+    
+    @pytest.mark.parametrize("codec,silence", [(Codec.MULAW, 0xFF), (Codec.ALAW, 0xD5)])
+    def test_known_silence_codes(self, codec, silence):
+        """Digital silence encodes to the standard idle code."""
+        assert encode_samples(np.zeros(4, dtype=np.int16), codec) == bytes([silence]) * 4
+    
+    def test_extremes_do_not_wrap(self):
+        """Full-scale samples keep their sign."""
+        samples = np.array([-32768, 32767], dtype=np.int16)
+        
+        decoded = decode_samples(encode_samples(samples, Codec.MULAW), Codec.MULAW)
+        
+        assert decoded[0] < -30000 and decoded[1] > 30000
+
+
+class TestResample:
+    """Test PCM16 resampling."""
+    
+    @pytest.mark.parametrize("source,target", [(8000, 16000), (16000, 8000), (24000, 48000), (48000, 16000)])
+    def test_length_and_frequency_preserved(self, source, target):
+        """Output length scales with the rate and the tone stays at 440 Hz."""
+        resampled = resample(tone(source), source, target)
+        
+        assert len(resampled) == int(target * 0.1)
+        spectrum = np.abs(np.fft.rfft(resampled))
+        peak_hz = np.argmax(spectrum) * target / len(resampled)
+        assert abs(peak_hz - 440) <= 10
+
+
+class TestWav:
+    """Test WAV framing."""
+    
+    def test_wrap_is_readable_by_wave_module(self):
+        """The header describes the payload correctly."""
+        samples = tone(16000)
+        
+        data = wrap_wav(samples.tobytes(), AudioFormatSpec(sample_rate=16000))
+        
+        with wave.open(io.BytesIO(data)) as reader:
+            assert reader.getframerate() == 16000
+            assert reader.getsampwidth() == 2
+            assert reader.getnframes() == len(samples)
+    
+    def test_unwrap_returns_payload_and_format(self):
+        """Unwrapping a wrapped payload is lossless."""
+        spec = AudioFormatSpec(codec=Codec.MULAW, sample_rate=8000)
+        
+        payload, parsed = unwrap_wav(wrap_wav(b"\x01\x02\x03", spec))
+        
+        assert bytes(payload) == b"\x01\x02\x03"
+        assert parsed == spec
+    
+    def test_unwrap_rejects_non_wav(self):
+        """Data without a RIFF header is rejected."""
+        with pytest.raises(ValueError):
+            unwrap_wav(b"not a wav file")
+
+
+class TestAudioTranscoder:
+    """Test AudioTranscoder chaining."""
+    
+    def test_passthrough_returns_input(self):
+        """Identical formats skip conversion."""
+        transcoder = AudioTranscoder(AudioFormatSpec(), AudioFormatSpec())
+        data = b"\x00\x01" * 10
+        
+        assert transcoder.convert(data) is data
+    
+    def test_mulaw_8k_to_pcm_16k(self):
+        """20 ms of μ-law at 8 kHz becomes 20 ms of PCM16 at 16 kHz."""
+        transcoder = AudioTranscoder(
+            AudioFormatSpec(codec=Codec.MULAW, sample_rate=8000),
+            AudioFormatSpec(sample_rate=16000)
+        )
+        
+        chunks = [transcoder.convert(bytes(160)) for _ in range(3)]
+        
+        # Only the first chunk holds samples back, for the filter's look-ahead
+        assert len(chunks[0]) < 640
+        assert [len(chunk) for chunk in chunks[1:]] == [640, 640]
+        assert len(chunks[0]) + len(transcoder.flush()) == 640
+    
+    @pytest.mark.parametrize("source,target", [(16000, 8000), (8000, 16000), (24000, 16000)])
+    def test_chunked_output_matches_whole_buffer(self, source, target):
+        """Resampling 20 ms chunks gives the same audio as resampling the whole signal."""
+        signal = tone(source, duration=0.5, amplitude=10000)
+        transcoder = AudioTranscoder(AudioFormatSpec(sample_rate=source), AudioFormatSpec(sample_rate=target))
+        frame = source // 50
+        
+        chunks = [transcoder.convert(signal[i:i + frame].tobytes()) for i in range(0, len(signal), frame)]
+        chunked = np.frombuffer(b"".join(chunks) + transcoder.flush(), dtype=np.int16)
+        whole = resample(signal, source, target)
+        
+        assert len(chunked) == len(whole)
+        assert np.abs(chunked.astype(np.int32) - whole).max() <= 1
+    
+    def test_unaligned_pcm_is_carried_over(self):
+        """A split PCM16 sample is completed by the next chunk."""
+        transcoder = AudioTranscoder(AudioFormatSpec(sample_rate=16000), AudioFormatSpec(codec=Codec.ALAW, sample_rate=16000))
+        
+        first = transcoder.convert(b"\x00\x00\x00")
+        second = transcoder.convert(b"\x00")
+        
+        assert len(first) == 1 and len(second) == 1
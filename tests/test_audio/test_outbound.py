@@ -0,0 +1,198 @@
+"""Tests for paced outbound audio delivery."""
+
+import asyncio
+
+import pytest
+
+from src.audio.outbound import FramePacketizer, OutboundAudioConfig, OutboundAudioStream
+
+
+def make_config(**overrides):
+    """8 kHz, 10 ms frames (160 bytes) keep the paced tests fast."""
+    values = {"sample_rate": 8000, "frame_ms": 10, "jitter_buffer_ms": 20, "max_buffer_ms": 100}
+    values.update(overrides)
+    return OutboundAudioConfig(**values)
+
+
+class RecordingSink:
+    """Collects published frames with their publish times."""
+    
+    def __init__(self):
+        self.frames = []
+        self.times = []
+    
+    async def __call__(self, frame):
+        self.frames.append(frame)
+        self.times.append(asyncio.get_running_loop().time())
+
+
+class TestFramePacketizer:
+    """Test FramePacketizer behaviour."""
+    
+    def test_feed_returns_complete_frames(self):
+        """Chunks of any size are cut into fixed frames with the remainder kept."""
+        packetizer = FramePacketizer(4)
+        
+        assert packetizer.feed(b"abc") == []
+        assert packetizer.feed(b"defghij") == [b"abcd", b"efgh"]
+        assert len(packetizer) == 2
+    
+    def test_flush_pads_with_silence(self):
+        """The final partial frame is padded to full size."""
+        packetizer = FramePacketizer(4)
+        packetizer.feed(b"ab")
+        
+        assert packetizer.flush() == b"ab\x00\x00"
+        assert packetizer.flush() is None
+
+
+class TestOutboundAudioConfig:
+    """Test OutboundAudioConfig derived sizes."""
+    
+    def test_default_frame_size(self):
+        """20 ms of 16 kHz mono PCM16 is 640 bytes."""
+        config = OutboundAudioConfig()
+        
+        assert config.frame_bytes == 640
+        assert config.prebuffer_frames == 3
+        assert config.max_frames == 100
+
+
+class TestOutboundAudioStream:
+    """Test OutboundAudioStream pacing and buffer accounting."""
+    
+    @pytest.mark.asyncio
+    async def test_frames_are_paced_in_real_time(self):
+        """Each frame is published roughly one frame duration after the last."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(bytes(160 * 5))
+        await stream.drain()
+        
+        assert len(sink.frames) == 5
+        assert all(len(frame) == 160 for frame in sink.frames)
+        assert sink.times[-1] - sink.times[0] >= 0.035
+        assert stream.stats.frames_sent == 5
+        assert stream.stats.underruns == 0
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_drain_flushes_partial_frame(self):
+        """A short response shorter than the jitter buffer is still played."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(b"\x01\x02" * 10)
+        await stream.drain()
+        
+        assert sink.frames == [b"\x01\x02" * 10 + bytes(140)]
+        assert stream.stats.first_frame_latency >= 0
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_first_frame_clock_spans_whole_response(self):
+        """Later writes of the same response do not restart the first-frame clock."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(bytes(160 * 3))
+        await asyncio.sleep(0.03)
+        first_frame_at = stream.stats.first_frame_at
+        await stream.write(bytes(160 * 3))
+        await stream.drain()
+        
+        assert first_frame_at is not None
+        assert stream.stats.first_frame_at == first_frame_at
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_underrun_when_audio_arrives_late(self):
+        """Running dry mid-response counts an underrun and rebuffers."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(bytes(160 * 2))
+        await asyncio.sleep(0.06)
+        await stream.write(bytes(160 * 2))
+        await stream.drain()
+        
+        assert stream.stats.underruns == 1
+        assert len(sink.frames) == 4
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_overrun_applies_backpressure(self):
+        """Writing more than max_buffer_ms holds the writer instead of dropping."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config(max_buffer_ms=40))
+        
+        await stream.write(bytes(160 * 8))
+        
+        assert stream.stats.overruns >= 1
+        assert stream.queued_frames <= 4
+        await stream.drain()
+        assert len(sink.frames) == 8
+        assert stream.stats.frames_dropped == 0
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_clear_drops_unplayed_audio(self):
+        """Clearing stops playout of queued frames without an underrun."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(bytes(160 * 10))
+        await asyncio.sleep(0.015)
+        dropped = stream.clear()
+        await asyncio.sleep(0.03)
+        
+        assert dropped > 0
+        assert len(sink.frames) + dropped == 10
+        assert stream.stats.underruns == 0
+        assert stream.queued_frames == 0
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_response_after_clear_is_buffered_and_played(self):
+        """A response written right after a clear is prebuffered and played to the end."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(bytes(160 * 10))
+        await asyncio.sleep(0.015)
+        stream.clear()
+        played_before = len(sink.frames)
+        
+        # Less than the jitter buffer: playout waits for more audio
+        await stream.write(b"\x01" * 160)
+        await asyncio.sleep(0.03)
+        assert len(sink.frames) == played_before
+        assert stream.queued_frames == 1
+        
+        await stream.write(b"\x01" * 160 * 2)
+        await stream.drain()
+        
+        assert sink.frames[played_before:] == [b"\x01" * 160] * 3
+        assert stream.stats.underruns == 0
+        stream.close()
+    
+    @pytest.mark.asyncio
+    async def test_written_and_played_offsets(self):
+        """Offsets count queued audio up front and played audio as frames go out."""
+        sink = RecordingSink()
+        stream = OutboundAudioStream(sink, make_config())
+        
+        await stream.write(bytes(160 * 10 + 40))
+        assert stream.bytes_written == 160 * 10 + 40
+        assert stream.bytes_played < stream.bytes_written
+        
+        await stream.drain()
+        # The final partial frame is padded and played in full
+        assert stream.bytes_written == stream.bytes_played == 160 * 11
+        
+        await stream.write(bytes(160 * 10))
+        await asyncio.sleep(0.015)
+        stream.clear()
+        assert stream.bytes_written == stream.bytes_played == 160 * len(sink.frames)
+        stream.close()
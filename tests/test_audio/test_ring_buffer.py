@@ -0,0 +1,131 @@
+"""Tests for the bounded per-call audio buffer."""
+
+import pytest
+
+from src.audio.ring_buffer import DEFAULT_INITIAL_SIZE, AudioRingBuffer, OverflowPolicy
+
+
+class TestAudioRingBuffer:
+    """Test AudioRingBuffer behaviour."""
+    
+    def test_write_and_view(self):
+        """Buffered bytes are readable through a read-only view."""
+        buffer = AudioRingBuffer(16)
+        
+        assert buffer.write(b"abc") == 3
+        assert buffer.write(b"def") == 3
+        
+        view = buffer.view()
+        assert view == b"abcdef"
+        assert view.readonly
+        assert len(buffer) == 6
+        assert buffer.free == 10
+    
+    def test_drop_oldest_policy(self):
+        """Writes past capacity discard the oldest audio and count it."""
+        buffer = AudioRingBuffer(8, OverflowPolicy.DROP_OLDEST)
+        
+        buffer.write(b"123456")
+        assert buffer.write(b"abcd") == 4
+        
+        assert buffer.view() == b"3456abcd"
+        assert buffer.dropped_bytes == 2
+        assert buffer.overflow_count == 1
+    
+    def test_drop_oldest_write_larger_than_capacity(self):
+        """A single oversized write keeps only its newest bytes."""
+        buffer = AudioRingBuffer(4)
+        buffer.write(b"xy")
+        
+        assert buffer.write(b"abcdefgh") == 4
+        
+        assert buffer.view() == b"efgh"
+        assert buffer.dropped_bytes == 6
+    
+    def test_reject_policy_applies_backpressure(self):
+        """With REJECT the part of a write that does not fit is refused."""
+        buffer = AudioRingBuffer(8, OverflowPolicy.REJECT)
+        
+        buffer.write(b"123456")
+        assert buffer.write(b"abcd") == 2
+        assert buffer.write(b"z") == 0
+        
+        assert buffer.view() == b"123456ab"
+        assert buffer.dropped_bytes == 3
+        assert buffer.overflow_count == 2
+    
+    def test_contents_stay_contiguous_across_compaction(self):
+        """Long-running writes wrap the storage without corrupting the window."""
+        buffer = AudioRingBuffer(10)
+        written = b""
+        
+        for i in range(50):
+            chunk = bytes([i]) * 3
+            buffer.write(chunk)
+            written += chunk
+            assert buffer.view() == written[-len(buffer):]
+        
+        assert len(buffer) == 10
+        assert buffer.dropped_bytes == len(written) - 10
+    
+    def test_storage_grows_with_buffered_audio(self):
+        """Storage starts small and grows only as far as the buffered window needs."""
+        buffer = AudioRingBuffer(64, initial_size=4)
+        assert buffer.allocated == 4
+        
+        buffer.write(b"abc")
+        assert buffer.allocated == 4
+        buffer.write(b"defgh")
+        assert buffer.allocated == 16
+        assert buffer.view() == b"abcdefgh"
+        
+        # Bounded by twice the capacity however much is written
+        written = b"abcdefgh"
+        for i in range(100):
+            chunk = bytes([i]) * 5
+            buffer.write(chunk)
+            written += chunk
+            assert buffer.view() == written[-len(buffer):]
+        assert buffer.allocated == 128
+    
+    def test_short_utterances_keep_storage_small(self):
+        """A window that stays small is compacted rather than grown."""
+        buffer = AudioRingBuffer(16000, initial_size=32)
+        
+        for i in range(100):
+            buffer.write(bytes([i]) * 10)
+            assert buffer.view() == bytes([i]) * 10
+            buffer.trim(0)
+        
+        assert buffer.allocated == 32
+    
+    def test_trim_and_clear(self):
+        """Trim keeps the newest bytes without counting them as dropped."""
+        buffer = AudioRingBuffer(16)
+        buffer.write(b"0123456789")
+        
+        buffer.trim(4)
+        assert buffer.view() == b"6789"
+        assert buffer.dropped_bytes == 0
+        
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.view() == b""
+    
+    def test_for_duration(self):
+        """Capacity is derived from duration and sample format."""
+        buffer = AudioRingBuffer.for_duration(500, 16000)
+        
+        assert buffer.capacity == 16000
+    
+    def test_long_buffer_is_not_preallocated(self):
+        """A 30 s buffer allocates only its initial storage until audio arrives."""
+        buffer = AudioRingBuffer.for_duration(30000, 16000)
+        
+        assert buffer.capacity == 960000
+        assert buffer.allocated == DEFAULT_INITIAL_SIZE
+    
+    def test_invalid_capacity(self):
+        """Zero capacity is rejected."""
+        with pytest.raises(ValueError):
+            AudioRingBuffer(0)
@@ -0,0 +1,89 @@
+"""Tests for voice activity detection and endpointing."""
+
+import numpy as np
+import pytest
+
+from src.audio.vad import VoiceActivityDetector, VADConfig, VADEvent
+
+
+SAMPLE_RATE = 16000
+
+
+def tone(ms: int, amplitude: float = 0.3) -> bytes:
+    """Generate a 440 Hz PCM16 tone."""
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 440 * t) * amplitude * 32767).astype("<i2").tobytes()
+
+
+def silence(ms: int) -> bytes:
+    """Generate PCM16 silence."""
+    return bytes(SAMPLE_RATE * ms // 1000 * 2)
+
+
+@pytest.fixture
+def detector():
+    """Create a detector with short timings."""
+    return VoiceActivityDetector(VADConfig(speech_start_ms=60, speech_end_ms=200))
+
+
+class TestVoiceActivityDetector:
+    """Test VoiceActivityDetector behaviour."""
+    
+    def test_silence_produces_no_events(self, detector):
+        """Silence never starts an utterance."""
+        assert detector.process(silence(1000)) == []
+        assert not detector.is_speaking
+    
+    def test_speech_start_and_end(self, detector):
+        """Speech followed by enough silence yields start then end."""
+        events = detector.process(silence(100) + tone(300) + silence(300))
+        
+        assert events == [VADEvent.SPEECH_START, VADEvent.SPEECH_END]
+        assert not detector.is_speaking
+    
+    def test_short_pause_does_not_end_utterance(self, detector):
+        """Pauses shorter than speech_end_ms keep the utterance open."""
+        events = detector.process(tone(200) + silence(100) + tone(200))
+        
+        assert events == [VADEvent.SPEECH_START]
+        assert detector.is_speaking
+    
+    def test_short_click_does_not_start_utterance(self, detector):
+        """Bursts shorter than speech_start_ms are ignored."""
+        assert detector.process(silence(100) + tone(20) + silence(100)) == []
+    
+    def test_frames_split_across_chunks(self, detector):
+        """Audio delivered in odd-sized chunks is analysed identically."""
+        audio = tone(300) + silence(300)
+        events = []
+        for i in range(0, len(audio), 333):
+            events.extend(detector.process(audio[i:i + 333]))
+        
+        assert events == [VADEvent.SPEECH_START, VADEvent.SPEECH_END]
+    
+    def test_max_speech_duration_forces_end(self):
+        """Continuous speech is cut at max_speech_ms."""
+        detector = VoiceActivityDetector(VADConfig(max_speech_ms=500))
+        
+        events = detector.process(tone(1000))
+        
+        assert events[:2] == [VADEvent.SPEECH_START, VADEvent.SPEECH_END]
+    
+    def test_noise_floor_adapts_to_background(self):
+        """Quiet sounds close to a raised noise floor are not treated as speech."""
+        config = VADConfig(threshold=0.3)
+        quiet_voice = tone(300, amplitude=0.018)
+        
+        assert VoiceActivityDetector(config).process(quiet_voice)[0] == VADEvent.SPEECH_START
+        
+        detector = VoiceActivityDetector(config)
+        detector.process(tone(2000, amplitude=0.01))
+        
+        assert detector.noise_floor_db > config.floor_db
+        assert detector.process(quiet_voice) == []
+        assert detector.process(tone(300, amplitude=0.5))[0] == VADEvent.SPEECH_START
+    
+    def test_threshold_mapping(self):
+        """The 0-1 threshold maps onto the dBFS range."""
+        assert VADConfig(threshold=0.5, floor_db=-60.0).threshold_db == pytest.approx(-30.0)
+        assert VADConfig(sample_rate=16000, speech_pad_ms=100).speech_pad_bytes == 3200
@@ -11,7 +11,8 @@ from src.clients.base import (
     CircuitBreakerConfig,
     CircuitBreakerState,
     RetryConfig,
-    ClientMetrics
+    ClientMetrics,
+    RequestRateLimiter
 )
 
 
@@ -124,6 +125,28 @@ class TestClientMetrics:
         assert metrics.average_latency == 2.0
 
 
+class TestRequestRateLimiter:
+    """Test the shared request rate limit."""
+    
+    @pytest.mark.asyncio
+    async def test_burst_then_spacing(self):
+        """Burst requests pass at once; later ones wait for tokens."""
+        limiter = RequestRateLimiter(rate=50.0, burst=2)
+        
+        start = time.monotonic()
+        waits = [await limiter.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - start
+        
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+        assert elapsed >= 0.035
+    
+    def test_rate_must_be_positive(self):
+        """A zero rate is rejected."""
+        with pytest.raises(ValueError):
+            RequestRateLimiter(rate=0)
+
+
 class MockResilientClient(BaseResilientClient):
     """Mock implementation for testing."""
     
@@ -0,0 +1,161 @@
+"""Tests for the pre-opened Deepgram live connection pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from deepgram import LiveTranscriptionEvents
+
+from src.clients.deepgram_pool import LiveConnection, LiveConnectionPool, LivePoolConfig
+from src.metrics import MetricsCollector
+
+
+def make_connection():
+    """Started live connection double that records its event handlers."""
+    connection = MagicMock()
+    connection.handlers = {}
+    connection.on = lambda event, handler: connection.handlers.__setitem__(event, handler)
+    connection.keep_alive = AsyncMock(return_value=True)
+    connection.finish = AsyncMock()
+    return connection
+
+
+class ConnectionFactory:
+    """Opens fake live connections and counts the handshakes."""
+    
+    def __init__(self):
+        self.opened = []
+    
+    async def __call__(self):
+        live = LiveConnection(make_connection())
+        self.opened.append(live)
+        return live
+
+
+@pytest.fixture
+def metrics():
+    """Isolated metrics collector."""
+    return MetricsCollector()
+
+
+class TestLiveConnection:
+    """Test routing events to the attached stream."""
+    
+    @pytest.mark.asyncio
+    async def test_events_reach_the_attached_stream(self):
+        """Idle connections only track closure; attached ones forward events."""
+        connection = make_connection()
+        live = LiveConnection(connection)
+        transcripts = []
+        
+        await connection.handlers[LiveTranscriptionEvents.Transcript](connection, "ignored")
+        assert live.usable
+        
+        live.attach(AsyncMock(side_effect=transcripts.append), AsyncMock(), AsyncMock())
+        await connection.handlers[LiveTranscriptionEvents.Transcript](connection, "hello")
+        await connection.handlers[LiveTranscriptionEvents.Close](connection, "closed")
+        
+        assert transcripts == ["hello"]
+        assert live.closed
+        live.on_close.assert_awaited_once_with("closed")
+        assert not live.usable
+
+
+class TestLiveConnectionPool:
+    """Test pool sizing, reuse and replacement."""
+    
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_warm_connections(self, metrics):
+        """A warm connection is handed out and the pool refills behind it."""
+        factory = ConnectionFactory()
+        pool = LiveConnectionPool(factory, LivePoolConfig(min_idle=1), metrics)
+        await pool.start()
+        await asyncio.sleep(0.01)
+        assert pool.idle == 1
+        
+        live = await pool.acquire()
+        await asyncio.sleep(0.01)
+        await pool.stop()
+        
+        assert live is factory.opened[0]
+        assert len(factory.opened) == 2
+        assert metrics.get_counter("deepgram_pool_hits_total") == 1
+        factory.opened[1].connection.finish.assert_awaited_once()
+        live.connection.finish.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_closed_connections_are_replaced(self, metrics):
+        """Connections the server closed are skipped, or dropped on keepalive."""
+        factory = ConnectionFactory()
+        pool = LiveConnectionPool(factory, LivePoolConfig(min_idle=2, keepalive_interval=0.01), metrics)
+        for _ in range(2):
+            pool._idle.append(await factory())
+        
+        pool._idle[0].closed = True
+        live = await pool.acquire()
+        assert live is factory.opened[1]
+        
+        pool._idle.append(await factory())
+        factory.opened[2].connection.keep_alive.return_value = False
+        await pool._refresh_idle()
+        
+        assert pool.idle == 0
+        assert metrics.get_counter("deepgram_pool_replaced_total") == 2
+    
+    @pytest.mark.asyncio
+    async def test_empty_pool_opens_on_demand(self, metrics):
+        """A stream that finds no warm connection opens its own."""
+        factory = ConnectionFactory()
+        pool = LiveConnectionPool(factory, LivePoolConfig(min_idle=0), metrics)
+        
+        live = await pool.acquire()
+        
+        assert live is factory.opened[0]
+        assert metrics.get_counter("deepgram_pool_misses_total") == 1
+        assert metrics.get_timer_stats("deepgram_connect_duration")["count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_acquire_during_refresh(self, metrics):
+        """Acquiring while keepalives are in flight does not break the refresh pass."""
+        factory = ConnectionFactory()
+        pool = LiveConnectionPool(factory, LivePoolConfig(min_idle=2), metrics)
+        first, second = await factory(), await factory()
+        pool._idle.extend([first, second])
+        
+        release = asyncio.Event()
+        
+        async def slow_keep_alive():
+            await release.wait()
+            return True
+        
+        first.connection.keep_alive = AsyncMock(side_effect=slow_keep_alive)
+        refresh = asyncio.create_task(pool._refresh_idle())
+        await asyncio.sleep(0)
+        
+        acquired = await pool.acquire()
+        release.set()
+        await refresh
+        
+        assert acquired not in (first, second)
+        second.connection.keep_alive.assert_awaited_once()
+        assert list(pool._idle) == [first, second]
+    
+    def test_target_follows_arrival_rate(self):
+        """Idle target covers the lookahead at the smoothed arrival rate, within bounds."""
+        pool = LiveConnectionPool(
+            ConnectionFactory(),
+            LivePoolConfig(min_idle=1, max_idle=4, lookahead_seconds=5.0, keepalive_interval=0.0),
+            MetricsCollector()
+        )
+        assert pool.target_idle == 1
+        
+        pool.arrival_rate = 0.5
+        assert pool.target_idle == 3
+        pool.arrival_rate = 10.0
+        assert pool.target_idle == 4
+        
+        pool.arrival_rate = 0.0
+        pool._arrivals = 100
+        pool._update_arrival_rate()
+        assert pool.arrival_rate > 0
+        assert pool._arrivals == 0
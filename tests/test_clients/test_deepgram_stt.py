@@ -2,16 +2,23 @@
 
 import asyncio
 import json
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from typing import AsyncIterator, List
 
+from deepgram import LiveTranscriptionEvents
+
+from src.clients.deepgram_pool import LiveConnection
 from src.clients.deepgram_stt import (
+    BatchItem,
     DeepgramSTTClient,
     TranscriptionResult,
     StreamingConfig,
     DeepgramMetrics,
-    TranscriptionMode
+    TranscriptionMode,
+    WordTimings,
+    _ResultChannel
 )
 
 
@@ -42,6 +49,42 @@ class TestTranscriptionResult:
         assert result.metadata == {}
 
 
+class TestWordTimings:
+    """Test the array-backed word timings."""
+    
+    def test_words_materialize_as_dicts(self):
+        """Indexing and iteration build the familiar word dicts."""
+        words = WordTimings.from_words([
+            MagicMock(word="Hello", start=0.0, end=0.5, confidence=0.9),
+            MagicMock(word="world", start=0.6, end=1.0, confidence=1.0)
+        ])
+        
+        assert len(words) == 2
+        assert words[1] == {"word": "world", "start": 0.6, "end": 1.0, "confidence": 1.0}
+        assert words[-2]["word"] == "Hello"
+        assert [word["word"] for word in words[0:2]] == ["Hello", "world"]
+        assert words.word(0) == "Hello"
+        assert words.text() == "Hello world"
+        assert list(words.ends) == [0.5, 1.0]
+        with pytest.raises(IndexError):
+            words[2]
+    
+    def test_concat_and_equality(self):
+        """Segments join in order and compare equal to the dicts they hold."""
+        first = WordTimings.from_dicts([{"word": "Book", "start": 0.0, "end": 0.3, "confidence": 0.9}])
+        second = WordTimings.from_dicts([
+            {"word": "a", "start": 0.4, "end": 0.5, "confidence": 0.8},
+            {"word": "table", "start": 0.5, "end": 0.9, "confidence": 0.95}
+        ])
+        
+        joined = WordTimings.concat([first, WordTimings(), second])
+        
+        assert joined.text() == "Book a table"
+        assert joined == list(first) + list(second)
+        assert joined == WordTimings.from_dicts(list(joined))
+        assert WordTimings() == []
+
+
 class TestStreamingConfig:
     """Test StreamingConfig data class."""
     
@@ -117,6 +160,62 @@ class TestDeepgramMetrics:
         assert metrics.transcription_speed_ratio == 0.0
 
 
+def _result(text, is_final=True):
+    return TranscriptionResult(text=text, confidence=0.9, language="en-US", duration=0.1, is_final=is_final)
+
+
+class TestResultChannel:
+    """Test the bounded handoff from connection callbacks."""
+    
+    @pytest.mark.asyncio
+    async def test_order_and_close(self):
+        """Results come out in order; close ends the channel after draining."""
+        channel = _ResultChannel(8, DeepgramMetrics())
+        for text in ("one", "two", "three"):
+            channel.put_nowait(_result(text))
+        channel.close()
+        channel.put_nowait(_result("late"))
+        
+        received = []
+        while (result := await channel.get()) is not None:
+            received.append(result.text)
+        
+        assert received == ["one", "two", "three"]
+    
+    @pytest.mark.asyncio
+    async def test_overflow_drops_interim_results_first(self):
+        """A full channel drops the oldest interim and counts it."""
+        metrics = DeepgramMetrics()
+        channel = _ResultChannel(3, metrics)
+        channel.put_nowait(_result("final one"))
+        channel.put_nowait(_result("inter", is_final=False))
+        channel.put_nowait(_result("final two"))
+        channel.put_nowait(_result("final three"))
+        channel.put_nowait(_result("final four"))
+        channel.close()
+        
+        received = []
+        while (result := await channel.get()) is not None:
+            received.append(result.text)
+        
+        assert received == ["final two", "final three", "final four"]
+        assert metrics.dropped_results == 2
+    
+    @pytest.mark.asyncio
+    async def test_put_from_another_thread_wakes_consumer(self):
+        """Callbacks on SDK threads hand results to the loop."""
+        channel = _ResultChannel(8, DeepgramMetrics())
+        getter = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+        
+        thread = threading.Thread(target=channel.put_nowait, args=(_result("from thread"),))
+        thread.start()
+        thread.join()
+        
+        result = await asyncio.wait_for(getter, timeout=1.0)
+        assert result.text == "from thread"
+
+
 @pytest.fixture
 def mock_settings():
     """Mock settings for testing."""
@@ -348,6 +447,63 @@ class TestDeepgramSTTClient:
             with pytest.raises(Exception, match="Transcription failed"):
                 await client.transcribe_batch(audio_data)
     
+    @pytest.mark.asyncio
+    async def test_transcribe_many_streams_outcomes(self, mock_settings, mock_deepgram_client):
+        """Outcomes arrive as items finish, within the concurrency limit."""
+        client = DeepgramSTTClient()
+        in_flight = peak = 0
+        
+        async def fake_transcribe_batch(audio_data, mimetype="audio/wav", options=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * len(audio_data))
+            in_flight -= 1
+            if audio_data == b"bad":
+                raise ValueError("Invalid audio data")
+            return TranscriptionResult(text=audio_data.decode(), confidence=0.9, language="en-US", duration=0.1)
+        
+        items = [b"slowest", b"bad", BatchItem(audio=b"ok", item_id="short"), b"medium"]
+        with patch.object(client, 'transcribe_batch', fake_transcribe_batch):
+            outcomes = [outcome async for outcome in client.transcribe_many(items, concurrency=2)]
+        
+        assert peak == 2
+        assert [outcome.item_id for outcome in outcomes] == ["1", "short", "0", "3"]
+        assert not outcomes[0].ok
+        assert isinstance(outcomes[0].error, ValueError)
+        assert outcomes[2].result.text == "slowest"
+    
+    @pytest.mark.asyncio
+    async def test_transcribe_many_maps_files(self, mock_settings, mock_deepgram_client, tmp_path):
+        """Files are memory-mapped and uploaded in chunks rather than read whole."""
+        audio = b"RIFF" + b"\x00" * 200_000
+        path = tmp_path / "call.wav"
+        path.write_bytes(audio)
+        uploads = []
+        
+        async def transcribe_file(source, options):
+            assert "buffer" not in source
+            chunks = [chunk async for chunk in source["stream"]]
+            uploads.append((source["mimetype"], len(chunks), b"".join(chunks)))
+            response = MagicMock()
+            response.results.channels = [MagicMock()]
+            response.results.channels[0].alternatives = [MagicMock(transcript="From file", confidence=0.9, words=[])]
+            response.results.metadata = None
+            return response
+        
+        mock_deepgram_client.listen.asyncrest.v.return_value.transcribe_file = transcribe_file
+        client = DeepgramSTTClient(batch_requests_per_second=100)
+        
+        outcomes = [outcome async for outcome in client.transcribe_many([path, tmp_path / "missing.wav"])]
+        
+        by_id = {outcome.item_id: outcome for outcome in outcomes}
+        assert by_id[str(path)].result.text == "From file"
+        assert isinstance(by_id[str(tmp_path / "missing.wav")].error, FileNotFoundError)
+        mimetype, chunk_count, uploaded = uploads[0]
+        assert mimetype in ("audio/wav", "audio/x-wav")
+        assert chunk_count > 1
+        assert uploaded == audio
+    
     @pytest.mark.asyncio
     async def test_transcribe_stream_basic(self, mock_settings, mock_deepgram_client):
         """Test basic streaming transcription."""
@@ -450,6 +606,59 @@ class TestDeepgramSTTClient:
                     async for result in client.transcribe_stream(mock_audio_stream()):
                         pass
     
+    @pytest.mark.asyncio
+    async def test_finalize_stream(self, mock_settings, mock_deepgram_client):
+        """Test flushing an open streaming connection without closing it."""
+        client = DeepgramSTTClient()
+        
+        mock_connection = MagicMock()
+        mock_connection.finalize = AsyncMock(return_value=True)
+        client._active_connections["test_connection"] = mock_connection
+        
+        assert await client.finalize_stream("test_connection") is True
+        assert await client.finalize_stream("unknown_connection") is False
+        mock_connection.finalize.assert_awaited_once()
+        assert "test_connection" in client._active_connections
+    
+    @pytest.mark.asyncio
+    async def test_streaming_connection_from_pool(self, mock_settings, mock_deepgram_client):
+        """Test a stream using a pre-opened connection from the pool."""
+        client = DeepgramSTTClient()
+        
+        mock_connection = MagicMock()
+        handlers = {}
+        mock_connection.on = lambda event, handler: handlers.__setitem__(event, handler)
+        mock_connection.send = AsyncMock()
+        
+        async def finish():
+            await handlers[LiveTranscriptionEvents.Close](mock_connection, None)
+        
+        mock_connection.finish = AsyncMock(side_effect=finish)
+        live = LiveConnection(mock_connection)
+        client.connection_pool = MagicMock()
+        client.connection_pool.acquire = AsyncMock(return_value=live)
+        
+        async def audio_stream():
+            yield b"audio_chunk"
+            await handlers[LiveTranscriptionEvents.Transcript](mock_connection, MagicMock(
+                channel=MagicMock(alternatives=[MagicMock(transcript="Pooled", confidence=0.9, words=[])]),
+                is_final=True,
+                channel_index=[0],
+                start=0.0,
+                duration=1.0,
+                metadata=None
+            ))
+        
+        results = [
+            result async for result in client._create_streaming_connection(audio_stream(), "pooled")
+        ]
+        
+        assert [result.text for result in results] == ["Pooled"]
+        mock_deepgram_client.listen.asynclive.v.assert_not_called()
+        mock_connection.send.assert_awaited_once_with(b"audio_chunk")
+        assert live.closed
+        assert "pooled" not in client._active_connections
+    
     @pytest.mark.asyncio
     async def test_close_connection(self, mock_settings, mock_deepgram_client):
         """Test closing a specific connection."""
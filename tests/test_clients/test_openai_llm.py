@@ -18,6 +18,8 @@ from src.clients.openai_llm import (
     LLMResponse
 )
 from src.clients.base import RetryConfig, CircuitBreakerConfig
+from src.clients.response_cache import ResponseCacheConfig
+from src.clients.token_counter import TOKENS_PER_MESSAGE, TOKENS_PER_REPLY, TokenCounter
 
 
 class TestMessage:
@@ -75,6 +77,85 @@ class TestTokenUsage:
         assert abs(usage.cost_estimate - expected_cost) < 0.001
 
 
+class WordEncoding:
+    """Encoding double with one token per word that counts its calls."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def encode(self, text, disallowed_special=()):
+        self.calls += 1
+        return text.split()
+
+
+class TestTokenCounting:
+    """Test cached per-message counts and the running context total."""
+    
+    def test_counter_caches_texts(self):
+        """Each distinct text is encoded once."""
+        encoding = WordEncoding()
+        counter = TokenCounter(encoding)
+        
+        assert counter.count("one two three") == 3
+        assert counter.count("one two three") == 3
+        assert counter.count_message("user", "hi there") == TOKENS_PER_MESSAGE + 1 + 2
+        assert encoding.calls == 3
+        assert counter.exact
+    
+    def test_context_total_is_incremental(self):
+        """Messages are encoded once, when added, however often the total is read."""
+        encoding = WordEncoding()
+        context = ConversationContext(
+            conversation_id="test",
+            system_prompt="Be brief.",
+            token_counter=TokenCounter(encoding, cache_size=0)
+        )
+        
+        previous = 0
+        for turn in range(20):
+            context.add_message(MessageRole.USER, f"question number {turn}")
+            context.add_message(MessageRole.ASSISTANT, f"answer {turn}")
+            total = context.token_count
+            assert total > previous
+            previous = total
+        
+        # Role and content of 40 messages, plus the system message per read
+        assert encoding.calls == 40 * 2 + 20 * 2
+        assert context.messages[0].token_count == TOKENS_PER_MESSAGE + 1 + 3
+        assert context.token_count == TokenCounter(WordEncoding()).count_messages(context.get_messages_for_api())
+    
+    def test_replaced_messages_are_recounted(self):
+        """Assigning context.messages directly keeps the total correct."""
+        context = ConversationContext(conversation_id="test", token_counter=TokenCounter(WordEncoding()))
+        context.add_message(MessageRole.USER, "one two")
+        context.add_message(MessageRole.ASSISTANT, "three")
+        
+        context.messages = context.messages[1:]
+        
+        assert context.token_count == TOKENS_PER_MESSAGE + 1 + 1 + TOKENS_PER_REPLY
+        context.add_message(MessageRole.USER, "four five")
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+    
+    def test_replaced_content_is_recounted(self):
+        """Truncating or removing a message keeps its count and the total correct."""
+        context = ConversationContext(conversation_id="test", token_counter=TokenCounter(WordEncoding()))
+        context.add_message(MessageRole.USER, "when are you open")
+        context.add_message(MessageRole.ASSISTANT, "we open at nine and close at five")
+        before = context.token_count
+        
+        context.replace_message(1, "we open at nine")
+        
+        assert context.messages[1].token_count == TOKENS_PER_MESSAGE + 1 + 4
+        assert context.token_count == before - 4
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+        
+        context.remove_message(1)
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+        
+        context.add_message(MessageRole.ASSISTANT, "nine")
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+
+
 class TestConversationContext:
     """Test ConversationContext class."""
     
@@ -138,6 +219,56 @@ class TestConversationContext:
         ]
         
         assert api_messages == expected
+    
+    def test_api_view_is_kept_between_requests(self):
+        """Message dicts are built once and reused by later requests."""
+        context = ConversationContext(conversation_id="test", system_prompt="Be brief.")
+        context.add_message(MessageRole.USER, "Hello")
+        first = context.get_messages_for_api()
+        
+        context.add_message(MessageRole.ASSISTANT, "Hi!")
+        second = context.get_messages_for_api()
+        
+        assert second[0] is first[0]
+        assert second[1] is first[1]
+        assert second[2] == {"role": "assistant", "content": "Hi!"}
+        assert len(first) == 2
+    
+    def test_drop_oldest(self):
+        """Dropping messages updates the view and token total in place."""
+        context = ConversationContext(conversation_id="test", token_counter=TokenCounter())
+        for index in range(5):
+            context.add_message(MessageRole.USER, f"message {index} " * 4)
+        
+        context.drop_oldest(3)
+        
+        assert [message["content"] for message in context.get_messages_for_api()] == [
+            "message 3 " * 4,
+            "message 4 " * 4
+        ]
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+        
+        context.messages = []
+        context.add_message(MessageRole.USER, "again")
+        assert context.get_messages_for_api() == [{"role": "user", "content": "again"}]
+    
+    def test_replace_and_remove_message(self):
+        """Editing a message through the context updates the API view."""
+        context = ConversationContext(conversation_id="test", system_prompt="Be brief.")
+        context.add_message(MessageRole.USER, "Hello")
+        context.add_message(MessageRole.ASSISTANT, "Hi there. How can I help you today?")
+        context.get_messages_for_api()
+        
+        context.replace_message(1, "Hi there.")
+        
+        assert context.messages[1].content == "Hi there."
+        assert context.get_messages_for_api()[-1] == {"role": "assistant", "content": "Hi there."}
+        
+        context.remove_message(1)
+        assert context.get_messages_for_api() == [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Hello"}
+        ]
 
 
 class TestOpenAILLMClient:
@@ -199,7 +330,8 @@ class TestOpenAILLMClient:
     
     def test_estimate_tokens(self, client):
         """Test token estimation."""
-        # Test basic estimation (4 chars per token)
+        # Without tiktoken, estimate 4 chars per token
+        client.token_counter = TokenCounter()
         assert client.estimate_tokens("hello") == 1  # 5 chars / 4 = 1.25 -> 1
         assert client.estimate_tokens("hello world") == 2  # 11 chars / 4 = 2.75 -> 2
         assert client.estimate_tokens("a" * 100) == 25  # 100 chars / 4 = 25
@@ -216,6 +348,17 @@ class TestOpenAILLMClient:
         assert tokens > 0  # Should calculate some tokens
         assert tokens < 100  # Should be reasonable for short messages
     
+    def test_client_counts_context_with_its_model(self, client):
+        """A context counted by another model's counter is recounted with the client's."""
+        context = ConversationContext(conversation_id="test", token_counter=TokenCounter())
+        context.add_message(MessageRole.USER, "hello there friend")
+        client.token_counter = TokenCounter(WordEncoding())
+        
+        tokens = client.calculate_context_tokens(context)
+        
+        assert context.token_counter is client.token_counter
+        assert tokens == TOKENS_PER_MESSAGE + 1 + 3 + TOKENS_PER_REPLY
+    
     def test_truncate_context_no_truncation_needed(self, client):
         """Test context truncation when no truncation is needed."""
         messages = [
@@ -293,6 +436,156 @@ class TestOpenAILLMClient:
         assert response.token_usage.total_tokens == 18
         assert response.response_time > 0
     
+    @pytest.mark.asyncio
+    async def test_generate_response_from_cache(self, client):
+        """A repeated standalone question is answered without another API call."""
+        mock_response = MagicMock(spec=ChatCompletion)
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "We're open 9 to 5."
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.usage = None
+        client.client.chat.completions.create = AsyncMock(return_value=mock_response)
+        client.enable_response_cache(ResponseCacheConfig(similarity_threshold=1.0))
+        
+        responses = []
+        for question, use_cache in (("What are your hours?", True), ("what are your hours", True), ("What are your hours?", False)):
+            context = ConversationContext(conversation_id="test", system_prompt="Be brief.")
+            context.add_message(MessageRole.USER, question)
+            responses.append(await client.generate_response(context, use_cache=use_cache))
+        
+        assert client.client.chat.completions.create.await_count == 2
+        assert responses[1].content == "We're open 9 to 5."
+        assert responses[1].metadata["cached"] is True
+        assert responses[1].token_usage.total_tokens == 0
+        assert "cached" not in responses[2].metadata
+        assert client.get_token_usage_summary()["response_cache"]["hits"] == 1
+    
+    def _completion(self, content, finish_reason="stop"):
+        response = MagicMock(spec=ChatCompletion)
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = content
+        response.choices[0].finish_reason = finish_reason
+        response.usage = None
+        return response
+    
+    def _stream(self, chunks, finish_reason="stop"):
+        async def stream():
+            for index, content in enumerate(chunks):
+                chunk = MagicMock()
+                chunk.choices = [MagicMock()]
+                chunk.choices[0].delta.content = content
+                chunk.choices[0].finish_reason = finish_reason if index == len(chunks) - 1 else None
+                yield chunk
+        return stream()
+    
+    @pytest.mark.asyncio
+    async def test_answers_shaped_by_history_are_not_cached(self, client):
+        """Only answers to a conversation's first turn are stored for other callers."""
+        client.client.chat.completions.create = AsyncMock(return_value=self._completion("Tomorrow we open at ten."))
+        cache = client.enable_response_cache(ResponseCacheConfig(similarity_threshold=1.0))
+        
+        context = ConversationContext(conversation_id="a", system_prompt="Be brief.")
+        context.add_message(MessageRole.USER, "When do you open today?")
+        context.add_message(MessageRole.ASSISTANT, "At nine.")
+        context.add_message(MessageRole.USER, "What about tomorrow?")
+        await client.generate_response(context)
+        assert len(cache) == 0
+        
+        context = ConversationContext(conversation_id="b", system_prompt="Be brief.")
+        context.add_message(MessageRole.USER, "What about tomorrow?")
+        await client.generate_response(context)
+        assert len(cache) == 1
+        
+        # Answers are keyed on the system prompt too
+        context = ConversationContext(conversation_id="c", system_prompt="Be chatty.")
+        context.add_message(MessageRole.USER, "What about tomorrow?")
+        response = await client.generate_response(context)
+        assert "cached" not in response.metadata
+        assert client.client.chat.completions.create.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_semantic_lookup_runs_alongside_request(self, client):
+        """A slow embedding request neither delays the answer nor loses the embedding."""
+        async def slow_embedding(model, input):
+            await asyncio.sleep(0.3)
+            response = MagicMock()
+            response.data = [MagicMock(embedding=[1.0, 0.0])]
+            return response
+        
+        client.client.chat.completions.create = AsyncMock(return_value=self._completion("9 to 5."))
+        client.client.embeddings.create = slow_embedding
+        cache = client.enable_response_cache(ResponseCacheConfig(similarity_threshold=0.9))
+        context = ConversationContext(conversation_id="test", system_prompt="Be brief.")
+        context.add_message(MessageRole.USER, "What are your hours?")
+        
+        started = asyncio.get_running_loop().time()
+        response = await client.generate_response(context)
+        
+        assert asyncio.get_running_loop().time() - started < 0.2
+        assert response.content == "9 to 5."
+        assert len(cache) == 0
+        await asyncio.sleep(0.4)
+        assert len(cache) == 1
+        assert cache.get_stats()["misses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_semantic_hit_cancels_slow_request(self, client):
+        """A semantic match found before the model answers is used instead."""
+        request_cancelled = asyncio.Event()
+        
+        async def slow_completion(**kwargs):
+            try:
+                await asyncio.sleep(5)
+            finally:
+                request_cancelled.set()
+        
+        async def embedding(model, input):
+            response = MagicMock()
+            response.data = [MagicMock(embedding=[1.0, 0.0])]
+            return response
+        
+        client.client.embeddings.create = embedding
+        cache = client.enable_response_cache(ResponseCacheConfig(similarity_threshold=0.9))
+        lookup = await cache.lookup("Be brief.", "What are your hours?")
+        cache.store(lookup, "9 to 5.", "gpt-4")
+        client.client.chat.completions.create = slow_completion
+        
+        context = ConversationContext(conversation_id="test", system_prompt="Be brief.")
+        context.add_message(MessageRole.USER, "When are you open?")
+        response = await client.generate_response(context)
+        
+        assert response.content == "9 to 5."
+        assert response.metadata["cache_match"] == "semantic"
+        assert request_cancelled.is_set()
+    
+    @pytest.mark.asyncio
+    async def test_only_completed_streams_are_cached(self, client):
+        """Streams cut short by the reader or the token limit are not stored."""
+        cache = client.enable_response_cache(ResponseCacheConfig(similarity_threshold=1.0))
+        
+        def context():
+            context = ConversationContext(conversation_id="test", system_prompt="Be brief.")
+            context.add_message(MessageRole.USER, "What are your hours?")
+            return context
+        
+        # The caller barges in after the first chunk
+        client.client.chat.completions.create = AsyncMock(return_value=self._stream(["We open", " at nine."]))
+        stream = client.stream_response(context())
+        assert await stream.__anext__() == "We open"
+        await stream.aclose()
+        assert len(cache) == 0
+        
+        client.client.chat.completions.create = AsyncMock(
+            return_value=self._stream(["We open", " at"], finish_reason="length")
+        )
+        assert [chunk async for chunk in client.stream_response(context())] == ["We open", " at"]
+        assert len(cache) == 0
+        
+        client.client.chat.completions.create = AsyncMock(return_value=self._stream(["We open", " at nine."]))
+        assert [chunk async for chunk in client.stream_response(context())] == ["We open", " at nine."]
+        assert len(cache) == 1
+        assert [chunk async for chunk in client.stream_response(context())] == ["We open at nine."]
+    
     @pytest.mark.asyncio
     async def test_generate_response_with_context_truncation(self, client):
         """Test response generation with context truncation."""
@@ -486,6 +779,8 @@ class TestOpenAILLMClient:
         
         # Should have fewer messages after optimization
         assert len(context.messages) < original_count
+        assert context.messages[-1].content == "Long response 49" * 20
+        assert client.calculate_context_tokens(context) <= client.max_context_tokens * 0.6
     
     def test_get_token_usage_summary(self, client):
         """Test token usage summary."""
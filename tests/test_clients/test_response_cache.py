@@ -0,0 +1,106 @@
+"""Tests for the LLM response cache."""
+
+import numpy as np
+import pytest
+
+from src.clients.response_cache import ResponseCache, ResponseCacheConfig, normalize_utterance
+from src.metrics import MetricsCollector
+
+
+VOCABULARY = ["what", "are", "your", "hours", "opening", "when", "open", "where", "address"]
+SYNONYMS = {"opening": "hours", "when": "what", "open": "hours"}
+
+PROMPT = "You are the clinic's phone agent."
+
+
+async def bag_of_words(text):
+    """Embedding double: word counts with a few synonyms folded together."""
+    vector = np.zeros(len(VOCABULARY), dtype=np.float32)
+    for word in normalize_utterance(text):
+        word = SYNONYMS.get(word, word)
+        if word in VOCABULARY:
+            vector[VOCABULARY.index(word)] += 1
+    return vector
+
+
+async def failing_embedder(text):
+    raise TimeoutError("embedding timed out")
+
+
+def make_cache(embed=bag_of_words, **config):
+    return ResponseCache(ResponseCacheConfig(**config), embed=embed, metrics_collector=MetricsCollector())
+
+
+async def cache_answer(cache, utterance, content, system_prompt=PROMPT):
+    lookup = await cache.lookup(system_prompt, utterance)
+    assert lookup is not None and lookup.entry is None
+    return cache.store(lookup, content, "gpt-4")
+
+
+class TestResponseCache:
+    """Test lookup, bypass and eviction."""
+    
+    @pytest.mark.asyncio
+    async def test_exact_match_after_normalization(self):
+        """Case, punctuation and hesitations do not matter; hits are counted per entry."""
+        cache = make_cache(embed=None)
+        await cache_answer(cache, "What are your hours?", "We're open 9 to 5.")
+        
+        lookup = await cache.lookup(PROMPT, "um, what are your HOURS")
+        
+        assert lookup.match == "exact"
+        assert lookup.entry.content == "We're open 9 to 5."
+        assert lookup.entry.hits == 1
+        assert (await cache.lookup("Another prompt.", "What are your hours?")).entry is None
+    
+    @pytest.mark.asyncio
+    async def test_similar_question_matches_semantically(self):
+        """A reworded question is answered when its embedding is close enough."""
+        cache = make_cache(similarity_threshold=0.85)
+        await cache_answer(cache, "What are your hours?", "We're open 9 to 5.")
+        await cache_answer(cache, "Where is your address?", "12 High Street.")
+        
+        hit = await cache.lookup(PROMPT, "When are you open?")
+        miss = await cache.lookup(PROMPT, "Do you take walk-ins?")
+        
+        assert hit.match == "semantic"
+        assert hit.entry.content == "We're open 9 to 5."
+        assert hit.entry.semantic_hits == 1
+        assert miss.entry is None
+        assert cache.get_stats()["top_entries"][0]["utterance"] == "What are your hours?"
+    
+    @pytest.mark.asyncio
+    async def test_context_dependent_turns_bypass(self):
+        """Utterances that refer back to the conversation are not looked up."""
+        cache = make_cache()
+        
+        assert await cache.lookup(PROMPT, "Is that one free?") is None
+        assert await cache.lookup(PROMPT, "Yes please.") is None
+        assert await cache.lookup(PROMPT, "") is None
+        assert cache.get_stats()["bypasses"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_ttl_and_lru_eviction(self):
+        """Expired entries miss and the least recently used entry is evicted when full."""
+        cache = make_cache(embed=None, max_entries=2, ttl_seconds=60)
+        hours = await cache_answer(cache, "What are your hours?", "9 to 5.")
+        await cache_answer(cache, "Where is your address?", "12 High Street.")
+        
+        await cache.lookup(PROMPT, "What are your hours?")
+        await cache_answer(cache, "Do you take walk-ins?", "We do.")
+        assert (await cache.lookup(PROMPT, "Where is your address?")).entry is None
+        assert len(cache) == 2
+        
+        hours.created_at -= 61
+        assert (await cache.lookup(PROMPT, "What are your hours?")).entry is None
+        assert len(cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_embedding_failure_is_a_miss(self):
+        """A failed embedding request falls back to exact matching."""
+        cache = make_cache(embed=failing_embedder)
+        entry = await cache_answer(cache, "What are your hours?", "9 to 5.")
+        
+        assert entry.embedding is None
+        assert (await cache.lookup(PROMPT, "What are your hours")).match == "exact"
+        assert cache.metrics_collector.get_counter("llm_cache_embedding_failures_total") == 1
@@ -0,0 +1,199 @@
+"""Tests for STT backend failover and the local Whisper engine."""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.audio.codec import AudioFormatSpec, wrap_wav
+from src.clients.deepgram_stt import StreamingConfig, TranscriptionResult
+from src.clients.local_stt import LocalWhisperSTT
+from src.clients.stt_backend import FailoverSTTClient, STTBackend
+from src.metrics import MetricsCollector
+
+
+def result(text):
+    return TranscriptionResult(text=text, confidence=0.9, language="en-US", duration=0.1)
+
+
+class FakeBackend(STTBackend):
+    """Backend that answers with its name, or fails on demand."""
+    
+    def __init__(self, name, latency=0.0):
+        self.name = name
+        self.latency = latency
+        self.available = True
+        self.fail = False
+        self.fail_stream_after = None
+        self.breaker_state = "closed"
+        self.streaming_config = StreamingConfig()
+        self.frames = []
+    
+    async def transcribe_batch(self, audio_data, mimetype="audio/wav", options=None):
+        await asyncio.sleep(self.latency)
+        if self.fail:
+            raise ConnectionError(f"{self.name} down")
+        return result(self.name)
+    
+    async def transcribe_stream(self, audio_stream, connection_id=None):
+        async for frame in audio_stream:
+            self.frames.append(frame)
+            if self.fail_stream_after is not None and len(self.frames) >= self.fail_stream_after:
+                raise ConnectionError(f"{self.name} stream lost")
+            yield result(f"{self.name}:{frame.decode()}")
+    
+    def is_available(self):
+        return self.available
+    
+    def get_health_status(self):
+        return {"service": self.name, "circuit_breaker_state": self.breaker_state}
+
+
+@pytest.fixture
+def backends():
+    return FakeBackend("deepgram"), FakeBackend("local")
+
+
+def make_client(backends, **kwargs):
+    primary, fallback = backends
+    return FailoverSTTClient(primary, fallback, metrics_collector=MetricsCollector(), **kwargs)
+
+
+class TestFailoverSTTClient:
+    """Test switching between primary and fallback backends."""
+    
+    @pytest.mark.asyncio
+    async def test_open_breaker_routes_to_fallback(self, backends):
+        """An unavailable primary is skipped, and reported closed while the fallback serves."""
+        primary, _ = backends
+        client = make_client(backends)
+        assert (await client.transcribe_batch(b"audio")).text == "deepgram"
+        
+        primary.available = False
+        primary.breaker_state = "open"
+        
+        assert (await client.transcribe_batch(b"audio")).text == "local"
+        assert client.using_fallback
+        status = client.get_health_status()
+        assert status["circuit_breaker_state"] == "closed"
+        assert status["active_backend"] == "local"
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_retries_on_fallback(self, backends):
+        """A primary error is answered by the fallback; invalid audio is not retried."""
+        primary, _ = backends
+        client = make_client(backends)
+        primary.fail = True
+        
+        assert (await client.transcribe_batch(b"audio")).text == "local"
+        
+        async def invalid(*args, **kwargs):
+            raise ValueError("Invalid audio data")
+        
+        primary.transcribe_batch = invalid
+        with pytest.raises(ValueError):
+            await client.transcribe_batch(b"audio")
+    
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_suspended(self, backends):
+        """Once the primary's p95 passes the threshold, new requests go to the fallback."""
+        primary, _ = backends
+        primary.latency = 0.02
+        client = make_client(backends, latency_threshold=0.01, recovery_interval=60.0)
+        
+        texts = [(await client.transcribe_batch(b"audio")).text for _ in range(6)]
+        
+        assert texts == ["deepgram"] * 5 + ["local"]
+        client.suspended_until = 0.0
+        assert (await client.transcribe_batch(b"audio")).text == "deepgram"
+    
+    @pytest.mark.asyncio
+    async def test_failed_stream_continues_on_fallback(self, backends):
+        """Audio not yet sent when the primary stream fails goes to the fallback."""
+        primary, fallback = backends
+        primary.fail_stream_after = 2
+        client = make_client(backends)
+        
+        async def frames():
+            for index in range(4):
+                yield str(index).encode()
+        
+        texts = [item.text async for item in client.transcribe_stream(frames(), connection_id="call")]
+        
+        assert texts == ["deepgram:0", "local:2", "local:3"]
+        assert fallback.frames == [b"2", b"3"]
+        assert client.suspended_until > 0
+
+
+class FakeWhisperModel:
+    """Stands in for faster_whisper.WhisperModel and records the audio it gets."""
+    
+    def __init__(self):
+        self.inputs = []
+    
+    def transcribe(self, samples, **kwargs):
+        self.inputs.append(samples)
+        word = SimpleNamespace(word=" hello", start=0.0, end=0.4, probability=0.8)
+        segment = SimpleNamespace(text=" hello", avg_logprob=0.0, words=[word])
+        return iter([segment]), None
+
+
+class TestLocalWhisperSTT:
+    """Test the local engine's audio handling around the model."""
+    
+    @pytest.fixture
+    def engine(self):
+        engine = LocalWhisperSTT(streaming_config=StreamingConfig(sample_rate=8000), metrics_collector=MetricsCollector())
+        engine._model = FakeWhisperModel()
+        yield engine
+        engine.executor.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_batch_resamples_wav_to_model_rate(self, engine):
+        """WAV input is converted to 16 kHz mono float samples."""
+        pcm = (np.ones(8000, dtype=np.int16) * 16384).tobytes()
+        wav = wrap_wav(pcm, AudioFormatSpec(sample_rate=8000))
+        
+        transcription = await engine.transcribe_batch(wav)
+        
+        samples = engine._model.inputs[0]
+        assert samples.dtype == np.float32
+        assert len(samples) == 16000
+        assert transcription.text == "hello"
+        assert transcription.confidence == pytest.approx(1.0)
+        assert transcription.words[0]["word"] == "hello"
+        assert transcription.metadata["backend"] == "local_whisper"
+    
+    @pytest.mark.asyncio
+    async def test_stream_transcribes_on_finalize(self, engine):
+        """finalize_stream() flushes buffered audio as a positioned final."""
+        frames: asyncio.Queue = asyncio.Queue()
+        
+        async def audio():
+            while (frame := await frames.get()) is not None:
+                yield frame
+        
+        results = []
+        
+        async def consume():
+            async for item in engine.transcribe_stream(audio(), connection_id="call_live"):
+                results.append(item)
+        
+        consumer = asyncio.create_task(consume())
+        await frames.put(bytes(16000))
+        await asyncio.sleep(0.01)
+        assert await engine.finalize_stream("call_live") is True
+        await frames.put(None)
+        await consumer
+        
+        assert [item.metadata["from_finalize"] for item in results] == [True, False]
+        assert results[0].end_time == pytest.approx(1.0)
+        assert results[1].text == ""
+        assert await engine.finalize_stream("call_live") is False
+    
+    @pytest.mark.asyncio
+    async def test_unsupported_audio_is_rejected(self, engine):
+        """Compressed formats the engine cannot decode raise ValueError."""
+        with pytest.raises(ValueError):
+            await engine.transcribe_batch(b"ID3" + bytes(200), mimetype="audio/mpeg")
@@ -206,6 +206,58 @@ class TestUserInputProcessing:
         # Verify metrics
         assert dialogue_manager.metrics.error_count == 1
         assert dialogue_manager.metrics.fallback_responses == 1
+    
+    @pytest.mark.asyncio
+    async def test_stream_user_input_success(self, dialogue_manager, mock_llm_client):
+        """Test streaming response generation records the completed turn."""
+        async def fake_stream(context, correlation_id=None):
+            for fragment in ["Hello", " there", "!"]:
+                yield fragment
+        
+        mock_llm_client.stream_response = MagicMock(side_effect=fake_stream)
+        
+        fragments = [
+            fragment async for fragment in dialogue_manager.stream_user_input(
+                "Hi", metadata={"source": "phone"}
+            )
+        ]
+        
+        assert fragments == ["Hello", " there", "!"]
+        assert len(dialogue_manager.conversation_turns) == 1
+        turn = dialogue_manager.conversation_turns[0]
+        assert turn.assistant_response == "Hello there!"
+        assert turn.metadata["streamed"] is True
+        assert turn.metadata["source"] == "phone"
+        assert dialogue_manager.metrics.total_turns == 1
+        assert dialogue_manager.metrics.llm_first_token_latency >= 0
+        role, content = dialogue_manager.conversation_context.add_message.call_args.args
+        assert role == MessageRole.ASSISTANT
+        assert content == "Hello there!"
+    
+    @pytest.mark.asyncio
+    async def test_stream_user_input_error_yields_fallback(self, dialogue_manager, mock_llm_client):
+        """Test streaming falls back when the LLM fails before any output."""
+        async def failing_stream(context, correlation_id=None):
+            raise Exception("Stream error")
+            yield  # pragma: no cover
+        
+        mock_llm_client.stream_response = MagicMock(side_effect=failing_stream)
+        mock_llm_client.generate_fallback_response = MagicMock(return_value=LLMResponse(
+            content="Sorry, could you repeat that?",
+            token_usage=TokenUsage(),
+            model="fallback",
+            finish_reason="fallback",
+            response_time=0.0
+        ))
+        
+        fragments = [
+            fragment async for fragment in dialogue_manager.stream_user_input("Hi")
+        ]
+        
+        assert fragments == ["Sorry, could you repeat that?"]
+        assert dialogue_manager.metrics.error_count == 1
+        assert dialogue_manager.metrics.fallback_responses == 1
+        assert dialogue_manager.conversation_turns[0].metadata["fallback"] is True
 
 
 class TestContextManagement:
@@ -401,6 +453,86 @@ class TestMetricsAndAnalytics:
         
         assert dialogue_manager.metrics.interruption_count == initial_count + 2
     
+    @pytest.mark.asyncio
+    async def test_record_interruption_truncates_spoken_response(self, dialogue_manager, mock_llm_client):
+        """Test barge-in trims the last turn and context to what was spoken."""
+        context = ConversationContext(conversation_id="test_conversation")
+        dialogue_manager.conversation_context = context
+        
+        async def fake_stream(conversation_context, correlation_id=None):
+            for fragment in ["We open at nine.", " We close at five."]:
+                yield fragment
+        
+        mock_llm_client.stream_response = MagicMock(side_effect=fake_stream)
+        async for _ in dialogue_manager.stream_user_input("When are you open?"):
+            pass
+        
+        dialogue_manager.record_interruption("We open at nine.")
+        
+        turn = dialogue_manager.conversation_turns[-1]
+        assert turn.assistant_response == "We open at nine."
+        assert turn.metadata["interrupted"] is True
+        assert turn.metadata["generated_response"] == "We open at nine. We close at five."
+        assert context.messages[-1].role == MessageRole.ASSISTANT
+        assert context.messages[-1].content == "We open at nine."
+        
+        assert context.get_messages_for_api()[-1] == {"role": "assistant", "content": "We open at nine."}
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+        
+        # Nothing heard: the assistant message is dropped entirely
+        dialogue_manager.record_interruption("")
+        assert context.messages[-1].role == MessageRole.USER
+        assert context.get_messages_for_api()[-1] == {"role": "user", "content": "When are you open?"}
+        assert context.token_count == context.token_counter.count_messages(context.get_messages_for_api())
+        assert dialogue_manager.metrics.interruption_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_stream_user_input_cancelled_records_turn(self, dialogue_manager, mock_llm_client):
+        """Test closing the stream mid-generation still records the partial turn."""
+        async def endless_stream(conversation_context, correlation_id=None):
+            yield "Let me check"
+            await asyncio.Event().wait()
+            yield "never"  # pragma: no cover
+        
+        mock_llm_client.stream_response = MagicMock(side_effect=endless_stream)
+        
+        stream = dialogue_manager.stream_user_input("Hi")
+        assert await stream.__anext__() == "Let me check"
+        await stream.aclose()
+        
+        turn = dialogue_manager.conversation_turns[-1]
+        assert turn.assistant_response == "Let me check"
+        assert turn.metadata["generation_cancelled"] is True
+        assert not dialogue_manager.processing_lock.locked()
+    
+    @pytest.mark.asyncio
+    async def test_stream_user_input_commits_speculation(self, dialogue_manager, mock_llm_client):
+        """Test a speculative response is reused instead of a new LLM request."""
+        context = ConversationContext(conversation_id="test_conversation")
+        dialogue_manager.conversation_context = context
+        
+        async def fake_stream(conversation_context, correlation_id=None):
+            yield "We open at nine."
+        
+        mock_llm_client.stream_response = MagicMock(side_effect=fake_stream)
+        speculation = dialogue_manager.create_speculation("when do you open")
+        await asyncio.sleep(0)
+        assert context.messages == []
+        
+        fragments = [
+            fragment async for fragment in dialogue_manager.stream_user_input(
+                "When do you open?", speculation=speculation
+            )
+        ]
+        
+        assert fragments == ["We open at nine."]
+        assert mock_llm_client.stream_response.call_count == 1
+        assert [message.content for message in context.messages] == ["When do you open?", "We open at nine."]
+        turn = dialogue_manager.conversation_turns[-1]
+        assert turn.metadata["speculative"] is True
+        assert turn.metadata["speculative_input"] == "when do you open"
+        assert turn.metadata["correlation_id"] == speculation.correlation_id
+    
     def test_conversation_metrics_update(self, dialogue_manager):
         """Test conversation metrics update with response times."""
         metrics = dialogue_manager.metrics
@@ -0,0 +1,42 @@
+"""Tests for the filler clip cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.conversation.filler import FillerClipCache
+from src.clients.cartesia_tts import CartesiaTTSClient
+
+
+class TestFillerClipCache:
+    """Test FillerClipCache loading and rotation."""
+    
+    @pytest.mark.asyncio
+    async def test_load_skips_failed_phrases(self):
+        """A phrase that fails to synthesize is left out of the cache."""
+        client = AsyncMock(spec=CartesiaTTSClient)
+        
+        async def synthesize(text, voice_config=None, audio_config=None):
+            if text == "Hmm.":
+                raise RuntimeError("tts unavailable")
+            return MagicMock(audio_data=text.encode())
+        
+        client.synthesize_batch.side_effect = synthesize
+        cache = FillerClipCache(["Mm-hm.", "Hmm.", "One moment."])
+        
+        assert await cache.load(client, MagicMock(), MagicMock()) == 2
+        assert len(cache) == 2
+    
+    @pytest.mark.asyncio
+    async def test_clips_rotate(self):
+        """Consecutive clips cycle through the phrases."""
+        client = AsyncMock(spec=CartesiaTTSClient)
+        client.synthesize_batch.side_effect = lambda text, **kwargs: MagicMock(audio_data=text.encode())
+        cache = FillerClipCache(["A.", "B."])
+        await cache.load(client, MagicMock(), MagicMock())
+        
+        assert [cache.next_clip() for _ in range(3)] == [b"A.", b"B.", b"A."]
+    
+    def test_empty_cache_has_no_clip(self):
+        """Nothing is played before the cache is loaded."""
+        assert FillerClipCache().next_clip() is None
@@ -0,0 +1,71 @@
+"""Tests for incremental sentence splitting of streamed LLM output."""
+
+import pytest
+
+from src.conversation.sentence_splitter import SentenceSplitter
+
+
+class TestSentenceSplitter:
+    """Test SentenceSplitter behaviour."""
+    
+    def test_emits_sentence_once_followed_by_whitespace(self):
+        """A sentence is only emitted after whitespace follows the terminator."""
+        splitter = SentenceSplitter(min_length=5)
+        
+        assert splitter.feed("Hello there, how are") == []
+        assert splitter.feed(" you today?") == []
+        assert splitter.feed(" I am fine.") == ["Hello there, how are you today?"]
+        assert splitter.flush() == "I am fine."
+        assert splitter.flush() is None
+    
+    def test_token_by_token_feed(self):
+        """Sentences are reconstructed from small token fragments."""
+        splitter = SentenceSplitter(min_length=5)
+        tokens = ["Our", " hours", " are", " 9", " to", " 5", ".", " We", " open", " Monday", "."]
+        
+        sentences = []
+        for token in tokens:
+            sentences.extend(splitter.feed(token))
+        
+        assert sentences == ["Our hours are 9 to 5."]
+        assert splitter.flush() == "We open Monday."
+    
+    def test_decimal_numbers_are_not_split(self):
+        """Periods inside numbers do not end a sentence."""
+        splitter = SentenceSplitter(min_length=5)
+        
+        sentences = splitter.feed("The price is 3.5 dollars per unit. ")
+        
+        assert sentences == ["The price is 3.5 dollars per unit."]
+    
+    def test_abbreviations_do_not_end_sentence(self):
+        """Known abbreviations are not treated as sentence boundaries."""
+        splitter = SentenceSplitter(min_length=5)
+        
+        sentences = splitter.feed("Please ask Dr. Smith about it. Thanks! ")
+        
+        assert sentences == ["Please ask Dr. Smith about it.", "Thanks!"]
+    
+    def test_short_sentences_are_merged(self):
+        """Sentences shorter than min_length are merged with the next one."""
+        splitter = SentenceSplitter(min_length=16)
+        
+        sentences = splitter.feed("Sure. Let me check that for you. ")
+        
+        assert sentences == ["Sure. Let me check that for you."]
+    
+    def test_long_text_without_punctuation_is_force_split(self):
+        """Overlong runs are split at a clause or word boundary."""
+        splitter = SentenceSplitter(min_length=5, max_length=40)
+        
+        sentences = splitter.feed("one two three four five, six seven eight nine ten eleven")
+        
+        assert sentences == ["one two three four five,"]
+        assert splitter.flush() == "six seven eight nine ten eleven"
+    
+    @pytest.mark.parametrize("terminator", ["!", "?", ".", '."'])
+    def test_terminators(self, terminator):
+        """All terminal punctuation marks end a sentence."""
+        splitter = SentenceSplitter(min_length=1)
+        
+        assert splitter.feed(f"Done{terminator} next") == [f"Done{terminator}"]
@@ -0,0 +1,110 @@
+"""Tests for speculative LLM generation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.clients.openai_llm import OpenAILLMClient, ConversationContext, MessageRole
+from src.conversation.speculation import SpeculativeGeneration, transcript_similarity
+
+
+def make_llm_client(fragments, started=None):
+    """LLM client whose stream yields the given fragments."""
+    client = AsyncMock(spec=OpenAILLMClient)
+    
+    async def fake_stream(context, correlation_id=None):
+        if started is not None:
+            started.append([message.content for message in context.messages])
+        for fragment in fragments:
+            yield fragment
+            await asyncio.sleep(0)
+    
+    client.stream_response = MagicMock(side_effect=fake_stream)
+    return client
+
+
+class TestTranscriptSimilarity:
+    """Test transcript_similarity()."""
+    
+    def test_ignores_case_and_punctuation(self):
+        """Formatting differences between interim and final do not count."""
+        assert transcript_similarity("what are your hours", "What are your hours?") == 1.0
+    
+    def test_partial_overlap(self):
+        """A trailing extra word lowers similarity proportionally."""
+        similarity = transcript_similarity("what are your hours", "what are your hours today")
+        
+        assert 0.85 < similarity < 1.0
+    
+    def test_different_requests(self):
+        """Unrelated transcripts score low."""
+        assert transcript_similarity("book a table", "cancel my order") < 0.5
+
+
+class TestSpeculativeGeneration:
+    """Test SpeculativeGeneration."""
+    
+    @pytest.mark.asyncio
+    async def test_generates_without_touching_history(self):
+        """The interim transcript is only added to a copy of the context."""
+        context = ConversationContext(conversation_id="conv")
+        context.add_message(MessageRole.USER, "Hi")
+        seen = []
+        client = make_llm_client(["Sure", ", we open at nine."], started=seen)
+        
+        speculation = SpeculativeGeneration(client, context, "when do you open").start()
+        fragments = [fragment async for fragment in speculation.fragments()]
+        
+        assert fragments == ["Sure", ", we open at nine."]
+        assert seen == [["Hi", "when do you open"]]
+        assert [message.content for message in context.messages] == ["Hi"]
+        assert speculation.first_token_latency >= 0
+    
+    @pytest.mark.asyncio
+    async def test_matches_threshold(self):
+        """Matching compares the interim input against the final transcript."""
+        context = ConversationContext(conversation_id="conv")
+        speculation = SpeculativeGeneration(make_llm_client([]), context, "when do you open")
+        
+        assert speculation.matches("When do you open?", 0.85)
+        assert not speculation.matches("when do you close on sundays", 0.85)
+    
+    @pytest.mark.asyncio
+    async def test_cancel_stops_generation(self):
+        """Cancelling a running speculation stops the LLM stream."""
+        context = ConversationContext(conversation_id="conv")
+        client = AsyncMock(spec=OpenAILLMClient)
+        
+        async def endless_stream(context, correlation_id=None):
+            while True:
+                yield "more"
+                await asyncio.sleep(0.01)
+        
+        client.stream_response = MagicMock(side_effect=endless_stream)
+        speculation = SpeculativeGeneration(client, context, "hello there").start()
+        await asyncio.sleep(0.02)
+        
+        speculation.cancel()
+        await asyncio.sleep(0)
+        
+        assert speculation.cancelled
+    
+    @pytest.mark.asyncio
+    async def test_error_is_raised_to_reader(self):
+        """A failed generation surfaces its error when the fragments are read."""
+        context = ConversationContext(conversation_id="conv")
+        client = AsyncMock(spec=OpenAILLMClient)
+        
+        async def failing_stream(context, correlation_id=None):
+            yield "Partial"
+            raise RuntimeError("stream dropped")
+        
+        client.stream_response = MagicMock(side_effect=failing_stream)
+        speculation = SpeculativeGeneration(client, context, "hello there").start()
+        
+        received = []
+        with pytest.raises(RuntimeError, match="stream dropped"):
+            async for fragment in speculation.fragments():
+                received.append(fragment)
+        assert received == ["Partial"]
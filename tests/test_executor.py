@@ -0,0 +1,114 @@
+"""Tests for the shared blocking-work executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.executor import BlockingExecutor, get_blocking_executor, shutdown_blocking_executor
+from src.metrics import MetricsCollector
+
+
+@pytest.fixture
+def metrics():
+    """Isolated metrics collector."""
+    return MetricsCollector()
+
+
+@pytest.fixture
+def executor(metrics):
+    """Small executor for tests."""
+    pool = BlockingExecutor(max_workers=2, max_pending=1, metrics_collector=metrics)
+    yield pool
+    pool.shutdown()
+
+
+class TestBlockingExecutor:
+    """Test offloading blocking calls."""
+    
+    @pytest.mark.asyncio
+    async def test_runs_off_the_loop_thread(self, executor, metrics):
+        """Calls run in a worker thread and are timed per task name."""
+        result = await executor.run(lambda x: (threading.current_thread().name, x * 2), 21, task_name="double")
+        
+        thread_name, value = result
+        assert value == 42
+        assert thread_name.startswith("blocking")
+        assert metrics.get_counter("executor_tasks_total", labels={"task": "double", "status": "success"}) == 1
+        assert metrics.get_timer_stats("executor_task_duration", labels={"task": "double"})["count"] == 1
+        assert executor.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_loop_stays_responsive(self, executor):
+        """The loop keeps scheduling while a blocking call runs."""
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+        
+        ticker_task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.1, task_name="sleep")
+        ticker_task.cancel()
+        
+        assert ticks >= 5
+    
+    @pytest.mark.asyncio
+    async def test_admission_is_bounded(self, executor):
+        """No more than max_workers + max_pending calls are in flight."""
+        release = threading.Event()
+        peak = 0
+        
+        async def submit():
+            nonlocal peak
+            task = asyncio.create_task(executor.run(release.wait, 1.0, task_name="wait"))
+            await asyncio.sleep(0.01)
+            peak = max(peak, executor.in_flight)
+            return await task
+        
+        runs = [asyncio.create_task(submit()) for _ in range(6)]
+        await asyncio.sleep(0.05)
+        assert executor.in_flight == 3
+        release.set()
+        await asyncio.gather(*runs)
+        
+        assert peak == 3
+        assert executor.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_errors_and_timeouts_are_counted(self, executor, metrics):
+        """Exceptions propagate and timeouts raise asyncio.TimeoutError."""
+        def fail():
+            raise ValueError("boom")
+        
+        with pytest.raises(ValueError):
+            await executor.run(fail, task_name="fail")
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 0.2, task_name="slow", timeout=0.01)
+        
+        assert metrics.get_counter("executor_tasks_total", labels={"task": "fail", "status": "error"}) == 1
+        assert metrics.get_counter("executor_tasks_total", labels={"task": "slow", "status": "timeout"}) == 1
+    
+    @pytest.mark.asyncio
+    async def test_timed_out_call_records_actual_duration(self, executor, metrics):
+        """A call that outlives its timeout is timed when its thread finishes."""
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 0.1, task_name="slow", timeout=0.01)
+        assert metrics.get_timer_stats("executor_task_duration", labels={"task": "slow"})["count"] == 0
+        
+        await asyncio.sleep(0.15)
+        stats = metrics.get_timer_stats("executor_task_duration", labels={"task": "slow"})
+        assert stats["count"] == 1
+        assert stats["max"] >= 0.1
+
+
+def test_global_executor_is_shared_and_recreated():
+    """get_blocking_executor returns one instance until it is shut down."""
+    first = get_blocking_executor()
+    assert get_blocking_executor() is first
+    
+    shutdown_blocking_executor()
+    assert get_blocking_executor() is not first
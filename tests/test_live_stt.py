@@ -0,0 +1,170 @@
+"""Tests for per-call streaming transcription."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.clients.deepgram_stt import TranscriptionResult
+from src.live_stt import LiveTranscriber
+from src.metrics import MetricsCollector
+
+
+BYTES_PER_SECOND = 32000
+
+
+class ScriptedStreamClient:
+    """STT client that answers each finalize request with a scripted final."""
+    
+    def __init__(self, finals, interims=(), acknowledge=True):
+        self.finals = list(finals)
+        self.interims = list(interims)
+        self.acknowledge = acknowledge
+        self.streaming_config = SimpleNamespace(language="en-US")
+        self.frames = []
+        self.streams_opened = 0
+        self._results = asyncio.Queue()
+    
+    async def transcribe_stream(self, audio_stream, connection_id=None):
+        self.streams_opened += 1
+        
+        async def receive():
+            async for frame in audio_stream:
+                self.frames.append(frame)
+                for text in self.interims:
+                    await self._results.put(
+                        TranscriptionResult(text=text, confidence=0.5, language="en-US", duration=0.0, is_final=False)
+                    )
+                self.interims = []
+            await self._results.put(None)
+        
+        receiver = asyncio.create_task(receive())
+        try:
+            while True:
+                result = await self._results.get()
+                if result is None:
+                    return
+                yield result
+        finally:
+            receiver.cancel()
+    
+    async def finalize_stream(self, connection_id):
+        if not self.acknowledge:
+            return False
+        end = sum(len(frame) for frame in self.frames) / BYTES_PER_SECOND
+        text = self.finals.pop(0) if self.finals else ""
+        await self._results.put(TranscriptionResult(
+            text=text,
+            confidence=0.9,
+            language="en-US",
+            duration=1.0,
+            end_time=end,
+            metadata={"from_finalize": True}
+        ))
+        return True
+
+
+async def push_seconds(transcriber, seconds):
+    """Push PCM16 silence in 20 ms frames."""
+    frame = bytes(BYTES_PER_SECOND // 50)
+    for _ in range(int(seconds * 50)):
+        transcriber.push(frame)
+    await asyncio.sleep(0)
+
+
+class TestLiveTranscriber:
+    """Test the call-long STT stream."""
+    
+    @pytest.mark.asyncio
+    async def test_one_stream_serves_every_utterance(self):
+        """Each finalize returns that utterance's finals over the same connection."""
+        client = ScriptedStreamClient(["Hello there.", "What time is it?"])
+        transcriber = LiveTranscriber(client, "call_live", BYTES_PER_SECOND, metrics_collector=MetricsCollector())
+        transcriber.start()
+        
+        await push_seconds(transcriber, 1.0)
+        first = await transcriber.finalize_utterance(timeout=1.0)
+        await push_seconds(transcriber, 1.0)
+        second = await transcriber.finalize_utterance(timeout=1.0)
+        await transcriber.close()
+        
+        assert first.text == "Hello there."
+        assert second.text == "What time is it?"
+        assert client.streams_opened == 1
+        assert sum(len(frame) for frame in client.frames) == 2 * BYTES_PER_SECOND
+        assert transcriber.closed
+    
+    @pytest.mark.asyncio
+    async def test_transcript_callback_sees_interims_and_finals(self):
+        """on_transcript gets the utterance so far, interim included."""
+        updates = []
+        client = ScriptedStreamClient(["When do you open?"], interims=["when do"])
+        transcriber = LiveTranscriber(
+            client,
+            "call_live",
+            BYTES_PER_SECOND,
+            on_transcript=lambda text, is_final: updates.append((text, is_final)),
+            metrics_collector=MetricsCollector()
+        )
+        transcriber.start()
+        
+        await push_seconds(transcriber, 0.5)
+        await asyncio.sleep(0.01)
+        assert transcriber.transcript() == "when do"
+        result = await transcriber.finalize_utterance(timeout=1.0)
+        await transcriber.close()
+        
+        assert updates == [("when do", False), ("When do you open?", True)]
+        assert result.text == "When do you open?"
+        assert transcriber.transcript() == ""
+    
+    @pytest.mark.asyncio
+    async def test_finalize_times_out_without_finals(self):
+        """A provider that never flushes costs at most the timeout."""
+        metrics = MetricsCollector()
+        client = ScriptedStreamClient([], acknowledge=False)
+        transcriber = LiveTranscriber(client, "call_live", BYTES_PER_SECOND, metrics_collector=metrics)
+        transcriber.start()
+        
+        await push_seconds(transcriber, 0.5)
+        result = await transcriber.finalize_utterance(timeout=0.05)
+        await transcriber.close()
+        
+        assert result.text == ""
+        assert metrics.get_counter("stt_finalize_timeouts_total") == 1
+    
+    @pytest.mark.asyncio
+    async def test_finals_before_the_utterance_are_dropped(self):
+        """Finals that end before begin_utterance() belong to earlier noise."""
+        client = ScriptedStreamClient([])
+        transcriber = LiveTranscriber(client, "call_live", BYTES_PER_SECOND, metrics_collector=MetricsCollector())
+        transcriber._on_result(TranscriptionResult(
+            text="background chatter", confidence=0.9, language="en-US", duration=0.5, end_time=0.5
+        ))
+        await push_seconds(transcriber, 2.0)
+        transcriber.begin_utterance(lookback_seconds=0.5)
+        transcriber._on_result(TranscriptionResult(
+            text="Book a table.", confidence=0.9, language="en-US", duration=0.5, end_time=2.0
+        ))
+        
+        result = await transcriber.finalize_utterance(timeout=0.01)
+        
+        assert result.text == "Book a table."
+    
+    @pytest.mark.asyncio
+    async def test_push_drops_frames_when_queue_is_full(self):
+        """A stalled connection bounds the audio held for it."""
+        metrics = MetricsCollector()
+        transcriber = LiveTranscriber(
+            ScriptedStreamClient([]),
+            "call_live",
+            BYTES_PER_SECOND,
+            max_queued_frames=2,
+            metrics_collector=metrics
+        )
+        
+        accepted = [transcriber.push(b"\x00" * 640) for _ in range(3)]
+        
+        assert accepted == [True, True, False]
+        assert transcriber.pushed_bytes == 1280
+        assert metrics.get_counter("stt_live_frames_dropped_total") == 1
@@ -20,6 +20,8 @@ from src.monitoring.metrics_exporter import (
 from src.monitoring.dashboard import (
     DashboardManager, Dashboard, DashboardPanel, DashboardMetric
 )
+from src.monitoring.loop_monitor import EventLoopMonitor, task_group_name
+from src.metrics import MetricsCollector
 
 
 class TestHealthMonitor:
@@ -109,6 +111,7 @@ class TestHealthMonitor:
             return True
         
         health_monitor.component_timeout = 0.1  # Short timeout
+        health_monitor.metrics_collector = MetricsCollector()
         health_monitor.register_component(
             "slow_component",
             ComponentType.STT_CLIENT,
@@ -120,6 +123,13 @@ class TestHealthMonitor:
         assert health.component_name == "slow_component"
         assert health.status == HealthStatus.UNHEALTHY
         assert "timed out" in health.error_message
+        assert health.response_time_ms >= 100
+        
+        # Timeouts are counted, not recorded as response times
+        metrics = health_monitor.metrics_collector
+        labels = {"component": "slow_component"}
+        assert metrics.get_counter("component_health_check_timeouts_total", labels=labels) == 1
+        assert metrics.get_histogram_stats("component_health_response_time_ms", labels=labels)["count"] == 0
     
     @pytest.mark.asyncio
     async def test_check_all_components(self, health_monitor):
@@ -506,6 +516,137 @@ class TestDashboardManager:
         assert isinstance(dashboard_data["panels"], list)
 
 
+class TestEventLoopMonitor:
+    """Test event loop health monitoring."""
+    
+    @pytest.fixture
+    def metrics(self):
+        """Isolated metrics collector."""
+        return MetricsCollector()
+    
+    @pytest.fixture
+    def loop_monitor(self, metrics):
+        """Create event loop monitor instance."""
+        return EventLoopMonitor(
+            sample_interval=0.01,
+            report_interval=0.05,
+            slow_callback_threshold=0.03,
+            lag_degraded_threshold=0.02,
+            track_slow_callbacks=True,
+            metrics_collector=metrics
+        )
+    
+    @pytest.mark.asyncio
+    async def test_blocking_callback_is_flagged(self, loop_monitor, metrics):
+        """Test that a callback blocking the loop shows up as lag and a slow callback."""
+        import time
+        
+        async def blocking_work():
+            time.sleep(0.06)
+        
+        original_run = asyncio.Handle._run
+        await loop_monitor.start_monitoring()
+        try:
+            await asyncio.sleep(0.03)
+            await asyncio.create_task(blocking_work())
+            await asyncio.sleep(0.03)
+        finally:
+            await loop_monitor.stop_monitoring()
+        
+        assert loop_monitor.lag_percentiles()["max"] >= 0.03
+        assert loop_monitor.slow_callbacks["TestEventLoopMonitor.test_blocking_callback_is_flagged.<locals>.blocking_work"] == 1
+        assert metrics.get_counter(
+            "event_loop_slow_callbacks_total",
+            labels={"callback": "TestEventLoopMonitor.test_blocking_callback_is_flagged.<locals>.blocking_work"}
+        ) == 1
+        assert asyncio.Handle._run is original_run
+    
+    @pytest.mark.asyncio
+    async def test_callbacks_untimed_by_default(self, metrics):
+        """Test that Handle._run is left alone unless slow callback tracking is enabled."""
+        original_run = asyncio.Handle._run
+        monitor = EventLoopMonitor(sample_interval=0.01, metrics_collector=metrics)
+        
+        await monitor.start_monitoring()
+        try:
+            assert asyncio.Handle._run is original_run
+            await asyncio.sleep(0.02)
+        finally:
+            await monitor.stop_monitoring()
+        
+        assert asyncio.Handle._run is original_run
+    
+    @pytest.mark.asyncio
+    async def test_stop_keeps_later_handle_wrapper(self, loop_monitor):
+        """Test that stopping does not drop a Handle._run wrapper installed after the monitor's."""
+        original_run = asyncio.Handle._run
+        await loop_monitor.start_monitoring()
+        timed_run = asyncio.Handle._run
+        
+        def outer_run(handle):
+            timed_run(handle)
+        
+        asyncio.Handle._run = outer_run
+        try:
+            await loop_monitor.stop_monitoring()
+            assert asyncio.Handle._run is outer_run
+        finally:
+            asyncio.Handle._run = original_run
+    
+    @pytest.mark.asyncio
+    async def test_health_check_grades_lag(self, loop_monitor):
+        """Test health status thresholds on p99 lag."""
+        loop_monitor.lag_samples.extend([0.001] * 50)
+        result = await loop_monitor.health_check()
+        assert result["status"] == HealthStatus.HEALTHY.value
+        assert result["success_rate"] == 100.0
+        
+        loop_monitor.lag_samples.extend([0.1] * 5)
+        result = await loop_monitor.health_check()
+        assert result["status"] == HealthStatus.DEGRADED.value
+        assert result["details"]["lag_max_ms"] == pytest.approx(100.0)
+        
+        loop_monitor.lag_samples.extend([1.0] * 5)
+        result = await loop_monitor.health_check()
+        assert result["status"] == HealthStatus.UNHEALTHY.value
+    
+    @pytest.mark.asyncio
+    async def test_report_counts_tasks_by_name(self, loop_monitor, metrics):
+        """Test pending task gauges group default-named tasks by coroutine."""
+        async def idle():
+            await asyncio.sleep(10)
+        
+        tasks = [asyncio.create_task(idle()) for _ in range(3)]
+        named = asyncio.create_task(idle(), name="custom")
+        await asyncio.sleep(0)
+        try:
+            group = task_group_name(tasks[0])
+            assert group.endswith("<locals>.idle")
+            assert task_group_name(named) == "custom"
+            
+            loop_monitor.report()
+            assert metrics.get_gauge("event_loop_tasks_by_name", labels={"task": group}) == 3
+            assert metrics.get_gauge("event_loop_tasks_by_name", labels={"task": "custom"}) == 1
+        finally:
+            for task in tasks + [named]:
+                task.cancel()
+            await asyncio.gather(*tasks, named, return_exceptions=True)
+        
+        loop_monitor.report()
+        assert metrics.get_gauge("event_loop_tasks_by_name", labels={"task": group}) == 0
+    
+    @pytest.mark.asyncio
+    async def test_registers_with_health_monitor(self, loop_monitor):
+        """Test the monitor plugs into HealthMonitor as a component."""
+        health_monitor = HealthMonitor(check_interval=1.0, enable_auto_checks=False)
+        health_monitor.register_component("event_loop", ComponentType.EVENT_LOOP, loop_monitor.health_check)
+        
+        component_health = await health_monitor.check_component_health("event_loop")
+        
+        assert component_health.status == HealthStatus.HEALTHY
+        assert "pending_tasks" in component_health.details
+
+
 @pytest.mark.asyncio
 async def test_monitoring_integration():
     """Test integration between monitoring components."""
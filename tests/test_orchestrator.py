@@ -1,6 +1,7 @@
 """Unit tests for CallOrchestrator."""
 
 import asyncio
+import numpy as np
 import pytest
 from datetime import datetime, UTC
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,13 +13,19 @@ from src.orchestrator import (
     CallMetrics,
     CallStatus,
     AudioStreamState,
-    HealthStatus
+    HealthStatus,
+    ResponsePlayback,
+    CallSession
 )
 from src.clients.deepgram_stt import DeepgramSTTClient, TranscriptionResult
-from src.clients.openai_llm import OpenAILLMClient, LLMResponse, TokenUsage
+from src.clients.openai_llm import OpenAILLMClient, LLMResponse, TokenUsage, ConversationContext, MessageRole
 from src.clients.cartesia_tts import CartesiaTTSClient, TTSResponse, AudioFormat
 from src.conversation.state_machine import ConversationState
 from src.conversation.dialogue_manager import ConversationTurn
+from src.audio.ring_buffer import AudioRingBuffer
+from src.audio.outbound import OutboundAudioStream
+from src.audio.codec import AudioFormatSpec, Codec
+from src.tracing import TurnStage
 
 
 @pytest.fixture
@@ -106,7 +113,7 @@ class TestCallOrchestrator:
         assert orchestrator.max_concurrent_calls == 5
         assert orchestrator.audio_buffer_size == 1024
         assert orchestrator.response_timeout == 30.0
-        assert len(orchestrator.active_calls) == 0
+        assert len(orchestrator.sessions) == 0
         assert orchestrator.total_calls_handled == 0
     
     @pytest.mark.asyncio
@@ -118,16 +125,16 @@ class TestCallOrchestrator:
             await orchestrator.handle_call_start(call_context)
             
             # Verify call is tracked
-            assert call_context.call_id in orchestrator.active_calls
-            assert call_context.call_id in orchestrator.call_metrics
-            assert call_context.call_id in orchestrator.call_state_machines
-            assert call_context.call_id in orchestrator.dialogue_managers
+            assert call_context.call_id in orchestrator.sessions
+            session = orchestrator.sessions[call_context.call_id]
+            assert session.context is call_context
+            assert session.metrics.call_id == call_context.call_id
             
             # Verify metrics
             assert orchestrator.total_calls_handled == 1
             
             # Verify state machine is initialized
-            state_machine = orchestrator.call_state_machines[call_context.call_id]
+            state_machine = orchestrator.sessions[call_context.call_id].state_machine
             assert state_machine.current_state == ConversationState.LISTENING
     
     @pytest.mark.asyncio
@@ -157,6 +164,31 @@ class TestCallOrchestrator:
             await orchestrator.handle_call_start(overflow_call)
             mock_rejection.assert_called_once_with(overflow_call, "max_concurrent_calls_reached")
     
+    @pytest.mark.asyncio
+    async def test_handle_call_start_rejected_when_provider_circuit_open(
+        self, orchestrator, call_context, mock_llm_client
+    ):
+        """Test admission control sheds calls while a provider breaker is open."""
+        mock_llm_client.get_health_status = MagicMock(return_value={"circuit_breaker_state": "open"})
+        
+        with patch.object(orchestrator, '_handle_call_rejection') as mock_rejection:
+            await orchestrator.handle_call_start(call_context)
+            mock_rejection.assert_called_once_with(call_context, "provider_unavailable")
+        
+        assert call_context.call_id not in orchestrator.sessions
+    
+    @pytest.mark.asyncio
+    async def test_call_end_releases_admission_slot(self, orchestrator, call_context):
+        """Test ending a call frees its admission slot."""
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        assert orchestrator.admission_controller.active == 1
+        
+        await orchestrator.handle_call_end(call_context)
+        
+        assert orchestrator.admission_controller.active == 0
+    
     @pytest.mark.asyncio
     async def test_handle_audio_received(self, orchestrator, call_context):
         """Test audio data handling."""
@@ -172,13 +204,94 @@ class TestCallOrchestrator:
             await orchestrator.handle_audio_received(call_context.call_id, audio_data)
             
             # Verify audio is buffered
-            assert len(orchestrator.audio_buffers[call_context.call_id]) == 1
-            assert orchestrator.audio_buffers[call_context.call_id][0] == audio_data
+            assert orchestrator.sessions[call_context.call_id].audio_buffer.view() == audio_data
             
             # Verify metrics updated
-            metrics = orchestrator.call_metrics[call_context.call_id]
+            metrics = orchestrator.sessions[call_context.call_id].metrics
             assert metrics.bytes_received == len(audio_data)
     
+    @pytest.mark.asyncio
+    async def test_audio_processed_only_at_end_of_speech(self, orchestrator, call_context):
+        """Test VAD endpointing triggers one processing pass per utterance."""
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        t = np.arange(320) / 16000
+        voiced = (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+        silent = bytes(640)
+        
+        with patch.object(orchestrator, '_process_audio_buffer') as mock_process:
+            for _ in range(20):
+                await orchestrator.handle_audio_received(call_context.call_id, silent)
+            
+            # Leading silence is trimmed to the configured pre-speech padding
+            buffered = len(orchestrator.sessions[call_context.call_id].audio_buffer)
+            assert buffered == orchestrator.vad_config.speech_pad_bytes
+            
+            for _ in range(25):
+                await orchestrator.handle_audio_received(call_context.call_id, voiced)
+            mock_process.assert_not_called()
+            assert orchestrator.sessions[call_context.call_id].audio_state == AudioStreamState.RECEIVING
+            
+            for _ in range(40):
+                await orchestrator.handle_audio_received(call_context.call_id, silent)
+            mock_process.assert_called_once()
+            call_id, trace = mock_process.call_args.args
+            assert call_id == call_context.call_id
+            assert set(trace.marks) == {TurnStage.AUDIO_IN, TurnStage.ENDPOINT}
+    
+    @pytest.mark.asyncio
+    async def test_queued_utterance_is_not_trimmed(self, orchestrator, call_context, mock_stt_client):
+        """Test an utterance waiting behind an earlier turn keeps all its audio."""
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        session = orchestrator.sessions[call_context.call_id]
+        session.dialogue_manager.process_user_input = AsyncMock(return_value=("Okay.", MagicMock()))
+        
+        t = np.arange(320) / 16000
+        voiced = (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+        silent = bytes(640)
+        
+        # An earlier turn is still running while both utterances end
+        await session.processing_lock.acquire()
+        with patch.object(orchestrator, '_generate_audio_response'):
+            for _ in range(2):
+                for _ in range(50):
+                    await orchestrator.handle_audio_received(call_context.call_id, voiced)
+                for _ in range(40):
+                    await orchestrator.handle_audio_received(call_context.call_id, silent)
+            assert len(session.turn_tasks) == 2
+            
+            session.processing_lock.release()
+            await asyncio.gather(*session.turn_tasks)
+        
+        assert mock_stt_client.transcribe_batch.call_count == 2
+        for call in mock_stt_client.transcribe_batch.call_args_list:
+            # About one second of speech, plus padding and the endpoint silence
+            assert len(call.args[0]) >= 32000
+    
+    @pytest.mark.asyncio
+    async def test_inbound_audio_buffer_is_bounded(self, orchestrator, call_context):
+        """Test inbound audio beyond the buffer limit is dropped and counted."""
+        orchestrator.max_buffered_audio_ms = 100
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        t = np.arange(16000) / 16000
+        voiced = (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+        
+        with patch.object(orchestrator, '_process_audio_buffer'):
+            await orchestrator.handle_audio_received(call_context.call_id, voiced)
+        
+        audio_buffer = orchestrator.sessions[call_context.call_id].audio_buffer
+        assert len(audio_buffer) == 3200
+        # The newest audio is kept
+        assert audio_buffer.view() == voiced[-3200:]
+        assert orchestrator.sessions[call_context.call_id].metrics.audio_bytes_dropped == len(voiced) - 3200
+    
     @pytest.mark.asyncio
     async def test_handle_audio_received_unknown_call(self, orchestrator):
         """Test handling audio for unknown call."""
@@ -194,10 +307,10 @@ class TestCallOrchestrator:
             await orchestrator.handle_call_start(call_context)
         
         # Add audio to buffer
-        orchestrator.audio_buffers[call_context.call_id] = [b"audio1", b"audio2"]
+        orchestrator.sessions[call_context.call_id].audio_buffer.write(b"audio1audio2")
         
         # Mock dialogue manager response
-        dialogue_manager = orchestrator.dialogue_managers[call_context.call_id]
+        dialogue_manager = orchestrator.sessions[call_context.call_id].dialogue_manager
         mock_turn = ConversationTurn(
             turn_id="turn_1",
             user_input="Hello",
@@ -221,7 +334,7 @@ class TestCallOrchestrator:
             mock_tts.assert_called_once_with(call_context.call_id, "Hi there!")
             
             # Verify buffer was cleared
-            assert len(orchestrator.audio_buffers[call_context.call_id]) == 0
+            assert len(orchestrator.sessions[call_context.call_id].audio_buffer) == 0
     
     @pytest.mark.asyncio
     async def test_process_audio_buffer_low_confidence(self, orchestrator, call_context, mock_stt_client):
@@ -239,13 +352,13 @@ class TestCallOrchestrator:
             mock_settings.return_value.context_window_size = 4000
             await orchestrator.handle_call_start(call_context)
         
-        orchestrator.audio_buffers[call_context.call_id] = [b"unclear_audio"]
+        orchestrator.sessions[call_context.call_id].audio_buffer.write(b"unclear_audio")
         
         # Process audio
         await orchestrator._process_audio_buffer(call_context.call_id)
         
         # Verify state machine returned to listening
-        state_machine = orchestrator.call_state_machines[call_context.call_id]
+        state_machine = orchestrator.sessions[call_context.call_id].state_machine
         assert state_machine.current_state == ConversationState.LISTENING
     
     @pytest.mark.asyncio
@@ -266,10 +379,104 @@ class TestCallOrchestrator:
         mock_tts_client.synthesize_batch.assert_called_once()
         
         # Verify metrics updated
-        metrics = orchestrator.call_metrics[call_context.call_id]
+        metrics = orchestrator.sessions[call_context.call_id].metrics
         assert metrics.bytes_sent > 0
         assert metrics.tts_latency > 0
     
+    @pytest.mark.asyncio
+    async def test_response_audio_paced_into_sink(self, orchestrator, call_context, mock_tts_client):
+        """Test TTS audio reaches the call's sink as fixed 20 ms frames."""
+        frames = []
+        
+        async def sink(frame):
+            frames.append(frame)
+        
+        orchestrator.audio_sink_factory = lambda context: sink
+        mock_tts_client.synthesize_batch.return_value.audio_data = bytes(640 * 3 + 100)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        session = orchestrator.sessions[call_context.call_id]
+        await orchestrator._generate_audio_response(call_context.call_id, "Hello there.")
+        await session.audio_output.drain()
+        
+        assert len(frames) == 4
+        assert all(len(frame) == 640 for frame in frames)
+        assert session.audio_output.stats.frames_sent == 4
+        
+        await orchestrator.handle_call_end(call_context)
+    
+    @pytest.mark.asyncio
+    async def test_g711_call_is_transcoded(self, orchestrator, call_context, mock_tts_client):
+        """Test a μ-law call is decoded inbound and encoded/resampled outbound."""
+        frames = []
+        
+        async def sink(frame):
+            frames.append(frame)
+        
+        orchestrator.audio_sink_factory = lambda context: sink
+        call_context.audio_format = AudioFormatSpec(codec=Codec.MULAW, sample_rate=8000)
+        mock_tts_client.synthesize_batch.return_value.audio_data = bytes(640 * 3)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        session = orchestrator.sessions[call_context.call_id]
+        await orchestrator.handle_audio_received(call_context.call_id, b"\xff" * 160)
+        buffered = len(session.audio_buffer)
+        await orchestrator.handle_audio_received(call_context.call_id, b"\xff" * 160)
+        # The resampler holds back its look-ahead only once per stream
+        assert len(session.audio_buffer) - buffered == 640
+        
+        await orchestrator._generate_audio_response(call_context.call_id, "Hello there.")
+        await session.audio_output.drain()
+        
+        assert len(frames) == 3
+        assert [len(frame) for frame in frames[1:]] == [160, 160]
+        assert all(frame == b"\xff" * len(frame) for frame in frames)
+        
+        await orchestrator.handle_call_end(call_context)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("llm_delay,expect_filler", [(0.15, True), (0.0, False)])
+    async def test_filler_audio_masks_slow_response(
+        self, orchestrator, call_context, mock_tts_client, llm_delay, expect_filler
+    ):
+        """Test a cached filler clip plays only when the response is late."""
+        frames = []
+        
+        async def sink(frame):
+            frames.append(frame)
+        
+        filler_audio = b"\x01\x00" * 320
+        response_audio = b"\x02\x00" * 960
+        orchestrator.audio_sink_factory = lambda context: sink
+        orchestrator.filler_deadline = 0.05
+        mock_tts_client.synthesize_batch.return_value.audio_data = filler_audio
+        await orchestrator.start()
+        assert len(orchestrator.filler_clips) == 3
+        
+        mock_tts_client.synthesize_batch.return_value.audio_data = response_audio
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        session = orchestrator.sessions[call_context.call_id]
+        session.audio_buffer.write(b"\x00" * 640)
+        
+        async def slow_response(user_input, metadata=None):
+            await asyncio.sleep(llm_delay)
+            return "Hi there!", MagicMock()
+        
+        session.dialogue_manager.process_user_input = AsyncMock(side_effect=slow_response)
+        await orchestrator._process_audio_buffer(call_context.call_id)
+        
+        assert (frames[0] == filler_audio) is expect_filler
+        assert frames[-3:] == [response_audio[:640]] * 3
+        assert session.filler_task is None
+        
+        await orchestrator.handle_call_end(call_context)
+    
     @pytest.mark.asyncio
     async def test_handle_call_end(self, orchestrator, call_context):
         """Test call end handling."""
@@ -282,15 +489,13 @@ class TestCallOrchestrator:
         await orchestrator.handle_call_end(call_context)
         
         # Verify call is removed from active calls
-        assert call_context.call_id not in orchestrator.active_calls
+        assert call_context.call_id not in orchestrator.sessions
         
         # Verify metrics updated
         assert orchestrator.successful_calls == 1
         
         # Verify resources cleaned up
-        assert call_context.call_id not in orchestrator.call_state_machines
-        assert call_context.call_id not in orchestrator.dialogue_managers
-        assert call_context.call_id not in orchestrator.audio_buffers
+        assert orchestrator.sessions == {}
     
     @pytest.mark.asyncio
     async def test_cleanup_call_resources(self, orchestrator, call_context):
@@ -303,21 +508,25 @@ class TestCallOrchestrator:
         call_id = call_context.call_id
         
         # Verify resources exist
-        assert call_id in orchestrator.active_calls
-        assert call_id in orchestrator.call_state_machines
-        assert call_id in orchestrator.dialogue_managers
+        session = orchestrator.sessions[call_id]
+        session.audio_buffer.write(b"pending_audio")
+        pending_turn = asyncio.create_task(asyncio.sleep(10))
+        session.add_turn_task(pending_turn)
         
         # Clean up resources
         await orchestrator._cleanup_call_resources(call_id)
         
         # Verify resources removed
-        assert call_id not in orchestrator.active_calls
-        assert call_id not in orchestrator.call_state_machines
-        assert call_id not in orchestrator.dialogue_managers
-        assert call_id not in orchestrator.audio_streams
-        assert call_id not in orchestrator.audio_stream_states
-        assert call_id not in orchestrator.audio_buffers
-        assert call_id not in orchestrator.processing_locks
+        assert call_id not in orchestrator.sessions
+        assert session.closed
+        assert len(session.audio_buffer) == 0
+        assert not session.turn_tasks
+        await asyncio.sleep(0)
+        assert pending_turn.cancelled()
+        
+        # Cleaning up again is harmless
+        await orchestrator._cleanup_call_resources(call_id)
+        assert session.close() == []
     
     @pytest.mark.asyncio
     async def test_health_status(self, orchestrator):
@@ -485,9 +694,9 @@ class TestCallOrchestrator:
             await asyncio.gather(*tasks)
         
         # Verify all calls are active
-        assert len(orchestrator.active_calls) == 3
+        assert len(orchestrator.sessions) == 3
         for call_ctx in call_contexts:
-            assert call_ctx.call_id in orchestrator.active_calls
+            assert call_ctx.call_id in orchestrator.sessions
     
     @pytest.mark.asyncio
     async def test_audio_processing_error_handling(self, orchestrator, call_context, mock_stt_client):
@@ -500,19 +709,265 @@ class TestCallOrchestrator:
             mock_settings.return_value.context_window_size = 4000
             await orchestrator.handle_call_start(call_context)
         
-        orchestrator.audio_buffers[call_context.call_id] = [b"audio_data"]
+        orchestrator.sessions[call_context.call_id].audio_buffer.write(b"audio_data")
         
         # Process audio - should handle error gracefully
         await orchestrator._process_audio_buffer(call_context.call_id)
         
         # Verify error metrics updated
-        metrics = orchestrator.call_metrics[call_context.call_id]
+        metrics = orchestrator.sessions[call_context.call_id].metrics
         assert metrics.failed_turns == 1
         
         # Verify state machine recovered
-        state_machine = orchestrator.call_state_machines[call_context.call_id]
+        state_machine = orchestrator.sessions[call_context.call_id].state_machine
         assert state_machine.current_state == ConversationState.LISTENING
     
+    @pytest.mark.asyncio
+    async def test_streaming_turn_pipeline(self, orchestrator, call_context, mock_stt_client, mock_tts_client):
+        """Test streaming mode speaks sentences while the LLM is still generating."""
+        orchestrator.streaming_mode = True
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        call_id = call_context.call_id
+        events = []
+        
+        async def fake_transcribe_stream(audio_stream, connection_id=None):
+            async for _ in audio_stream:
+                pass
+            yield TranscriptionResult(text="what are", confidence=0.9, language="en-US", duration=0.5, is_final=False)
+            yield TranscriptionResult(text="What are your hours?", confidence=0.9, language="en-US", duration=1.0, is_final=True)
+        
+        async def fake_stream_user_input(user_text, metadata=None, speculation=None):
+            events.append(("user", user_text))
+            for fragment in ["We are open from nine.", " Closed on", " Sundays."]:
+                events.append(("llm", fragment))
+                yield fragment
+                await asyncio.sleep(0)
+        
+        async def fake_synthesize_stream(text, voice_config=None, audio_config=None, correlation_id=None):
+            events.append(("tts", text))
+            yield b"\x00\x01" * 10
+        
+        mock_stt_client.transcribe_stream = MagicMock(side_effect=fake_transcribe_stream)
+        mock_tts_client.synthesize_stream = MagicMock(side_effect=fake_synthesize_stream)
+        dialogue_manager = orchestrator.sessions[call_id].dialogue_manager
+        dialogue_manager.stream_user_input = fake_stream_user_input
+        
+        orchestrator.sessions[call_id].audio_buffer.write(b"audio1audio2")
+        await orchestrator._process_audio_buffer(call_id)
+        
+        mock_stt_client.transcribe_batch.assert_not_called()
+        assert events[0] == ("user", "What are your hours?")
+        # First sentence is synthesized before the LLM finishes generating
+        assert events.index(("tts", "We are open from nine.")) < events.index(("llm", " Sundays."))
+        assert ("tts", "Closed on Sundays.") in events
+        
+        metrics = orchestrator.sessions[call_id].metrics
+        assert metrics.successful_turns == 1
+        assert metrics.bytes_sent == 40
+        assert orchestrator.sessions[call_id].state_machine.current_state == ConversationState.LISTENING
+        
+        # Every stage after the endpoint is traced, in pipeline order
+        trace = metrics.turn_traces[-1]
+        stages = [TurnStage.ENDPOINT, TurnStage.STT_FINAL, TurnStage.LLM_FIRST_TOKEN, TurnStage.TTS_FIRST_BYTE,
+                  TurnStage.LLM_DONE, TurnStage.AUDIO_OUT_FIRST_FRAME]
+        assert sorted(trace.marks, key=trace.marks.get) == stages
+        assert metrics.to_dict()["turn_traces"][0]["spans"]["response"] > 0
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("final_text,llm_requests", [
+        ("When do you open?", 1),
+        ("When do you close?", 2)
+    ])
+    async def test_speculative_llm_on_stable_interim(
+        self, orchestrator, call_context, mock_stt_client, mock_llm_client, mock_tts_client,
+        final_text, llm_requests
+    ):
+        """Test a stable interim starts the LLM early and is kept only if the final matches."""
+        orchestrator.streaming_mode = True
+        orchestrator.speculative_llm = True
+        context = ConversationContext(conversation_id=call_context.call_id)
+        mock_llm_client.create_conversation_context.return_value = context
+        mock_llm_client.calculate_context_tokens = MagicMock(return_value=100)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        call_id = call_context.call_id
+        llm_inputs = []
+        
+        async def fake_transcribe_stream(audio_stream, connection_id=None):
+            async for _ in audio_stream:
+                pass
+            for text in ["when do", "when do you open", "when do you open"]:
+                yield TranscriptionResult(text=text, confidence=0.8, language="en-US", duration=0.5, is_final=False)
+                await asyncio.sleep(0)
+            yield TranscriptionResult(text=final_text, confidence=0.9, language="en-US", duration=1.0, is_final=True)
+        
+        async def fake_llm_stream(conversation_context, correlation_id=None):
+            llm_inputs.append(conversation_context.messages[-1].content)
+            yield "Nine to five, every day."
+        
+        async def fake_synthesize_stream(text, voice_config=None, audio_config=None, correlation_id=None):
+            yield b"\x00\x01" * 10
+        
+        mock_stt_client.transcribe_stream = MagicMock(side_effect=fake_transcribe_stream)
+        mock_llm_client.stream_response = MagicMock(side_effect=fake_llm_stream)
+        mock_tts_client.synthesize_stream = MagicMock(side_effect=fake_synthesize_stream)
+        
+        session = orchestrator.sessions[call_id]
+        session.audio_buffer.write(b"audio1audio2")
+        await orchestrator._process_audio_buffer(call_id)
+        
+        assert llm_inputs[0] == "when do you open"
+        assert len(llm_inputs) == llm_requests
+        assert session.speculation is None
+        turn = session.dialogue_manager.conversation_turns[-1]
+        assert turn.user_input == final_text
+        assert turn.assistant_response == "Nine to five, every day."
+        # A mismatch cancels the interim speculation and regenerates for the final text
+        assert llm_inputs[-1] == ("when do you open" if llm_requests == 1 else final_text)
+        assert session.metrics.successful_turns == 1
+    
+    @pytest.mark.asyncio
+    async def test_persistent_stt_streams_call_audio(self, orchestrator, call_context, mock_stt_client, mock_tts_client):
+        """Test persistent STT keeps one stream per call and finalizes it at each endpoint."""
+        orchestrator.streaming_mode = True
+        orchestrator.persistent_stt = True
+        frames = []
+        turns = []
+        results = asyncio.Queue()
+        transcripts = ["What are your hours?", "Thanks."]
+        
+        async def fake_transcribe_stream(audio_stream, connection_id=None):
+            async def receive():
+                async for frame in audio_stream:
+                    frames.append(frame)
+                await results.put(None)
+            
+            receiver = asyncio.create_task(receive())
+            try:
+                while (result := await results.get()) is not None:
+                    yield result
+            finally:
+                receiver.cancel()
+        
+        async def fake_finalize_stream(connection_id):
+            await results.put(TranscriptionResult(
+                text=transcripts.pop(0), confidence=0.9, language="en-US", duration=1.0,
+                metadata={"from_finalize": True}
+            ))
+            return True
+        
+        async def fake_stream_user_input(user_text, metadata=None, speculation=None):
+            turns.append(user_text)
+            yield f"You said {user_text}"
+        
+        async def fake_synthesize_stream(text, voice_config=None, audio_config=None, correlation_id=None):
+            yield b"\x00\x01" * 10
+        
+        mock_stt_client.transcribe_stream = MagicMock(side_effect=fake_transcribe_stream)
+        mock_stt_client.finalize_stream = AsyncMock(side_effect=fake_finalize_stream)
+        mock_tts_client.synthesize_stream = MagicMock(side_effect=fake_synthesize_stream)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        call_id = call_context.call_id
+        session = orchestrator.sessions[call_id]
+        session.dialogue_manager.stream_user_input = fake_stream_user_input
+        for chunk in (b"\x01\x00" * 160, b"\x02\x00" * 160):
+            await orchestrator.handle_audio_received(call_id, chunk)
+            await orchestrator._process_audio_buffer(call_id)
+        
+        mock_stt_client.transcribe_batch.assert_not_called()
+        mock_stt_client.transcribe_stream.assert_called_once()
+        assert mock_stt_client.finalize_stream.await_count == 2
+        assert turns == ["What are your hours?", "Thanks."]
+        assert frames == [b"\x01\x00" * 160, b"\x02\x00" * 160]
+        
+        live_stt = session.live_stt
+        await orchestrator.handle_call_end(call_context)
+        assert live_stt.closed
+    
+    @pytest.mark.asyncio
+    async def test_persistent_stt_reopens_after_provider_close(self, orchestrator, call_context, mock_stt_client, mock_tts_client):
+        """Test a turn after the provider closes the live stream still gets a transcript."""
+        orchestrator.persistent_stt = True
+        streams = []
+        turns = []
+        transcripts = ["What are your hours?", "And on Sunday?"]
+        
+        async def fake_transcribe_stream(audio_stream, connection_id=None):
+            results = asyncio.Queue()
+            streams.append(results)
+            
+            async def receive():
+                async for _ in audio_stream:
+                    pass
+                await results.put(None)
+            
+            receiver = asyncio.create_task(receive())
+            try:
+                while (result := await results.get()) is not None:
+                    yield result
+            finally:
+                receiver.cancel()
+        
+        async def fake_finalize_stream(connection_id):
+            await streams[-1].put(TranscriptionResult(
+                text=transcripts.pop(0), confidence=0.9, language="en-US", duration=1.0,
+                metadata={"from_finalize": True}
+            ))
+            return True
+        
+        async def fake_process_user_input(user_text, metadata=None):
+            turns.append(user_text)
+            return f"You said {user_text}", MagicMock()
+        
+        async def fake_synthesize_stream(text, voice_config=None, audio_config=None, correlation_id=None):
+            yield b"\x00\x01" * 10
+        
+        mock_stt_client.transcribe_stream = MagicMock(side_effect=fake_transcribe_stream)
+        mock_stt_client.finalize_stream = AsyncMock(side_effect=fake_finalize_stream)
+        mock_stt_client.transcribe_batch = AsyncMock(return_value=TranscriptionResult(
+            text="Are you open late?", confidence=0.9, language="en-US", duration=1.0
+        ))
+        mock_tts_client.synthesize_stream = MagicMock(side_effect=fake_synthesize_stream)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        call_id = call_context.call_id
+        session = orchestrator.sessions[call_id]
+        session.dialogue_manager.process_user_input = fake_process_user_input
+        
+        await orchestrator.handle_audio_received(call_id, b"\x01\x00" * 160)
+        await orchestrator._process_audio_buffer(call_id)
+        
+        # The provider closes the stream normally between turns
+        first_stream = session.live_stt
+        await streams[0].put(None)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert first_stream.closed
+        
+        await orchestrator.handle_audio_received(call_id, b"\x02\x00" * 160)
+        await orchestrator._process_audio_buffer(call_id)
+        
+        assert session.live_stt is not first_stream
+        assert not session.live_stt.closed
+        assert mock_stt_client.transcribe_stream.call_count == 2
+        
+        await orchestrator.handle_audio_received(call_id, b"\x03\x00" * 160)
+        await orchestrator._process_audio_buffer(call_id)
+        
+        assert turns == ["What are your hours?", "Are you open late?", "And on Sunday?"]
+        mock_stt_client.transcribe_batch.assert_awaited_once()
+        await orchestrator.handle_call_end(call_context)
+    
     @pytest.mark.asyncio
     async def test_close_orchestrator(self, orchestrator, call_context):
         """Test orchestrator cleanup on close."""
@@ -525,7 +980,7 @@ class TestCallOrchestrator:
         await orchestrator.close()
         
         # Verify all calls ended
-        assert len(orchestrator.active_calls) == 0
+        assert len(orchestrator.sessions) == 0
         
         # Verify clients closed
         orchestrator.stt_client.close.assert_called_once()
@@ -642,6 +1097,59 @@ class TestCallMetrics:
         assert "start_time" in metrics_dict
 
 
+class TestCallSession:
+    """Test cases for CallSession."""
+    
+    def _session(self, call_context):
+        return CallSession(
+            context=call_context,
+            state_machine=MagicMock(),
+            dialogue_manager=MagicMock(),
+            audio_buffer=AudioRingBuffer(64),
+            spare_buffer=AudioRingBuffer(64),
+            vad=MagicMock(),
+            audio_output=OutboundAudioStream()
+        )
+    
+    def test_slots(self, call_context):
+        """Sessions reject attributes outside the declared slots."""
+        session = self._session(call_context)
+        
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unexpected = True
+    
+    def test_detach_utterance_swaps_buffers(self, call_context):
+        """Detaching hands back the filled buffer and swaps in an empty one."""
+        session = self._session(call_context)
+        session.audio_buffer.write(b"utterance")
+        
+        utterance = session.detach_utterance()
+        session.audio_buffer.write(b"next")
+        
+        assert utterance.view() == b"utterance"
+        assert session.spare_buffer is None
+        assert session.audio_buffer.view() == b"next"
+        
+        session.release_utterance(utterance)
+        assert session.spare_buffer is utterance
+        assert len(utterance) == 0
+    
+    def test_detach_while_utterance_pending(self, call_context):
+        """A second detach before the first is released gets a new buffer."""
+        session = self._session(call_context)
+        session.audio_buffer.write(b"first")
+        first = session.detach_utterance()
+        session.audio_buffer.write(b"second")
+        second = session.detach_utterance()
+        session.audio_buffer.write(b"third")
+        
+        assert first.view() == b"first"
+        assert second.view() == b"second"
+        assert session.audio_buffer.view() == b"third"
+        assert session.audio_buffer.capacity == first.capacity
+
+
 class TestHealthStatus:
     """Test cases for HealthStatus."""
     
@@ -680,4 +1188,187 @@ class TestHealthStatus:
         assert status_dict["status"] == "healthy"
         assert status_dict["components"] == {"test": True}
         assert status_dict["details"] == {"active_calls": 0}
-        assert "last_check" in status_dict
\ No newline at end of file
+        assert "last_check" in status_dict
+    
+    @pytest.mark.asyncio
+    async def test_barge_in_cancels_streaming_response(
+        self, orchestrator, call_context, mock_stt_client, mock_llm_client, mock_tts_client
+    ):
+        """Test caller speech during SPEAKING cancels LLM and TTS and trims the turn."""
+        orchestrator.streaming_mode = True
+        context = ConversationContext(conversation_id=call_context.call_id)
+        mock_llm_client.create_conversation_context.return_value = context
+        mock_llm_client.calculate_context_tokens = MagicMock(return_value=100)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        call_id = call_context.call_id
+        llm_cancelled = asyncio.Event()
+        
+        async def fake_transcribe_stream(audio_stream, connection_id=None):
+            async for _ in audio_stream:
+                pass
+            yield TranscriptionResult(text="When do you open?", confidence=0.9, language="en-US", duration=1.0, is_final=True)
+        
+        async def slow_llm_stream(conversation_context, correlation_id=None):
+            yield "We open at nine on weekdays. "
+            yield "On weekends we open at ten"
+            try:
+                await asyncio.Event().wait()
+            finally:
+                llm_cancelled.set()
+        
+        async def fake_synthesize_stream(text, voice_config=None, audio_config=None, correlation_id=None):
+            yield bytes(32000)  # One second of 16 kHz PCM16
+            await asyncio.sleep(0)
+        
+        mock_stt_client.transcribe_stream = MagicMock(side_effect=fake_transcribe_stream)
+        mock_llm_client.stream_response = MagicMock(side_effect=slow_llm_stream)
+        mock_tts_client.synthesize_stream = MagicMock(side_effect=fake_synthesize_stream)
+        
+        orchestrator.sessions[call_id].audio_buffer.write(b"audio1audio2")
+        orchestrator._start_turn(orchestrator.sessions[call_id])
+        
+        state_machine = orchestrator.sessions[call_id].state_machine
+        # Wait until the first sentence has actually been played
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if orchestrator.sessions[call_id].audio_output.bytes_played >= 32000:
+                break
+        assert state_machine.current_state == ConversationState.SPEAKING
+        
+        # Caller starts talking over the response
+        t = np.arange(1600) / 16000
+        voiced = (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+        await orchestrator.handle_audio_received(call_id, voiced)
+        
+        assert llm_cancelled.is_set()
+        assert not orchestrator.sessions[call_id].turn_tasks
+        assert state_machine.current_state == ConversationState.LISTENING
+        assert orchestrator.sessions[call_id].metrics.interruptions == 1
+        
+        turn = orchestrator.sessions[call_id].dialogue_manager.conversation_turns[-1]
+        assert turn.assistant_response == "We open at nine on weekdays."
+        assert turn.metadata["interrupted"] is True
+        assert context.messages[-1].role == MessageRole.ASSISTANT
+        assert context.messages[-1].content == "We open at nine on weekdays."
+    
+    @pytest.mark.asyncio
+    async def test_no_barge_in_while_listening(self, orchestrator, call_context):
+        """Test caller speech outside SPEAKING does not record an interruption."""
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        t = np.arange(1600) / 16000
+        voiced = (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+        await orchestrator.handle_audio_received(call_context.call_id, voiced)
+        
+        assert orchestrator.sessions[call_context.call_id].metrics.interruptions == 0
+    
+    def test_response_playback_spoken_text(self):
+        """Test spoken text estimation from the played stream offset."""
+        playback = ResponsePlayback()
+        playback.begin_sentence("Our hours are nine to five.")
+        playback.audio_queued(1000)
+        playback.finish_sentence(33000)
+        playback.begin_sentence("We are closed on public holidays and Sundays.")
+        playback.audio_queued(33000)
+        
+        # Queued but not yet played audio does not count
+        assert playback.spoken_text(1000, 32000) == ""
+        assert playback.spoken_text(17000, 32000) == "Our hours are"
+        # One second into the unfinished sentence at 16 kHz PCM16
+        assert playback.spoken_text(65000, 32000) == "Our hours are nine to five. We are"
+        
+        playback.finish_sentence(97000)
+        assert playback.spoken_text(65000, 32000) == "Our hours are nine to five. We are closed on"
+        assert playback.spoken_text(97000, 32000) == (
+            "Our hours are nine to five. We are closed on public holidays and Sundays."
+        )
+    
+    async def _barge_in_after(self, orchestrator, call_id, played_bytes):
+        """Wait until played_bytes of the response were played, then talk over it."""
+        session = orchestrator.sessions[call_id]
+        for _ in range(300):
+            await asyncio.sleep(0.01)
+            if session.audio_output.bytes_played >= played_bytes:
+                break
+        assert session.state_machine.current_state == ConversationState.SPEAKING
+        
+        t = np.arange(1600) / 16000
+        voiced = (np.sin(2 * np.pi * 440 * t) * 10000).astype("<i2").tobytes()
+        await orchestrator.handle_audio_received(call_id, voiced)
+        assert session.metrics.interruptions == 1
+        return session.dialogue_manager.conversation_turns[-1]
+    
+    @pytest.mark.asyncio
+    async def test_barge_in_counts_only_played_audio(
+        self, orchestrator, call_context, mock_llm_client, mock_tts_client
+    ):
+        """Test a queued but unplayed reply is not recorded as spoken."""
+        context = ConversationContext(conversation_id=call_context.call_id)
+        mock_llm_client.create_conversation_context.return_value = context
+        mock_llm_client.calculate_context_tokens = MagicMock(return_value=100)
+        reply = "We are open from nine in the morning until five every weekday."
+        mock_llm_client.generate_response = AsyncMock(return_value=LLMResponse(
+            content=reply,
+            token_usage=TokenUsage(),
+            model="gpt-4",
+            finish_reason="stop",
+            response_time=0.1
+        ))
+        mock_tts_client.synthesize_batch.return_value.audio_data = bytes(48000)  # 1.5 s
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        call_id = call_context.call_id
+        orchestrator.sessions[call_id].audio_buffer.write(b"audio1audio2")
+        orchestrator._start_turn(orchestrator.sessions[call_id])
+        turn = await self._barge_in_after(orchestrator, call_id, 10880)  # 0.34 s
+        
+        assert turn.metadata["interrupted"] is True
+        assert turn.assistant_response
+        assert reply.startswith(turn.assistant_response)
+        assert len(turn.assistant_response.split()) < len(reply.split()) // 2
+        assert context.messages[-1].content == turn.assistant_response
+    
+    @pytest.mark.asyncio
+    async def test_barge_in_while_writer_waits_for_buffer_space(
+        self, orchestrator, call_context, mock_stt_client, mock_llm_client, mock_tts_client
+    ):
+        """Test a reply longer than the outbound buffer keeps its played part."""
+        orchestrator.streaming_mode = True
+        context = ConversationContext(conversation_id=call_context.call_id)
+        mock_llm_client.create_conversation_context.return_value = context
+        mock_llm_client.calculate_context_tokens = MagicMock(return_value=100)
+        with patch('src.orchestrator.get_settings') as mock_settings:
+            mock_settings.return_value.context_window_size = 4000
+            await orchestrator.handle_call_start(call_context)
+        
+        async def fake_transcribe_stream(audio_stream, connection_id=None):
+            async for _ in audio_stream:
+                pass
+            yield TranscriptionResult(text="Tell me about your hours.", confidence=0.9, language="en-US", duration=1.0, is_final=True)
+        
+        async def llm_stream(conversation_context, correlation_id=None):
+            yield "We are open from nine in the morning until five in the evening on every weekday."
+        
+        async def fake_synthesize_stream(text, voice_config=None, audio_config=None, correlation_id=None):
+            yield bytes(32000 * 3)  # Three seconds, more than the 2 s buffer
+        
+        mock_stt_client.transcribe_stream = MagicMock(side_effect=fake_transcribe_stream)
+        mock_llm_client.stream_response = MagicMock(side_effect=llm_stream)
+        mock_tts_client.synthesize_stream = MagicMock(side_effect=fake_synthesize_stream)
+        
+        call_id = call_context.call_id
+        orchestrator.sessions[call_id].audio_buffer.write(b"audio1audio2")
+        orchestrator._start_turn(orchestrator.sessions[call_id])
+        turn = await self._barge_in_after(orchestrator, call_id, 16000)  # 0.5 s
+        
+        assert turn.metadata["interrupted"] is True
+        assert turn.assistant_response.startswith("We")
+        assert context.messages[-1].role == MessageRole.ASSISTANT
+        assert context.messages[-1].content == turn.assistant_response
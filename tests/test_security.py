@@ -1,7 +1,9 @@
 """Tests for security utilities."""
 
+import mmap
 import pytest
 import logging
+import struct
 from unittest.mock import patch
 
 from src.security import (
@@ -10,6 +12,9 @@ from src.security import (
     calculate_entropy,
     validate_api_key,
     validate_audio_data,
+    parse_wav_header,
+    PCMFormat,
+    StreamingAudioValidator,
     mask_sensitive_data,
     sanitize_log_data,
     SensitiveDataFilter,
@@ -209,6 +214,119 @@ class TestAudioDataValidation:
         assert "too large" in result.error_message
 
 
+def make_wav(data: bytes, sample_rate=16000, channels=1, bits=16, block_align=None, extra_chunks=b"", data_size=None):
+    """Build a WAVE file, optionally with chunks between fmt and data."""
+    block_align = block_align if block_align is not None else channels * bits // 8
+    fmt = struct.pack("<HHIIHH", 1, channels, sample_rate, sample_rate * block_align, block_align, bits)
+    body = (
+        b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + extra_chunks
+        + b"data" + struct.pack("<I", len(data) if data_size is None else data_size) + data
+    )
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+LIST_CHUNK = b"LIST" + struct.pack("<I", 26) + b"INFOISFT" + struct.pack("<I", 14) + b"Lavf58.76.100\x00"
+
+
+class TestWavParsing:
+    """Test RIFF chunk parsing and format checks."""
+    
+    def test_header_with_list_chunk(self):
+        """Chunks before the data chunk move the audio offset."""
+        wav = make_wav(b"\x00\x00" * 8000, extra_chunks=LIST_CHUNK)
+        
+        info = parse_wav_header(memoryview(wav))
+        result = validate_audio_data(wav)
+        
+        assert info.data_offset == 44 + len(LIST_CHUNK)
+        assert info.data_size == 16000
+        assert result.is_valid is True
+        assert result.duration_estimate == pytest.approx(0.5)
+    
+    def test_incomplete_header_returns_none(self):
+        """A prefix without the data chunk header is not an error yet."""
+        wav = make_wav(b"\x00" * 200, extra_chunks=LIST_CHUNK)
+        assert parse_wav_header(memoryview(wav)[:50]) is None
+    
+    @pytest.mark.parametrize("wav,message", [
+        (make_wav(b"\x00" * 1001), "whole number of frames"),
+        (make_wav(b"\x00" * 1000, block_align=4), "block alignment"),
+        (make_wav(b"\x00" * 1000, channels=0), "channel count"),
+        (make_wav(b"\x00" * 1000, data_size=2000), "truncated"),
+    ])
+    def test_invalid_declared_format(self, wav, message):
+        """Headers that contradict themselves or the data are rejected."""
+        result = validate_audio_data(wav)
+        assert result.is_valid is False
+        assert message in result.error_message
+    
+    def test_memory_mapped_file(self, tmp_path):
+        """Validation reads a mapped file in place and releases it."""
+        path = tmp_path / "audio.wav"
+        path.write_bytes(make_wav(b"\x00\x00" * 16000))
+        
+        with open(path, "rb") as audio_file:
+            mapped = mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ)
+            result = validate_audio_data(mapped)
+            mapped.close()
+        
+        assert result.is_valid is True
+        assert result.duration_estimate == pytest.approx(1.0)
+    
+    def test_raw_pcm_with_declared_format(self):
+        """Headerless PCM is checked against the declared frame size."""
+        stereo = PCMFormat(sample_rate=8000, channels=2)
+        
+        valid = validate_audio_data(b"\x00" * 3200, pcm_format=stereo)
+        partial_frame = validate_audio_data(b"\x00" * 3202, pcm_format=stereo)
+        
+        assert valid.is_valid is True
+        assert valid.detected_format == "pcm"
+        assert valid.duration_estimate == pytest.approx(0.1)
+        assert partial_frame.is_valid is False
+
+
+class TestStreamingAudioValidator:
+    """Test incremental validation."""
+    
+    def test_header_split_across_chunks(self):
+        """Results match validate_audio_data when fed a byte at a time through the header."""
+        wav = make_wav(b"\x00\x00" * 8000, extra_chunks=LIST_CHUNK)
+        validator = StreamingAudioValidator()
+        
+        for index in range(100):
+            assert validator.feed(wav[index:index + 1]).is_valid
+        validator.feed(wav[100:])
+        result = validator.finish()
+        
+        assert result.is_valid is True
+        assert result.detected_format == "wav"
+        assert result.duration_estimate == pytest.approx(0.5)
+        assert result.file_size == len(wav)
+    
+    def test_duration_limit_fails_early(self):
+        """An overlong PCM stream is rejected as soon as it crosses the limit."""
+        validator = StreamingAudioValidator(pcm_format=PCMFormat(sample_rate=8000))
+        second = b"\x00" * 16000
+        
+        results = [validator.feed(second) for _ in range(302)]
+        
+        assert results[299].is_valid is True
+        assert results[300].is_valid is False
+        assert "too long" in results[301].error_message
+    
+    def test_truncated_stream_fails_on_finish(self):
+        """Completeness is checked once the stream ends."""
+        wav = make_wav(b"\x00" * 1000)
+        validator = StreamingAudioValidator()
+        
+        assert validator.feed(wav[:500]).is_valid is True
+        result = validator.finish()
+        
+        assert result.is_valid is False
+        assert "truncated" in result.error_message
+
+
 class TestSensitiveDataMasking:
     """Test sensitive data masking."""
     
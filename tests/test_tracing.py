@@ -0,0 +1,53 @@
+"""Tests for per-turn latency tracing."""
+
+import pytest
+
+from src.metrics import MetricsCollector
+from src.tracing import TurnStage, TurnTrace
+
+
+def make_trace(**offsets):
+    """Trace with stages marked at the given offsets in seconds."""
+    trace = TurnTrace(call_id="call_1", turn_index=0)
+    for stage, offset in offsets.items():
+        trace.mark(TurnStage(stage), 100.0 + offset)
+    return trace
+
+
+class TestTurnTrace:
+    """Test TurnTrace marks and spans."""
+    
+    def test_first_mark_wins(self):
+        """A stage reached again later keeps its first timestamp."""
+        trace = TurnTrace(call_id="call_1", turn_index=0)
+        trace.mark(TurnStage.LLM_FIRST_TOKEN, 1.0)
+        trace.mark(TurnStage.LLM_FIRST_TOKEN, 2.0)
+        
+        assert trace.marks[TurnStage.LLM_FIRST_TOKEN] == 1.0
+    
+    def test_spans_skip_missing_stages(self):
+        """Only spans whose start and end were both reached are reported."""
+        trace = make_trace(endpoint=0.0, stt_final=0.2, llm_first_token=0.5)
+        
+        spans = trace.spans()
+        
+        assert spans == pytest.approx({"stt": 0.2, "llm_first_token": 0.3})
+        assert trace.span(TurnStage.ENDPOINT, TurnStage.AUDIO_OUT_FIRST_FRAME) is None
+    
+    def test_record_aggregates_by_stage(self):
+        """Spans land in one histogram per stage, not per call."""
+        collector = MetricsCollector()
+        make_trace(endpoint=0.0, stt_final=0.2).record(collector)
+        make_trace(endpoint=0.0, stt_final=0.4).record(collector)
+        
+        stats = collector.get_histogram_stats("turn_stage_latency", labels={"stage": "stt"})
+        
+        assert stats["count"] == 2
+        assert stats["max"] == pytest.approx(0.4)
+    
+    def test_to_dict_offsets_from_first_mark(self):
+        """Serialized marks are relative to the start of the turn."""
+        data = make_trace(audio_in=0.0, endpoint=1.5).to_dict()
+        
+        assert data["marks"] == pytest.approx({"audio_in": 0.0, "endpoint": 1.5})
+        assert data["spans"] == pytest.approx({"utterance": 1.5})
@@ -0,0 +1,153 @@
+"""Tests for the multi-process orchestrator worker pool."""
+
+import asyncio
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, MagicMock
+
+from src.clients.deepgram_stt import DeepgramSTTClient
+from src.clients.openai_llm import OpenAILLMClient
+from src.clients.cartesia_tts import CartesiaTTSClient
+from src.admission import AdmissionConfig
+from src.orchestrator import CallContext, CallOrchestrator
+from src.worker_pool import (
+    OrchestratorWorkerPool,
+    FrameKind,
+    shard_for_call,
+    encode_audio_frame,
+    decode_audio_payload,
+    encode_frame,
+    read_frame
+)
+
+
+def build_test_orchestrator() -> CallOrchestrator:
+    """Worker-side factory using mocked service clients."""
+    stt_client = AsyncMock(spec=DeepgramSTTClient)
+    llm_client = AsyncMock(spec=OpenAILLMClient)
+    llm_client.create_conversation_context.return_value = MagicMock()
+    tts_client = AsyncMock(spec=CartesiaTTSClient)
+    for client in (stt_client, llm_client, tts_client):
+        client.health_check.return_value = True
+    return CallOrchestrator(stt_client, llm_client, tts_client, max_concurrent_calls=5)
+
+
+def build_single_slot_orchestrator() -> CallOrchestrator:
+    """Worker-side factory admitting one call and queueing the next."""
+    orchestrator = build_test_orchestrator()
+    return CallOrchestrator(
+        orchestrator.stt_client,
+        orchestrator.llm_client,
+        orchestrator.tts_client,
+        max_concurrent_calls=1,
+        admission_config=AdmissionConfig(queue_size=2, queue_timeout=30.0)
+    )
+
+
+def make_call(call_id: str) -> CallContext:
+    """Create a call context."""
+    return CallContext(
+        call_id=call_id,
+        caller_number="+1234567890",
+        start_time=datetime.now(UTC),
+        livekit_room=f"room_{call_id}"
+    )
+
+
+class TestFraming:
+    """Test the IPC frame encoding."""
+    
+    def test_shard_is_stable_and_in_range(self):
+        """Sharding is deterministic and covers all workers."""
+        shards = {shard_for_call(f"call_{i}", 4) for i in range(100)}
+        
+        assert shards == {0, 1, 2, 3}
+        assert shard_for_call("call_7", 4) == shard_for_call("call_7", 4)
+    
+    @pytest.mark.asyncio
+    async def test_frames_round_trip(self):
+        """Audio and control frames survive a stream round trip."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_audio_frame("call_é", b"\x00\x01\x02"))
+        reader.feed_data(encode_frame(FrameKind.CONTROL, ("stop",)))
+        reader.feed_eof()
+        
+        kind, payload = await read_frame(reader)
+        assert kind == FrameKind.AUDIO
+        call_id, audio = decode_audio_payload(payload)
+        assert call_id == "call_é"
+        assert audio == b"\x00\x01\x02"
+        
+        kind, payload = await read_frame(reader)
+        assert kind == FrameKind.CONTROL
+        
+        with pytest.raises(asyncio.IncompleteReadError):
+            await read_frame(reader)
+
+
+class TestOrchestratorWorkerPool:
+    """Test OrchestratorWorkerPool with real worker processes."""
+    
+    def test_invalid_worker_count(self):
+        """At least one worker is required."""
+        with pytest.raises(ValueError):
+            OrchestratorWorkerPool(0)
+    
+    @pytest.mark.asyncio
+    async def test_calls_are_sharded_and_aggregated(self):
+        """Calls land on their shard and metrics aggregate across workers."""
+        pool = OrchestratorWorkerPool(2, orchestrator_factory=build_test_orchestrator, request_timeout=30.0)
+        await pool.start()
+        try:
+            call_ids = [f"call_{i}" for i in range(6)]
+            for call_id in call_ids:
+                await pool.handle_call_start(make_call(call_id))
+                await pool.handle_audio_received(call_id, b"\x00" * 640)
+            
+            active_calls = await pool.get_active_calls()
+            assert sorted(call["call_id"] for call in active_calls) == call_ids
+            for call in active_calls:
+                assert call["worker_id"] == shard_for_call(call["call_id"], 2)
+            
+            metrics = await pool.get_call_metrics()
+            assert metrics["active_calls"] == 6
+            assert metrics["workers"] == 2
+            assert (await pool.get_call_metrics("call_0"))["bytes_received"] == 640
+            
+            health = await pool.get_health_status()
+            assert health.is_healthy
+            assert set(health.components) == {"worker_0", "worker_1"}
+            
+            await pool.handle_call_end(make_call("call_0"))
+            assert len(await pool.get_active_calls()) == 5
+        finally:
+            await pool.shutdown()
+        
+        assert pool.workers == []
+    
+    @pytest.mark.asyncio
+    async def test_queued_call_does_not_stall_worker(self):
+        """A call waiting for admission leaves other calls' frames flowing."""
+        pool = OrchestratorWorkerPool(1, orchestrator_factory=build_single_slot_orchestrator, request_timeout=30.0)
+        await pool.start()
+        try:
+            await pool.handle_call_start(make_call("call_a"))
+            await pool.handle_call_start(make_call("call_b"))
+            await pool.handle_audio_received("call_b", b"\x00" * 320)
+            await pool.handle_audio_received("call_a", b"\x00" * 640)
+            
+            # The worker keeps serving call_a while call_b waits for a slot
+            assert (await pool.get_call_metrics("call_a"))["bytes_received"] == 640
+            assert [call["call_id"] for call in await pool.get_active_calls()] == ["call_a"]
+            
+            # Ending call_a frees the slot; call_b then gets its queued audio in order
+            await pool.handle_call_end(make_call("call_a"))
+            for _ in range(100):
+                call_b_metrics = await pool.get_call_metrics("call_b")
+                if call_b_metrics.get("bytes_received"):
+                    break
+                await asyncio.sleep(0.05)
+            assert call_b_metrics["bytes_received"] == 320
+            assert [call["call_id"] for call in await pool.get_active_calls()] == ["call_b"]
+        finally:
+            await pool.shutdown()